@@ -31,6 +31,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 단계 내부 구간 perf span (스케줄러 경유 시 부모 단계 span 아래에 기록, app 패키지가 없으면 생략)
+try:
+    from app.utils.perf import span as perf_span
+except ImportError:
+    from contextlib import nullcontext
+
+    def perf_span(name, step=None):
+        return nullcontext()
+
 @dataclass
 class TrendConfig:
     """트렌드 분석 설정"""
@@ -951,15 +960,18 @@ def main():
     analyzer = EnhancedKoreanInstitutionalTrendAnalyzer(config=config)
 
     # 전체 데이터 다운로드 (멀티스레딩 사용)
-    df = analyzer.download_all_institutional_data(
-        max_stocks=None,        # 전체 종목 (테스트시 50으로 설정)
-        max_workers=8,          # 동시 처리 스레드 수
-        save_interval=100       # 100개마다 중간 저장
-    )
+    with perf_span('download', step='fetch'):
+        df = analyzer.download_all_institutional_data(
+            max_stocks=None,        # 전체 종목 (테스트시 50으로 설정)
+            max_workers=8,          # 동시 처리 스레드 수
+            save_interval=100       # 100개마다 중간 저장
+        )
 
     if not df.empty:
         # 데이터 저장
-        if analyzer.save_institutional_data(df):
+        with perf_span('save', step='write'):
+            saved = analyzer.save_institutional_data(df)
+        if saved:
             print(f"\n🎯 Enhanced 전체 기관/외국인 순매매 트렌드 데이터 다운로드 및 저장 완료!")
             print(f"📊 총 {len(df)}개 종목")
             print(f"📁 저장 위치: {analyzer.all_institutional_csv_path}")
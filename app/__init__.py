@@ -3,19 +3,106 @@
 
 import os
 import sys
-from flask import Flask, make_response
+import math
+from flask import Flask, make_response, Response, stream_with_context
 from flask.json.provider import DefaultJSONProvider
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 패키지 루트 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+def _sanitize_floats(obj):
+    """NaN/Infinity float leaf → None (orjson 미설치 시 fallback 경로)"""
+    if isinstance(obj, float):
+        return None if math.isnan(obj) or math.isinf(obj) else obj
+    if isinstance(obj, dict):
+        return {k: _sanitize_floats(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_sanitize_floats(v) for v in obj]
+    return obj
+
+
 class SafeJSONProvider(DefaultJSONProvider):
-    """NaN/Infinity → null 변환 (JSON 표준 준수)"""
+    """NaN/Infinity → null 변환 (JSON 표준 준수)
+
+    orjson이 있으면 NaN/Infinity를 네이티브로 null 처리하고 numpy 타입도 직접 직렬화한다.
+    없으면 float leaf만 None으로 바꾼 뒤 표준 json으로 직렬화한다.
+    (문자열 안의 "NaN"은 건드리지 않음)
+    """
+
+    def _orjson_option(self, sort_keys: bool) -> int:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def _dumps_bytes(self, obj, sort_keys=None):
+        """orjson 경로 (지원 불가 객체면 None 반환 → 표준 경로)"""
+        if orjson is None:
+            return None
+        if sort_keys is None:
+            sort_keys = self.sort_keys
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_option(sort_keys))
+        except (orjson.JSONEncodeError, TypeError):
+            return None
+
     def dumps(self, obj, **kwargs):
+        if not (kwargs.keys() - {'sort_keys', 'ensure_ascii', 'default'}):
+            raw = self._dumps_bytes(obj, kwargs.get('sort_keys'))
+            if raw is not None:
+                return raw.decode('utf-8')
         kwargs.setdefault("default", self.default)
-        raw = super().dumps(obj, **kwargs)
-        return raw.replace("NaN", "null").replace("Infinity", "null").replace("-Infinity", "null")
+        return super().dumps(_sanitize_floats(obj), **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if not ((self.compact is None and self._app.debug) or self.compact is False):
+            raw = self._dumps_bytes(obj)
+            if raw is not None:
+                return self._app.response_class(raw + b"\n", mimetype=self.mimetype)
+        return super().response(obj)
+
+    def stream_response(self, obj: dict, status: int = 200, chunk_items: int = 500) -> Response:
+        """대용량 payload 스트리밍 응답
+
+        최상위 dict의 list/tuple/generator 값은 chunk_items개씩 나눠 직렬화해서 전송한다.
+        generator를 넘기면 행 dict를 미리 다 만들지 않아 peak 메모리가 줄어든다.
+        (최상위 키 순서는 입력 순서 유지)
+        """
+        def _encode(value):
+            return self.dumps(value, sort_keys=False)
+
+        def _iter_list(items):
+            yield '['
+            first = True
+            batch = []
+            for item in items:
+                batch.append(_encode(item))
+                if len(batch) >= chunk_items:
+                    yield ('' if first else ',') + ','.join(batch)
+                    first = False
+                    batch = []
+            if batch:
+                yield ('' if first else ',') + ','.join(batch)
+            yield ']'
+
+        def _generate():
+            yield '{'
+            for i, (key, value) in enumerate(obj.items()):
+                yield (',' if i else '') + _encode(str(key)) + ':'
+                if isinstance(value, (list, tuple)) or hasattr(value, '__next__'):
+                    yield from _iter_list(value)
+                else:
+                    yield _encode(value)
+            yield '}\n'
+
+        return Response(stream_with_context(_generate()), status=status, mimetype=self.mimetype)
 
 
 def create_app(config=None):
@@ -103,26 +190,22 @@ def create_app(config=None):
     @app.route('/api/scheduler/trigger/<task>', methods=['POST'])
     def scheduler_trigger(task):
         from flask import jsonify as _jsonify
-        import threading
-        from app.utils.scheduler import (
-            _run_jongga_v2, _run_round2, _run_us_update, _run_crypto_pipeline,
-            _run_all_update
-        )
+        from app.utils.scheduler import _trigger_pipeline
 
         tasks_map = {
-            'jongga-v2': _run_jongga_v2,
-            'round2': _run_round2,
-            'us-update': _run_us_update,
-            'crypto': _run_crypto_pipeline,
-            'all-update': _run_all_update,
+            'jongga-v2': 'jongga_v2',
+            'round2': 'round2',
+            'us-update': 'us_update',
+            'crypto': 'crypto',
+            'all-update': 'all_update',
         }
-        func = tasks_map.get(task)
-        if not func:
+        name = tasks_map.get(task)
+        if not name:
             return _jsonify({'error': f'Unknown task: {task}', 'available': list(tasks_map.keys())}), 400
 
-        # 백그라운드 스레드에서 실행
-        threading.Thread(target=func, daemon=True, name=f'trigger-{task}').start()
-        return _jsonify({'status': 'triggered', 'task': task})
+        # 실행기 대기열에 추가 — 이미 대기/실행 중이면 병합 (중복 실행 없음)
+        outcome = _trigger_pipeline(name, 'manual')
+        return _jsonify({'status': 'triggered' if outcome == 'queued' else 'coalesced', 'task': task})
 
     # ── 데이터 freshness 확인 (GitHub Actions용) ──
     @app.route('/api/system/last-update')
@@ -148,6 +231,32 @@ def create_app(config=None):
                 result[key] = {'timestamp': None, 'age_seconds': -1}
         return _jsonify(result)
 
+    # ── 파이프라인 성능 추이 (perf span 시계열) ──
+    @app.route('/api/system/perf')
+    def system_perf():
+        from flask import jsonify as _jsonify, request as _request
+        from app.utils.perf import build_report
+        try:
+            report = build_report(
+                days=_request.args.get('days', 14, type=int),
+                path_prefix=_request.args.get('path') or None,
+                recent_days=_request.args.get('recent', 3, type=int),
+                threshold=_request.args.get('threshold', 1.3, type=float),
+            )
+            return _jsonify(report)
+        except Exception as e:
+            return _jsonify({'error': str(e)}), 500
+
+    # ── 데이터 제공자 상태 (서킷 브레이커, 지연, 호출 예산) ──
+    @app.route('/api/system/providers')
+    def system_providers():
+        from flask import jsonify as _jsonify
+        from us_market.provider_router import load_health_snapshot
+        snapshot = load_health_snapshot()
+        if snapshot is None:
+            return _jsonify({'providers': {}, 'updated_at': None})
+        return _jsonify(snapshot)
+
     # ── 라우트 등록 검증: 핵심 라우트 누락 시 즉시 중단 ──
     registered = {r.rule for r in app.url_map.iter_rules()}
     for critical in ['/api/health', '/api/data-version']:
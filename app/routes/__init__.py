@@ -1,54 +1,39 @@
 # app/routes/__init__.py
-"""Blueprint Registration"""
-
-from flask import Blueprint
+"""Blueprint Registration
+
+라우트 모듈은 pandas/yfinance/stripe 같은 무거운 의존성을 최상단에서 import하지 않는다
+(app/utils/lazy_import.py 또는 함수 내부 import). 모듈별 import 소요 시간은
+app.extensions['blueprint_import_ms']에 남고, 전체 프로파일은
+`python -m app.utils.import_profile`로 확인한다.
+"""
+
+import time
+from importlib import import_module
+
+# (모듈, Blueprint 변수, URL prefix)
+BLUEPRINTS = [
+    ('app.routes.common', 'common_bp', '/api'),                              # Common API routes
+    ('app.routes.kr_market', 'kr_bp', '/api/kr'),                            # KR Market routes
+    ('app.routes.us_market', 'us_bp', '/api/us'),                            # US Market routes
+    ('app.routes.crypto', 'crypto_bp', '/api/crypto'),                       # Crypto routes
+    ('app.routes.econ', 'econ_bp', '/api/econ'),                             # Economy routes
+    ('app.routes.dividend', 'dividend_bp', '/api/dividend'),                 # Dividend routes
+    ('app.routes.auth', 'auth_bp', '/api/auth'),                             # Auth routes
+    ('app.routes.admin', 'admin_bp', '/api/admin'),                          # Admin routes (관리자 전용)
+    ('app.routes.stripe_routes', 'stripe_bp', '/api/stripe'),                # Stripe routes
+    ('app.routes.stock_analyzer', 'stock_analyzer_bp', '/api/stock-analyzer'),  # Stock Analyzer (Investing.com ProPicks)
+    ('app.routes.trading_skills', 'skills_bp', '/api/skills'),               # Trading Skills (38 skills)
+]
 
 
 def register_blueprints(app):
     """Register all Blueprints"""
-
-    # Common API routes
-    from app.routes.common import common_bp
-    app.register_blueprint(common_bp, url_prefix='/api')
-
-    # KR Market routes
-    from app.routes.kr_market import kr_bp
-    app.register_blueprint(kr_bp, url_prefix='/api/kr')
-
-    # US Market routes
-    from app.routes.us_market import us_bp
-    app.register_blueprint(us_bp, url_prefix='/api/us')
-
-    # Crypto routes
-    from app.routes.crypto import crypto_bp
-    app.register_blueprint(crypto_bp, url_prefix='/api/crypto')
-
-    # Economy routes
-    from app.routes.econ import econ_bp
-    app.register_blueprint(econ_bp, url_prefix='/api/econ')
-
-    # Dividend routes
-    from app.routes.dividend import dividend_bp
-    app.register_blueprint(dividend_bp, url_prefix='/api/dividend')
-
-    # Auth routes
-    from app.routes.auth import auth_bp
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-
-    # Admin routes (관리자 전용)
-    from app.routes.admin import admin_bp
-    app.register_blueprint(admin_bp, url_prefix='/api/admin')
-
-    # Stripe routes
-    from app.routes.stripe_routes import stripe_bp
-    app.register_blueprint(stripe_bp, url_prefix='/api/stripe')
-
-    # Stock Analyzer routes (Investing.com ProPicks)
-    from app.routes.stock_analyzer import stock_analyzer_bp
-    app.register_blueprint(stock_analyzer_bp, url_prefix='/api/stock-analyzer')
-
-    # Trading Skills routes (38 skills from claude-trading-skills)
-    from app.routes.trading_skills import skills_bp
-    app.register_blueprint(skills_bp, url_prefix='/api/skills')
+    import_ms = {}
+    for module_name, attr, url_prefix in BLUEPRINTS:
+        start = time.perf_counter()
+        blueprint = getattr(import_module(module_name), attr)
+        import_ms[module_name] = round((time.perf_counter() - start) * 1000, 1)
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
+    app.extensions['blueprint_import_ms'] = import_ms
 
     print("[OK] All Blueprints registered (KR + US + Crypto + Econ + Dividend + Auth + Admin + Stripe + StockAnalyzer + Skills)")
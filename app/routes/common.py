@@ -4,13 +4,17 @@
 import os
 import json
 import traceback
-import pandas as pd
-import yfinance as yf
+import csv
 import sys
 import subprocess
 from flask import Blueprint, jsonify, request, Response, stream_with_context
 
 from app.utils.cache import get_sector, SECTOR_MAP
+from app.utils.lazy_import import lazy_module
+
+# 무거운 모듈은 첫 사용 시 import (워커 부팅 시간/RSS 절감)
+pd = lazy_module('pandas')
+yf = lazy_module('yfinance')
 
 common_bp = Blueprint('common', __name__)
 
@@ -28,11 +32,11 @@ try:
         map_path = os.path.join(_DATA_DIR, 'ticker_to_yahoo_map.csv')
 
     try:
-        map_df = pd.read_csv(map_path, dtype=str)
+        with open(map_path, 'r', encoding='utf-8-sig', newline='') as f:
+            TICKER_TO_YAHOO_MAP = {row['ticker']: row['yahoo_ticker'] for row in csv.DictReader(f)}
     except FileNotFoundError:
         print(f"Error loading ticker map: {map_path} not found")
-        map_df = pd.DataFrame()
-    TICKER_TO_YAHOO_MAP = dict(zip(map_df['ticker'], map_df['yahoo_ticker']))
+        TICKER_TO_YAHOO_MAP = {}
     print(f"Loaded {len(TICKER_TO_YAHOO_MAP)} verified ticker mappings.")
 except Exception as e:
     print(f"Error loading ticker map: {e}")
@@ -693,97 +697,59 @@ def update_single_data():
     
     config = update_commands[data_type]
     
-    def generate():
-        yield f"data: [SYSTEM] Starting {config['name']} update...\n\n"
-        
-        try:
-            # For jongga_v2, use inline script to call run_screener
-            if data_type == 'jongga_v2':
-                script_code = '''
+    def _work(job):
+        job.log(f"[SYSTEM] Starting {config['name']} update...")
+
+        # For jongga_v2, use inline script to call run_screener
+        if data_type == 'jongga_v2':
+            script_code = '''
 import asyncio
 import sys
 sys.path.insert(0, '.')
 from engine.generator import run_screener
 asyncio.run(run_screener(capital=50_000_000))
 '''
-                cmd = [sys.executable, '-u', '-c', script_code]
-            else:
-                script_path = config['script']
-                if not os.path.exists(script_path):
-                    yield f"data: [ERROR] Script not found: {script_path}\n\n"
-                    yield "event: end\ndata: close\n\n"
-                    return
-                cmd = [sys.executable, '-u', script_path] + config.get('args', [])
-            
-            env = os.environ.copy()
-            # 현재 실행 중인 파이썬의 라이브러리 경로들을 포함
-            site_packages = [
-                os.getcwd(),
-                *sys.path
-            ]
-            env['PYTHONPATH'] = os.pathsep.join(site_packages)
-            env['PYTHONUNBUFFERED'] = '1'  # Force unbuffered output
-            env['KR_MARKET_DIR'] = os.getcwd()  # Set scheduler base directory
-            
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=False,  # Binary mode to avoid Windows cp949 issues
-                env=env,
-                bufsize=0  # Unbuffered
-            )
-            
-            # Read character by character to handle \r properly
-            buffer = b""  # Binary buffer
-            last_progress_line = ""
-            
-            while True:
-                char = process.stdout.read(1)
-                if not char:
-                    break
-                    
-                if char == b'\n':
-                    # Normal newline - send the line
-                    try:
-                        clean_line = buffer.decode('utf-8', errors='replace').strip()
-                        if clean_line:
-                            yield f"data: {clean_line}\n\n"
-                    except Exception:
-                        pass
-                    buffer = b""
-                elif char == b'\r':
-                    # Carriage return (progress bar update)
-                    try:
-                        clean_line = buffer.decode('utf-8', errors='replace').strip()
-                        if clean_line and clean_line != last_progress_line:
-                            yield f"data: {clean_line}\n\n"
-                            last_progress_line = clean_line
-                    except Exception:
-                        pass
-                    buffer = b""
-                else:
-                    buffer += char
-            
-            # Flush remaining buffer
-            if buffer.strip():
-                try:
-                    yield f"data: {buffer.decode('utf-8', errors='replace').strip()}\n\n"
-                except Exception:
-                    pass
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                yield f"data: [SYSTEM] {config['name']} update completed successfully.\n\n"
-            else:
-                yield f"data: [SYSTEM] {config['name']} update failed (exit code: {process.returncode})\n\n"
-                
-        except Exception as e:
-            yield f"data: [ERROR] Failed: {str(e)}\n\n"
-        
-        yield "event: end\ndata: close\n\n"
-    
+            cmd = [sys.executable, '-u', '-c', script_code]
+        else:
+            script_path = config['script']
+            if not os.path.exists(script_path):
+                raise FileNotFoundError(f"Script not found: {script_path}")
+            cmd = [sys.executable, '-u', script_path] + config.get('args', [])
+
+        env = os.environ.copy()
+        # 현재 실행 중인 파이썬의 라이브러리 경로들을 포함
+        env['PYTHONPATH'] = os.pathsep.join([_BASE_DIR, *sys.path])
+        env['PYTHONUNBUFFERED'] = '1'  # Force unbuffered output
+        env['PYTHONIOENCODING'] = 'utf-8'
+        env['KR_MARKET_DIR'] = _BASE_DIR  # Set scheduler base directory
+
+        exit_code = job.run_subprocess(cmd, cwd=_BASE_DIR, env=env, timeout=1800)
+        if exit_code == 0:
+            job.log(f"[SYSTEM] {config['name']} update completed successfully.")
+        else:
+            job.log(f"[SYSTEM] {config['name']} update failed (exit code: {exit_code})")
+            raise RuntimeError(f"exit code {exit_code}")
+        return {'type': data_type, 'exit_code': exit_code}
+
+    # 백그라운드 작업으로 실행하고, 이 연결은 작업 로그만 구독 (끊겨도 작업은 계속)
+    from app.utils.jobs import get_job_manager, job_sse_stream, QueueFullError
+    try:
+        job, _ = get_job_manager().submit(f'update-single:{data_type}', _work, kind='update_single')
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 429
+
+    def generate():
+        yield f"event: job\ndata: {json.dumps({'job_id': job.id})}\n\n"
+        for event in job_sse_stream(job):
+            if event.startswith('event: status'):
+                # 프론트 호환: 종료 시 {"status": "completed"} 이벤트
+                if job.done:
+                    yield f"event: status\ndata: {json.dumps({'status': 'completed', 'result': job.status})}\n\n"
+                continue
+            if event.startswith('event: end') and job.error:
+                yield f"data: [ERROR] Failed: {job.error}\n\n"
+            yield event
+
     return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
 
@@ -1032,3 +998,54 @@ def data_version():
     import time
     return jsonify({'versions': versions, 'timestamp': time.time()})
 
+
+# ============================================================
+# 백그라운드 작업 (POST 트리거 파이프라인)
+# ============================================================
+
+@common_bp.route('/jobs')
+def list_jobs():
+    """백그라운드 작업 목록 (최신순)"""
+    from app.utils.jobs import get_job_manager
+    manager = get_job_manager()
+    return jsonify({
+        'jobs': [j.to_dict(log_tail=0) for j in manager.list_jobs()],
+        'max_workers': manager.max_workers,
+    })
+
+
+@common_bp.route('/jobs/<job_id>')
+def get_job(job_id):
+    """작업 상태/결과 폴링"""
+    from app.utils.jobs import get_job_manager
+    job = get_job_manager().get(job_id)
+    if not job:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    resp = jsonify(job.to_dict(log_tail=request.args.get('log_tail', 50, type=int)))
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp
+
+
+@common_bp.route('/jobs/<job_id>/stream')
+def stream_job(job_id):
+    """작업 로그 SSE 스트리밍"""
+    from app.utils.jobs import get_job_manager, job_sse_stream
+    job = get_job_manager().get(job_id)
+    if not job:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    return Response(stream_with_context(job_sse_stream(job)), mimetype='text/event-stream')
+
+
+@common_bp.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """작업 취소"""
+    from app.utils.jobs import get_job_manager
+    manager = get_job_manager()
+    job = manager.get(job_id)
+    if not job:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    cancelled = manager.cancel(job_id)
+    if not cancelled and not job.done:
+        return jsonify({'cancelled': False, 'error': 'Running job cannot be cancelled',
+                        'job': job.to_dict(log_tail=0)}), 409
+    return jsonify({'cancelled': cancelled, 'job': job.to_dict(log_tail=0)})
@@ -6,9 +6,13 @@ import sys
 import json
 import traceback
 from datetime import datetime, date
-import pandas as pd
 from flask import Blueprint, jsonify, request, current_app
 
+from app.utils.lazy_import import lazy_module
+
+# 무거운 모듈은 첫 사용 시 import (워커 부팅 시간/RSS 절감)
+pd = lazy_module('pandas')
+
 kr_bp = Blueprint('kr', __name__)
 
 # ── 고정 경로 ──────────────────────────────────────────────
@@ -26,34 +30,26 @@ if _BASE_DIR not in sys.path:
 def get_kr_market_status():
     """한국 시장 상태"""
     try:
-        prices_path = os.path.join(DATA_DIR, 'daily_prices.csv')
-        if not os.path.exists(prices_path):
-            return jsonify({'status': 'UNKNOWN', 'reason': 'No price data'}), 404
-            
-        df = pd.read_csv(prices_path, dtype={'ticker': str})
+        from app.utils.price_store import get_ticker_prices
+
         target_ticker = '069500'
         target_name = 'KODEX 200'
-        
-        market_df = df[df['ticker'] == target_ticker].copy()
-        
+
+        market_df = get_ticker_prices(DATA_DIR, target_ticker)
+        if market_df is None:
+            return jsonify({'status': 'UNKNOWN', 'reason': 'No price data'}), 404
+
         if market_df.empty:
             target_ticker = '005930'
             target_name = 'Samsung Elec'
-            market_df = df[df['ticker'] == target_ticker].copy()
-            
+            market_df = get_ticker_prices(DATA_DIR, target_ticker)
+
         if market_df.empty:
             return jsonify({'status': 'UNKNOWN', 'reason': 'Market proxy data not found'}), 404
-             
-        market_df['date'] = pd.to_datetime(market_df['date'])
-        market_df = market_df.sort_values('date')
-        
+
         if len(market_df) < 200:
             return jsonify({'status': 'NEUTRAL', 'reason': 'Insufficient data'}), 200
-             
-        market_df['MA20'] = market_df['current_price'].rolling(20).mean()
-        market_df['MA50'] = market_df['current_price'].rolling(50).mean()
-        market_df['MA200'] = market_df['current_price'].rolling(200).mean()
-        
+
         last = market_df.iloc[-1]
         price = last['current_price']
         ma20 = last['MA20']
@@ -259,38 +255,41 @@ def get_vcp_history():
             df = df[df['signal_date'] >= cutoff]
             df = df.sort_values('signal_date', ascending=False)
 
-        signals = []
-        for idx, row in df.iterrows():
-            ticker = str(row.get('ticker', '')).zfill(6)
-            entry_price = float(row.get('entry_price', 0))
-            exit_price = float(row.get('exit_price', 0)) if pd.notna(row.get('exit_price')) else None
-            return_pct = float(row.get('return_pct', 0)) if pd.notna(row.get('return_pct')) else None
-            hold_days = int(row.get('hold_days', 0)) if pd.notna(row.get('hold_days')) else None
-            status = str(row.get('status', 'OPEN'))
-
-            # CSV에 name/market 컬럼이 없거나 비어있으면 ticker_map에서 조회
-            csv_name = str(row.get('name', '')).strip() if pd.notna(row.get('name')) else ''
-            csv_market = str(row.get('market', '')).strip() if pd.notna(row.get('market')) else ''
-
-            signals.append({
-                'id': int(idx),
-                'ticker': ticker,
-                'name': csv_name or name_map.get(ticker, ticker),
-                'market': csv_market or market_map.get(ticker, ''),
-                'signalDate': row['signal_date'].strftime('%m월 %d일') if hasattr(row['signal_date'], 'strftime') else str(row['signal_date']),
-                'foreign5d': int(row.get('foreign_5d', 0)) if pd.notna(row.get('foreign_5d')) else 0,
-                'inst5d': int(row.get('inst_5d', 0)) if pd.notna(row.get('inst_5d')) else 0,
-                'score': float(row.get('score', 0)) if pd.notna(row.get('score')) else 0,
-                'contractionRatio': float(row.get('contraction_ratio', 0)) if pd.notna(row.get('contraction_ratio')) else 0,
-                'entryPrice': entry_price,
-                'status': status,
-                'exitPrice': exit_price,
-                'exitDate': str(row.get('exit_date', '')) if pd.notna(row.get('exit_date')) else None,
-                'returnPct': return_pct,
-                'holdDays': hold_days,
-            })
-
-        return jsonify({
+        def _iter_signals():
+            for idx, row in df.iterrows():
+                ticker = str(row.get('ticker', '')).zfill(6)
+                entry_price = float(row.get('entry_price', 0))
+                exit_price = float(row.get('exit_price', 0)) if pd.notna(row.get('exit_price')) else None
+                return_pct = float(row.get('return_pct', 0)) if pd.notna(row.get('return_pct')) else None
+                hold_days = int(row.get('hold_days', 0)) if pd.notna(row.get('hold_days')) else None
+                status = str(row.get('status', 'OPEN'))
+
+                # CSV에 name/market 컬럼이 없거나 비어있으면 ticker_map에서 조회
+                csv_name = str(row.get('name', '')).strip() if pd.notna(row.get('name')) else ''
+                csv_market = str(row.get('market', '')).strip() if pd.notna(row.get('market')) else ''
+
+                yield {
+                    'id': int(idx),
+                    'ticker': ticker,
+                    'name': csv_name or name_map.get(ticker, ticker),
+                    'market': csv_market or market_map.get(ticker, ''),
+                    'signalDate': row['signal_date'].strftime('%m월 %d일') if hasattr(row['signal_date'], 'strftime') else str(row['signal_date']),
+                    'foreign5d': int(row.get('foreign_5d', 0)) if pd.notna(row.get('foreign_5d')) else 0,
+                    'inst5d': int(row.get('inst_5d', 0)) if pd.notna(row.get('inst_5d')) else 0,
+                    'score': float(row.get('score', 0)) if pd.notna(row.get('score')) else 0,
+                    'contractionRatio': float(row.get('contraction_ratio', 0)) if pd.notna(row.get('contraction_ratio')) else 0,
+                    'entryPrice': entry_price,
+                    'status': status,
+                    'exitPrice': exit_price,
+                    'exitDate': str(row.get('exit_date', '')) if pd.notna(row.get('exit_date')) else None,
+                    'returnPct': return_pct,
+                    'holdDays': hold_days,
+                }
+
+        # 행 변환은 응답 전에 끝내서 도중 예외가 잘린 JSON(200) 대신 500으로 가도록 하고,
+        # 직렬화만 청크 단위로 스트리밍
+        signals = list(_iter_signals())
+        return current_app.json.stream_response({
             'signals': signals,
             'count': len(signals),
             'days': days,
@@ -374,34 +373,27 @@ def get_vcp_stats():
 def get_kr_stock_chart(ticker):
     """KR 종목 차트 데이터 (실시간 포함)"""
     try:
-        # Load from daily_prices.csv
-        prices_path = os.path.join(DATA_DIR, 'daily_prices.csv')
-        if not os.path.exists(prices_path):
-            return jsonify({'error': 'Price data not found'}), 404
-        
-        df = pd.read_csv(prices_path, dtype={'ticker': str})
+        from app.utils.price_store import get_ticker_prices
+
         ticker_padded = str(ticker).zfill(6)
-        stock_df = df[df['ticker'] == ticker_padded].copy()
-        
-        if stock_df.empty:
+        # Optimization: Take last 300 rows to ensure we have enough history but not too much payload
+        history_df = get_ticker_prices(DATA_DIR, ticker_padded, tail=300)
+        if history_df is None:
+            return jsonify({'error': 'Price data not found'}), 404
+
+        if history_df.empty:
             return jsonify({'error': 'Ticker not found'}), 404
-        
-        stock_df['date'] = pd.to_datetime(stock_df['date'])
-        stock_df = stock_df.sort_values('date')
-        
+
         # Prepare chart data from history
         chart_data = []
-        # Optimization: Take last 300 rows to ensure we have enough history but not too much payload
-        history_df = stock_df.tail(300)
-        
         for _, row in history_df.iterrows():
             chart_data.append({
                 'date': row['date'].strftime('%Y-%m-%d'),
-                'open': float(row.get('open', row['current_price'])),
-                'high': float(row.get('high', row['current_price'])),
-                'low': float(row.get('low', row['current_price'])),
+                'open': float(row['open']),
+                'high': float(row['high']),
+                'low': float(row['low']),
                 'close': float(row['current_price']),
-                'volume': int(row.get('volume', 0))
+                'volume': int(row['volume']) if pd.notna(row['volume']) else 0
             })
 
         # Check if we need to append today's real-time data
@@ -543,30 +535,46 @@ def get_kr_performance():
         return jsonify({'error': str(e)}), 500
 
 
+def _submit_job(key: str, fn, *args, kind: str = None):
+    """백그라운드 작업 등록 후 즉시 202 응답 (진행 중이면 기존 작업 반환)
+
+    여기 작업들은 프로세스 안에서 한 번에 실행돼 취소 지점이 없으므로 시작 후에는 취소 불가
+    """
+    from app.utils.jobs import get_job_manager, QueueFullError
+    try:
+        job, created = get_job_manager().submit(key, fn, *args, kind=kind, cancellable=False)
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 429
+    payload = job.to_dict(log_tail=0)
+    payload['created'] = created
+    payload['poll_url'] = f"/api/jobs/{job.id}"
+    return jsonify(payload), 202
+
+
+def _vcp_scan_job(job):
+    from scheduler import run_vcp_signal_scan
+    if not run_vcp_signal_scan():
+        raise RuntimeError('VCP scan failed')
+    return {'status': 'success'}
+
+
+def _full_update_job(job):
+    from scheduler import run_full_update
+    if not run_full_update():
+        raise RuntimeError('Full update finished with failures')
+    return {'status': 'success'}
+
+
 @kr_bp.route('/vcp-scan', methods=['POST'])
 def kr_vcp_scan():
-    """VCP 스캔 실행"""
-    try:
-        from scheduler import run_vcp_scan
-        
-        result = run_vcp_scan()
-        return jsonify(result)
-    except Exception as e:
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+    """VCP 스캔 실행 (백그라운드 작업)"""
+    return _submit_job('kr-vcp-scan', _vcp_scan_job, kind='kr_vcp_scan')
 
 
 @kr_bp.route('/update', methods=['POST'])
 def kr_update():
-    """KR 데이터 업데이트"""
-    try:
-        from scheduler import run_full_update
-        
-        result = run_full_update()
-        return jsonify(result)
-    except Exception as e:
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+    """KR 데이터 업데이트 (백그라운드 작업)"""
+    return _submit_job('kr-update', _full_update_job, kind='kr_update')
 
 
 
@@ -634,16 +642,15 @@ def kr_market_gate():
         traceback.print_exc()
         # Fallback to simple logic if enhanced fails
         try:
-            prices_path = os.path.join(DATA_DIR, 'daily_prices.csv')
-            if not os.path.exists(prices_path):
+            from app.utils.price_store import get_ticker_prices
+
+            market_df = get_ticker_prices(DATA_DIR, '069500')
+            if market_df is None:
                 return jsonify({'status': 'NEUTRAL', 'score': 50, 'sectors': []})
-            
-            df = pd.read_csv(prices_path, dtype={'ticker': str})
-            market_df = df[df['ticker'] == '069500'].copy()
-            
+
             if not market_df.empty and len(market_df) > 200:
                 last_price = market_df.iloc[-1]['current_price']
-                ma200 = market_df['current_price'].rolling(200).mean().iloc[-1]
+                ma200 = market_df.iloc[-1]['MA200']
                 
                 score = 80 if last_price > ma200 else 20
                 status = "RISK_ON" if last_price > ma200 else "RISK_OFF"
@@ -856,26 +863,10 @@ def get_jongga_v2_latest():
 def get_jongga_v2_dates():
     """데이터가 존재하는 날짜 목록 조회 (빈 파일 제외)"""
     try:
-        data_dir = DATA_DIR
-        # jongga_v2_results_YYYYMMDD.json 패턴 검색
-        import glob
-        files = glob.glob(os.path.join(data_dir, 'jongga_v2_results_*.json'))
+        from engine.history_index import list_signal_dates
 
-        dates = []
-        for f in files:
-            # 파일명에서 날짜 추출 (jongga_v2_results_20240115.json)
-            basename = os.path.basename(f)
-            if len(basename) >= 26:  # 최소 길이 체크
-                input_date = basename[18:26]  # 20240115
-
-                # 빈 파일(0 시그널 = 휴장일) 제외: 500바이트 미만이면 데이터 없음
-                if os.path.getsize(f) < 500:
-                    continue
-
-                formatted = f"{input_date[:4]}-{input_date[4:6]}-{input_date[6:]}"
-                dates.append(formatted)
-
-        dates.sort(reverse=True)  # 최신순 정렬
+        # 인덱스 기반 (변경된 날짜 파일만 다시 읽음), 빈 파일(0 시그널 = 휴장일) 제외
+        dates = [f"{d[:4]}-{d[4:6]}-{d[6:]}" for d in list_signal_dates(DATA_DIR)]
         return jsonify(dates)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -907,52 +898,49 @@ def get_jongga_v2_history(date_str):
         print(f"Error reading historical data: {e}")
         return jsonify({"error": str(e)}), 500
 
+def _analyze_single_stock_job(job, code):
+    import asyncio
+    from engine.generator import analyze_single_stock_by_code
+
+    job.log(f"Re-analyzing {code}...")
+    result = asyncio.run(analyze_single_stock_by_code(code))
+    if not result:
+        raise RuntimeError('Analysis failed or no signal generated')
+    return {"status": "success", "signal": result.to_dict()}
+
+
+def _run_jongga_v2_job(job):
+    import asyncio
+    from engine.generator import run_screener
+
+    job.log("Jongga V2 screener started")
+    # 5천만원 기본 자본금으로 실행
+    result = asyncio.run(run_screener(capital=50_000_000))
+    return {
+        "status": "success",
+        "date": result.date.isoformat(),
+        "filtered_count": result.filtered_count,
+        "processing_time": result.processing_time_ms
+    }
+
+
 @kr_bp.route('/jongga-v2/analyze', methods=['POST'])
 def analyze_single_stock():
     """
-    단일 종목 재분석 요청
+    단일 종목 재분석 요청 (백그라운드 작업 — 결과는 /api/jobs/<job_id>)
     """
-    try:
-        req_data = request.get_json()
-        code = req_data.get('code')
-        
-        if not code:
-            return jsonify({"error": "Stock code is required"}), 400
-            
-        # Async 함수 실행을 위한 처리
-        import asyncio
-        from engine.generator import analyze_single_stock_by_code
-        
-        result = asyncio.run(analyze_single_stock_by_code(code))
-        
-        if result:
-            return jsonify({"status": "success", "signal": result.to_dict()})
-        else:
-            return jsonify({"status": "failed", "message": "Analysis failed or no signal generated"}), 500
-            
-    except Exception as e:
-        print(f"Error re-analyzing stock {code}: {e}")
-        return jsonify({"error": str(e)}), 500
+    req_data = request.get_json() or {}
+    code = req_data.get('code')
+
+    if not code:
+        return jsonify({"error": "Stock code is required"}), 400
+
+    return _submit_job(f'jongga-v2-analyze:{code}', _analyze_single_stock_job, code,
+                       kind='jongga_v2_analyze')
 
 @kr_bp.route('/jongga-v2/run', methods=['POST'])
 def run_jongga_v2():
     """
-    전체 종가베팅 v2 엔진 실행 (배치)
+    전체 종가베팅 v2 엔진 실행 (배치, 백그라운드 작업 — 결과는 /api/jobs/<job_id>)
     """
-    try:
-        from engine.generator import run_screener
-        import asyncio
-        
-        # 5천만원 기본 자본금으로 실행
-        result = asyncio.run(run_screener(capital=50_000_000))
-        
-        return jsonify({
-            "status": "success",
-            "date": result.date.isoformat(),
-            "filtered_count": result.filtered_count,
-            "processing_time": result.processing_time_ms
-        })
-        
-    except Exception as e:
-        print(f"Error running Jongga V2 engine: {e}")
-        return jsonify({"error": str(e)}), 500
+    return _submit_job('jongga-v2-run', _run_jongga_v2_job, kind='jongga_v2_run')
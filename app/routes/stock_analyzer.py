@@ -11,11 +11,15 @@
 import os
 import time
 import logging
-import pandas as pd
 from io import BytesIO
 from flask import Blueprint, jsonify, request, send_file
 from datetime import datetime
 
+from app.utils.lazy_import import lazy_module
+
+# 무거운 모듈은 첫 사용 시 import (워커 부팅 시간/RSS 절감)
+pd = lazy_module('pandas')
+
 logger = logging.getLogger('stock_analyzer')
 
 stock_analyzer_bp = Blueprint('stock_analyzer', __name__)
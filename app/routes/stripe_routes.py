@@ -1,7 +1,6 @@
 """Stripe payment routes"""
 
 import os
-import stripe
 from flask import Blueprint, request, jsonify
 from app.models import db
 from app.models.user import User
@@ -11,16 +10,23 @@ stripe_bp = Blueprint('stripe', __name__)
 
 # Stripe 설정 (키가 없으면 결제 기능 비활성화)
 _stripe_key = os.getenv('STRIPE_SECRET_KEY', '')
-if _stripe_key and not _stripe_key.startswith('pk_'):
-    stripe.api_key = _stripe_key
 STRIPE_WEBHOOK_SECRET = os.getenv('STRIPE_WEBHOOK_SECRET', '')
 STRIPE_PRICE_ID = os.getenv('STRIPE_PRICE_ID', '')
 
 
+def _stripe():
+    """stripe SDK — 부팅 시간 절감을 위해 첫 결제 요청 때 import + API 키 설정"""
+    import stripe
+    if _stripe_key and not _stripe_key.startswith('pk_') and not stripe.api_key:
+        stripe.api_key = _stripe_key
+    return stripe
+
+
 @stripe_bp.route('/create-checkout', methods=['POST'])
 @login_required
 def create_checkout():
     user = request.current_user
+    stripe = _stripe()
     try:
         # Create or reuse Stripe customer
         if not user.stripe_customer_id:
@@ -49,6 +55,7 @@ def create_checkout():
 def webhook():
     payload = request.get_data()
     sig = request.headers.get('Stripe-Signature', '')
+    stripe = _stripe()
 
     try:
         event = stripe.Webhook.construct_event(payload, sig, STRIPE_WEBHOOK_SECRET)
@@ -84,6 +91,7 @@ def portal():
     user = request.current_user
     if not user.stripe_customer_id:
         return jsonify({'error': 'No subscription found'}), 404
+    stripe = _stripe()
     try:
         session = stripe.billing_portal.Session.create(
             customer=user.stripe_customer_id,
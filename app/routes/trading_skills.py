@@ -8,8 +8,6 @@ This blueprint reads the latest report for each skill and serves via API.
 import os
 import json
 import glob
-import subprocess
-import threading
 import time
 from datetime import datetime
 from flask import Blueprint, jsonify
@@ -180,27 +178,19 @@ def skill_report(skill_name):
     return jsonify(report)
 
 
-@skills_bp.route('/run/<skill_name>', methods=['POST'])
-def run_skill(skill_name):
-    """Trigger a skill execution (async)."""
-    if skill_name not in SKILLS_CATALOG:
-        return jsonify({'error': f'Unknown skill: {skill_name}'}), 404
-
-    meta = SKILLS_CATALOG[skill_name]
-    if not meta['script']:
-        return jsonify({'error': f'Skill {skill_name} has no script (prompt-only)'}), 400
-
-    if skill_name in _running_skills:
-        return jsonify({'status': 'already_running', 'skill': skill_name}), 409
+def _build_skill_cmd(skill_name: str):
+    """스킬 실행 명령 생성. 실행 불가 시 (None, reason) 반환"""
+    meta = SKILLS_CATALOG.get(skill_name, {})
+    if not meta.get('script'):
+        return None, 'prompt-only'
 
     cli_flags = meta.get('cli_flags', {})
     if cli_flags.get('needs_input'):
-        return jsonify({'error': f'Skill {skill_name} requires input data (not auto-runnable)'}), 400
+        return None, 'needs_input'
 
-    # Build command
     script_path = os.path.join(_SKILLS_DIR, skill_name, 'scripts', meta['script'])
     if not os.path.isfile(script_path):
-        return jsonify({'error': f'Script not found: {meta["script"]}'}), 404
+        return None, 'script_not_found'
 
     output_dir = os.path.join(_REPORTS_DIR, skill_name)
     os.makedirs(output_dir, exist_ok=True)
@@ -222,43 +212,67 @@ def run_skill(skill_name):
             api_flag = cli_flags.get('api_flag', '--api-key')
             cmd.extend([api_flag, api_key])
 
-    # Run in background thread
-    def _execute():
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        exit_code = -1
-        try:
-            proc = subprocess.Popen(
-                cmd, cwd=_BASE_DIR, env=env,
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-            _running_skills[skill_name] = {
-                'started_at': datetime.now().isoformat(),
-                'pid': proc.pid,
-            }
-            proc.wait(timeout=600)  # 10 min timeout
-            exit_code = proc.returncode
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            exit_code = -2  # timeout
-        except Exception:
-            pass
-        finally:
-            _running_skills.pop(skill_name, None)
-            _recent_results[skill_name] = {
-                'finished_at': datetime.now().isoformat(),
-                'success': exit_code == 0,
-                'exit_code': exit_code,
-            }
+    return cmd, None
+
+
+def _skill_job(job, skill_name: str, cmd: list):
+    """백그라운드 작업: 스킬 스크립트 실행 (10분 타임아웃)"""
+    env = os.environ.copy()
+    env['PYTHONIOENCODING'] = 'utf-8'
+    _running_skills[skill_name] = {
+        'started_at': datetime.now().isoformat(),
+        'job_id': job.id,
+    }
+    exit_code = -1
+    try:
+        exit_code = job.run_subprocess(cmd, cwd=_BASE_DIR, env=env, timeout=600)
+    finally:
+        _running_skills.pop(skill_name, None)
+        _recent_results[skill_name] = {
+            'finished_at': datetime.now().isoformat(),
+            'success': exit_code == 0,
+            'exit_code': exit_code,
+        }
+    if exit_code != 0:
+        raise RuntimeError(f'{skill_name} exit code {exit_code}')
+    return {'skill': skill_name, 'exit_code': exit_code}
+
+
+def _submit_skill(skill_name: str, cmd: list):
+    from app.utils.jobs import get_job_manager
+    return get_job_manager().submit(f'skill:{skill_name}', _skill_job, skill_name, cmd, kind='skill')
+
+
+@skills_bp.route('/run/<skill_name>', methods=['POST'])
+def run_skill(skill_name):
+    """Trigger a skill execution (async job)."""
+    from app.utils.jobs import QueueFullError
+
+    if skill_name not in SKILLS_CATALOG:
+        return jsonify({'error': f'Unknown skill: {skill_name}'}), 404
 
-    thread = threading.Thread(target=_execute, daemon=True, name=f'skill-{skill_name}')
-    thread.start()
+    cmd, reason = _build_skill_cmd(skill_name)
+    if reason == 'prompt-only':
+        return jsonify({'error': f'Skill {skill_name} has no script (prompt-only)'}), 400
+    if reason == 'needs_input':
+        return jsonify({'error': f'Skill {skill_name} requires input data (not auto-runnable)'}), 400
+    if reason == 'script_not_found':
+        return jsonify({'error': f'Script not found: {SKILLS_CATALOG[skill_name]["script"]}'}), 404
+
+    try:
+        job, created = _submit_skill(skill_name, cmd)
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 429
+
+    if not created:
+        return jsonify({'status': 'already_running', 'skill': skill_name, 'job_id': job.id}), 409
 
     return jsonify({
         'status': 'started',
         'skill': skill_name,
-        'output_dir': output_dir,
-    })
+        'job_id': job.id,
+        'output_dir': os.path.join(_REPORTS_DIR, skill_name),
+    }), 202
 
 
 @skills_bp.route('/status')
@@ -838,83 +852,38 @@ def chain_results(chain_id):
 
 @skills_bp.route('/chain/<chain_id>/run', methods=['POST'])
 def run_chain(chain_id):
-    """Run all executable skills in a workflow chain sequentially."""
+    """Queue all executable skills in a workflow chain (bounded job pool)."""
+    from app.utils.jobs import QueueFullError
+
     if chain_id not in WORKFLOW_CHAINS:
         return jsonify({'error': f'Unknown chain: {chain_id}'}), 404
 
     chain = WORKFLOW_CHAINS[chain_id]
     started = []
     skipped = []
+    jobs = {}
 
     for skill_name in chain['skills']:
-        meta = SKILLS_CATALOG.get(skill_name, {})
-        if not meta.get('script'):
-            skipped.append({'id': skill_name, 'reason': 'prompt-only'})
-            continue
-        cli_flags = meta.get('cli_flags', {})
-        if cli_flags.get('needs_input'):
-            skipped.append({'id': skill_name, 'reason': 'needs_input'})
-            continue
-        if skill_name in _running_skills:
-            skipped.append({'id': skill_name, 'reason': 'already_running'})
+        cmd, reason = _build_skill_cmd(skill_name)
+        if reason:
+            skipped.append({'id': skill_name, 'reason': reason})
             continue
 
-        script_path = os.path.join(_SKILLS_DIR, skill_name, 'scripts', meta['script'])
-        if not os.path.isfile(script_path):
-            skipped.append({'id': skill_name, 'reason': 'script_not_found'})
+        try:
+            job, created = _submit_skill(skill_name, cmd)
+        except QueueFullError:
+            skipped.append({'id': skill_name, 'reason': 'queue_full'})
             continue
 
-        output_dir = os.path.join(_REPORTS_DIR, skill_name)
-        os.makedirs(output_dir, exist_ok=True)
-
-        cmd = [_PYTHON, script_path]
-        if not cli_flags.get('no_output_dir'):
-            cmd.extend(['--output-dir', output_dir])
-        if cli_flags.get('auto_args'):
-            cmd.extend(cli_flags['auto_args'])
-        if meta.get('api_key'):
-            api_key_val = os.environ.get(meta['api_key'], '')
-            if api_key_val:
-                api_flag = cli_flags.get('api_flag', '--api-key')
-                cmd.extend([api_flag, api_key_val])
-
-        def _execute(sname, command):
-            env = os.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
-            exit_code = -1
-            try:
-                proc = subprocess.Popen(
-                    command, cwd=_BASE_DIR, env=env,
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                )
-                _running_skills[sname] = {
-                    'started_at': datetime.now().isoformat(),
-                    'pid': proc.pid,
-                }
-                proc.wait(timeout=600)
-                exit_code = proc.returncode
-            except subprocess.TimeoutExpired:
-                proc.kill()
-                exit_code = -2
-            except Exception:
-                pass
-            finally:
-                _running_skills.pop(sname, None)
-                _recent_results[sname] = {
-                    'finished_at': datetime.now().isoformat(),
-                    'success': exit_code == 0,
-                    'exit_code': exit_code,
-                }
-
-        thread = threading.Thread(
-            target=_execute, args=(skill_name, cmd),
-            daemon=True, name=f'chain-{chain_id}-{skill_name}'
-        )
-        thread.start()
+        jobs[skill_name] = job.id
+        if not created:
+            skipped.append({'id': skill_name, 'reason': 'already_running'})
+            continue
         started.append(skill_name)
 
     return jsonify({
         'chain': chain_id,
         'started': started,
         'skipped': skipped,
-    })
+        'jobs': jobs,
+    }), 202
@@ -5,11 +5,14 @@ import os
 import json
 import traceback
 from datetime import datetime
-import pandas as pd
-import yfinance as yf
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
 
 from app.utils.cache import get_sector
+from app.utils.lazy_import import lazy_module
+
+# 무거운 모듈은 첫 사용 시 import (워커 부팅 시간/RSS 절감)
+pd = lazy_module('pandas')
+yf = lazy_module('yfinance')
 
 us_bp = Blueprint('us', __name__)
 
@@ -364,204 +367,30 @@ def get_us_history_performance(date):
 
 @us_bp.route('/history-summary')
 def get_us_history_summary():
-    """전체 히스토리 성과 요약"""
+    """전체 히스토리 성과 요약 (track_record_aggregate.json 사전 집계)"""
     try:
-        import pandas as pd
-        import numpy as np
-
-        history_path = os.path.join(_HISTORY_DIR)
-        csv_path = os.path.join(_DATA_DIR, 'us_daily_prices.csv')
+        from us_market.track_record_store import get_track_record
 
-        if not os.path.exists(history_path) or not os.path.exists(csv_path):
+        payload = get_track_record(_US_MARKET_DIR, 'history_summary')
+        if payload is None:
             return jsonify({'error': 'Data not found'}), 404
 
-        # Load price data
-        df = pd.read_csv(csv_path)
-        latest_date = df['Date'].max()
-        latest_df = df[df['Date'] == latest_date]
-
-        # Process each history file
-        summaries = []
-        for f in os.listdir(history_path):
-            if f.startswith('picks_') and f.endswith('.json'):
-                date_str = f[6:-5]
-                history_file = os.path.join(history_path, f)
-
-                with open(history_file, 'r', encoding='utf-8') as hf:
-                    snapshot = json.load(hf)
-
-                # Calculate returns for this date's picks
-                changes = []
-                for pick in snapshot['picks']:
-                    ticker = pick['ticker']
-                    price_at_rec = pick.get('price_at_analysis', 0)
-                    row = latest_df[latest_df['Ticker'] == ticker]
-                    if not row.empty and price_at_rec > 0:
-                        current = float(row['Close'].iloc[0])
-                        change = ((current / price_at_rec) - 1) * 100
-                        changes.append(change)
-
-                if changes:
-                    # SPY benchmark
-                    spy_df = df[df['Ticker'] == 'SPY'].copy()
-                    spy_df = spy_df[spy_df['Date'] >= date_str].sort_values('Date')
-                    spy_return = 0.0
-                    if len(spy_df) >= 2:
-                        spy_return = ((spy_df['Close'].iloc[-1] / spy_df['Close'].iloc[0]) - 1) * 100
-
-                    avg_return = float(np.mean(changes))
-                    summaries.append({
-                        'date': date_str,
-                        'avg_return': round(avg_return, 2),
-                        'spy_return': round(spy_return, 2),
-                        'alpha': round(avg_return - spy_return, 2),
-                        'win_rate': round(len([c for c in changes if c > 0]) / len(changes) * 100, 1),
-                        'num_picks': len(changes)
-                    })
-
-        # Sort by date
-        summaries = sorted(summaries, key=lambda x: x['date'], reverse=True)
-
-        # Calculate overall stats
-        if summaries:
-            overall = {
-                'total_recommendations': sum(s['num_picks'] for s in summaries),
-                'avg_return_all': round(np.mean([s['avg_return'] for s in summaries]), 2),
-                'avg_alpha': round(np.mean([s['alpha'] for s in summaries]), 2),
-                'avg_win_rate': round(np.mean([s['win_rate'] for s in summaries]), 1),
-                'num_dates': len(summaries)
-            }
-        else:
-            overall = {}
-
-        return jsonify({
-            'overall': overall,
-            'by_date': summaries
-        })
+        return current_app.json.stream_response(payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @us_bp.route('/cumulative-performance')
 def get_us_cumulative_performance():
-    """누적 성과 (Cumulative Performance) - all picks across all snapshots"""
+    """누적 성과 (Cumulative Performance) - all picks across all snapshots (사전 집계)"""
     try:
-        import numpy as np
+        from us_market.track_record_store import get_track_record
 
-        history_path = os.path.join(_HISTORY_DIR)
-        csv_path = os.path.join(_DATA_DIR, 'us_daily_prices.csv')
-
-        if not os.path.exists(history_path) or not os.path.exists(csv_path):
-            return jsonify({'error': 'Data not found'}), 404
-
-        # Load price data - get latest price per ticker
-        df = pd.read_csv(csv_path)
-        latest_date = df['Date'].max()
-        latest_df = df[df['Date'] == latest_date]
-
-        # Get all snapshot dates first to determine SPY fetch range
-        snap_files = sorted([f for f in os.listdir(history_path)
-                             if f.startswith('picks_') and f.endswith('.json')])
-        if not snap_files:
+        payload = get_track_record(_US_MARKET_DIR, 'cumulative_performance')
+        if payload is None:
             return jsonify({'error': 'No history snapshots found'}), 404
 
-        earliest_date = snap_files[0][6:-5]  # picks_YYYY-MM-DD.json
-
-        # Fetch SPY via yfinance for benchmark
-        spy_hist = yf.Ticker('SPY').history(start=earliest_date, auto_adjust=True)
-        spy_prices = {}
-        if not spy_hist.empty:
-            for idx, row in spy_hist.iterrows():
-                spy_prices[idx.strftime('%Y-%m-%d')] = float(row['Close'])
-        spy_latest = spy_prices.get(max(spy_prices)) if spy_prices else None
-
-        all_picks = []
-        by_date = []
-
-        for f in snap_files:
-            date_str = f[6:-5]
-            with open(os.path.join(history_path, f), 'r', encoding='utf-8') as hf:
-                snapshot = json.load(hf)
-
-            date_picks = []
-            for pick in snapshot.get('picks', []):
-                ticker = pick.get('ticker', '')
-                entry_price = pick.get('price_at_analysis', 0)
-                row = latest_df[latest_df['Ticker'] == ticker]
-                if row.empty or entry_price <= 0:
-                    continue
-                current_price = safe_float(row['Close'].iloc[0])
-                return_pct = ((current_price / entry_price) - 1) * 100
-
-                all_picks.append({
-                    'ticker': ticker,
-                    'name': pick.get('name', ticker),
-                    'rec_date': date_str,
-                    'entry_price': round(entry_price, 2),
-                    'current_price': round(current_price, 2),
-                    'return_pct': round(return_pct, 2),
-                    'final_score': safe_float(pick.get('final_score', 0)),
-                    'recommendation': pick.get('ai_recommendation', ''),
-                })
-                date_picks.append(return_pct)
-
-            if not date_picks:
-                continue
-
-            # SPY benchmark: find nearest SPY close on or after snapshot date
-            spy_return = 0.0
-            if spy_prices and spy_latest is not None:
-                spy_dates_after = [d for d in sorted(spy_prices) if d >= date_str]
-                if spy_dates_after:
-                    spy_entry = spy_prices[spy_dates_after[0]]
-                    spy_return = ((spy_latest / spy_entry) - 1) * 100
-
-            avg_ret = float(np.mean(date_picks))
-            win_count = len([r for r in date_picks if r > 0])
-            by_date.append({
-                'date': date_str,
-                'avg_return': round(avg_ret, 2),
-                'spy_return': round(spy_return, 2),
-                'alpha': round(avg_ret - spy_return, 2),
-                'win_rate': round(win_count / len(date_picks) * 100, 1),
-                'num_picks': len(date_picks),
-            })
-
-        # Chart data (sorted chronologically)
-        chart_data = sorted(
-            [{'date': d['date'], 'avg_return': d['avg_return'], 'spy_return': d['spy_return']} for d in by_date],
-            key=lambda x: x['date']
-        )
-
-        # Sort by_date reverse chronological
-        by_date.sort(key=lambda x: x['date'], reverse=True)
-
-        # Summary
-        if all_picks:
-            returns = [p['return_pct'] for p in all_picks]
-            tickers = list({p['ticker'] for p in all_picks})
-            alphas = [d['alpha'] for d in by_date]
-            summary = {
-                'total_picks': len(all_picks),
-                'unique_tickers': len(tickers),
-                'win_rate': round(len([r for r in returns if r > 0]) / len(returns) * 100, 1),
-                'avg_return': round(float(np.mean(returns)), 2),
-                'avg_alpha': round(float(np.mean(alphas)), 2) if alphas else 0,
-                'max_gain': round(max(returns), 2),
-                'max_loss': round(min(returns), 2),
-                'best_ticker': max(all_picks, key=lambda p: p['return_pct'])['ticker'],
-                'worst_ticker': min(all_picks, key=lambda p: p['return_pct'])['ticker'],
-                'num_snapshots': len(by_date),
-            }
-        else:
-            summary = {}
-
-        return jsonify({
-            'summary': summary,
-            'chart_data': chart_data,
-            'picks': all_picks,
-            'by_date': by_date,
-        })
+        return jsonify(payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -589,33 +418,38 @@ def get_us_macro_analysis():
         return jsonify({'error': str(e)}), 500
 
 
+def build_sector_heatmap() -> dict:
+    """섹터 히트맵 응답 생성 (라우트 + 대시보드 스냅샷 공용)"""
+    heatmap_path = os.path.join(_OUTPUT_DIR, 'sector_heatmap.json')
+    if not os.path.exists(heatmap_path):
+        return {'sectors': [], 'series': []}
+
+    with open(heatmap_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    # sector_groups → series 변환 (프론트엔드 SectorSeries[] 호환)
+    if 'sector_groups' in data and 'series' not in data:
+        series = []
+        for sector_name, stocks in data['sector_groups'].items():
+            items = []
+            for s in stocks:
+                items.append({
+                    'x': s.get('ticker', s.get('symbol', '')),
+                    'y': s.get('weight', s.get('market_cap', 0)),
+                    'price': s.get('price', 0),
+                    'change': s.get('change_pct', s.get('change', 0)),
+                    'color': ''
+                })
+            series.append({'name': sector_name, 'data': items})
+        data['series'] = series
+    return data
+
+
 @us_bp.route('/heatmap-data')
 def get_us_sector_heatmap():
     """섹터 히트맵"""
     try:
-        heatmap_path = os.path.join(_OUTPUT_DIR, 'sector_heatmap.json')
-        if os.path.exists(heatmap_path):
-            with open(heatmap_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # sector_groups → series 변환 (프론트엔드 SectorSeries[] 호환)
-            if 'sector_groups' in data and 'series' not in data:
-                series = []
-                for sector_name, stocks in data['sector_groups'].items():
-                    items = []
-                    for s in stocks:
-                        items.append({
-                            'x': s.get('ticker', s.get('symbol', '')),
-                            'y': s.get('weight', s.get('market_cap', 0)),
-                            'price': s.get('price', 0),
-                            'change': s.get('change_pct', s.get('change', 0)),
-                            'color': ''
-                        })
-                    series.append({'name': sector_name, 'data': items})
-                data['series'] = series
-
-            return jsonify(data)
-        return jsonify({'sectors': [], 'series': []})
+        return jsonify(build_sector_heatmap())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1059,90 +893,95 @@ def get_us_risk_alerts():
         return jsonify({'error': str(e)}), 500
 
 
+def build_earnings_impact() -> dict:
+    """어닝 임팩트 응답 생성 — earnings_impact + earnings_analysis + earnings_transcripts 병합"""
+    # 1) earnings_impact.json — sector_profiles
+    data = {'sector_profiles': {}, 'upcoming_earnings': [], 'details': {}}
+    impact_path = os.path.join(_OUTPUT_DIR, 'earnings_impact.json')
+    if os.path.exists(impact_path):
+        with open(impact_path, 'r', encoding='utf-8') as f:
+            impact = json.load(f)
+        data['sector_profiles'] = impact.get('sector_profiles', {})
+        data['timestamp'] = impact.get('timestamp', '')
+
+    # 2) earnings_analysis.json — upcoming_earnings + details (per-ticker)
+    analysis_path = os.path.join(_OUTPUT_DIR, 'earnings_analysis.json')
+    if not os.path.exists(analysis_path):
+        analysis_path = os.path.join(_PREVIEW_DIR, 'earnings_analysis.json')
+    if os.path.exists(analysis_path):
+        with open(analysis_path, 'r', encoding='utf-8') as f:
+            analysis = json.load(f)
+        # upcoming_earnings from analysis (has actual entries)
+        upcoming = analysis.get('upcoming_earnings', [])
+        details = analysis.get('details', {})
+        data['details'] = details
+
+        # Enrich upcoming with detail info
+        from datetime import datetime, date
+        today = date.today()
+        enriched = []
+        for item in upcoming:
+            ticker = item.get('ticker', '')
+            detail = details.get(ticker, {})
+            earn_date = item.get('date', detail.get('next_earnings_date', ''))
+            # Recalculate days_left from today
+            days_left = item.get('days_left', 0)
+            try:
+                ed = datetime.strptime(earn_date[:10], '%Y-%m-%d').date()
+                days_left = max(0, (ed - today).days)
+            except Exception:
+                pass
+            enriched.append({
+                'ticker': ticker,
+                'date': earn_date,
+                'days_left': days_left,
+                'revenue_growth': detail.get('revenue_growth', 0),
+                'avg_surprise_pct': detail.get('avg_surprise_pct', 0),
+                'surprises': detail.get('surprises', []),
+            })
+
+        # Also add tickers from details that have earnings within 30 days
+        seen = {e['ticker'] for e in enriched}
+        for ticker, detail in details.items():
+            if ticker in seen:
+                continue
+            earn_date = detail.get('next_earnings_date', '')
+            if not earn_date:
+                continue
+            try:
+                ed = datetime.strptime(earn_date[:10], '%Y-%m-%d').date()
+                days_left = (ed - today).days
+                if 0 <= days_left <= 30:
+                    enriched.append({
+                        'ticker': ticker,
+                        'date': earn_date,
+                        'days_left': days_left,
+                        'revenue_growth': detail.get('revenue_growth', 0),
+                        'avg_surprise_pct': detail.get('avg_surprise_pct', 0),
+                        'surprises': detail.get('surprises', []),
+                    })
+            except Exception:
+                pass
+
+        # Sort by days_left
+        enriched.sort(key=lambda x: x.get('days_left', 999))
+        data['upcoming_earnings'] = enriched
+
+    # 3) earnings_transcripts.json — transcript metadata
+    transcripts_path = os.path.join(_OUTPUT_DIR, 'earnings_transcripts.json')
+    if os.path.exists(transcripts_path):
+        with open(transcripts_path, 'r', encoding='utf-8') as f:
+            transcripts = json.load(f)
+        data['transcript_metadata'] = transcripts.get('metadata', {})
+
+    return data
+
+
 @us_bp.route('/earnings-impact')
 def get_us_earnings_impact():
     """어닝 임팩트 분석 — earnings_impact + earnings_analysis + earnings_transcripts 병합"""
     try:
-        # 1) earnings_impact.json — sector_profiles
-        data = {'sector_profiles': {}, 'upcoming_earnings': [], 'details': {}}
-        impact_path = os.path.join(_OUTPUT_DIR, 'earnings_impact.json')
-        if os.path.exists(impact_path):
-            with open(impact_path, 'r', encoding='utf-8') as f:
-                impact = json.load(f)
-            data['sector_profiles'] = impact.get('sector_profiles', {})
-            data['timestamp'] = impact.get('timestamp', '')
-
-        # 2) earnings_analysis.json — upcoming_earnings + details (per-ticker)
-        analysis_path = os.path.join(_OUTPUT_DIR, 'earnings_analysis.json')
-        if not os.path.exists(analysis_path):
-            analysis_path = os.path.join(_PREVIEW_DIR, 'earnings_analysis.json')
-        if os.path.exists(analysis_path):
-            with open(analysis_path, 'r', encoding='utf-8') as f:
-                analysis = json.load(f)
-            # upcoming_earnings from analysis (has actual entries)
-            upcoming = analysis.get('upcoming_earnings', [])
-            details = analysis.get('details', {})
-            data['details'] = details
-
-            # Enrich upcoming with detail info
-            from datetime import datetime, date
-            today = date.today()
-            enriched = []
-            for item in upcoming:
-                ticker = item.get('ticker', '')
-                detail = details.get(ticker, {})
-                earn_date = item.get('date', detail.get('next_earnings_date', ''))
-                # Recalculate days_left from today
-                days_left = item.get('days_left', 0)
-                try:
-                    ed = datetime.strptime(earn_date[:10], '%Y-%m-%d').date()
-                    days_left = max(0, (ed - today).days)
-                except Exception:
-                    pass
-                enriched.append({
-                    'ticker': ticker,
-                    'date': earn_date,
-                    'days_left': days_left,
-                    'revenue_growth': detail.get('revenue_growth', 0),
-                    'avg_surprise_pct': detail.get('avg_surprise_pct', 0),
-                    'surprises': detail.get('surprises', []),
-                })
-
-            # Also add tickers from details that have earnings within 30 days
-            seen = {e['ticker'] for e in enriched}
-            for ticker, detail in details.items():
-                if ticker in seen:
-                    continue
-                earn_date = detail.get('next_earnings_date', '')
-                if not earn_date:
-                    continue
-                try:
-                    ed = datetime.strptime(earn_date[:10], '%Y-%m-%d').date()
-                    days_left = (ed - today).days
-                    if 0 <= days_left <= 30:
-                        enriched.append({
-                            'ticker': ticker,
-                            'date': earn_date,
-                            'days_left': days_left,
-                            'revenue_growth': detail.get('revenue_growth', 0),
-                            'avg_surprise_pct': detail.get('avg_surprise_pct', 0),
-                            'surprises': detail.get('surprises', []),
-                        })
-                except Exception:
-                    pass
-
-            # Sort by days_left
-            enriched.sort(key=lambda x: x.get('days_left', 999))
-            data['upcoming_earnings'] = enriched
-
-        # 3) earnings_transcripts.json — transcript metadata
-        transcripts_path = os.path.join(_OUTPUT_DIR, 'earnings_transcripts.json')
-        if os.path.exists(transcripts_path):
-            with open(transcripts_path, 'r', encoding='utf-8') as f:
-                transcripts = json.load(f)
-            data['transcript_metadata'] = transcripts.get('metadata', {})
-
-        return jsonify(data)
+        return jsonify(build_earnings_impact())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1175,74 +1014,79 @@ def get_us_index_prediction():
         return jsonify({'error': str(e)}), 500
 
 
+def build_market_briefing() -> dict:
+    """시황 분석 응답 생성 — market_briefing.json + briefing.json/market_data.json/top_picks.json 보충"""
+    json_path = os.path.join(_OUTPUT_DIR, 'market_briefing.json')
+    data = {}
+    if os.path.exists(json_path):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    # ai_analysis.content가 비어있으면 briefing.json에서 보충
+    ai = data.get('ai_analysis', {})
+    if not ai.get('content'):
+        briefing_path = os.path.join(_OUTPUT_DIR, 'briefing.json')
+        if not os.path.exists(briefing_path):
+            briefing_path = os.path.join(_PREVIEW_DIR, 'briefing.json')
+        if os.path.exists(briefing_path):
+            with open(briefing_path, 'r', encoding='utf-8') as f:
+                briefing = json.load(f)
+            data['ai_analysis'] = {
+                'content': briefing.get('content', ''),
+                'citations': briefing.get('citations', [])
+            }
+
+    # vix 데이터 보충 (market_data.json)
+    if not data.get('vix', {}).get('value'):
+        md_path = os.path.join(_OUTPUT_DIR, 'market_data.json')
+        if not os.path.exists(md_path):
+            md_path = os.path.join(_PREVIEW_DIR, 'market_data.json')
+        if os.path.exists(md_path):
+            with open(md_path, 'r', encoding='utf-8') as f:
+                md = json.load(f)
+            vol = md.get('volatility', {})
+            vix_data = vol.get('^VIX', {})
+            val = vix_data.get('current', 0)
+            change = vix_data.get('change_pct', 0)
+            level = 'Low' if val < 15 else ('High' if val > 25 else 'Neutral')
+            color = '#4CAF50' if val < 15 else ('#F44336' if val > 25 else '#FFC107')
+            data['vix'] = {'value': val, 'change': change, 'level': level, 'color': color}
+
+    # fear_greed color 보충
+    fg = data.get('fear_greed', {})
+    if fg and 'color' not in fg:
+        score = fg.get('score', 50)
+        fg['color'] = 'green' if score >= 60 else ('red' if score <= 40 else 'yellow')
+        data['fear_greed'] = fg
+
+    # smart_money.top_picks 키 매핑
+    sm = data.get('smart_money', {})
+    if sm and 'top_picks' not in sm:
+        tp_path = os.path.join(_OUTPUT_DIR, 'top_picks.json')
+        if not os.path.exists(tp_path):
+            tp_path = os.path.join(_PREVIEW_DIR, 'top_picks.json')
+        if os.path.exists(tp_path):
+            with open(tp_path, 'r', encoding='utf-8') as f:
+                tp = json.load(f)
+            picks = tp.get('top_picks', tp.get('picks', []))
+            for p in picks:
+                if 'composite_score' in p and 'final_score' not in p:
+                    p['final_score'] = p.pop('composite_score')
+                if 'signal' in p and 'ai_recommendation' not in p:
+                    p['ai_recommendation'] = p.pop('signal')
+            sm['top_picks'] = {'picks': picks}
+            data['smart_money'] = sm
+
+    if not data:
+        return {'ai_analysis': {'content': '', 'citations': []}, 'vix': {}, 'fear_greed': {}}
+    return data
+
+
 @us_bp.route('/market-briefing')
 def get_us_market_briefing():
     """Perplexity 기반 시황 분석 — briefing.json + market_briefing.json 병합"""
     try:
-        json_path = os.path.join(_OUTPUT_DIR, 'market_briefing.json')
-        data = {}
-        if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-        # ai_analysis.content가 비어있으면 briefing.json에서 보충
-        ai = data.get('ai_analysis', {})
-        if not ai.get('content'):
-            briefing_path = os.path.join(_OUTPUT_DIR, 'briefing.json')
-            if not os.path.exists(briefing_path):
-                briefing_path = os.path.join(_PREVIEW_DIR, 'briefing.json')
-            if os.path.exists(briefing_path):
-                with open(briefing_path, 'r', encoding='utf-8') as f:
-                    briefing = json.load(f)
-                data['ai_analysis'] = {
-                    'content': briefing.get('content', ''),
-                    'citations': briefing.get('citations', [])
-                }
-
-        # vix 데이터 보충 (market_data.json)
-        if not data.get('vix', {}).get('value'):
-            md_path = os.path.join(_OUTPUT_DIR, 'market_data.json')
-            if not os.path.exists(md_path):
-                md_path = os.path.join(_PREVIEW_DIR, 'market_data.json')
-            if os.path.exists(md_path):
-                with open(md_path, 'r', encoding='utf-8') as f:
-                    md = json.load(f)
-                vol = md.get('volatility', {})
-                vix_data = vol.get('^VIX', {})
-                val = vix_data.get('current', 0)
-                change = vix_data.get('change_pct', 0)
-                level = 'Low' if val < 15 else ('High' if val > 25 else 'Neutral')
-                color = '#4CAF50' if val < 15 else ('#F44336' if val > 25 else '#FFC107')
-                data['vix'] = {'value': val, 'change': change, 'level': level, 'color': color}
-
-        # fear_greed color 보충
-        fg = data.get('fear_greed', {})
-        if fg and 'color' not in fg:
-            score = fg.get('score', 50)
-            fg['color'] = 'green' if score >= 60 else ('red' if score <= 40 else 'yellow')
-            data['fear_greed'] = fg
-
-        # smart_money.top_picks 키 매핑
-        sm = data.get('smart_money', {})
-        if sm and 'top_picks' not in sm:
-            tp_path = os.path.join(_OUTPUT_DIR, 'top_picks.json')
-            if not os.path.exists(tp_path):
-                tp_path = os.path.join(_PREVIEW_DIR, 'top_picks.json')
-            if os.path.exists(tp_path):
-                with open(tp_path, 'r', encoding='utf-8') as f:
-                    tp = json.load(f)
-                picks = tp.get('top_picks', tp.get('picks', []))
-                for p in picks:
-                    if 'composite_score' in p and 'final_score' not in p:
-                        p['final_score'] = p.pop('composite_score')
-                    if 'signal' in p and 'ai_recommendation' not in p:
-                        p['ai_recommendation'] = p.pop('signal')
-                sm['top_picks'] = {'picks': picks}
-                data['smart_money'] = sm
-
-        if not data:
-            return jsonify({'ai_analysis': {'content': '', 'citations': []}, 'vix': {}, 'fear_greed': {}})
-        return jsonify(data)
+        return jsonify(build_market_briefing())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
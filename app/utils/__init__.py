@@ -1,11 +1,20 @@
 # app/utils/__init__.py
-"""유틸리티 패키지"""
+"""유틸리티 패키지
 
-from .helpers import calculate_rsi, analyze_trend, format_currency, format_percent
+helpers 함수는 pandas/numpy를 쓰므로 첫 접근 시에만 import한다 (PEP 562).
+app.utils 하위 모듈(perf, notifier 등)만 쓰는 프로세스는 pandas를 불러오지 않는다.
+"""
 
 __all__ = [
     'calculate_rsi',
-    'analyze_trend', 
+    'analyze_trend',
     'format_currency',
     'format_percent'
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import helpers
+        return getattr(helpers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
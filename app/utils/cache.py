@@ -3,7 +3,10 @@
 
 import os
 import json
-import yfinance as yf
+
+from app.utils.lazy_import import lazy_module
+
+yf = lazy_module('yfinance')  # get_sector 캐시 미스 때만 필요
 
 # Sector mapping for major US stocks (S&P 500 + popular stocks)
 SECTOR_MAP = {
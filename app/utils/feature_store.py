@@ -0,0 +1,266 @@
+"""공용 피처 스토어 (증분 추가 + 피처 정의 버전 관리 + 학습/추론 행렬 정렬)
+
+index_predictor(SPY/QQQ)와 crypto_prediction(BTC)이 매 실행마다 수년치 SPY/QQQ/
+VIX/DXY/섹터 종가를 다시 받고 RSI/MACD/BB/VIX 백분위를 처음부터 다시 계산하던 것을
+대체한다. 피처 세트별로 (입력 종가 + 계산된 피처) 프레임을 디스크에 쌓아 두고,
+갱신 시에는 마지막 WARMUP 행 + 새 봉만 다시 계산해 뒤에 붙인다.
+
+- 저장: data/feature_store/<이름>.pkl (+ <이름>.meta.json), 피처 세트별 FileLock
+- 입력: OHLCV 레이크(get_panel) 경유 — 같은 심볼-일자는 시스템 전체에서 하루 한 번만 다운로드
+- 증분: 마지막 OVERLAP_ROWS행(장중 미완성 봉)은 다시 계산해 덮어씀.
+  롤링/EWM 피처는 warmup_rows행 이전 구간의 영향이 사실상 0이므로(EWM 잔차 < 1e-9)
+  전체 재계산과 같은 값이 된다
+- 버전: FeatureSet.version + 빌더 함수 소스/입력 심볼 해시가 바뀌면 전체 재계산
+
+사용법:
+    from app.utils.feature_store import FeatureSet, get_feature_store
+
+    fs = FeatureSet(name='index_predictor', version='1',
+                    tickers={'SPY': 'SPY', '^VIX': 'VIX'}, builder=build_features,
+                    history_start='2022-06-01')
+    store = get_feature_store()
+    frame = store.load(fs, start='2023-06-01')     # 피처 열 + 입력 종가 열('SPY', 'VIX' ...)
+    X = store.matrix(frame, feature_names)          # 학습/추론 공용 열 순서 (없는 열은 0)
+"""
+import os
+import json
+import time
+import pickle
+import hashlib
+import inspect
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from filelock import FileLock
+
+from app.utils import ohlcv_lake
+
+try:
+    from app.utils import perf
+except ImportError:
+    perf = None
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STORE_DIR = os.environ.get('FEATURE_STORE_DIR') or os.path.join(_BASE_DIR, 'data', 'feature_store')
+
+OVERLAP_ROWS = 5            # 갱신 때 다시 계산해 덮어쓰는 최근 행 수
+DEFAULT_WARMUP_ROWS = 400   # 가장 긴 롤링 창(252) + EWM 수렴 여유
+DEFAULT_REFRESH_MINUTES = 60
+LOCK_TIMEOUT = 300
+
+
+@dataclass
+class FeatureSet:
+    """피처 세트 정의
+
+    Args:
+        name: 저장 파일 이름
+        version: 피처 정의 버전 — 빌더가 호출하는 보조 함수(RSI 등)를 바꿨으면 올릴 것
+        tickers: {다운로드 심볼: 입력 열 이름} (종가)
+        builder: 입력 프레임 → 피처 프레임 (같은 인덱스)
+        history_start: 저장 시작일 (더 이른 시작일로 바뀌면 전체 재계산)
+        volume: 거래량도 필요한 심볼 → '<열 이름>_VOLUME' 열로 추가
+        warmup_rows: 증분 계산 시 새 행 앞에 붙여 계산하는 과거 행 수
+        refresh_minutes: 마지막 갱신 후 이 시간 안이면 레이크도 건드리지 않음
+    """
+    name: str
+    version: str
+    tickers: Dict[str, str]
+    builder: Callable[[pd.DataFrame], pd.DataFrame]
+    history_start: str
+    volume: List[str] = field(default_factory=list)
+    warmup_rows: int = DEFAULT_WARMUP_ROWS
+    refresh_minutes: float = DEFAULT_REFRESH_MINUTES
+
+    @property
+    def fingerprint(self) -> str:
+        try:
+            source = inspect.getsource(self.builder)
+        except (OSError, TypeError):
+            source = getattr(self.builder, '__qualname__', repr(self.builder))
+        payload = json.dumps([self.version, source, sorted(self.tickers.items()), sorted(self.volume)])
+        return f"{self.version}-{hashlib.sha1(payload.encode()).hexdigest()[:10]}"
+
+    @property
+    def input_columns(self) -> List[str]:
+        return list(self.tickers.values()) + [f'{self.tickers[t]}_VOLUME' for t in self.volume]
+
+
+class FeatureStore:
+    """피처 세트별 디스크 프레임 + 증분 갱신"""
+
+    def __init__(self, store_dir: str = None):
+        self.store_dir = store_dir or STORE_DIR
+        self._memory: Dict[str, tuple] = {}  # name → (fingerprint, loaded_at, frame)
+        self._lock = threading.Lock()
+
+    def _paths(self, name: str) -> Dict[str, str]:
+        base = os.path.join(self.store_dir, name)
+        return {'data': f'{base}.pkl', 'meta': f'{base}.meta.json', 'lock': f'{base}.lock'}
+
+    def _read(self, name: str):
+        paths = self._paths(name)
+        try:
+            with open(paths['meta'], 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            frame = pd.read_pickle(paths['data'])
+            return meta, frame
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            return None, None
+
+    def _write(self, name: str, meta: dict, frame: pd.DataFrame):
+        paths = self._paths(name)
+        tmp = f"{paths['data']}.{os.getpid()}.tmp"
+        frame.to_pickle(tmp)
+        os.replace(tmp, paths['data'])
+        tmp = f"{paths['meta']}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, paths['meta'])
+
+    def _fetch_inputs(self, fs: FeatureSet, start) -> pd.DataFrame:
+        """레이크 패널 → 입력 프레임 (종가 열 + 거래량 열)"""
+        symbols = list(fs.tickers)
+        panel = ohlcv_lake.get_panel(symbols, start=start, max_age_hours=fs.refresh_minutes / 60)
+        if panel.empty:
+            return pd.DataFrame()
+        inputs = panel['Close'].rename(columns=fs.tickers)
+        for symbol in fs.volume:
+            inputs[f'{fs.tickers[symbol]}_VOLUME'] = panel['Volume'][symbol]
+        inputs = inputs.reindex(columns=fs.input_columns)
+        return inputs.dropna(how='all')
+
+    def _build(self, fs: FeatureSet, inputs: pd.DataFrame) -> pd.DataFrame:
+        features = fs.builder(inputs)
+        features = features.drop(columns=[c for c in fs.input_columns if c in features.columns])
+        return pd.concat([features, inputs], axis=1)
+
+    def update(self, fs: FeatureSet, force: bool = False) -> pd.DataFrame:
+        """저장된 프레임을 최신으로 (필요한 행만 다시 계산) — 전체 프레임 반환"""
+        fingerprint = fs.fingerprint
+        os.makedirs(self.store_dir, exist_ok=True)
+
+        with FileLock(self._paths(fs.name)['lock'], timeout=LOCK_TIMEOUT):
+            meta, stored = self._read(fs.name)
+            now = time.time()
+
+            rebuild = (
+                force or stored is None or stored.empty
+                or meta.get('fingerprint') != fingerprint
+                or meta.get('history_start', '9999') > fs.history_start
+            )
+            if not rebuild and now - meta.get('updated_at', 0) < fs.refresh_minutes * 60:
+                return stored
+
+            started = time.perf_counter()
+            if rebuild:
+                inputs = self._fetch_inputs(fs, fs.history_start)
+                if inputs.empty:
+                    logger.warning(f"feature store {fs.name}: no input data")
+                    return stored if stored is not None else pd.DataFrame()
+                frame = self._build(fs, inputs)
+                mode = 'full'
+            else:
+                # 새 봉 + 마지막 OVERLAP_ROWS행을, 그 앞 warmup_rows행을 붙여 다시 계산
+                tail_pos = max(0, len(stored) - fs.warmup_rows - OVERLAP_ROWS)
+                cut = stored.index[max(0, len(stored) - OVERLAP_ROWS)]
+                inputs = self._fetch_inputs(fs, stored.index[tail_pos])
+                if inputs.empty:
+                    return stored
+                rebuilt = self._build(fs, inputs)
+                frame = pd.concat([stored.loc[stored.index < cut], rebuilt.loc[rebuilt.index >= cut]])
+                mode = 'incremental'
+
+            new_rows = len(frame) - (0 if rebuild or stored is None else len(stored))
+            self._write(fs.name, {
+                'name': fs.name,
+                'fingerprint': fingerprint,
+                'history_start': fs.history_start,
+                'rows': len(frame),
+                'last_date': str(frame.index[-1].date()) if len(frame) else None,
+                'updated_at': now,
+                'updated_at_iso': datetime.now().isoformat(timespec='seconds'),
+                'mode': mode,
+            }, frame)
+            logger.info(f"feature store {fs.name}: {mode} update, +{new_rows} rows "
+                        f"({time.perf_counter() - started:.2f}s)")
+            if perf is not None:
+                perf.count(f'feature_store_{mode}')
+            return frame
+
+    def load(self, fs: FeatureSet, start=None, end=None, refresh: bool = True) -> pd.DataFrame:
+        """피처 + 입력 열 프레임 (start 이상, end 미만)
+
+        같은 프로세스에서는 한 번 갱신한 프레임을 메모리에서 재사용한다.
+        """
+        fingerprint = fs.fingerprint
+        with self._lock:
+            cached = self._memory.get(fs.name)
+            if (cached is not None and cached[0] == fingerprint
+                    and time.time() - cached[1] < fs.refresh_minutes * 60):
+                frame = cached[2]
+            else:
+                if refresh:
+                    frame = self.update(fs)
+                else:
+                    frame = self._read(fs.name)[1]
+                    frame = frame if frame is not None else pd.DataFrame()
+                if not frame.empty:
+                    self._memory[fs.name] = (fingerprint, time.time(), frame)
+        if frame.empty:
+            return frame
+        if start is not None:
+            frame = frame.loc[frame.index >= pd.Timestamp(start)]
+        if end is not None:
+            frame = frame.loc[frame.index < pd.Timestamp(end)]
+        return frame
+
+    @staticmethod
+    def matrix(frame, feature_names: List[str], fill: float = 0.0) -> np.ndarray:
+        """학습(DataFrame)/추론(Series) 공용: feature_names 순서의 행렬, 없는 열/NaN은 fill"""
+        if isinstance(frame, pd.Series):
+            return frame.reindex(feature_names).astype(float).fillna(fill).to_numpy().reshape(1, -1)
+        return frame.reindex(columns=feature_names).astype(float).fillna(fill).to_numpy()
+
+    def invalidate(self, name: str):
+        """저장된 피처 세트 삭제 (다음 load 때 전체 재계산)"""
+        with self._lock:
+            self._memory.pop(name, None)
+        for key in ('data', 'meta'):
+            path = self._paths(name)[key]
+            if os.path.exists(path):
+                os.remove(path)
+
+    def status(self) -> List[dict]:
+        """저장된 피처 세트 메타 목록"""
+        if not os.path.isdir(self.store_dir):
+            return []
+        out = []
+        for fname in sorted(os.listdir(self.store_dir)):
+            if fname.endswith('.meta.json'):
+                try:
+                    with open(os.path.join(self.store_dir, fname), 'r', encoding='utf-8') as f:
+                        out.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return out
+
+
+_store: Optional[FeatureStore] = None
+_store_lock = threading.Lock()
+
+
+def get_feature_store() -> FeatureStore:
+    """FeatureStore 싱글톤"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FeatureStore()
+        return _store
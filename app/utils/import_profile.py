@@ -0,0 +1,171 @@
+"""부팅 import 프로파일 (`python -X importtime` 결과 집계)
+
+새 인터프리터에서 대상(기본: Flask 앱 생성)을 import하고, -X importtime 출력을
+파싱해 최상위 모듈별 누적 시간, 패키지별 자체 시간, 최대 RSS, 로드된 무거운
+모듈 목록을 보고한다. gunicorn 워커 콜드 스타트/RSS가 늘어난 원인을 찾거나
+import 예산을 검사할 때 쓴다.
+
+사용법:
+    python -m app.utils.import_profile                      # Flask 앱 (in-memory DB)
+    python -m app.utils.import_profile --target scheduler   # 클라우드 스케줄러 모듈
+    python -m app.utils.import_profile --top 30 --json
+    python -m app.utils.import_profile --budget-ms 900 --budget-rss-mb 90   # 초과 시 exit 1
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 웹 워커 부팅 경로에서 import되면 안 되는 모듈 (첫 요청 때 로드)
+HEAVY_MODULES = ('pandas', 'numpy', 'yfinance', 'scipy', 'sklearn', 'stripe', 'matplotlib')
+
+_REPORT_MARKER = '__IMPORT_PROFILE__'
+
+_EPILOGUE = f"""
+import json as _json, resource as _resource, sys as _sys, time as _time
+print({_REPORT_MARKER!r} + _json.dumps({{
+    'wall_ms': (_time.perf_counter() - _t0) * 1000,
+    'rss_mb': _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy_loaded': [m for m in {HEAVY_MODULES!r} if m in _sys.modules],
+    'modules_loaded': len(_sys.modules),
+}}))
+"""
+
+TARGETS = {
+    'app': (
+        "from app import create_app\n"
+        "create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})\n"
+    ),
+    'flask_app': "import flask_app\n",
+    'scheduler': "import app.utils.scheduler\n",
+}
+
+_LINE_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """-X importtime 출력 → [{'name', 'self_us', 'cumulative_us', 'depth'}]"""
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        records.append({
+            'name': name,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'depth': (len(indent) - 1) // 2,
+        })
+    return records
+
+
+def profile_imports(target: str = 'app', code: str = None, top: int = 15,
+                    env: Dict[str, str] = None) -> dict:
+    """새 인터프리터에서 대상 import 후 프로파일 보고서 반환
+
+    Args:
+        target: TARGETS 키 (code 지정 시 무시)
+        code: 직접 실행할 파이썬 코드
+    """
+    body = code if code is not None else TARGETS[target]
+    script = (
+        "import sys as _sys, time as _time\n"
+        f"_sys.path.insert(0, {_BASE_DIR!r})\n"
+        "_t0 = _time.perf_counter()\n"
+        + body + _EPILOGUE
+    )
+    run_env = {**os.environ, **(env or {})}
+    # 프로파일 중 스케줄러 스레드가 뜨지 않도록
+    run_env.pop('RENDER', None)
+    run_env['SCHEDULER_ENABLED'] = 'false'
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=_BASE_DIR, env=run_env, capture_output=True, text=True, timeout=300,
+    )
+    summary = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(_REPORT_MARKER):
+            summary = json.loads(line[len(_REPORT_MARKER):])
+    if proc.returncode != 0 or summary is None:
+        tail = '\n'.join(l for l in proc.stderr.splitlines() if not l.startswith('import time:'))[-2000:]
+        raise RuntimeError(f"import profile 실패 (exit {proc.returncode}):\n{tail}")
+
+    records = parse_importtime(proc.stderr)
+    roots = [r for r in records if r['depth'] == 0]
+    by_package = defaultdict(int)
+    for r in records:
+        by_package[r['name'].split('.')[0]] += r['self_us']
+
+    return {
+        'target': target if code is None else 'code',
+        'import_ms': round(sum(r['cumulative_us'] for r in roots) / 1000, 1),
+        'wall_ms': round(summary['wall_ms'], 1),
+        'rss_mb': round(summary['rss_mb'], 1),
+        'modules_loaded': summary['modules_loaded'],
+        'heavy_loaded': summary['heavy_loaded'],
+        'top_modules': [
+            {'name': r['name'], 'ms': round(r['cumulative_us'] / 1000, 1)}
+            for r in sorted(roots, key=lambda r: r['cumulative_us'], reverse=True)[:top]
+        ],
+        'top_packages': [
+            {'name': name, 'ms': round(us / 1000, 1)}
+            for name, us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ],
+    }
+
+
+def check_budget(report: dict, budget_ms: Optional[float] = None,
+                 budget_rss_mb: Optional[float] = None) -> List[str]:
+    """예산 초과 항목 (없으면 빈 리스트)"""
+    problems = []
+    if budget_ms is not None and report['import_ms'] > budget_ms:
+        problems.append(f"import {report['import_ms']:.0f}ms > 예산 {budget_ms:.0f}ms")
+    if budget_rss_mb is not None and report['rss_mb'] > budget_rss_mb:
+        problems.append(f"RSS {report['rss_mb']:.0f}MB > 예산 {budget_rss_mb:.0f}MB")
+    return problems
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"[import profile: {report['target']}]",
+        f"  import {report['import_ms']:.0f}ms | wall {report['wall_ms']:.0f}ms | "
+        f"RSS {report['rss_mb']:.0f}MB | modules {report['modules_loaded']}",
+        f"  heavy modules loaded: {', '.join(report['heavy_loaded']) or '-'}",
+        "",
+        "  최상위 import (누적):",
+    ]
+    lines += [f"    {m['ms']:8.1f}ms  {m['name']}" for m in report['top_modules']]
+    lines += ["", "  패키지별 (자체 시간 합):"]
+    lines += [f"    {p['ms']:8.1f}ms  {p['name']}" for p in report['top_packages']]
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='부팅 import 프로파일 (-X importtime)')
+    parser.add_argument('--target', choices=sorted(TARGETS), default='app')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    parser.add_argument('--budget-ms', type=float, help='import 시간 예산 (초과 시 exit 1)')
+    parser.add_argument('--budget-rss-mb', type=float, help='RSS 예산 (초과 시 exit 1)')
+    args = parser.parse_args(argv)
+
+    report = profile_imports(args.target, top=args.top)
+    problems = check_budget(report, args.budget_ms, args.budget_rss_mb)
+    if args.json:
+        print(json.dumps({**report, 'over_budget': problems}, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+        for problem in problems:
+            print(f"  ❌ {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,346 @@
+"""백그라운드 작업 실행기 (POST 트리거 파이프라인용)
+
+gunicorn 요청 스레드에서 수 분짜리 파이프라인/서브프로세스를 직접 실행하면
+워커가 묶여 조회 트래픽이 밀린다. 요청은 작업만 등록하고 즉시 job_id를 반환하며,
+실제 실행은 크기가 제한된 워커 풀에서 처리한다.
+
+특징:
+- 워커 수 제한 (JOB_MAX_WORKERS, 기본 2) + 대기열 상한 (JOB_MAX_QUEUED, 기본 20)
+- 동일 key 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업 반환 (중복 제거)
+- 진행 로그 버퍼 → 폴링(/api/jobs/<id>) 또는 SSE(/api/jobs/<id>/stream)
+- 취소: 대기 중이면 즉시 취소, 실행 중이면 서브프로세스 종료 / 협조적 중단
+  (취소 지점이 없는 프로세스 내 작업은 cancellable=False — 실행 중에는 취소 거부)
+
+사용법:
+    from app.utils.jobs import get_job_manager
+
+    def _work(job):
+        job.log('시작')
+        job.run_subprocess([sys.executable, 'script.py'], timeout=600)
+        return {'ok': True}
+
+    job, created = get_job_manager().submit('kr-update', _work, kind='kr_update')
+    return jsonify(job.to_dict()), 202
+"""
+
+import os
+import time
+import uuid
+import logging
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+MAX_LOG_LINES = 500
+MAX_FINISHED_JOBS = 100
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 중단됨"""
+
+
+class QueueFullError(RuntimeError):
+    """대기열 상한 초과"""
+
+
+class Job:
+    """단일 백그라운드 작업 상태"""
+
+    def __init__(self, key: str, kind: str, cancellable: bool = True):
+        self.id = uuid.uuid4().hex[:12]
+        self.key = key
+        self.kind = kind
+        self.cancellable = cancellable   # 실행 중 취소 가능 (서브프로세스 / check_cancelled 지점 있음)
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.progress = None          # 0~100 (작업이 보고하는 경우만)
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+
+        self._lines = deque(maxlen=MAX_LOG_LINES)
+        self._line_seq = 0             # 지금까지 기록된 전체 줄 수 (SSE 커서)
+        self._cancel_event = threading.Event()
+        self._proc = None
+        self._future = None
+        self._cond = threading.Condition()
+
+    # ── 작업 함수에서 사용하는 API ──
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """협조적 취소 지점 — 취소 요청 시 JobCancelled 발생"""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def log(self, line: str):
+        with self._cond:
+            self._lines.append(line)
+            self._line_seq += 1
+            self._cond.notify_all()
+
+    def set_progress(self, pct: float):
+        with self._cond:
+            self.progress = max(0, min(100, round(pct, 1)))
+            self._cond.notify_all()
+
+    def run_subprocess(self, cmd: list, cwd: str = None, env: dict = None,
+                       timeout: int = 600) -> int:
+        """서브프로세스 실행 + 출력 줄 단위 로그 수집 (취소 시 종료)
+
+        Returns:
+            종료 코드 (타임아웃 -2)
+        """
+        self.check_cancelled()
+        proc = subprocess.Popen(
+            cmd, cwd=cwd, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace', bufsize=1
+        )
+        self._proc = proc
+
+        # 타임아웃은 별도 타이머로 처리 (readline이 블로킹되므로)
+        timed_out = threading.Event()
+
+        def _on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in iter(proc.stdout.readline, ''):
+                clean = line.rstrip()
+                if clean:
+                    self.log(clean)
+            proc.wait()
+        finally:
+            timer.cancel()
+            self._proc = None
+
+        if self.cancelled:
+            raise JobCancelled()
+        if timed_out.is_set():
+            self.log(f'[TIMEOUT] {timeout}초 초과로 종료')
+            return -2
+        return proc.returncode
+
+    # ── 조회 ──
+
+    @property
+    def done(self) -> bool:
+        return self.status not in ACTIVE_STATES
+
+    def lines_since(self, cursor: int):
+        """cursor 이후 로그 줄과 새 cursor 반환 (버퍼에서 밀려난 줄은 생략)"""
+        with self._cond:
+            missing = self._line_seq - cursor
+            lines = list(self._lines)[-missing:] if missing > 0 else []
+            return lines, self._line_seq
+
+    def wait_for_update(self, cursor: int, timeout: float = 15.0):
+        """새 로그/상태 변화가 있거나 timeout까지 대기"""
+        with self._cond:
+            if self._line_seq == cursor and not self.done:
+                self._cond.wait(timeout)
+
+    def to_dict(self, log_tail: int = 50) -> dict:
+        with self._cond:
+            tail = list(self._lines)[-log_tail:] if log_tail else []
+        return {
+            'job_id': self.id,
+            'key': self.key,
+            'kind': self.kind,
+            'status': self.status,
+            'cancellable': self.cancellable,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'log_tail': tail,
+        }
+
+    def _set_status(self, status: str):
+        with self._cond:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = datetime.now().isoformat()
+            elif status not in ACTIVE_STATES:
+                self.finished_at = datetime.now().isoformat()
+            self._cond.notify_all()
+
+
+class JobManager:
+    """제한된 워커 풀 + 작업 레지스트리"""
+
+    def __init__(self, max_workers: int = 2, max_queued: int = 20):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = {}          # job_id → Job (삽입 순서 유지)
+        self._active_keys = {}   # key → job_id (대기/실행 중인 작업만)
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, fn, *args, kind: str = None, cancellable: bool = True, **kwargs):
+        """작업 등록 — 동일 key 작업이 진행 중이면 그 작업을 반환
+
+        Args:
+            key: 중복 제거 키 (예: 'skill:vcp-screener')
+            fn: fn(job, *args, **kwargs) 형태의 작업 함수. 반환값이 job.result가 됨
+            cancellable: False면 시작 후에는 취소 요청을 거부 (취소 지점 없이 프로세스 안에서 도는 작업)
+
+        Returns:
+            (Job, created: bool)
+
+        Raises:
+            QueueFullError: 대기 작업 수가 상한을 넘은 경우
+        """
+        with self._lock:
+            existing_id = self._active_keys.get(key)
+            if existing_id:
+                existing = self._jobs.get(existing_id)
+                if existing and not existing.done:
+                    return existing, False
+
+            queued = sum(1 for j in self._jobs.values() if j.status == QUEUED)
+            if queued >= self.max_queued:
+                raise QueueFullError(f'job queue full ({queued}/{self.max_queued})')
+
+            job = Job(key, kind or key.split(':', 1)[0], cancellable=cancellable)
+            self._jobs[job.id] = job
+            self._active_keys[key] = job.id
+            self._prune_locked()
+            job._future = self._executor.submit(self._run, job, fn, args, kwargs)
+
+        logger.info(f"[jobs] 등록: {job.kind} ({job.id}, key={key})")
+        return job, True
+
+    def _run(self, job: Job, fn, args, kwargs):
+        if job.cancelled:
+            job._set_status(CANCELLED)
+            self._release(job)
+            return
+
+        job._set_status(RUNNING)
+        start = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job._set_status(CANCELLED if job.cancelled else SUCCEEDED)
+        except JobCancelled:
+            job._set_status(CANCELLED)
+        except Exception as e:
+            logger.exception(f"[jobs] 실패: {job.kind} ({job.id})")
+            job.error = str(e)
+            job._set_status(FAILED)
+        finally:
+            self._release(job)
+            logger.info(f"[jobs] 종료: {job.kind} ({job.id}) {job.status} ({time.time() - start:.1f}초)")
+
+    def _release(self, job: Job):
+        with self._lock:
+            if self._active_keys.get(job.key) == job.id:
+                del self._active_keys[job.key]
+
+    def _prune_locked(self):
+        finished = [j.id for j in self._jobs.values() if j.done]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str):
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list:
+        return list(reversed(list(self._jobs.values())))
+
+    def cancel(self, job_id: str) -> bool:
+        """취소 요청 — 대기 중이면 즉시 취소, 실행 중이면 서브프로세스 종료
+
+        Returns:
+            취소(요청)됐으면 True. 이미 끝났거나, 취소할 수 없는 작업이 실행 중이면 False
+        """
+        job = self._jobs.get(job_id)
+        if not job or job.done:
+            return False
+
+        if job._future is not None and job._future.cancel():
+            job._cancel_event.set()
+            job._set_status(CANCELLED)
+            self._release(job)
+            return True
+        if not job.cancellable:
+            # 끝까지 실행돼 결과를 쓰므로 CANCELLED로 표시하지 않는다
+            return False
+
+        job._cancel_event.set()
+
+        proc = job._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+            except OSError:
+                pass
+        job.log('[SYSTEM] 취소 요청됨')
+        return True
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """프로세스 단위 JobManager 싱글톤"""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = JobManager(
+                    max_workers=int(os.environ.get('JOB_MAX_WORKERS', '2')),
+                    max_queued=int(os.environ.get('JOB_MAX_QUEUED', '20')),
+                )
+    return _manager
+
+
+def job_sse_stream(job: Job, heartbeat: float = 15.0):
+    """작업 로그/상태를 SSE 이벤트로 스트리밍 (작업 종료 시 end 이벤트)"""
+    import json
+
+    cursor = 0
+    last_status = None
+    while True:
+        lines, cursor = job.lines_since(cursor)
+        for line in lines:
+            yield f"data: {line}\n\n"
+
+        if job.status != last_status:
+            last_status = job.status
+            yield f"event: status\ndata: {json.dumps({'status': job.status, 'progress': job.progress})}\n\n"
+
+        if job.done:
+            # 종료 직전 기록된 로그 flush
+            lines, cursor = job.lines_since(cursor)
+            for line in lines:
+                yield f"data: {line}\n\n"
+            yield "event: end\ndata: close\n\n"
+            return
+
+        job.wait_for_update(cursor, timeout=heartbeat)
+        if not job.lines_since(cursor)[0] and job.status == last_status:
+            yield ": keep-alive\n\n"
@@ -0,0 +1,58 @@
+"""무거운 모듈 지연 import (첫 속성 접근 시 실제 import)
+
+Flask 앱은 부팅 시 모든 Blueprint를 등록하는데, 라우트 모듈이 최상단에서
+pandas/yfinance를 import하면 요청이 한 번도 오지 않은 워커도 그 비용(수백 ms,
+수십 MB RSS)을 치른다. 모듈 최상단에서는 프록시만 만들고, 라우트 함수가 처음
+pd.DataFrame, yf.download 등에 접근할 때 실제 모듈을 불러온다.
+
+사용법:
+    from app.utils.lazy_import import lazy_module
+
+    pd = lazy_module('pandas')
+    yf = lazy_module('yfinance')
+
+주의: 함수 시그니처 타입 힌트(`df: pd.DataFrame`)처럼 정의 시점에 평가되는 곳에서
+쓰면 그 자리에서 import된다.
+"""
+import importlib
+import sys
+import threading
+import types
+
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """속성 접근 시 실제 모듈로 위임하는 프록시"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self) -> types.ModuleType:
+        target = self.__dict__['_lazy_target']
+        if target is None:
+            with _lock:
+                target = self.__dict__['_lazy_target']
+                if target is None:
+                    target = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_target'] = target
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """이미 import된 모듈이면 그대로, 아니면 지연 프록시 반환"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
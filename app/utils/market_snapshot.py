@@ -0,0 +1,210 @@
+"""파이프라인 실행 단위 시장 스냅샷 (지수/매크로/섹터 시세를 실행 시작 시 한 번에 수신)
+
+update_all.py 한 번 실행 동안 market_regime(SPY/^VIX/^TNX/^IRX/^MMFI), market_gate(SPY/QQQ/
+섹터 ETF), macro_analyzer(매크로 30여 종 + 종목별 52주 고저 history), risk_alert(추천 종목
+3mo/6mo/1d 반복 수신)가 같은 심볼을 단계마다 따로 받던 것을 한 번으로 줄인다.
+
+- build(): 실행 시작 시 US_SNAPSHOT_TICKERS 전체를 OHLCV 레이크 get_panel 한 번(yf.download
+  일괄 수신)으로 받아 data/market_snapshot/<run_id>.pkl에 저장하고, 경로를 환경변수
+  MARKETFLOW_MARKET_SNAPSHOT로 내보낸다 → 자식 스크립트 프로세스가 그대로 물려받음
+- get_panel()/get_close()/get_ohlcv(): ohlcv_lake와 같은 시그니처·열 구조.
+  스냅샷이 있으면 메모리에서 잘라 주고, 스냅샷에 없는 심볼(추천 종목 등)은 레이크에서
+  한 번 받아 프로세스 안에서 재사용한다. 스냅샷이 없거나(단독 실행, 웹 라우트) 요청 기간이
+  스냅샷보다 길면 ohlcv_lake.get_panel을 그대로 호출한다
+- 오래된 스냅샷(MAX_AGE_HOURS 초과)은 무시, 파일은 최근 KEEP_SNAPSHOTS개만 유지
+
+사용법:
+    # update_all.py (실행 시작 시 한 번)
+    from app.utils import market_snapshot
+    market_snapshot.build()
+
+    # 각 단계
+    close = market_snapshot.get_close(['SPY', '^VIX'], period='3mo')
+    panel = market_snapshot.get_panel(tickers, period='1y')   # panel['Close'], panel['High'] ...
+"""
+import os
+import pickle
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from app.utils import ohlcv_lake
+
+try:
+    from app.utils import perf
+except ImportError:
+    perf = None
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SNAPSHOT_DIR = os.environ.get('MARKET_SNAPSHOT_DIR') or os.path.join(_BASE_DIR, 'data', 'market_snapshot')
+SNAPSHOT_ENV = 'MARKETFLOW_MARKET_SNAPSHOT'
+
+SNAPSHOT_PERIOD = '1y'    # 단계별 최장 조회 기간 (SPY 200일선, 매크로 52주 고저)
+MAX_AGE_HOURS = 12
+KEEP_SNAPSHOTS = 3
+
+# US 파이프라인 단계가 읽는 심볼 — 여기 없는 심볼도 동작하지만 단계마다 레이크를 한 번 더 거친다
+US_SNAPSHOT_TICKERS = [
+    # market_regime
+    'SPY', '^VIX', '^TNX', '^IRX', '^MMFI',
+    # market_gate
+    'QQQ', 'XLK', 'XLV', 'XLF', 'XLY', 'XLP', 'XLE', 'XLI', 'XLB', 'XLRE', 'XLU', 'XLC',
+    # macro_analyzer
+    '^SKEW', 'DX-Y.NYB', 'EURUSD=X', 'USDJPY=X', '^TYX', 'HYG', 'LQD',
+    'GC=F', 'SI=F', 'CL=F', 'HG=F', 'NG=F', 'IWM', 'DIA', 'BTC-USD', 'ETH-USD',
+    '000300.SS', '^N225', '^GDAXI', '^FTSE', '^KS11', 'RSP', 'IEF', 'XHB', 'VNQ',
+]
+
+_lock = threading.Lock()
+_loaded: Dict[str, dict] = {}   # 경로 → {'created_at', 'start', 'panel', 'unavailable'}
+
+
+def _write(path: str, snapshot: dict):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _prune(keep: int = KEEP_SNAPSHOTS):
+    files = sorted(f for f in os.listdir(SNAPSHOT_DIR) if f.endswith('.pkl'))
+    for name in files[:-keep]:
+        try:
+            os.remove(os.path.join(SNAPSHOT_DIR, name))
+        except OSError:
+            pass
+
+
+def build(tickers: Iterable[str] = None, period: str = SNAPSHOT_PERIOD, run_id: str = None) -> Optional[str]:
+    """스냅샷 수신 + 저장 + 환경변수 설정 (이후 시작하는 자식 프로세스가 읽음)
+
+    Returns:
+        스냅샷 파일 경로 (수신 실패 시 None — 각 단계는 기존처럼 레이크에서 직접 받음)
+    """
+    symbols = list(dict.fromkeys(tickers or US_SNAPSHOT_TICKERS))
+    started = time.perf_counter()
+    try:
+        panel = ohlcv_lake.get_panel(symbols, period=period)
+    except Exception as e:
+        logger.warning(f"market snapshot fetch failed: {e}")
+        return None
+    if panel.empty:
+        logger.warning("market snapshot: no data")
+        return None
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(SNAPSHOT_DIR, f'{run_id}.pkl')
+    snapshot = {
+        'created_at': time.time(),
+        'start': period_start(period),
+        'panel': panel,
+        'unavailable': set(),
+    }
+    _write(path, snapshot)
+    _prune()
+
+    with _lock:
+        _loaded[path] = snapshot
+    os.environ[SNAPSHOT_ENV] = path
+
+    covered = panel['Close'].notna().any()
+    logger.info(f"market snapshot: {int(covered.sum())}/{len(symbols)} symbols, {len(panel)} rows "
+                f"({time.perf_counter() - started:.1f}s) → {path}")
+    if perf is not None:
+        perf.count('market_snapshot_symbols', int(covered.sum()))
+    return path
+
+
+def _load() -> Optional[dict]:
+    """현재 실행의 스냅샷 (환경변수 경로, 프로세스당 한 번 읽음)"""
+    path = os.environ.get(SNAPSHOT_ENV)
+    if not path:
+        return None
+    with _lock:
+        snapshot = _loaded.get(path)
+        if snapshot is None:
+            try:
+                with open(path, 'rb') as f:
+                    snapshot = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError) as e:
+                logger.warning(f"market snapshot unreadable ({path}): {e}")
+                return None
+            _loaded[path] = snapshot
+    if time.time() - snapshot['created_at'] > MAX_AGE_HOURS * 3600:
+        return None
+    return snapshot
+
+
+def is_active() -> bool:
+    return _load() is not None
+
+
+def period_start(period: str) -> pd.Timestamp:
+    """yfinance period 문자열 → 시작일 (레이크와 같은 기준)"""
+    return ohlcv_lake._resolve_range(period=period)[0]
+
+
+def _extend(snapshot: dict, symbols: List[str]):
+    """스냅샷에 없는 심볼을 레이크에서 한 번 받아 메모리 스냅샷에 합침"""
+    fetched = ohlcv_lake.get_panel(symbols, start=snapshot['start'])
+    with _lock:
+        if not fetched.empty:
+            merged = pd.concat([snapshot['panel'], fetched], axis=1)
+            snapshot['panel'] = merged.loc[:, ~merged.columns.duplicated()].sort_index()
+        got = set(fetched['Close'].columns[fetched['Close'].notna().any()]) if not fetched.empty else set()
+        snapshot['unavailable'].update(set(symbols) - got)
+    if perf is not None:
+        perf.count('market_snapshot_extend', len(symbols))
+
+
+def get_panel(symbols: Iterable[str], start=None, end=None, period: str = None, **kwargs) -> pd.DataFrame:
+    """ohlcv_lake.get_panel과 같은 (필드, 심볼) MultiIndex 프레임 — 스냅샷이 있으면 메모리에서"""
+    symbols = list(dict.fromkeys(symbols))
+    snapshot = _load()
+    start_ts, end_ts, tail = ohlcv_lake._resolve_range(start, end, period)
+    if snapshot is None or start_ts < snapshot['start'] or kwargs.get('interval', '1d') != '1d':
+        return ohlcv_lake.get_panel(symbols, start=start, end=end, period=period, **kwargs)
+
+    # 다른 스레드의 _extend가 panel을 교체하고 unavailable을 갱신하므로 잠금 안에서 참조를 잡아 둔다
+    with _lock:
+        current = snapshot['panel']
+        unavailable = set(snapshot['unavailable'])
+    close = current['Close']
+    missing = [s for s in symbols
+               if s not in unavailable and (s not in close.columns or close[s].isna().all())]
+    if missing:
+        _extend(snapshot, missing)
+        with _lock:
+            current = snapshot['panel']
+    elif perf is not None:
+        perf.count('market_snapshot_hits')
+
+    columns = pd.MultiIndex.from_product([ohlcv_lake.FIELDS, symbols], names=['Price', 'Ticker'])
+    panel = current.reindex(columns=columns)
+    panel = panel.loc[panel.index >= start_ts]
+    if end_ts is not None:
+        panel = panel.loc[panel.index < end_ts]
+    panel = panel.dropna(how='all')
+    if tail is not None:
+        panel = panel.tail(tail)
+    return panel
+
+
+def get_close(symbols: Iterable[str], **kwargs) -> pd.DataFrame:
+    """종가만 (열 = 심볼)"""
+    return get_panel(symbols, **kwargs)['Close']
+
+
+def get_ohlcv(symbol: str, **kwargs) -> pd.DataFrame:
+    """단일 심볼 OHLCV (열 = Open/High/Low/Close/Volume, 데이터 없으면 빈 프레임)"""
+    panel = get_panel([symbol], **kwargs)
+    if panel.empty:
+        return ohlcv_lake._empty_frame()
+    return panel.xs(symbol, axis=1, level='Ticker').dropna(how='all')
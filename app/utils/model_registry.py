@@ -0,0 +1,217 @@
+"""예측 모델 레지스트리 + 증분(warm start) 재학습 판단
+
+IndexPredictor(SPY/QQQ), CryptoPredictor(BTC 앙상블), VCPMLPredictor가 재학습 때마다
+전체 히스토리로 TimeSeriesSplit CV + 최종 학습을 처음부터 다시 하던 것을 줄인다.
+
+- plan_training(): 이전 모델 파일과 새 학습 행렬을 비교해 'skip' / 'incremental' / 'full' 결정
+    full: 이전 모델 없음, 피처 목록 변경, 드리프트 초과, 마지막 전체 학습 후 full_retrain_days 경과,
+          증분으로 늘어난 단계/트리 수가 원래의 max_growth배 초과
+    skip: 학습 데이터 해시가 같음 (새 행 없음)
+- extend_model(): 이전 fit을 이어서 학습 (트리 앙상블은 warm_start로 단계/트리 추가,
+  LogisticRegression은 이전 계수에서 시작). 이전 scaler를 그대로 써야 기존 트리 분할이 유효하다
+- ModelRegistry: data/model_registry.json에 모델별 버전, 데이터/피처 해시, 학습 방식, 소요 시간,
+  CV 점수, 드리프트 기록 (프로세스 간 FileLock)
+
+사용법:
+    from app.utils.model_registry import RetrainPolicy, plan_training, extend_model, get_model_registry
+
+    plan = plan_training(previous_model_data, features, X, y, RetrainPolicy())
+    if plan['mode'] == 'incremental':
+        X_scaled = previous_model_data['scaler'].transform(X)
+        extend_model(clf, X_scaled, y, plan['extra_estimators'])
+    get_model_registry().record('index_spy', mode=plan['mode'], data_hash=plan['data_hash'], ...)
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REGISTRY_FILE = os.environ.get('MODEL_REGISTRY_FILE') or os.path.join(_BASE_DIR, 'data', 'model_registry.json')
+HISTORY_PER_MODEL = 50
+DRIFT_MIN_ROWS = 20
+
+
+@dataclass
+class RetrainPolicy:
+    """증분/전체 재학습 기준
+
+    Args:
+        full_retrain_days: 마지막 전체 학습 후 이 기간이 지나면 전체 재학습 (CV 점수 갱신)
+        drift_threshold: 최근 행의 피처 평균 이동(이전 scaler 표준편차 단위) 또는
+                         표준편차 로그비의 최댓값이 이 값을 넘으면 전체 재학습
+        extra_estimators: 증분 1회에 추가하는 단계/트리 수
+        max_growth: 누적 단계/트리 수가 전체 학습 때의 이 배수를 넘으면 전체 재학습
+    """
+    full_retrain_days: int = 28
+    drift_threshold: float = 1.0
+    extra_estimators: int = 20
+    max_growth: float = 2.0
+
+
+def data_hash(X: np.ndarray, y: np.ndarray) -> str:
+    h = hashlib.sha1()
+    h.update(np.ascontiguousarray(X, dtype=float).tobytes())
+    h.update(np.ascontiguousarray(y, dtype=float).tobytes())
+    return h.hexdigest()[:16]
+
+
+def feature_hash(features: List[str]) -> str:
+    return hashlib.sha1(json.dumps(list(features)).encode()).hexdigest()[:12]
+
+
+def fingerprint(features: List[str], X: np.ndarray, y: np.ndarray) -> Dict[str, str]:
+    """학습 데이터/피처 식별자 — 이전 모델 유무와 관계없이 모델 파일·레지스트리에 기록"""
+    return {'data_hash': data_hash(X, y), 'feature_hash': feature_hash(features)}
+
+
+def feature_drift(scaler, X_recent: np.ndarray) -> float:
+    """최근 행 분포가 이전 학습 분포(scaler 평균/표준편차)에서 얼마나 벗어났는지"""
+    mean = getattr(scaler, 'mean_', None)
+    scale = getattr(scaler, 'scale_', None)
+    if mean is None or scale is None or len(X_recent) == 0:
+        return float('inf')
+    scale = np.where(scale > 0, scale, 1.0)
+    mean_shift = np.abs(X_recent.mean(axis=0) - mean) / scale
+    if len(X_recent) > 1:
+        std = X_recent.std(axis=0)
+        std_ratio = np.abs(np.log(np.where(std > 0, std, scale) / scale))
+    else:
+        std_ratio = np.zeros_like(mean_shift)
+    return float(np.nanmax(np.maximum(mean_shift, std_ratio)))
+
+
+def model_size(model) -> int:
+    """트리 앙상블 단계/트리 수 (그 외 0)"""
+    params = model.get_params()
+    if 'n_estimators' in params:
+        return int(params['n_estimators'])
+    if 'learning_rate' in params and 'max_iter' in params:
+        return int(params['max_iter'])
+    return 0
+
+
+def extend_model(model, X: np.ndarray, y: np.ndarray, extra: int):
+    """이전 fit을 이어서 학습 — X는 이전 scaler로 변환한 전체 학습 행렬"""
+    params = model.get_params()
+    if 'n_estimators' in params:          # GradientBoosting*, RandomForest
+        model.set_params(warm_start=True, n_estimators=params['n_estimators'] + extra)
+    elif 'learning_rate' in params and 'max_iter' in params:   # HistGradientBoosting
+        model.set_params(warm_start=True, max_iter=params['max_iter'] + extra)
+    elif 'warm_start' in params:          # LogisticRegression: 이전 계수에서 시작
+        model.set_params(warm_start=True)
+    model.fit(X, y)
+    return model
+
+
+def plan_training(previous: Optional[dict], features: List[str], X: np.ndarray, y: np.ndarray,
+                  policy: RetrainPolicy = None, sizes: List[int] = None) -> Dict:
+    """학습 방식 결정
+
+    Args:
+        previous: 이전 모델 파일 내용 (features, scaler, training_samples, data_hash,
+                  full_trained_at, base_size 키 사용 — 없으면 전체 학습)
+        sizes: 이전 모델들의 현재 단계/트리 수 (max_growth 판단용)
+
+    Returns:
+        {'mode', 'reason', 'drift', 'data_hash', 'feature_hash', 'new_rows', 'extra_estimators'}
+    """
+    policy = policy or RetrainPolicy()
+    plan = {
+        'mode': 'full', 'reason': '', 'drift': None,
+        **fingerprint(features, X, y),
+        'new_rows': len(X), 'extra_estimators': policy.extra_estimators,
+    }
+
+    if not previous or 'scaler' not in previous or 'full_trained_at' not in previous:
+        plan['reason'] = 'no previous incremental-capable model'
+        return plan
+    if list(previous.get('features', [])) != list(features):
+        plan['reason'] = 'feature set changed'
+        return plan
+    if previous.get('data_hash') == plan['data_hash']:
+        plan.update(mode='skip', reason='training data unchanged', new_rows=0)
+        return plan
+
+    age_days = (datetime.now() - datetime.fromisoformat(previous['full_trained_at'])).days
+    if age_days > policy.full_retrain_days:
+        plan['reason'] = f'last full retrain {age_days}d ago'
+        return plan
+
+    base = previous.get('base_size') or 0
+    if base and sizes and max(sizes) + policy.extra_estimators > base * policy.max_growth:
+        plan['reason'] = f'ensemble grew past {policy.max_growth}x'
+        return plan
+
+    new_rows = max(0, len(X) - int(previous.get('training_samples', 0)))
+    recent = X[-max(new_rows, DRIFT_MIN_ROWS):]
+    drift = feature_drift(previous['scaler'], recent)
+    plan.update(drift=round(drift, 3), new_rows=new_rows)
+    if drift > policy.drift_threshold:
+        plan['reason'] = f'feature drift {drift:.2f} > {policy.drift_threshold}'
+        return plan
+
+    plan.update(mode='incremental', reason=f'{new_rows} new rows, drift {drift:.2f}')
+    return plan
+
+
+class ModelRegistry:
+    """모델별 학습 이력 (JSON 파일)"""
+
+    def __init__(self, path: str = None):
+        self.path = path or REGISTRY_FILE
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, List[dict]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, name: str, **entry) -> dict:
+        """학습 1회 기록 — 버전은 모델별 1부터 증가"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock, FileLock(f'{self.path}.lock', timeout=60):
+            registry = self._read()
+            history = registry.get(name, [])
+            entry = {
+                'version': (history[-1]['version'] + 1) if history else 1,
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                **entry,
+            }
+            registry[name] = (history + [entry])[-HISTORY_PER_MODEL:]
+            tmp = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(registry, f, ensure_ascii=False, indent=1, default=str)
+            os.replace(tmp, self.path)
+        return entry
+
+    def latest(self, name: str) -> Optional[dict]:
+        history = self._read().get(name) or []
+        return history[-1] if history else None
+
+    def history(self, name: str, limit: int = 20) -> List[dict]:
+        return (self._read().get(name) or [])[-limit:]
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """ModelRegistry 싱글톤"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
@@ -0,0 +1,284 @@
+"""텔레그램 발신 큐 (백그라운드 전송 + 채팅별 속도 제한 + 병합 + 재시도)
+
+파이프라인 단계가 텔레그램 응답을 기다리느라 멈추지 않도록, 메시지는 큐에 넣고
+바로 반환한다. 프로세스당 하나의 발신 스레드가 채팅별로 꺼내 보낸다.
+
+- 속도 제한: 같은 채팅에는 TELEGRAM_MIN_INTERVAL초(기본 1초)에 한 번만 전송
+- 병합: COALESCE_WINDOW초 안에 같은 채팅으로 들어온 짧은 메시지들은 한 메시지로 합쳐 전송
+  (합친 길이가 MAX_LEN 이하이고 parse_mode가 같은 경우만)
+- 분할: MAX_LEN을 넘는 메시지는 문단 단위로 나눠 순서대로 전송
+- 재시도: 네트워크 오류/5xx는 지수 백오프, 429는 retry_after만큼 대기 후 재시도
+  HTML/Markdown 파싱 오류(400)는 parse_mode 없이 한 번 더 전송
+- 종료: atexit에서 남은 메시지를 최대 FLUSH_TIMEOUT초 동안 마저 전송
+
+사용법:
+    from app.utils.notifier import notify, flush
+
+    notify("✅ 완료")                      # 개인 봇 + 채널 봇 (환경변수 설정된 곳)
+    notify(text, destinations=[(token, chat_id)], parse_mode='Markdown')
+    flush(timeout=30)                      # 필요 시 전송 완료까지 대기
+"""
+import os
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_LEN = 4000
+COALESCE_WINDOW = float(os.environ.get('TELEGRAM_COALESCE_WINDOW', '2.0'))
+MIN_INTERVAL = float(os.environ.get('TELEGRAM_MIN_INTERVAL', '1.0'))
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 2.0
+FLUSH_TIMEOUT = 30.0
+
+Destination = Tuple[str, str]  # (bot token, chat id)
+
+
+def default_destinations() -> List[Destination]:
+    """환경변수의 개인 봇 + 채널 봇 (미설정/placeholder는 제외)"""
+    destinations = []
+    token = os.getenv("TELEGRAM_BOT_TOKEN")
+    chat_id = os.getenv("TELEGRAM_CHAT_ID")
+    if token and chat_id and "your_bot_token" not in token:
+        destinations.append((token, chat_id))
+    ch_token = os.getenv("TELEGRAM_CHANNEL_BOT_TOKEN")
+    ch_chat_id = os.getenv("TELEGRAM_CHANNEL_CHAT_ID")
+    if ch_token and ch_chat_id:
+        destinations.append((ch_token, ch_chat_id))
+    return destinations
+
+
+def split_message(message: str, max_len: int = MAX_LEN) -> List[str]:
+    """문단(빈 줄) 단위로 max_len 이하 조각으로 분할 (문단 하나가 넘치면 줄/글자 단위)"""
+    if len(message) <= max_len:
+        return [message]
+
+    chunks = []
+    current = ""
+    for paragraph in message.split("\n\n"):
+        while len(paragraph) > max_len:
+            cut = paragraph.rfind("\n", 0, max_len)
+            cut = cut if cut > 0 else max_len
+            if current:
+                chunks.append(current.strip())
+                current = ""
+            chunks.append(paragraph[:cut].strip())
+            paragraph = paragraph[cut:].lstrip("\n")
+        if len(current) + len(paragraph) + 2 > max_len:
+            if current:
+                chunks.append(current.strip())
+            current = paragraph
+        else:
+            current = current + "\n\n" + paragraph if current else paragraph
+    if current.strip():
+        chunks.append(current.strip())
+    return chunks
+
+
+class _Message:
+    __slots__ = ('text', 'parse_mode', 'coalesce', 'enqueued_at', 'not_before', 'attempts')
+
+    def __init__(self, text: str, parse_mode: Optional[str], coalesce: bool):
+        self.text = text
+        self.parse_mode = parse_mode
+        self.coalesce = coalesce
+        self.enqueued_at = time.monotonic()
+        self.not_before = 0.0
+        self.attempts = 0
+
+
+class TelegramQueue:
+    """채팅별 대기열 + 단일 발신 스레드"""
+
+    def __init__(self, min_interval: float = MIN_INTERVAL, coalesce_window: float = COALESCE_WINDOW,
+                 post=None):
+        """
+        Args:
+            post: (url, payload) → (status_code, json) 전송 함수 (기본: requests.post)
+        """
+        self.min_interval = min_interval
+        self.coalesce_window = coalesce_window
+        self._post = post or _requests_post
+        self._queues: Dict[Destination, Deque[_Message]] = {}
+        self._last_sent: Dict[Destination, float] = {}
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self.stats = {'queued': 0, 'sent': 0, 'coalesced': 0, 'retried': 0, 'dropped': 0}
+
+    # ── 입력 ──
+
+    def enqueue(self, message: str, destinations: List[Destination] = None,
+                parse_mode: Optional[str] = 'HTML', coalesce: bool = True) -> bool:
+        """큐에 넣고 즉시 반환 (전송 대상이 없으면 False)"""
+        destinations = default_destinations() if destinations is None else destinations
+        if not destinations or not message:
+            return False
+        chunks = split_message(message)
+        with self._cond:
+            for dest in destinations:
+                queue = self._queues.setdefault(dest, deque())
+                for chunk in chunks:
+                    # 분할 조각은 이미 한도에 가까우므로 병합 대상에서 제외
+                    queue.append(_Message(chunk, parse_mode, coalesce and len(chunks) == 1))
+                    self.stats['queued'] += 1
+            self._ensure_thread()
+            self._cond.notify_all()
+        return True
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(len(q) for q in self._queues.values()) + self._in_flight
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """큐가 빌 때까지 대기 (timeout 내 완료 여부)"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while any(self._queues.values()) or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining)
+        return True
+
+    # ── 발신 스레드 ──
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name='TelegramSender')
+            self._thread.start()
+
+    def _ready_at(self, dest: Destination, head: _Message) -> float:
+        ready = max(self._last_sent.get(dest, 0.0) + self.min_interval, head.not_before)
+        if head.coalesce:
+            # 병합 창이 끝날 때까지 뒤따르는 메시지를 기다림
+            ready = max(ready, head.enqueued_at + self.coalesce_window)
+        return ready
+
+    def _next_batch(self) -> Tuple[Optional[Destination], Optional[_Message], float]:
+        """전송 가능한 가장 이른 채팅의 (병합된) 메시지, 없으면 다음 확인까지 대기 시간"""
+        now = time.monotonic()
+        best, best_at = None, None
+        for dest, queue in self._queues.items():
+            if not queue:
+                continue
+            at = self._ready_at(dest, queue[0])
+            if best_at is None or at < best_at:
+                best, best_at = dest, at
+        if best is None:
+            return None, None, 60.0
+        if best_at > now:
+            return None, None, best_at - now
+
+        queue = self._queues[best]
+        head = queue.popleft()
+        if head.coalesce:
+            merged = 0
+            while queue and queue[0].coalesce and queue[0].parse_mode == head.parse_mode \
+                    and len(head.text) + len(queue[0].text) + 2 <= MAX_LEN:
+                head.text = head.text + "\n\n" + queue.popleft().text
+                merged += 1
+            if merged:
+                self.stats['coalesced'] += merged
+                head.coalesce = False  # 재시도 시 다시 합치지 않도록
+        return best, head, 0.0
+
+    def _run(self):
+        while True:
+            with self._cond:
+                dest, msg, wait = self._next_batch()
+                while dest is None:
+                    self._cond.wait(timeout=wait)
+                    dest, msg, wait = self._next_batch()
+                self._in_flight += 1
+            retry_after = None
+            try:
+                retry_after = self._deliver(dest, msg)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._last_sent[dest] = time.monotonic()
+                    if retry_after is not None:
+                        msg.not_before = time.monotonic() + retry_after
+                        self._queues[dest].appendleft(msg)
+                        self.stats['retried'] += 1
+                    self._cond.notify_all()
+
+    def _deliver(self, dest: Destination, msg: _Message) -> Optional[float]:
+        """한 건 전송 — 재시도가 필요하면 대기 초, 끝났으면(성공/포기) None"""
+        token, chat_id = dest
+        payload = {"chat_id": chat_id, "text": msg.text}
+        if msg.parse_mode:
+            payload["parse_mode"] = msg.parse_mode
+        msg.attempts += 1
+        try:
+            status, body = self._post(f"https://api.telegram.org/bot{token}/sendMessage", payload)
+        except Exception as e:
+            status, body = None, {'description': str(e)}
+
+        if status == 200:
+            self.stats['sent'] += 1
+            return None
+        description = (body or {}).get('description', '')
+        if status == 400 and msg.parse_mode and 'parse' in description.lower():
+            logger.warning(f"텔레그램 파싱 오류 → 일반 텍스트로 재전송: {description[:120]}")
+            msg.parse_mode = None
+            return 0.0
+        if msg.attempts >= MAX_ATTEMPTS or (status is not None and 400 <= status < 500 and status != 429):
+            self.stats['dropped'] += 1
+            logger.error(f"텔레그램 전송 실패 (chat {chat_id}, {msg.attempts}회): {status} {description[:200]}")
+            return None
+        if status == 429:
+            return float((body or {}).get('parameters', {}).get('retry_after', 5))
+        return BACKOFF_BASE ** msg.attempts
+
+    def status(self) -> dict:
+        with self._cond:
+            return {**self.stats, 'pending': sum(len(q) for q in self._queues.values()) + self._in_flight}
+
+
+def _requests_post(url: str, payload: dict):
+    import requests
+    r = requests.post(url, json=payload, timeout=10)
+    try:
+        body = r.json()
+    except ValueError:
+        body = {'description': r.text[:200]}
+    return r.status_code, body
+
+
+_queue: Optional[TelegramQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_telegram_queue() -> TelegramQueue:
+    """TelegramQueue 싱글톤 (첫 사용 시 종료 전 flush 등록)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = TelegramQueue()
+            atexit.register(_flush_at_exit)
+        return _queue
+
+
+def notify(message: str, destinations: List[Destination] = None,
+           parse_mode: Optional[str] = 'HTML', coalesce: bool = True) -> bool:
+    """텔레그램 메시지 비동기 전송 (큐 적재 여부 반환 — 전송 대상 미설정이면 False)"""
+    return get_telegram_queue().enqueue(message, destinations, parse_mode=parse_mode, coalesce=coalesce)
+
+
+def flush(timeout: float = FLUSH_TIMEOUT) -> bool:
+    """대기 중인 메시지 전송 완료까지 대기"""
+    if _queue is None:
+        return True
+    return _queue.flush(timeout)
+
+
+def _flush_at_exit():
+    if _queue is not None and _queue.pending():
+        if not _queue.flush(FLUSH_TIMEOUT):
+            logger.warning(f"텔레그램 미전송 {_queue.pending()}건 — 종료 시한 초과")
@@ -0,0 +1,480 @@
+"""공용 OHLCV 데이터 레이크 (심볼/주기별 파티션 + 증분 추가 + 프로세스 간 잠금)
+
+KR/US/크립토 파이프라인이 SPY, ^VIX, BTC-USD, 섹터 ETF 같은 겹치는 심볼을 각자
+yf.download로 받던 것을 한곳으로 모은다. 심볼별 파티션 파일에 일봉을 쌓아 두고,
+조회 시 해당 시장의 마지막 장 마감 이후 아직 받지 않은 심볼만 마지막 봉 이후 구간을
+증분으로 받아 붙인다.
+→ 같은 심볼-일자는 시스템 전체에서 하루 한 번만 다운로드된다. 다른 모듈은 yf.download 대신
+  get_panel/get_close/get_ohlcv를 호출하기만 하면 된다.
+
+- 저장: data/ohlcv_lake/<interval>/<심볼>.parquet (+ <심볼>.meta.json)
+  pyarrow/fastparquet 미설치 환경에서는 같은 위치에 .pkl(pandas pickle)로 저장
+- 잠금: 심볼별 FileLock — 다른 프로세스가 같은 심볼을 받는 중이면 기다렸다가 그 결과를 읽음
+- 신선도: 심볼의 시장(US 16:00 ET / KR 15:30 KST / 크립토 00:00 UTC) 마지막 장 마감 +
+  CLOSE_SETTLE_MINUTES 이후에 받은 데이터만 최신으로 취급 → 장중에 받은 미완성 봉은
+  장 마감 뒤 첫 조회에서 다시 받음
+- 증분: 마지막 봉 OVERLAP_BARS개 전부터 다시 받아 덮어씀 (장중에 받은 미완성 봉 보정)
+  다시 받은 겹침 봉의 종가가 저장된 봉과 ADJUSTMENT_TOLERANCE 이상 어긋나면 그 사이 분할/배당으로
+  수정주가가 바뀐 것이므로 해당 심볼은 커버 구간 전체를 다시 받아 파티션을 교체
+- 조회: 여러 심볼을 날짜 합집합 인덱스로 정렬한 (필드, 심볼) MultiIndex 프레임
+  → 기존 yf.download(...)['Close'] 코드를 그대로 대체 가능
+- 가격은 yfinance 기본값과 같은 수정주가(auto_adjust=True)
+
+설정 (환경변수):
+    OHLCV_LAKE_DIR       저장 위치 (기본: data/ohlcv_lake)
+    OHLCV_LAKE_DISABLED  true면 레이크를 거치지 않고 매번 직접 다운로드
+
+사용법:
+    from app.utils.ohlcv_lake import get_panel, get_close, get_ohlcv
+
+    close = get_close(['SPY', '^VIX', 'XLK'], period='1y')
+    panel = get_panel(['BTC-USD', 'ETH-USD'], start='2023-01-01')   # panel['Close'], panel['Volume']
+    spy = get_ohlcv('SPY', period='6mo')                              # Open/High/Low/Close/Volume
+"""
+import os
+import re
+import json
+import time
+import logging
+from contextlib import ExitStack
+from datetime import datetime, time as dt_time, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from filelock import FileLock, Timeout
+
+try:
+    from app.utils import perf
+except ImportError:
+    perf = None
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+LAKE_DIR = os.environ.get('OHLCV_LAKE_DIR') or os.path.join(_BASE_DIR, 'data', 'ohlcv_lake')
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+OVERLAP_BARS = 5            # 증분 시 다시 받는 최근 봉 수
+FETCH_BATCH = 50            # 한 번에 잠그고 받는 심볼 수 (파일 핸들 수 제한)
+FAILURE_RETRY_MINUTES = 30  # 다운로드 실패 심볼 재시도 간격
+LOCK_TIMEOUT = 300
+CLOSE_SETTLE_MINUTES = 30   # 장 마감 후 일봉이 확정될 때까지의 여유
+ADJUSTMENT_TOLERANCE = 0.005  # 겹침 봉 종가 비율이 이만큼 어긋나면 수정주가 재계산으로 판단
+
+# 시장별 일봉 마감 (시간대, 마감 시각, 주말 휴장 여부)
+MARKET_CLOSE = {
+    'us': ('America/New_York', dt_time(16, 0), True),
+    'kr': ('Asia/Seoul', dt_time(15, 30), True),
+    'crypto': ('UTC', dt_time(0, 0), False),
+}
+_KR_INDICES = {'^KS11', '^KQ11', '^KS200'}
+_CRYPTO_PATTERN = re.compile(r'^[A-Z0-9]+-(USD|USDT|KRW|BTC|ETH)$')
+
+
+def _parquet_available() -> bool:
+    for module in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+STORAGE_EXT = '.parquet' if _parquet_available() else '.pkl'
+
+
+def _empty_frame() -> pd.DataFrame:
+    return pd.DataFrame(columns=FIELDS, index=pd.DatetimeIndex([], name='Date'), dtype='float64')
+
+
+def _disabled() -> bool:
+    return os.environ.get('OHLCV_LAKE_DISABLED', '').lower() in ('true', '1')
+
+
+# ── 파티션 파일 ──
+
+def _safe_name(symbol: str) -> str:
+    """파일명에 쓸 수 없는 문자(^, =, / 등)는 %XX로 치환"""
+    return re.sub(r'[^A-Za-z0-9._-]', lambda m: f'%{ord(m.group()):02X}', symbol.upper())
+
+
+def _paths(symbol: str, interval: str) -> Dict[str, str]:
+    base = os.path.join(LAKE_DIR, interval, _safe_name(symbol))
+    return {
+        'data': base + STORAGE_EXT,
+        'meta': base + '.meta.json',
+        'lock': base + '.lock',
+    }
+
+
+def _read_meta(path: str) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(path: str, meta: dict):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _read_partition(symbol: str, interval: str) -> pd.DataFrame:
+    data_path = _paths(symbol, interval)['data']
+    # 저장 형식이 바뀐 경우(pyarrow 설치 전후) 다른 확장자 파일도 읽는다
+    for path in (data_path, os.path.splitext(data_path)[0] + ('.pkl' if STORAGE_EXT == '.parquet' else '.parquet')):
+        if not os.path.exists(path):
+            continue
+        try:
+            if path.endswith('.parquet'):
+                return pd.read_parquet(path)
+            return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"레이크 파티션 읽기 실패 ({symbol}/{interval}): {e}")
+    return _empty_frame()
+
+
+def _write_partition(symbol: str, interval: str, df: pd.DataFrame):
+    data_path = _paths(symbol, interval)['data']
+    tmp_path = data_path + '.tmp'
+    if STORAGE_EXT == '.parquet':
+        df.to_parquet(tmp_path)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, data_path)
+
+
+# ── 기간 계산 ──
+
+def _today() -> pd.Timestamp:
+    return pd.Timestamp(datetime.now().date())
+
+
+def _period_start(period: str) -> pd.Timestamp:
+    """yfinance period 문자열 → 시작일 ('5d'처럼 일 단위면 주말/휴장 여유를 두고 넉넉히)"""
+    today = _today()
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period or '')
+    if period == 'ytd':
+        return today.replace(month=1, day=1)
+    if period == 'max' or not match:
+        return pd.Timestamp('1970-01-01')
+    n, unit = int(match.group(1)), match.group(2)
+    if unit == 'd':
+        return today - pd.Timedelta(days=n * 7 // 5 + 7)
+    if unit == 'wk':
+        return today - pd.DateOffset(weeks=n)
+    if unit == 'mo':
+        return today - pd.DateOffset(months=n)
+    return today - pd.DateOffset(years=n)
+
+
+def _normalize_index(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    idx = pd.DatetimeIndex(df.index)
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    if interval in ('1d', '5d', '1wk', '1mo', '3mo'):
+        idx = idx.normalize()
+    df = df.copy()
+    df.index = idx.astype('datetime64[ns]')
+    df.index.name = 'Date'
+    return df
+
+
+# ── 다운로드 ──
+
+def _download(symbols: List[str], start: pd.Timestamp, interval: str, session=None) -> Dict[str, pd.DataFrame]:
+    """yf.download 한 번으로 여러 심볼 수신 → {심볼: OHLCV 프레임} (빈 결과 심볼은 제외)"""
+    import yfinance as yf
+
+    kwargs = dict(start=start.strftime('%Y-%m-%d'), interval=interval, group_by='ticker',
+                  auto_adjust=True, progress=False, threads=len(symbols) > 1)
+    if session is not None:
+        kwargs['session'] = session
+    data = yf.download(symbols, **kwargs)
+    if data is None or data.empty:
+        return {}
+
+    result = {}
+    for symbol in symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            frame = data[symbol]
+        elif len(symbols) == 1:
+            frame = data
+        else:
+            continue
+        frame = frame.reindex(columns=FIELDS).dropna(how='all')
+        if not frame.empty:
+            result[symbol] = _normalize_index(frame, interval)
+    return result
+
+
+def _market(symbol: str) -> str:
+    """심볼 → 일봉 마감 기준 시장 (KR 종목/지수, 크립토 페어, 그 외는 US 마감 기준)"""
+    symbol = symbol.upper()
+    if symbol.endswith(('.KS', '.KQ')) or symbol in _KR_INDICES:
+        return 'kr'
+    if _CRYPTO_PATTERN.match(symbol):
+        return 'crypto'
+    return 'us'
+
+
+def _last_close(symbol: str, now: datetime = None) -> datetime:
+    """심볼 시장의 마지막으로 확정된 일봉 마감 시각 (시간대 포함, 공휴일은 고려하지 않음)"""
+    from zoneinfo import ZoneInfo
+
+    tz_name, close_time, weekdays_only = MARKET_CLOSE[_market(symbol)]
+    tz = ZoneInfo(tz_name)
+    now = (now or datetime.now().astimezone()).astimezone(tz)
+    settle = timedelta(minutes=CLOSE_SETTLE_MINUTES)
+    close = datetime.combine(now.date(), close_time, tzinfo=tz) + settle
+    while close > now or (weekdays_only and (close - settle).weekday() >= 5):
+        close -= timedelta(days=1)
+    return close
+
+
+def _is_fresh(symbol: str, meta: dict, start: pd.Timestamp, max_age_hours: Optional[float]) -> bool:
+    """시장의 마지막 장 마감 이후에 받았고 요청 시작일까지 커버하면 다운로드 생략"""
+    fetched_at = meta.get('fetched_at')
+    if not fetched_at:
+        return False
+    fetched_at = datetime.fromisoformat(fetched_at).astimezone()   # 로컬 시각으로 저장됨
+    if fetched_at < _last_close(symbol):
+        return False
+    if max_age_hours is not None and datetime.now().astimezone() - fetched_at > timedelta(hours=max_age_hours):
+        return False
+    covered = meta.get('start')
+    return covered is not None and pd.Timestamp(covered) <= start
+
+
+def _recently_failed(meta: dict) -> bool:
+    failed_at = meta.get('failed_at')
+    if not failed_at:
+        return False
+    return datetime.now() - datetime.fromisoformat(failed_at) < timedelta(minutes=FAILURE_RETRY_MINUTES)
+
+
+def _fetch_start(meta: dict, existing: pd.DataFrame, start: pd.Timestamp) -> pd.Timestamp:
+    """필요한 구간의 시작일 — 커버 범위 밖이면 요청 시작일부터, 아니면 최근 봉부터 증분"""
+    covered = meta.get('start')
+    if existing.empty or covered is None or pd.Timestamp(covered) > start:
+        return start
+    tail = existing.index[-OVERLAP_BARS:] if len(existing) >= OVERLAP_BARS else existing.index
+    return pd.Timestamp(tail[0]).normalize()
+
+
+def _adjustment_changed(existing: pd.DataFrame, new: pd.DataFrame) -> bool:
+    """겹치는 확정 봉의 종가 비율(새/기존) 중앙값이 1에서 벗어났는지 — 분할/배당 반영 여부
+
+    기존 마지막 봉은 장중에 받은 미완성 봉일 수 있어 비교에서 제외한다.
+    """
+    common = existing.index[:-1].intersection(new.index)
+    if common.empty:
+        return False
+    ratio = (new.loc[common, 'Close'] / existing.loc[common, 'Close']).dropna()
+    ratio = ratio[ratio > 0]
+    if ratio.empty:
+        return False
+    return abs(float(ratio.median()) - 1.0) > ADJUSTMENT_TOLERANCE
+
+
+def _store(symbol: str, interval: str, meta: dict, existing: pd.DataFrame,
+           new: pd.DataFrame, fetch_start: pd.Timestamp, now: str):
+    """새로 받은 봉이 기존 봉을 덮어쓰도록 병합해 파티션/메타 저장"""
+    merged = pd.concat([existing[~existing.index.isin(new.index)], new]).sort_index()
+    _write_partition(symbol, interval, merged[FIELDS])
+    covered = meta.get('start')
+    meta.update({
+        'symbol': symbol,
+        'interval': interval,
+        'start': str(min(pd.Timestamp(covered), fetch_start).date()) if covered else str(fetch_start.date()),
+        'last_bar': str(merged.index[-1]),
+        'rows': len(merged),
+        'fetched_at': now,
+    })
+    meta.pop('failed_at', None)
+    _write_meta(_paths(symbol, interval)['meta'], meta)
+
+
+def _refresh_batch(symbols: List[str], start: pd.Timestamp, interval: str,
+                   max_age_hours: Optional[float], session=None):
+    """심볼 묶음을 잠그고 (다른 프로세스가 먼저 받았는지 재확인 후) 필요한 구간만 수신·병합"""
+    with ExitStack() as stack:
+        for symbol in sorted(symbols):  # 정렬된 순서로 잠가 교착 방지
+            stack.enter_context(FileLock(_paths(symbol, interval)['lock'], timeout=LOCK_TIMEOUT))
+
+        # 잠금 대기 중에 다른 프로세스가 받았을 수 있으므로 재확인
+        pending = {}
+        for symbol in symbols:
+            meta = _read_meta(_paths(symbol, interval)['meta'])
+            if _is_fresh(symbol, meta, start, max_age_hours) or _recently_failed(meta):
+                continue
+            existing = _read_partition(symbol, interval)
+            pending[symbol] = (meta, existing, _fetch_start(meta, existing, start))
+        if not pending:
+            return
+
+        # 같은 시작일끼리 묶어서 한 번에 다운로드
+        groups: Dict[pd.Timestamp, List[str]] = {}
+        for symbol, (_, _, fetch_start) in pending.items():
+            groups.setdefault(fetch_start, []).append(symbol)
+
+        # 증분 수신 중 수정주가가 바뀐 심볼 → 커버 시작일부터 전체 재수신
+        readjust: Dict[pd.Timestamp, List[str]] = {}
+
+        for fetch_start, group in groups.items():
+            try:
+                fetched = _download(group, fetch_start, interval, session=session)
+            except Exception as e:
+                logger.warning(f"레이크 다운로드 실패 ({len(group)}개, {fetch_start.date()}~): {e}")
+                fetched = {}
+            if perf is not None:
+                perf.count('lake_fetched', len(fetched))
+
+            now = datetime.now().isoformat(timespec='seconds')
+            for symbol in group:
+                meta, existing, _ = pending[symbol]
+                new = fetched.get(symbol)
+                if new is None:
+                    meta['failed_at'] = now
+                    _write_meta(_paths(symbol, interval)['meta'], meta)
+                    continue
+                covered = meta.get('start')
+                if covered and not existing.empty and _adjustment_changed(existing, new):
+                    logger.info(f"레이크 수정주가 변경 감지 ({symbol}) — {covered}부터 다시 받음")
+                    readjust.setdefault(pd.Timestamp(covered), []).append(symbol)
+                    continue
+                _store(symbol, interval, meta, existing, new, fetch_start, now)
+
+        for fetch_start, group in readjust.items():
+            try:
+                fetched = _download(group, fetch_start, interval, session=session)
+            except Exception as e:
+                logger.warning(f"레이크 재수신 실패 ({len(group)}개, {fetch_start.date()}~): {e}")
+                fetched = {}
+            if perf is not None:
+                perf.count('lake_readjusted', len(fetched))
+
+            now = datetime.now().isoformat(timespec='seconds')
+            for symbol in group:
+                meta = pending[symbol][0]
+                new = fetched.get(symbol)
+                if new is None:
+                    # 어긋난 기존 봉에 붙이지 않고 다음 재시도까지 기존 데이터 유지
+                    meta['failed_at'] = now
+                    _write_meta(_paths(symbol, interval)['meta'], meta)
+                    continue
+                _store(symbol, interval, meta, _empty_frame(), new, fetch_start, now)
+
+
+def refresh(symbols: Iterable[str], start: pd.Timestamp, interval: str = '1d',
+            max_age_hours: Optional[float] = None, session=None,
+            batch_size: int = FETCH_BATCH, pause: float = 0.0) -> List[str]:
+    """오래된 심볼만 증분 갱신
+
+    Args:
+        max_age_hours: 마지막 장 마감 이후라도 이 시간보다 오래 전에 받았으면 다시 받음
+            (None이면 장 마감마다 한 번 — 24시간 거래되는 크립토 등 진행 중인 봉이 필요한 경우 지정)
+        batch_size: 한 번에 받는 심볼 수
+        pause: 묶음 사이 대기(초) — 대량 수신 시 rate limit 회피
+
+    Returns:
+        갱신을 시도한 심볼 목록
+    """
+    os.makedirs(os.path.join(LAKE_DIR, interval), exist_ok=True)
+    stale = []
+    for symbol in dict.fromkeys(symbols):
+        meta = _read_meta(_paths(symbol, interval)['meta'])
+        if not _is_fresh(symbol, meta, start, max_age_hours) and not _recently_failed(meta):
+            stale.append(symbol)
+    if perf is not None:
+        perf.count('lake_hits', len(set(symbols)) - len(stale))
+    for i in range(0, len(stale), batch_size):
+        if i and pause:
+            time.sleep(pause)
+        batch = stale[i:i + batch_size]
+        try:
+            _refresh_batch(batch, start, interval, max_age_hours, session=session)
+        except Timeout:
+            logger.warning(f"레이크 잠금 타임아웃 — 기존 데이터로 진행: {batch}")
+    return stale
+
+
+# ── 조회 API ──
+
+def _resolve_range(start=None, end=None, period: str = None):
+    start_ts = pd.Timestamp(start).normalize() if start is not None else _period_start(period or '1y')
+    end_ts = pd.Timestamp(end) if end is not None else None
+    tail = None
+    match = re.fullmatch(r'(\d+)d', period or '')
+    if start is None and match:
+        tail = int(match.group(1))
+    return start_ts, end_ts, tail
+
+
+def get_panel(symbols: Iterable[str], start=None, end=None, period: str = None,
+              interval: str = '1d', max_age_hours: Optional[float] = None,
+              session=None, batch_size: int = FETCH_BATCH, pause: float = 0.0) -> pd.DataFrame:
+    """여러 심볼 OHLCV를 날짜 합집합 인덱스로 정렬한 (필드, 심볼) MultiIndex 프레임
+
+    yf.download(symbols, ...)와 같은 열 구조라 panel['Close'], panel['Volume']로 바로 쓸 수 있다.
+
+    Args:
+        start: 시작일 (지정 시 period 무시)
+        end: 종료일 (yfinance와 같이 미포함)
+        period: '5d', '3mo', '1y', 'ytd', 'max' 등 (start 미지정 시, 기본 '1y')
+    """
+    symbols = list(dict.fromkeys(symbols))
+    start_ts, end_ts, tail = _resolve_range(start, end, period)
+
+    if _disabled():
+        frames = _download(symbols, start_ts, interval, session=session)
+    else:
+        refresh(symbols, start_ts, interval, max_age_hours=max_age_hours, session=session,
+                batch_size=batch_size, pause=pause)
+        frames = {s: _read_partition(s, interval) for s in symbols}
+
+    columns = pd.MultiIndex.from_product([FIELDS, symbols], names=['Price', 'Ticker'])
+    sliced = {}
+    for symbol, df in frames.items():
+        df = df.loc[df.index >= start_ts]
+        if end_ts is not None:
+            df = df.loc[df.index < end_ts]
+        if not df.empty:
+            sliced[symbol] = df
+    if not sliced:
+        return pd.DataFrame(columns=columns)
+
+    panel = pd.concat(sliced, axis=1, names=['Ticker', 'Price']).swaplevel(axis=1)
+    panel = panel.reindex(columns=columns).sort_index()
+    panel.index.name = 'Date'
+    if tail is not None:
+        panel = panel.tail(tail)
+    return panel
+
+
+def get_close(symbols: Iterable[str], **kwargs) -> pd.DataFrame:
+    """종가만 (열 = 심볼)"""
+    return get_panel(symbols, **kwargs)['Close']
+
+
+def get_ohlcv(symbol: str, **kwargs) -> pd.DataFrame:
+    """단일 심볼 OHLCV (열 = Open/High/Low/Close/Volume, 데이터 없으면 빈 프레임)"""
+    panel = get_panel([symbol], **kwargs)
+    if panel.empty:
+        return _empty_frame()
+    return panel.xs(symbol, axis=1, level='Ticker').dropna(how='all')
+
+
+def status(interval: str = '1d') -> List[dict]:
+    """저장된 심볼별 메타 (커버 시작일, 마지막 봉, 마지막 수신 시각)"""
+    directory = os.path.join(LAKE_DIR, interval)
+    if not os.path.isdir(directory):
+        return []
+    return [_read_meta(os.path.join(directory, name))
+            for name in sorted(os.listdir(directory)) if name.endswith('.meta.json')]
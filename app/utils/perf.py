@@ -0,0 +1,451 @@
+"""파이프라인 성능 텔레메트리 (단계별 span + 카운터 → SQLite 시계열)
+
+스케줄러/업데이트 스크립트의 각 단계를 span으로, 단계 스크립트 안의 구간(fetch, parse, score,
+llm, write)을 그 아래 하위 span으로 기록하고, HTTP 호출 수 / 캐시 적중 / 처리 행 수 같은 카운터를 span에 붙인다.
+결과는 data/perf.db(SQLite, WAL)에 쌓이며 /api/system/perf 와 CLI에서
+일별 추이와 회귀(최근 평균이 기준 기간 대비 느려진 단계)를 조회한다.
+
+- span 경로는 중첩 구조를 그대로 반영 (예: round2/vcp_signals/KR VCP + 외인매집 시그널 스캔/vcp_filter)
+- step: 서브프로세스로 띄운 단계 전체는 'subprocess', 스크립트 안의 실제 구간만 fetch/parse/score/llm/write
+- 스레드: contextvars 기반 — 작업 그래프는 제출 시 컨텍스트를 복사해 부모 span을 잇는다
+- 자식 프로세스: child_env()의 MARKETFLOW_PERF_PARENT로 부모 경로 전달
+  (warm_pool 자식은 HTTP 카운터도 자동 설치)
+- 비활성화: MARKETFLOW_PERF=false / 저장 위치: MARKETFLOW_PERF_DB
+- 기록 실패는 파이프라인에 영향을 주지 않도록 무시 (debug 로그만)
+
+사용법:
+    from app.utils import perf
+
+    with perf.span('round2'):
+        with perf.span('vcp_scan', step='score'):
+            perf.count('rows', len(df))
+
+    @perf.timed('crypto_pipeline')
+    def run_crypto_pipeline(): ...
+
+    python -m app.utils.perf --days 14          # 일별 추이 + 회귀
+    python -m app.utils.perf --path round2 --regressions
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import sqlite3
+import logging
+import argparse
+import threading
+import contextvars
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_DB_PATH = os.path.join(_BASE_DIR, 'data', 'perf.db')
+PARENT_ENV = 'MARKETFLOW_PERF_PARENT'
+
+OK = 'ok'
+ERROR = 'error'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    step TEXT,
+    elapsed REAL NOT NULL,
+    status TEXT NOT NULL,
+    pid INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_spans_path_day ON spans(path, day);
+CREATE INDEX IF NOT EXISTS idx_spans_day ON spans(day);
+CREATE TABLE IF NOT EXISTS counters (
+    span_id INTEGER,
+    day TEXT NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_counters_path_day ON counters(path, day);
+"""
+
+
+def is_enabled() -> bool:
+    return os.environ.get('MARKETFLOW_PERF', 'true').lower() == 'true'
+
+
+def _db_path() -> str:
+    return os.environ.get('MARKETFLOW_PERF_DB', DEFAULT_DB_PATH)
+
+
+# ============================================================
+# 저장소
+# ============================================================
+
+class PerfStore:
+    """SQLite 시계열 저장소 (쓰기마다 짧은 연결 — 여러 프로세스가 동시에 기록)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        if not self._initialized:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+        return conn
+
+    def record_span(self, path: str, name: str, step: Optional[str], started_at: float,
+                    elapsed: float, status: str, counters: Dict[str, float]):
+        day = datetime.fromtimestamp(started_at).strftime('%Y-%m-%d')
+        conn = self._connect()
+        try:
+            with conn:
+                cur = conn.execute(
+                    'INSERT INTO spans (day, started_at, path, name, step, elapsed, status, pid) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (day, started_at, path, name, step, elapsed, status, os.getpid()))
+                conn.executemany(
+                    'INSERT INTO counters (span_id, day, path, name, value) VALUES (?, ?, ?, ?, ?)',
+                    [(cur.lastrowid, day, path, k, v) for k, v in counters.items()])
+        finally:
+            conn.close()
+
+    def record_counters(self, path: str, counters: Dict[str, float]):
+        """span 밖에서 쌓인 카운터 (span_id 없음)"""
+        if not counters:
+            return
+        day = datetime.now().strftime('%Y-%m-%d')
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    'INSERT INTO counters (span_id, day, path, name, value) VALUES (NULL, ?, ?, ?, ?)',
+                    [(day, path, k, v) for k, v in counters.items()])
+        finally:
+            conn.close()
+
+    # ── 조회 ──
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        if not os.path.exists(self.db_path):
+            return []
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def daily_trends(self, days: int = 14, path_prefix: str = None) -> List[dict]:
+        """경로 × 일자별 실행 수 / 평균·최대 소요 시간 / 실패 수 / 카운터 합계"""
+        since = (datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        where, params = 'day >= ?', [since]
+        if path_prefix:
+            where += ' AND (path = ? OR path LIKE ?)'
+            params += [path_prefix, path_prefix + '/%']
+
+        rows = self._query(
+            f'SELECT path, day, step, COUNT(*) AS runs, AVG(elapsed) AS avg_sec, MAX(elapsed) AS max_sec, '
+            f"SUM(status != 'ok') AS failures FROM spans WHERE {where} "
+            f'GROUP BY path, day ORDER BY path, day', tuple(params))
+        counter_rows = self._query(
+            f'SELECT path, day, name, SUM(value) AS total FROM counters WHERE {where} '
+            f'GROUP BY path, day, name', tuple(params))
+
+        counters: Dict[tuple, dict] = {}
+        for r in counter_rows:
+            counters.setdefault((r['path'], r['day']), {})[r['name']] = r['total']
+
+        trends = []
+        for r in rows:
+            trends.append({
+                'path': r['path'],
+                'day': r['day'],
+                'step': r['step'],
+                'runs': r['runs'],
+                'avg_sec': round(r['avg_sec'], 3),
+                'max_sec': round(r['max_sec'], 3),
+                'failures': r['failures'],
+                'counters': counters.pop((r['path'], r['day']), {}),
+            })
+        # span 없이 기록된 카운터 (자식 프로세스의 HTTP 호출 수 등)
+        for (path, day), values in sorted(counters.items()):
+            trends.append({'path': path, 'day': day, 'step': None, 'runs': 0,
+                           'avg_sec': None, 'max_sec': None, 'failures': 0, 'counters': values})
+        return trends
+
+    def find_regressions(self, recent_days: int = 3, baseline_days: int = 14,
+                         threshold: float = 1.3, min_seconds: float = 1.0,
+                         path_prefix: str = None) -> List[dict]:
+        """최근 recent_days 평균이 직전 baseline_days 평균보다 threshold배 이상 느린 단계"""
+        now = datetime.now()
+        recent_since = (now - timedelta(days=recent_days - 1)).strftime('%Y-%m-%d')
+        base_since = (now - timedelta(days=recent_days + baseline_days - 1)).strftime('%Y-%m-%d')
+        where, params = "day >= ? AND status = 'ok'", [base_since]
+        if path_prefix:
+            where += ' AND (path = ? OR path LIKE ?)'
+            params += [path_prefix, path_prefix + '/%']
+
+        rows = self._query(
+            'SELECT path, '
+            'AVG(CASE WHEN day >= ? THEN elapsed END) AS recent_sec, '
+            'AVG(CASE WHEN day < ? THEN elapsed END) AS baseline_sec, '
+            'SUM(day >= ?) AS recent_runs, SUM(day < ?) AS baseline_runs '
+            f'FROM spans WHERE {where} GROUP BY path',
+            (recent_since,) * 4 + tuple(params))
+
+        regressions = []
+        for r in rows:
+            recent, baseline = r['recent_sec'], r['baseline_sec']
+            if recent is None or not baseline or recent < min_seconds:
+                continue
+            ratio = recent / baseline
+            if ratio >= threshold:
+                regressions.append({
+                    'path': r['path'],
+                    'recent_sec': round(recent, 3),
+                    'baseline_sec': round(baseline, 3),
+                    'ratio': round(ratio, 2),
+                    'recent_runs': r['recent_runs'],
+                    'baseline_runs': r['baseline_runs'],
+                })
+        regressions.sort(key=lambda x: x['ratio'], reverse=True)
+        return regressions
+
+
+_store: Optional[PerfStore] = None
+_store_lock = threading.Lock()
+
+
+def get_perf_store() -> PerfStore:
+    """PerfStore 싱글톤 (MARKETFLOW_PERF_DB 반영)"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.db_path != _db_path():
+            _store = PerfStore(_db_path())
+        return _store
+
+
+# ============================================================
+# span / 카운터
+# ============================================================
+
+_current = contextvars.ContextVar('marketflow_perf_span', default=None)
+_orphan_counters: Dict[str, float] = {}
+_orphan_lock = threading.Lock()
+
+
+class Span:
+    """진행 중인 span — 카운터 누적 및 상태 지정"""
+
+    def __init__(self, name: str, path: str, step: Optional[str]):
+        self.name = name
+        self.path = path
+        self.step = step
+        self.status = OK
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def fail(self):
+        self.status = ERROR
+
+
+def current_path() -> str:
+    """현재 span 경로 (없으면 부모 프로세스가 넘긴 경로)"""
+    sp = _current.get()
+    if sp is not None:
+        return sp.path
+    return os.environ.get(PARENT_ENV, '')
+
+
+class span:
+    """단계 타이밍 컨텍스트 매니저 — 예외 시 status=error로 기록 후 예외 전파
+
+    Args:
+        name: 단계 이름 (경로의 마지막 요소)
+        step: 하위 단계 분류 (fetch / parse / score / llm / write / subprocess ...)
+    """
+
+    def __init__(self, name: str, step: str = None):
+        self.name = str(name).replace('/', '∕')
+        self.step = step
+        self._span: Optional[Span] = None
+        self._token = None
+        self._start = 0.0
+
+    def __enter__(self) -> Span:
+        parent = current_path()
+        path = f"{parent}/{self.name}" if parent else self.name
+        self._span = Span(self.name, path, self.step)
+        self._token = _current.set(self._span)
+        self._start = time.time()
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.time() - self._start
+        _current.reset(self._token)
+        sp = self._span
+        if exc_type is not None:
+            sp.status = ERROR
+        if is_enabled():
+            try:
+                get_perf_store().record_span(sp.path, sp.name, sp.step, self._start,
+                                             elapsed, sp.status, dict(sp.counters))
+            except Exception as e:
+                logger.debug(f"perf span 기록 실패: {e}")
+        return False
+
+
+def timed(name: str = None, step: str = None):
+    """함수 전체를 span으로 감싸는 데코레이터 — False 반환도 실패로 기록"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name or fn.__name__, step=step) as sp:
+                result = fn(*args, **kwargs)
+                if result is False:
+                    sp.fail()
+                return result
+        wrapper.perf_timed = True   # 호출부가 같은 함수를 span으로 다시 감싸지 않도록 표시
+        return wrapper
+    return decorator
+
+
+def count(name: str, value: float = 1):
+    """현재 span에 카운터 누적 (span 밖이면 프로세스 버퍼 → flush 시 기록)"""
+    sp = _current.get()
+    if sp is not None:
+        sp.count(name, value)
+        return
+    with _orphan_lock:
+        _orphan_counters[name] = _orphan_counters.get(name, 0) + value
+
+
+def flush():
+    """span 밖에서 쌓인 카운터 기록 (atexit / warm_pool 자식 종료 직전)"""
+    with _orphan_lock:
+        pending = dict(_orphan_counters)
+        _orphan_counters.clear()
+    if not pending or not is_enabled():
+        return
+    try:
+        get_perf_store().record_counters(current_path() or '-', pending)
+    except Exception as e:
+        logger.debug(f"perf 카운터 기록 실패: {e}")
+
+
+atexit.register(flush)
+
+
+def child_env() -> dict:
+    """자식 프로세스가 현재 span 아래에 기록하도록 넘길 환경변수"""
+    path = current_path()
+    return {PARENT_ENV: path} if path else {}
+
+
+_http_installed = False
+
+
+def install_http_counter():
+    """requests 전송마다 http_calls / http_errors 카운트 (프로세스당 1회)"""
+    global _http_installed
+    if _http_installed:
+        return
+    try:
+        import requests
+    except ImportError:
+        return
+    _http_installed = True
+    original_send = requests.Session.send
+
+    @wraps(original_send)
+    def send(self, request, **kwargs):
+        count('http_calls')
+        try:
+            response = original_send(self, request, **kwargs)
+        except Exception:
+            count('http_errors')
+            raise
+        if response.status_code >= 400:
+            count('http_errors')
+        return response
+
+    requests.Session.send = send
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def build_report(days: int = 14, path_prefix: str = None, recent_days: int = 3,
+                 threshold: float = 1.3) -> dict:
+    """/api/system/perf 및 CLI 공용 리포트"""
+    store = get_perf_store()
+    return {
+        'db': store.db_path,
+        'days': days,
+        'trends': store.daily_trends(days=days, path_prefix=path_prefix),
+        'regressions': store.find_regressions(recent_days=recent_days,
+                                              baseline_days=max(days - recent_days, 1),
+                                              threshold=threshold, path_prefix=path_prefix),
+    }
+
+
+def _format_counters(counters: dict) -> str:
+    return ', '.join(f"{k}={v:g}" for k, v in sorted(counters.items()))
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description='MarketFlow 파이프라인 성능 추이')
+    parser.add_argument('--days', type=int, default=14, help='조회 기간 (일)')
+    parser.add_argument('--path', default=None, help='span 경로 접두사 (예: round2)')
+    parser.add_argument('--recent', type=int, default=3, help='회귀 판정 최근 기간 (일)')
+    parser.add_argument('--threshold', type=float, default=1.3, help='회귀 판정 배수')
+    parser.add_argument('--regressions', action='store_true', help='회귀만 출력')
+    parser.add_argument('--json', action='store_true', help='JSON 출력')
+    args = parser.parse_args(argv)
+
+    report = build_report(args.days, args.path, args.recent, args.threshold)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    if not args.regressions:
+        print(f"📊 최근 {args.days}일 단계별 추이 ({report['db']})")
+        last_path = None
+        for t in report['trends']:
+            if t['path'] != last_path:
+                print(f"\n  {t['path']}" + (f"  [{t['step']}]" if t['step'] else ''))
+                last_path = t['path']
+            timing = (f"{t['runs']:>3}회  평균 {t['avg_sec']:>8.1f}초  최대 {t['max_sec']:>8.1f}초"
+                      if t['runs'] else ' ' * 38)
+            fails = f"  실패 {t['failures']}" if t['failures'] else ''
+            counters = f"  {_format_counters(t['counters'])}" if t['counters'] else ''
+            print(f"    {t['day']}  {timing}{fails}{counters}")
+        print('')
+
+    if report['regressions']:
+        print(f"⚠️ 회귀 (최근 {args.recent}일 vs 이전 기간, ≥{args.threshold}x)")
+        for r in report['regressions']:
+            print(f"  {r['path']}: {r['baseline_sec']:.1f}초 → {r['recent_sec']:.1f}초 ({r['ratio']:.2f}x)")
+    else:
+        print("✅ 회귀 없음")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
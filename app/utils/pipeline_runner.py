@@ -0,0 +1,396 @@
+"""파이프라인 실행 코어 (작업별 상호 배제 + 트리거 병합 + 자원 제한)
+
+클라우드 스케줄러의 정규 스케줄, 콜드 스타트 catch-up, 수동 트리거가 모두 이 실행기를
+거친다. 트리거는 작업을 "대기" 상태로 만들 뿐이고, 디스패처 스레드가 자원 한도 안에서
+우선순위 순으로 꺼내 실행한다.
+
+- 작업별 상호 배제: 같은 작업은 동시에 한 번만 실행
+- 트리거 병합: 대기/실행 중인 작업에 다시 들어온 트리거는 새 실행을 만들지 않음
+  (콜드 스타트 때 놓친 여러 스케줄 → 1회 실행). covers로 지정한 상위 작업
+  (예: 전체 업데이트)이 대기/실행 중이면 하위 작업 트리거도 병합. 반대로 하위 작업이 실행 중이면
+  상위 작업은 그 작업이 끝날 때까지 대기 (같은 출력 파일을 동시에 쓰지 않도록)
+- 우선순위: 장 마감 시각이 가장 최근인 시장의 작업부터 (마감 없는 작업은 마지막)
+- 자원 제한: 동시 실행 수(CPU) + 예상 메모리 합계(메모리 예산, 실제 가용 메모리)
+  실행 중인 작업이 없으면 예산을 넘는 작업도 단독으로 실행 (기아 방지)
+- 마지막 성공/실패 시각을 data/scheduler_runs.json에 기록 → catch-up 판단에 사용
+
+설정 (환경변수):
+    SCHEDULER_MAX_CONCURRENT   동시 실행 수 (기본: min(2, CPU 수))
+    SCHEDULER_MEMORY_BUDGET_MB 예상 메모리 합계 상한 (기본: 전체 메모리의 60%)
+
+CPU 수와 메모리는 컨테이너의 cgroup 한도(v2: cpu.max / memory.max, v1: cpu.cfs_quota_us /
+memory.limit_in_bytes)를 먼저 읽고, 한도가 없을 때만 호스트 값(os.cpu_count, /proc/meminfo)을 쓴다.
+
+사용법:
+    runner = get_pipeline_runner()
+    runner.register('us_update', _run_us_update, label='US Market Update',
+                    close_kst='06:00', mem_mb=900)
+    runner.trigger('us_update', reason='schedule')
+"""
+
+import os
+import json
+import logging
+import math
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger('cloud_scheduler')
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_STATE_PATH = os.path.join(_BASE_DIR, 'data', 'scheduler_runs.json')
+
+_CGROUP_ROOT = '/sys/fs/cgroup'
+
+QUEUED = 'queued'
+RUNNING = 'running'
+IDLE = 'idle'
+
+
+def _kst_now() -> datetime:
+    try:
+        from zoneinfo import ZoneInfo
+        return datetime.now(ZoneInfo('Asia/Seoul'))
+    except Exception:
+        return datetime.now(timezone(timedelta(hours=9)))
+
+
+def _read_meminfo_mb(key: str) -> Optional[int]:
+    """/proc/meminfo 값 (MB) — 리눅스 외 환경에서는 None"""
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith(key + ':'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _read_cgroup(*paths: str) -> Optional[str]:
+    """cgroup 파일 중 처음 읽히는 값 (v2 경로를 먼저 넘긴다)"""
+    for path in paths:
+        try:
+            with open(os.path.join(_CGROUP_ROOT, path), 'r') as f:
+                return f.read().strip()
+        except OSError:
+            continue
+    return None
+
+
+def _cgroup_memory_limit_mb() -> Optional[int]:
+    """컨테이너 메모리 한도 (MB) — 한도 없음/cgroup 없음이면 None"""
+    raw = _read_cgroup('memory.max', 'memory/memory.limit_in_bytes')
+    if not raw or raw == 'max':
+        return None
+    try:
+        limit_mb = int(raw) // (1024 * 1024)
+    except ValueError:
+        return None
+    # v1은 한도가 없으면 거대한 값(페이지 정렬된 2**63)을 돌려준다
+    host_total = _read_meminfo_mb('MemTotal')
+    if host_total and limit_mb >= host_total:
+        return None
+    return limit_mb
+
+
+def _cgroup_memory_available_mb() -> Optional[int]:
+    """컨테이너 한도 - 현재 사용량 (MB) — 한도가 없으면 None"""
+    limit = _cgroup_memory_limit_mb()
+    if limit is None:
+        return None
+    raw = _read_cgroup('memory.current', 'memory/memory.usage_in_bytes')
+    try:
+        used = int(raw) // (1024 * 1024)
+    except (TypeError, ValueError):
+        return None
+    return max(0, limit - used)
+
+
+def _cgroup_cpu_limit() -> Optional[int]:
+    """컨테이너 CPU 한도 (quota / period, 올림) — 한도 없음이면 None"""
+    raw = _read_cgroup('cpu.max')
+    if raw:
+        parts = raw.split()
+        quota, period = parts[0], (parts[1] if len(parts) > 1 else '100000')
+    else:
+        quota = _read_cgroup('cpu/cpu.cfs_quota_us', 'cpu,cpuacct/cpu.cfs_quota_us')
+        period = _read_cgroup('cpu/cpu.cfs_period_us', 'cpu,cpuacct/cpu.cfs_period_us')
+    if not quota or quota in ('max', '-1') or not period:
+        return None
+    try:
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def memory_total_mb() -> Optional[int]:
+    """사용 가능한 전체 메모리 (MB): cgroup 한도 → 호스트 MemTotal"""
+    return _cgroup_memory_limit_mb() or _read_meminfo_mb('MemTotal')
+
+
+def memory_available_mb() -> Optional[int]:
+    """현재 가용 메모리 (MB): cgroup 여유분과 호스트 MemAvailable 중 작은 값"""
+    values = [v for v in (_cgroup_memory_available_mb(), _read_meminfo_mb('MemAvailable'))
+              if v is not None]
+    return min(values) if values else None
+
+
+def cpu_count() -> int:
+    """사용 가능한 CPU 수: cgroup 한도 → 호스트 CPU 수"""
+    host = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    return min(host, limit) if limit else host
+
+
+def default_memory_budget_mb() -> int:
+    env = os.environ.get('SCHEDULER_MEMORY_BUDGET_MB')
+    if env:
+        return int(env)
+    total = memory_total_mb()
+    return int(total * 0.6) if total else 1024
+
+
+def default_max_concurrent() -> int:
+    env = os.environ.get('SCHEDULER_MAX_CONCURRENT')
+    if env:
+        return max(1, int(env))
+    return max(1, min(2, cpu_count()))
+
+
+class PipelineJob:
+    """등록된 파이프라인 작업 정의 + 실행 상태"""
+
+    def __init__(self, name: str, fn: Callable[[], Optional[bool]], label: str = None,
+                 close_kst: str = None, mem_mb: int = 300, covers: Iterable[str] = ()):
+        """
+        Args:
+            fn: 인자 없는 callable (실행기는 그대로 호출 — 예외/로그 처리는 fn 쪽 책임)
+            close_kst: 관련 시장 장 마감 시각 'HH:MM' (KST). None이면 최저 우선순위
+            mem_mb: 예상 최대 메모리 (MB)
+            covers: 이 작업이 함께 갱신하는 하위 작업 이름 (대기/실행 중이면 하위 트리거 병합)
+        """
+        self.name = name
+        self.fn = fn
+        self.label = label or name
+        self.close_kst = close_kst
+        self.mem_mb = mem_mb
+        self.covers = tuple(covers)
+
+        self.state = IDLE
+        self.queued_at = None
+        self.started_at = None
+        self.reasons: List[str] = []
+        self.coalesced = 0
+
+    def minutes_since_close(self, now: datetime) -> float:
+        """가장 최근 장 마감 이후 경과 분 (마감 없음 → 무한대)"""
+        if not self.close_kst:
+            return float('inf')
+        h, m = map(int, self.close_kst.split(':'))
+        close = now.replace(hour=h, minute=m, second=0, microsecond=0)
+        if close > now:
+            close -= timedelta(days=1)
+        return (now - close).total_seconds() / 60
+
+
+class PipelineRunner:
+    """트리거 → 대기열 → 디스패처 (자원 한도 내 우선순위 실행)"""
+
+    def __init__(self, max_concurrent: int = None, memory_budget_mb: int = None,
+                 state_path: str = DEFAULT_STATE_PATH, now_fn: Callable[[], datetime] = None):
+        self.max_concurrent = max_concurrent or default_max_concurrent()
+        self.memory_budget_mb = memory_budget_mb or default_memory_budget_mb()
+        self.state_path = state_path
+        self._now = now_fn or _kst_now
+        self._jobs: Dict[str, PipelineJob] = {}
+        self._order: List[str] = []
+        self._cond = threading.Condition()
+        self._dispatcher = None
+        self._runs = self._load_runs()
+
+    # ── 실행 기록 ──
+
+    def _load_runs(self) -> dict:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_runs(self):
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            tmp_path = self.state_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._runs, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"실행 기록 저장 실패: {e}")
+
+    def last_success(self, name: str) -> Optional[datetime]:
+        with self._cond:
+            ts = self._runs.get(name, {}).get('last_success')
+        return datetime.fromisoformat(ts) if ts else None
+
+    # ── 등록 / 트리거 ──
+
+    def register(self, name: str, fn: Callable[[], Optional[bool]], **kwargs) -> PipelineJob:
+        with self._cond:
+            job = PipelineJob(name, fn, **kwargs)
+            if name not in self._jobs:
+                self._order.append(name)
+            self._jobs[name] = job
+            return job
+
+    def _covering_job(self, name: str) -> Optional[PipelineJob]:
+        for other in self._jobs.values():
+            if name in other.covers and other.state in (QUEUED, RUNNING):
+                return other
+        return None
+
+    def trigger(self, name: str, reason: str = 'schedule') -> str:
+        """작업 실행 요청
+
+        Returns:
+            'queued' — 새로 대기열에 추가
+            'coalesced' — 이미 대기/실행 중이거나 상위 작업에 포함되어 병합됨
+        """
+        with self._cond:
+            job = self._jobs.get(name)
+            if job is None:
+                raise KeyError(f"unknown pipeline job: {name}")
+
+            target = job if job.state in (QUEUED, RUNNING) else self._covering_job(name)
+            if target is not None:
+                target.coalesced += 1
+                target.reasons.append(f"{reason}({name})" if target is not job else reason)
+                logger.info(f"🔗 트리거 병합: {job.label} ← {reason} (→ {target.label} {target.state})")
+                return 'coalesced'
+
+            job.state = QUEUED
+            job.queued_at = self._now()
+            job.reasons = [reason]
+            job.coalesced = 0
+            # 새로 대기한 상위 작업이 대기 중인 하위 작업을 흡수
+            for sub in job.covers:
+                sub_job = self._jobs.get(sub)
+                if sub_job is not None and sub_job.state == QUEUED:
+                    sub_job.state = IDLE
+                    job.coalesced += 1 + sub_job.coalesced
+                    job.reasons.extend(f"{r}({sub})" for r in sub_job.reasons)
+                    logger.info(f"🔗 {sub_job.label} 대기 → {job.label}에 병합")
+            logger.info(f"📥 대기열 추가: {job.label} ({reason})")
+            self._ensure_dispatcher()
+            self._cond.notify_all()
+            return 'queued'
+
+    # ── 디스패처 ──
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True,
+                                                name='PipelineDispatcher')
+            self._dispatcher.start()
+
+    def _running(self) -> List[PipelineJob]:
+        return [j for j in self._jobs.values() if j.state == RUNNING]
+
+    def _conflicts(self, job: PipelineJob, running: List[PipelineJob]) -> List[str]:
+        """job과 포함 관계(covers)인 실행 중 작업 — 같은 파이프라인을 동시에 돌리게 됨"""
+        return [j.name for j in running if j.name in job.covers or job.name in j.covers]
+
+    def _fits(self, job: PipelineJob, running: List[PipelineJob]) -> bool:
+        if self._conflicts(job, running):
+            return False
+        if not running:
+            return True  # 단독 실행은 항상 허용
+        if len(running) >= self.max_concurrent:
+            return False
+        if sum(j.mem_mb for j in running) + job.mem_mb > self.memory_budget_mb:
+            return False
+        available = memory_available_mb()
+        return available is None or available >= job.mem_mb
+
+    def next_job(self) -> Optional[PipelineJob]:
+        """우선순위(최근 마감 시장 → 등록 순) 상 첫 번째로 실행 가능한 대기 작업
+
+        앞선 작업이 자원 부족으로 못 뜨면 뒤 작업도 기다린다 (큰 작업 기아 방지).
+        """
+        now = self._now()
+        queued = [self._jobs[n] for n in self._order if self._jobs[n].state == QUEUED]
+        if not queued:
+            return None
+        queued.sort(key=lambda j: (j.minutes_since_close(now), self._order.index(j.name)))
+        head = queued[0]
+        return head if self._fits(head, self._running()) else None
+
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                job = self.next_job()
+                while job is None:
+                    # 가용 메모리 변화는 알림이 없으므로 주기적으로 재확인
+                    self._cond.wait(timeout=30)
+                    job = self.next_job()
+                job.state = RUNNING
+                job.started_at = self._now()
+            threading.Thread(target=self._execute, args=(job,), daemon=True,
+                             name=f'pipeline-{job.name}').start()
+
+    def _execute(self, job: PipelineJob):
+        reasons = ', '.join(job.reasons)
+        merged = f", 병합 {job.coalesced}건" if job.coalesced else ''
+        logger.info(f"▶️ 파이프라인 실행: {job.label} (사유: {reasons}{merged})")
+        ok = False
+        try:
+            result = job.fn()
+            ok = result is None or bool(result)
+        except Exception as e:
+            logger.error(f"❌ 파이프라인 예외: {job.label} — {e}")
+        finally:
+            with self._cond:
+                finished = self._now().isoformat(timespec='seconds')
+                record = self._runs.setdefault(job.name, {})
+                record['last_finished'] = finished
+                record['last_status'] = 'ok' if ok else 'failed'
+                if ok:
+                    record['last_success'] = finished
+                self._save_runs()
+                job.state = IDLE
+                job.started_at = None
+                self._cond.notify_all()
+
+    # ── 상태 ──
+
+    def status(self) -> dict:
+        with self._cond:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'memory_budget_mb': self.memory_budget_mb,
+                'memory_available_mb': memory_available_mb(),
+                'jobs': [{
+                    'name': j.name,
+                    'label': j.label,
+                    'state': j.state,
+                    'mem_mb': j.mem_mb,
+                    'close_kst': j.close_kst,
+                    'coalesced': j.coalesced if j.state != IDLE else 0,
+                    'started_at': j.started_at.isoformat(timespec='seconds') if j.started_at else None,
+                    **self._runs.get(j.name, {}),
+                } for j in (self._jobs[n] for n in self._order)],
+            }
+
+
+_runner: Optional[PipelineRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_pipeline_runner() -> PipelineRunner:
+    """PipelineRunner 싱글톤"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = PipelineRunner()
+        return _runner
@@ -0,0 +1,198 @@
+"""KR 일별 가격 컬럼형 저장소 (ticker 인덱스 + MA 선계산)
+
+daily_prices.csv 전체를 요청마다 읽지 않도록, CSV가 갱신될 때 한 번만
+(ticker, date) 정렬된 numpy 구조체 배열(.npy)과 ticker별 행 오프셋(JSON)으로
+변환해 둔다. 조회 시에는 .npy를 mmap으로 열어 해당 ticker 구간만 슬라이스하므로
+파일이 커져도 읽는 행 수는 종목 한 개 분량으로 고정된다.
+
+저장 구조 (data/price_store/):
+    prices.npy   — 구조체 배열: date, open, high, low, current_price, volume, MA20, MA50, MA200
+    index.json   — 원본 CSV mtime/size, ticker → [start, end) 오프셋
+
+사용법:
+    from app.utils.price_store import get_ticker_prices
+
+    df = get_ticker_prices(DATA_DIR, '069500', tail=300)
+"""
+import os
+import json
+import threading
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from app.utils.file_lock import safe_write
+except ImportError:
+    from contextlib import contextmanager
+
+    @contextmanager
+    def safe_write(filepath, timeout=30):
+        yield filepath
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = 'price_store'
+SOURCE_FILENAME = 'daily_prices.csv'
+PRICE_COLUMNS = ['open', 'high', 'low', 'current_price', 'volume']
+MA_WINDOWS = (20, 50, 200)
+
+_DTYPE = np.dtype(
+    [('date', 'M8[D]')]
+    + [(c, 'f8') for c in PRICE_COLUMNS]
+    + [(f'MA{w}', 'f8') for w in MA_WINDOWS]
+)
+
+# 프로세스 내 캐시: data_dir → (index, mmap 배열)
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _store_paths(data_dir: str):
+    store_dir = os.path.join(data_dir, STORE_DIRNAME)
+    return (
+        store_dir,
+        os.path.join(store_dir, 'prices.npy'),
+        os.path.join(store_dir, 'index.json'),
+    )
+
+
+def _source_signature(source_path: str) -> dict:
+    st = os.stat(source_path)
+    return {'source_mtime': st.st_mtime, 'source_size': st.st_size}
+
+
+def build_price_store(data_dir: str) -> dict:
+    """daily_prices.csv → prices.npy + index.json 변환 (원자적 교체)
+
+    Returns:
+        생성된 index dict
+    """
+    source_path = os.path.join(data_dir, SOURCE_FILENAME)
+    store_dir, npy_path, index_path = _store_paths(data_dir)
+    os.makedirs(store_dir, exist_ok=True)
+
+    with safe_write(index_path, timeout=120):
+        signature = _source_signature(source_path)
+
+        # 다른 프로세스가 잠금 대기 중에 이미 생성했으면 재사용
+        if os.path.exists(index_path) and os.path.exists(npy_path):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+                if all(existing.get(k) == v for k, v in signature.items()):
+                    return existing
+            except (OSError, ValueError):
+                pass
+
+        df = pd.read_csv(source_path, dtype={'ticker': str}, low_memory=False)
+        df['ticker'] = df['ticker'].str.zfill(6)
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        df = df.dropna(subset=['date'])
+        df = df.drop_duplicates(subset=['ticker', 'date'], keep='last')
+        df = df.sort_values(['ticker', 'date'], kind='mergesort').reset_index(drop=True)
+
+        for col in PRICE_COLUMNS:
+            if col not in df.columns:
+                # open/high/low 누락 시 종가로 대체 (기존 라우트 동작과 동일)
+                df[col] = df['current_price'] if col != 'volume' else 0
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+        grouped_close = df.groupby('ticker', sort=False)['current_price']
+        for w in MA_WINDOWS:
+            df[f'MA{w}'] = grouped_close.transform(lambda s, w=w: s.rolling(w).mean())
+
+        arr = np.empty(len(df), dtype=_DTYPE)
+        arr['date'] = df['date'].values.astype('M8[D]')
+        for name in _DTYPE.names[1:]:
+            arr[name] = df[name].to_numpy(dtype='f8')
+
+        # ticker별 [start, end) 오프셋 — 정렬되어 있으므로 연속 구간
+        tickers = df['ticker'].to_numpy()
+        offsets = {}
+        if len(tickers):
+            boundaries = np.flatnonzero(tickers[1:] != tickers[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(tickers)]))
+            offsets = {tickers[s]: [int(s), int(e)] for s, e in zip(starts, ends)}
+
+        index = dict(signature, rows=len(arr), tickers=offsets)
+
+        tmp_npy = npy_path + '.tmp'
+        with open(tmp_npy, 'wb') as f:
+            np.save(f, arr)
+        os.replace(tmp_npy, npy_path)
+
+        tmp_index = index_path + '.tmp'
+        with open(tmp_index, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_index, index_path)
+
+    logger.info(f"가격 저장소 생성: {len(arr):,}행, {len(offsets):,}종목 → {store_dir}")
+    return index
+
+
+def _load_store(data_dir: str):
+    """최신 저장소 (index, mmap 배열) 반환 — CSV 변경 시 재생성"""
+    source_path = os.path.join(data_dir, SOURCE_FILENAME)
+    if not os.path.exists(source_path):
+        return None, None
+
+    signature = _source_signature(source_path)
+    _, npy_path, index_path = _store_paths(data_dir)
+
+    with _cache_lock:
+        cached = _cache.get(data_dir)
+        if cached and all(cached[0].get(k) == v for k, v in signature.items()):
+            return cached
+
+        index = None
+        if os.path.exists(index_path) and os.path.exists(npy_path):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = None
+
+        if not index or any(index.get(k) != v for k, v in signature.items()):
+            index = build_price_store(data_dir)
+
+        arr = np.load(npy_path, mmap_mode='r')
+        if len(arr) != index.get('rows'):
+            # 다른 프로세스가 교체 중이던 파일을 읽은 경우 — 직접 재생성
+            index = build_price_store(data_dir)
+            arr = np.load(npy_path, mmap_mode='r')
+
+        _cache[data_dir] = (index, arr)
+        return index, arr
+
+
+def get_ticker_prices(data_dir: str, ticker: str, tail: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """단일 종목 일봉 + MA20/50/200 조회
+
+    Args:
+        data_dir: daily_prices.csv가 있는 디렉토리
+        ticker: 6자리 종목코드 (자동 zero-fill)
+        tail: 최근 N행만 반환 (None이면 전체)
+
+    Returns:
+        date 오름차순 DataFrame (date, open, high, low, current_price, volume, MA20, MA50, MA200).
+        가격 파일이 없으면 None, 종목이 없으면 빈 DataFrame.
+    """
+    index, arr = _load_store(data_dir)
+    if index is None:
+        return None
+
+    span = index['tickers'].get(str(ticker).zfill(6))
+    if not span:
+        return pd.DataFrame(columns=list(_DTYPE.names))
+
+    start, end = span
+    if tail is not None:
+        start = max(start, end - tail)
+
+    df = pd.DataFrame(np.array(arr[start:end]))
+    df['date'] = pd.to_datetime(df['date'])
+    return df
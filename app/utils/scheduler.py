@@ -22,6 +22,10 @@ import threading
 import traceback
 from datetime import datetime, date, timedelta
 from pathlib import Path
+from typing import Optional
+
+from app.utils import perf
+from app.utils.notifier import notify
 
 # .env 로드 보장 (standalone import 시에도 환경변수 사용 가능)
 try:
@@ -79,75 +83,23 @@ def _is_saturday_kst():
 # ============================================================
 
 def _send_telegram(message: str) -> bool:
-    """텔레그램 메시지 전송 (개인 + 채널 동시)"""
-    import requests
-    success = False
-
-    # 1) 개인 봇
-    token = os.getenv("TELEGRAM_BOT_TOKEN")
-    chat_id = os.getenv("TELEGRAM_CHAT_ID")
-    if token and chat_id and "your_bot_token" not in token:
-        try:
-            r = requests.post(
-                f"https://api.telegram.org/bot{token}/sendMessage",
-                json={"chat_id": chat_id, "text": message, "parse_mode": "HTML"},
-                timeout=10
-            )
-            if r.status_code == 200:
-                success = True
-            else:
-                logger.error(f"텔레그램(개인) 응답: {r.status_code} {r.text[:200]}")
-        except Exception as e:
-            logger.error(f"텔레그램(개인) 전송 실패: {e}")
+    """텔레그램 메시지 전송 (개인 + 채널 동시)
 
-    # 2) 채널 봇
-    ch_token = os.getenv("TELEGRAM_CHANNEL_BOT_TOKEN")
-    ch_chat_id = os.getenv("TELEGRAM_CHANNEL_CHAT_ID")
-    if ch_token and ch_chat_id:
-        try:
-            r = requests.post(
-                f"https://api.telegram.org/bot{ch_token}/sendMessage",
-                json={"chat_id": ch_chat_id, "text": message, "parse_mode": "HTML"},
-                timeout=10
-            )
-            if r.status_code == 200:
-                success = True
-        except Exception as e:
-            logger.error(f"텔레그램(채널) 전송 실패: {e}")
-
-    return success
+    발신 큐(app/utils/notifier.py)에 넣고 바로 반환한다 — 분할/속도 제한/재시도는 백그라운드 처리.
+    """
+    return notify(message)
 
 
 def _send_telegram_long(message: str) -> bool:
-    """긴 텔레그램 메시지를 4000자 단위로 분할 전송"""
-    MAX_LEN = 4000
-    if len(message) <= MAX_LEN:
-        return _send_telegram(message)
-
-    chunks = []
-    current = ""
-    for paragraph in message.split("\n\n"):
-        if len(current) + len(paragraph) + 2 > MAX_LEN:
-            if current:
-                chunks.append(current.strip())
-            current = paragraph
-        else:
-            current = current + "\n\n" + paragraph if current else paragraph
-    if current.strip():
-        chunks.append(current.strip())
-
-    ok = True
-    for chunk in chunks:
-        if not _send_telegram(chunk):
-            ok = False
-        time.sleep(0.5)
-    return ok
+    """긴 텔레그램 메시지 전송 (4000자 단위 분할은 발신 큐가 처리)"""
+    return _send_telegram(message)
 
 
 # ============================================================
 # 작업 함수들 (In-Process 실행)
 # ============================================================
 
+@perf.timed('jongga_v2')
 def _run_jongga_v2():
     """종가베팅 V2 — in-process 실행"""
     logger.info("🎯 종가베팅 V2 분석 시작...")
@@ -257,12 +209,12 @@ def _send_jongga_v2_telegram():
                 if i > 0:
                     chunk = f"<b>🎯 종가베팅 V2 계속 ({i+1}/{len(chunks)})</b>\n" + chunk
                 _send_telegram(chunk)
-                time.sleep(0.5)
 
     except Exception as e:
         logger.error(f"종가베팅 텔레그램 전송 실패: {e}")
 
 
+@perf.timed('institutional')
 def _run_institutional_data():
     """수급 데이터 업데이트 — in-process"""
     logger.info("📊 수급 데이터 업데이트 시작...")
@@ -285,6 +237,7 @@ def _run_institutional_data():
         return False
 
 
+@perf.timed('vcp_signals')
 def _run_vcp_signal_scan():
     """VCP 시그널 스캔 — in-process"""
     logger.info("📈 VCP 시그널 스캔 시작...")
@@ -305,6 +258,7 @@ def _run_vcp_signal_scan():
         return False
 
 
+@perf.timed('us_market')
 def _run_us_market_update():
     """US Market 데이터 업데이트 — in-process"""
     logger.info("🇺🇸 US Market 업데이트 시작...")
@@ -636,6 +590,9 @@ def _cloud_scheduler_loop():
     os.makedirs(LOG_DIR, exist_ok=True)
     os.makedirs(DATA_DIR, exist_ok=True)
 
+    # 텔레그램/self-ping 등 HTTP 호출 수를 perf 카운터로 기록
+    perf.install_http_counter()
+
     handler = logging.StreamHandler()
     handler.setFormatter(logging.Formatter('%(asctime)s [CloudSched] %(message)s'))
     logger.addHandler(handler)
@@ -660,33 +617,13 @@ def _cloud_scheduler_loop():
             return kst_to_utc(kst_time)
         return kst_time
 
-    weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
-
-    for day in weekdays:
-        # 04:00 KST — US Market 전체 갱신
-        getattr(sched.every(), day).at(sched_time('04:00')).do(
-            _safe_run, _run_us_update, 'US Market Update'
-        )
-        # 15:10 KST — KR 종가베팅 V2
-        getattr(sched.every(), day).at(sched_time('15:10')).do(
-            _safe_run, _run_round1, 'KR Round 1 (종가베팅)'
-        )
-        # 16:00 KST — KR 수급/VCP/리포트
-        getattr(sched.every(), day).at(sched_time('16:00')).do(
-            _safe_run, _run_round2, 'KR Round 2 (수급/VCP)'
-        )
-
-    # 07:00 KST — 전체 올 업데이트 (매일, 주말 포함)
-    sched.every().day.at(sched_time('07:00')).do(
-        _safe_run, _run_all_update, 'ALL DATA UPDATE (07:00)'
-    )
-
-    # Crypto — 매 4시간 (24/7)
-    crypto_times = ['00:00', '04:00', '08:00', '12:00', '16:00', '20:00']
-    for ct in crypto_times:
-        sched.every().day.at(sched_time(ct)).do(
-            _safe_run, _run_crypto_pipeline, 'Crypto Pipeline'
-        )
+    # 스케줄은 실행기에 트리거만 넣는다 — 같은 작업 중복 실행/메모리 과다 동시 실행 방지
+    for name, _fn, _label, days, times in PIPELINE_SCHEDULE:
+        for kst_time in times:
+            for day in (days or ['day']):
+                getattr(sched.every(), day).at(sched_time(kst_time)).do(
+                    _trigger_pipeline, name, 'schedule'
+                )
 
     logger.info("📅 클라우드 스케줄 등록 완료:")
     logger.info(f"   환경: {'Render (UTC)' if is_render else 'Local (KST)'}")
@@ -723,6 +660,75 @@ def _cloud_scheduler_loop():
         time.sleep(30)
 
 
+# ============================================================
+# 파이프라인 실행기 등록 (스케줄 / catch-up / 수동 트리거 공용)
+# ============================================================
+
+_WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+
+# (작업, 함수, 라벨, 요일(None=매일), KST 시각)
+PIPELINE_SCHEDULE = [
+    ('us_update', _run_us_update, 'US Market Update', _WEEKDAYS, ['04:00']),
+    ('round1', _run_round1, 'KR Round 1 (종가베팅)', _WEEKDAYS, ['15:10']),
+    ('round2', _run_round2, 'KR Round 2 (수급/VCP)', _WEEKDAYS, ['16:00']),
+    ('all_update', _run_all_update, 'ALL DATA UPDATE (07:00)', None, ['07:00']),
+    ('crypto', _run_crypto_pipeline, 'Crypto Pipeline', None,
+     ['00:00', '04:00', '08:00', '12:00', '16:00', '20:00']),
+]
+
+# 작업별 실행 특성: 관련 시장 마감(KST, 우선순위), 예상 메모리(MB), 포함하는 하위 작업
+_PIPELINE_PROFILE = {
+    'us_update': dict(close_kst='06:00', mem_mb=900),
+    'round1': dict(close_kst='15:30', mem_mb=500),
+    'jongga_v2': dict(close_kst='15:30', mem_mb=500),
+    'round2': dict(close_kst='15:30', mem_mb=600),
+    'all_update': dict(close_kst='15:30', mem_mb=1200,
+                       covers=('us_update', 'round2', 'jongga_v2', 'round1', 'crypto')),
+    'crypto': dict(mem_mb=400),
+}
+
+_pipelines_registered = False
+
+
+def _get_pipeline_runner():
+    """작업이 등록된 PipelineRunner (최초 호출 시 등록)"""
+    global _pipelines_registered
+    from app.utils.pipeline_runner import get_pipeline_runner
+    runner = get_pipeline_runner()
+    with _scheduler_lock:
+        if not _pipelines_registered:
+            jobs = [(name, fn, label) for name, fn, label, _, _ in PIPELINE_SCHEDULE]
+            jobs.append(('jongga_v2', _run_jongga_v2, '종가베팅 V2'))
+            for name, fn, label in jobs:
+                runner.register(name, (lambda f=fn, l=label: _safe_run(f, l)),
+                                label=label, **_PIPELINE_PROFILE.get(name, {}))
+            _pipelines_registered = True
+    return runner
+
+
+def _trigger_pipeline(name: str, reason: str = 'schedule') -> str:
+    """실행기에 작업 트리거 ('queued' / 'coalesced')"""
+    return _get_pipeline_runner().trigger(name, reason=reason)
+
+
+def _last_due_slot(now: datetime, days, times) -> Optional[datetime]:
+    """now 이전 가장 최근 스케줄 시각 (최대 7일 전까지)"""
+    day_names = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    for back in range(8):
+        d = now - timedelta(days=back)
+        if days and day_names[d.weekday()] not in days:
+            continue
+        slots = []
+        for t in times:
+            h, m = map(int, t.split(':'))
+            slot = d.replace(hour=h, minute=m, second=0, microsecond=0)
+            if slot <= now:
+                slots.append(slot)
+        if slots:
+            return max(slots)
+    return None
+
+
 def _check_and_catchup():
     """서버 시작 시 stale 데이터 감지 → 놓친 작업 즉시 실행
 
@@ -776,21 +782,31 @@ def _check_and_catchup():
         logger.info("   📊 종가베팅 데이터 파일 없음")
 
     # 2. 평일 + 15시 이후 + 데이터 stale → 종가베팅 즉시 실행
+    #    (실행기가 같은 작업 중복 실행을 막고, 전체 업데이트가 하위 작업 트리거를 흡수)
+    triggered = []
     if is_weekday and now.hour >= 15 and jongga_stale:
         logger.info("🚀 [Catch-up] 종가베팅 V2 즉시 실행!")
-        _send_telegram("🔄 <b>Catch-up 실행</b>\n서버 재시작 후 종가베팅 데이터 갱신 시작")
-        threading.Thread(
-            target=_safe_run, args=(_run_jongga_v2, 'Catch-up: 종가베팅 V2'),
-            daemon=True
-        ).start()
+        _trigger_pipeline('jongga_v2', 'catch-up')
+        triggered.append('종가베팅 V2')
     elif jongga_stale:
         # 평일 오전이거나 주말 → 전체 올 업데이트
         logger.info("🚀 [Catch-up] 전체 올 업데이트 즉시 실행!")
-        _send_telegram("🔄 <b>Catch-up 실행</b>\n서버 재시작 후 전체 데이터 갱신 시작")
-        threading.Thread(
-            target=_safe_run, args=(_run_all_update, 'Catch-up: ALL UPDATE'),
-            daemon=True
-        ).start()
+        _trigger_pipeline('all_update', 'catch-up')
+        triggered.append('전체 올 업데이트')
+
+    # 3. 마지막 성공 이후 놓친 스케줄 — 여러 번 놓쳤어도 작업당 1회로 병합
+    runner = _get_pipeline_runner()
+    for name, _fn, label, days, times in PIPELINE_SCHEDULE:
+        slot = _last_due_slot(now, days, times)
+        last_ok = runner.last_success(name)
+        if slot is None or last_ok is None or last_ok >= slot:
+            continue  # 실행 기록이 없으면 위의 데이터 기준 판단에 맡김
+        logger.info(f"   ⏰ 놓친 스케줄: {label} (예정 {slot.strftime('%m-%d %H:%M')}, 마지막 성공 {last_ok.strftime('%m-%d %H:%M')})")
+        if _trigger_pipeline(name, 'catch-up') == 'queued':
+            triggered.append(label)
+
+    if triggered:
+        _send_telegram("🔄 <b>Catch-up 실행</b>\n서버 재시작 후 데이터 갱신 시작\n" + "\n".join(f"• {t}" for t in triggered))
     else:
         logger.info("✅ 데이터 최신 상태 — catch-up 불필요")
 
@@ -830,12 +846,18 @@ def _keep_alive_loop():
         time.sleep(720)  # 12분
 
 
-def _safe_run(func, name: str):
+def _safe_run(func, name: str) -> bool:
     """작업을 안전하게 실행 (예외 캐치 + 로깅 + Vercel 동기화 트리거)"""
     try:
         logger.info(f"🚀 시작: {name}")
         start = time.time()
-        result = func()
+        if getattr(func, 'perf_timed', False):
+            result = func()   # @perf.timed 함수는 자체 span을 기록 (중첩 중복 방지)
+        else:
+            with perf.span(func.__name__.lstrip('_')) as sp:
+                result = func()
+                if not result:
+                    sp.fail()
         elapsed = time.time() - start
         status = "✅" if result else "⚠️"
         logger.info(f"{status} 완료: {name} ({elapsed:.1f}초)")
@@ -846,6 +868,7 @@ def _safe_run(func, name: str):
                 target=_trigger_vercel_sync, args=(name,),
                 daemon=True, name='vercel-sync-trigger'
             ).start()
+        return bool(result)
     except Exception as e:
         logger.error(f"❌ 실패: {name} — {e}")
         traceback.print_exc()
@@ -853,6 +876,7 @@ def _safe_run(func, name: str):
             _send_telegram(f"❌ 스케줄 작업 실패: {name}\n{str(e)[:300]}")
         except Exception:
             pass
+        return False
 
 
 def _trigger_vercel_sync(task_name: str = ''):
@@ -912,6 +936,7 @@ def get_scheduler_status() -> dict:
             'environment': 'render' if os.getenv('RENDER') else 'local',
             'jobs_count': len(jobs),
             'jobs': jobs[:20],
+            'pipelines': _get_pipeline_runner().status(),
             'kst_now': _get_kst_now().strftime('%Y-%m-%d %H:%M:%S KST'),
         }
     except Exception as e:
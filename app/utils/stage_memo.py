@@ -0,0 +1,149 @@
+"""파이프라인 단계 메모이제이션 (입력 해시가 같으면 재실행 생략)
+
+각 단계는 읽는 파일(inputs)과 결과에 영향을 주는 파라미터(params)를 선언한다.
+마지막 성공 실행 때의 입력 해시와 지금 해시가 같으면 단계를 건너뛴다.
+(예: BTC 캔들이 그대로인 crypto 브리핑, 휴장일의 스킬 리포트, 수급/가격 CSV가
+ 그대로인 VCP 스캔)
+
+- 파일 해시는 내용 기준(sha256)이지만 (크기, 수정시간)이 같으면 저장된 해시를 재사용해
+  큰 CSV를 매번 다시 읽지 않는다
+- 없는 파일도 "missing"으로 해시에 포함 (생성되면 재실행)
+- 강제 실행: force={'all'} 또는 단계 이름 집합, 환경변수 MARKETFLOW_FORCE_STAGES=all|a,b
+- 상태 파일: data/stage_memo.json (원자적 교체)
+
+사용법:
+    memo = StageMemo(os.path.join(DATA_DIR, 'stage_memo.json'))
+    ok, skipped = memo.run('crypto_briefing', run_crypto_briefing,
+                           inputs=[gate_json], params={'day': '2026-01-02'})
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Iterable, Optional, Tuple
+
+from app.utils import perf
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+_CHUNK = 1 << 20
+
+
+class StageMemo:
+    """단계별 마지막 성공 입력 해시 저장소 (스레드 안전)"""
+
+    def __init__(self, state_path: str, force: Iterable[str] = None):
+        self.state_path = state_path
+        if force is None:
+            env_force = os.environ.get('MARKETFLOW_FORCE_STAGES', '')
+            force = [s.strip() for s in env_force.split(',') if s.strip()]
+        self.force = set(force)
+        self._lock = threading.Lock()
+        self._state = None
+
+    # ── 상태 파일 ──
+
+    def _load(self) -> dict:
+        if self._state is None:
+            state = None
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if not state or state.get('version') != STATE_VERSION:
+                state = {'version': STATE_VERSION, 'stages': {}, 'files': {}}
+            self._state = state
+        return self._state
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    # ── 해시 ──
+
+    def _file_digest(self, path: str) -> str:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 'missing'
+
+        files = self._load()['files']
+        cached = files.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime:
+            return cached[2]
+
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        files[path] = [st.st_size, st.st_mtime, digest]
+        return digest
+
+    def fingerprint(self, inputs: Iterable[str] = (), params: dict = None) -> str:
+        """입력 파일 내용 + 파라미터 → 해시"""
+        with self._lock:
+            parts = {
+                'files': {p: self._file_digest(p) for p in sorted(set(inputs))},
+                'params': params or {},
+            }
+        blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+    # ── 판정/기록 ──
+
+    def is_forced(self, name: str) -> bool:
+        return 'all' in self.force or name in self.force
+
+    def is_fresh(self, name: str, fp: str) -> bool:
+        """마지막 성공 실행과 입력이 같은지 (강제 실행 대상이면 항상 False)"""
+        if self.is_forced(name):
+            return False
+        with self._lock:
+            entry = self._load()['stages'].get(name)
+        return bool(entry) and entry.get('fingerprint') == fp
+
+    def record(self, name: str, fp: str):
+        """성공 실행 기록"""
+        with self._lock:
+            self._load()['stages'][name] = {
+                'fingerprint': fp,
+                'succeeded_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            try:
+                self._save()
+            except OSError as e:
+                logger.warning(f"stage memo 저장 실패: {e}")
+
+    def run(self, name: str, fn: Callable[[], Optional[bool]],
+            inputs: Iterable[str] = (), params: dict = None) -> Tuple[bool, bool]:
+        """입력이 바뀌었거나 강제 실행일 때만 fn 실행
+
+        Returns:
+            (성공 여부, 건너뜀 여부) — 건너뛴 경우 (True, True)
+        """
+        fp = self.fingerprint(inputs, params)
+        if self.is_fresh(name, fp):
+            logger.info(f"⏩ 입력 변경 없음 — 건너뜀: {name}")
+            perf.count('memo_hits')
+            return True, True
+
+        ok = fn()
+        ok = True if ok is None else bool(ok)
+        if ok:
+            self.record(name, fp)
+        return ok, False
+
+
+def format_skipped(names: Iterable[str]) -> str:
+    """건너뛴 단계 보고 한 줄 (없으면 빈 문자열)"""
+    names = list(names)
+    return f"⏩ 변경 없음(건너뜀): {', '.join(names)}" if names else ''
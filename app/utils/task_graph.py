@@ -0,0 +1,274 @@
+"""의존성 그래프 기반 병렬 작업 실행기 (스케줄러 전체 업데이트/라운드용)
+
+각 작업은 읽는 파일(inputs)과 쓰는 파일(outputs)을 선언하고, 실행기는
+"다른 작업의 output을 input으로 쓰는 작업"을 그 작업 뒤에 배치한다.
+서로 무관한 분기(US / KR / Crypto 등)는 제한된 워커 수 안에서 동시에 실행되므로
+전체 소요 시간은 가장 긴 분기(크리티컬 패스)에 수렴한다.
+
+- 워커 수 제한: 각 작업은 대부분 서브프로세스를 띄우므로 동시 프로세스 수 상한 역할
+- 작업별 타임아웃: 초과 시 timeout 처리 후 해당 작업의 후속 작업은 skip
+  (스레드는 강제 종료할 수 없으므로 내부 run_command 타임아웃이 실제 프로세스를 정리)
+- 선행 작업 실패 시 기본은 순서만 보장하고 계속 실행 (기존 순차 실행과 동일),
+  requires_success=True인 작업만 skip
+- memoize=True인 작업은 StageMemo(app.utils.stage_memo)로 inputs+params 해시가
+  마지막 성공 때와 같으면 실행하지 않고 unchanged 처리 (후속 작업은 그대로 진행)
+- 결과에 작업별 소요 시간과 크리티컬 패스를 포함 → 텔레그램 요약에 사용
+- 각 작업은 perf span(작업 이름)으로 기록되며, 제출 시 컨텍스트를 복사해
+  그래프를 호출한 쪽의 span(예: round2) 아래에 중첩된다
+
+사용법:
+    from app.utils.task_graph import Task, run_task_graph
+
+    result = run_task_graph([
+        Task('inst', update_institutional_data, outputs=['data/inst.csv']),
+        Task('vcp', run_vcp_signal_scan, inputs=['data/inst.csv']),
+        Task('crypto', run_crypto_pipeline),
+    ], max_workers=3)
+    print(result.format_critical_path())
+"""
+
+import time
+import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, List, Optional
+
+from app.utils import perf
+
+logger = logging.getLogger(__name__)
+
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+SKIPPED = 'skipped'
+UNCHANGED = 'unchanged'   # 입력 변경 없음 (메모이제이션으로 생략, 성공으로 취급)
+
+_STATUS_ICONS = {SUCCEEDED: '✅', FAILED: '❌', TIMEOUT: '⏰', SKIPPED: '⏭️', UNCHANGED: '⏩'}
+
+
+class Task:
+    """그래프의 단일 작업"""
+
+    def __init__(self, name: str, fn: Callable[[], Optional[bool]],
+                 inputs: Iterable[str] = (), outputs: Iterable[str] = (),
+                 after: Iterable[str] = (), timeout: Optional[float] = None,
+                 requires_success: bool = False, label: str = None, emoji: str = '',
+                 memoize: bool = False, params: dict = None):
+        """
+        Args:
+            name: 작업 이름 (그래프 내 고유)
+            fn: 인자 없는 callable. False 반환/예외 → 실패, None → 성공
+            inputs / outputs: 읽고 쓰는 파일 경로 (의존성 추론용)
+            after: 파일로 표현되지 않는 명시적 선행 작업 이름
+            timeout: 작업 타임아웃 (초, None이면 무제한)
+            requires_success: 선행 작업이 모두 성공해야 실행
+            memoize: inputs 내용 + params가 마지막 성공 때와 같으면 생략
+            params: 메모이제이션 해시에 포함할 파라미터 (예: 기준 거래일)
+        """
+        self.name = name
+        self.fn = fn
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.after = tuple(after)
+        self.timeout = timeout
+        self.requires_success = requires_success
+        self.label = label or name
+        self.emoji = emoji
+        self.memoize = memoize
+        self.params = params or {}
+
+
+class TaskResult:
+    def __init__(self, task: Task, status: str, elapsed: float = 0.0, error: str = None):
+        self.task = task
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (SUCCEEDED, UNCHANGED)
+
+    @property
+    def icon(self) -> str:
+        return _STATUS_ICONS.get(self.status, '❔')
+
+
+class GraphResult:
+    """그래프 실행 결과 (선언 순서 유지)"""
+
+    def __init__(self, results: List[TaskResult], deps: Dict[str, set], wall_time: float):
+        self.results = results
+        self.deps = deps
+        self.wall_time = wall_time
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def all_ok(self) -> bool:
+        return all(r.ok for r in self.results)
+
+    @property
+    def unchanged(self) -> List[str]:
+        """입력 변경이 없어 생략된 작업 라벨"""
+        return [r.task.label for r in self.results if r.status == UNCHANGED]
+
+    def critical_path(self) -> List[TaskResult]:
+        """소요 시간 합이 가장 긴 의존성 경로"""
+        by_name = {r.task.name: r for r in self.results}
+        finish, prev = {}, {}
+        for r in self.results:  # 선언 순서는 위상 정렬 순서로 검증됨
+            best = max(self.deps[r.task.name], key=lambda d: finish[d], default=None)
+            finish[r.task.name] = r.elapsed + (finish[best] if best else 0.0)
+            prev[r.task.name] = best
+
+        if not finish:
+            return []
+        node = max(finish, key=finish.get)
+        path = []
+        while node:
+            path.append(by_name[node])
+            node = prev[node]
+        return list(reversed(path))
+
+    def format_critical_path(self) -> str:
+        path = self.critical_path()
+        if not path:
+            return ''
+        steps = ' → '.join(f"{r.task.label} ({r.elapsed:.0f}초)" for r in path)
+        total = sum(r.elapsed for r in path)
+        return f"⏱ 크리티컬 패스: {steps} = {total:.0f}초 / 실측 {self.wall_time:.0f}초"
+
+
+def resolve_dependencies(tasks: List[Task]) -> Dict[str, set]:
+    """inputs/outputs/after → 작업별 선행 작업 집합 (선언 순서가 위상 순서인지 검증)
+
+    같은 파일을 여러 작업이 output으로 선언하면 앞선 작업 → 뒤 작업 순서로 직렬화한다.
+
+    Raises:
+        ValueError: 이름 중복, 알 수 없는 선행 작업, 순환/역방향 의존
+    """
+    names = [t.name for t in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate task names: {names}")
+
+    order = {name: i for i, name in enumerate(names)}
+    producers: Dict[str, List[str]] = {}
+    for t in tasks:
+        for path in t.outputs:
+            producers.setdefault(path, []).append(t.name)
+
+    deps = {}
+    for t in tasks:
+        d = set()
+        for name in t.after:
+            if name not in order:
+                raise ValueError(f"{t.name}: unknown dependency '{name}'")
+            d.add(name)
+        for path in t.inputs + t.outputs:
+            d.update(p for p in producers.get(path, ()) if order[p] < order[t.name])
+        for name in d:
+            if order[name] >= order[t.name]:
+                raise ValueError(f"{t.name}: dependency '{name}' must be declared before it")
+        deps[t.name] = d
+    return deps
+
+
+def run_task_graph(tasks: List[Task], max_workers: int = 3,
+                   log: logging.Logger = None, memo=None) -> GraphResult:
+    """의존성을 지키며 최대 max_workers개씩 병렬 실행
+
+    Args:
+        memo: StageMemo — memoize=True 작업의 입력 해시 비교/기록 (None이면 항상 실행)
+
+    Returns:
+        GraphResult (작업 선언 순서)
+    """
+    log = log or logger
+    deps = resolve_dependencies(tasks)
+    by_name = {t.name: t for t in tasks}
+    results: Dict[str, TaskResult] = {}
+    pending = [t.name for t in tasks]
+    running = {}   # future → (name, start, deadline)
+    orphans = []   # 타임아웃 처리됐지만 스레드가 아직 살아 있는 future (워커 점유)
+
+    def _call(task: Task, fp: Optional[str]):
+        with perf.span(task.name) as sp:
+            try:
+                ok = task.fn()
+            except Exception as e:
+                log.error(f"❌ {task.label} 예외: {e}")
+                sp.fail()
+                return FAILED, str(e)
+            if ok is None or ok:
+                if fp is not None:
+                    memo.record(task.name, fp)
+                return SUCCEEDED, None
+            sp.fail()
+            return FAILED, None
+
+    overall_start = time.time()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='task')
+    try:
+        while pending or running:
+            # 준비된 작업 제출 / 선행 작업 결과에 따라 skip
+            orphans = [f for f in orphans if not f.done()]
+            for name in list(pending):
+                task = by_name[name]
+                # 워커가 빌 때만 제출 — 대기 시간이 타임아웃/소요 시간에 섞이지 않도록
+                if len(running) + len(orphans) >= max_workers or any(d not in results for d in deps[name]):
+                    continue
+                blocked = [d for d in deps[name]
+                           if results[d].status in (TIMEOUT, SKIPPED)
+                           or (task.requires_success and not results[d].ok)]
+                pending.remove(name)
+                if blocked:
+                    results[name] = TaskResult(task, SKIPPED, error=f"선행 작업 미완료: {', '.join(sorted(blocked))}")
+                    log.warning(f"⏭️ {task.emoji} {task.label} 건너뜀 (선행: {', '.join(sorted(blocked))})")
+                    continue
+                fp = None
+                if memo is not None and task.memoize:
+                    # 선행 작업이 끝난 뒤 해시 → 같은 그래프에서 갱신된 입력도 반영
+                    fp = memo.fingerprint(task.inputs, task.params)
+                    if memo.is_fresh(task.name, fp):
+                        results[name] = TaskResult(task, UNCHANGED)
+                        perf.count('memo_hits')
+                        log.info(f"⏩ {task.emoji} {task.label} 입력 변경 없음 — 건너뜀")
+                        continue
+                start = time.time()
+                deadline = start + task.timeout if task.timeout else None
+                ctx = contextvars.copy_context()  # 호출 측 perf span을 작업 스레드로 전달
+                running[executor.submit(ctx.run, _call, task, fp)] = (name, start, deadline)
+                log.info(f"▶️ {task.emoji} {task.label} 시작")
+
+            if not running:
+                if pending and orphans:
+                    # 모든 워커가 타임아웃 작업에 묶임 — 하나라도 풀릴 때까지 대기
+                    wait(orphans, return_when=FIRST_COMPLETED)
+                continue
+
+            deadlines = [d for _, _, d in running.values() if d]
+            wait_timeout = max(0.0, min(deadlines) - time.time()) if deadlines else None
+            done, _ = wait(list(running), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            now = time.time()
+            for future in list(running):
+                name, start, deadline = running[future]
+                task = by_name[name]
+                if future in done:
+                    status, error = future.result()
+                elif deadline and now >= deadline:
+                    status, error = TIMEOUT, f"{task.timeout}초 초과"
+                    orphans.append(future)
+                else:
+                    continue
+                del running[future]
+                results[name] = TaskResult(task, status, now - start, error)
+                log.info(f"{results[name].icon} {task.emoji} {task.label} ({now - start:.0f}초)")
+    finally:
+        # 타임아웃 처리된 작업 스레드는 기다리지 않음
+        executor.shutdown(wait=False)
+
+    return GraphResult([results[t.name] for t in tasks], deps, time.time() - overall_start)
@@ -0,0 +1,429 @@
+"""Python 스크립트 warm 실행기 (사전 로드된 fork 서버)
+
+스케줄러는 하루 수십 번 `python script.py`를 새로 띄우고, 매번 pandas·yfinance·
+sklearn import에 수 초를 쓴다. 여기서는 무거운 모듈을 미리 import한 fork 서버
+프로세스를 한 번 띄워 두고, 각 작업은 그 서버에서 fork된 자식이 runpy로 스크립트
+엔트리포인트를 실행한다. (multiprocessing forkserver는 자식마다 부모의 __main__을
+다시 import하므로 scheduler.py 같은 진입 스크립트에는 쓸 수 없어 직접 구현)
+
+- 격리: 작업마다 별도 프로세스 (크래시/메모리 누수가 스케줄러로 번지지 않음)
+- 로그: 자식의 fd 1/2를 부모가 만든 파이프에 연결 → 줄 단위 스트리밍
+  (C 확장/손자 프로세스 출력 포함)
+- 타임아웃: 초과 시 자식 SIGKILL 후 subprocess.TimeoutExpired (기존 subprocess 경로와 동일)
+- 서버가 죽으면 다음 호출에서 자동 재기동
+- fork/fd 전달 미지원 플랫폼(Windows)이나 다른 인터프리터(venv 등), warm 자식에서 재현할 수
+  없는 인터프리터 옵션(-I 등)을 지정한 경우 can_run()이 False → 호출 측에서 기존 subprocess 경로 사용
+
+환경변수:
+    MARKETFLOW_WARM_POOL=false       비활성화
+    MARKETFLOW_WARM_PRELOAD=...      사전 로드 모듈 (쉼표 구분)
+
+사용법:
+    from app.utils import warm_pool
+
+    argv = ['script.py', '--flag']
+    if warm_pool.can_run(python_path, argv):
+        code = warm_pool.run_python(argv, cwd=BASE_DIR, env=env, timeout=600, on_line=print)
+"""
+
+import io
+import os
+import sys
+import json
+import atexit
+import time
+import runpy
+import signal
+import socket
+import struct
+import logging
+import selectors
+import threading
+import subprocess
+import traceback
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRELOAD = 'numpy,pandas,requests,yfinance,sklearn,scipy'
+
+_HEADER = struct.Struct('!I')
+
+# warm 자식에서 의미가 없거나 이미 적용된 인터프리터 옵션 (출력은 줄 단위 전달이라 -u 불필요)
+_IGNORED_FLAGS = {'-u', '-B', '-E', '-s', '-S', '-q', '-b', '-bb', '-O', '-OO'}
+_FLAGS_WITH_ARG = {'-X', '-W'}
+
+
+# ── 메시지 프레이밍 (길이 4바이트 + JSON, 요청에는 파이프 fd 첨부) ──
+
+def _send_msg(sock: socket.socket, payload: dict, fds: List[int] = ()):
+    data = json.dumps(payload).encode('utf-8')
+    frame = _HEADER.pack(len(data)) + data
+    if fds:
+        sent = socket.send_fds(sock, [frame], list(fds))
+        frame = frame[sent:]
+    if frame:
+        sock.sendall(frame)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = b''
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise EOFError('warm pool socket closed')
+        buf += chunk
+    return buf
+
+
+def _recv_msg(sock: socket.socket, with_fds: bool = False):
+    if with_fds:
+        head, fds, _, _ = socket.recv_fds(sock, _HEADER.size, 1)
+        if not head:
+            raise EOFError('warm pool socket closed')
+        head += _recv_exact(sock, _HEADER.size - len(head))
+    else:
+        head, fds = _recv_exact(sock, _HEADER.size), []
+    (length,) = _HEADER.unpack(head)
+    return json.loads(_recv_exact(sock, length).decode('utf-8')), fds
+
+
+# ── 서버 프로세스 ──
+
+def _strip_interpreter_flags(argv: List[str]) -> List[str]:
+    """스크립트/-m/-c 앞의 인터프리터 옵션 제거 (-u, -B, -X opt, -W arg 등)
+
+    Raises:
+        ValueError: warm 자식에서 재현할 수 없는 옵션 (-I 등) 또는 실행 대상 없음
+    """
+    argv = list(argv)
+    while argv and argv[0].startswith('-') and argv[0] not in ('-m', '-c', '-'):
+        flag = argv.pop(0)
+        if flag in _FLAGS_WITH_ARG:
+            if not argv:
+                raise ValueError(f"{flag} requires an argument")
+            argv.pop(0)
+        elif flag[:2] in _FLAGS_WITH_ARG:
+            continue          # -Xdev, -Wignore 형태
+        elif flag not in _IGNORED_FLAGS:
+            raise ValueError(f"unsupported interpreter option for warm run: {flag}")
+    if not argv:
+        raise ValueError("no script, -m module or -c code given")
+    return argv
+
+
+def _run_entry(argv: List[str], cwd: Optional[str], env: Optional[dict]):
+    """fork된 자식에서 `python <argv...>`와 동일하게 엔트리포인트 실행"""
+    if argv[0].startswith('-') and argv[0] not in ('-m', '-c'):
+        print(f"unsupported interpreter option: {argv[0]}", file=sys.stderr)
+        raise SystemExit(2)
+    if env is not None:
+        os.environ.clear()
+        os.environ.update(env)
+    if cwd:
+        os.chdir(cwd)
+    for path in reversed([p for p in os.environ.get('PYTHONPATH', '').split(os.pathsep) if p]):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    if os.environ.get('MARKETFLOW_PERF_PARENT'):
+        # 스케줄러 단계 아래에서 실행 중 — 스크립트의 HTTP 호출 수를 perf 카운터로 기록
+        from app.utils import perf
+        perf.install_http_counter()
+
+    if argv[0] == '-m':
+        sys.argv = [argv[1]] + argv[2:]
+        runpy.run_module(argv[1], run_name='__main__', alter_sys=True)
+    elif argv[0] == '-c':
+        sys.argv = ['-c'] + argv[2:]
+        sys.path.insert(0, '')
+        exec(compile(argv[1], '<string>', 'exec'), {'__name__': '__main__'})
+    else:
+        script = os.path.abspath(argv[0])
+        sys.argv = [script] + argv[1:]
+        sys.path.insert(0, os.path.dirname(script))
+        runpy.run_path(script, run_name='__main__')
+
+
+def _child(sock: socket.socket, request: dict, out_fd: int):
+    """fork 직후 자식: 출력 연결 → 실행 → 종료 코드로 _exit"""
+    code = 0
+    try:
+        sock.close()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.dup2(out_fd, 1)
+        os.dup2(out_fd, 2)
+        os.close(out_fd)
+        sys.stdout = io.TextIOWrapper(io.FileIO(1, 'w', closefd=False), encoding='utf-8',
+                                      errors='replace', line_buffering=True)
+        sys.stderr = io.TextIOWrapper(io.FileIO(2, 'w', closefd=False), encoding='utf-8',
+                                      errors='replace', line_buffering=True)
+        _run_entry(request['argv'], request.get('cwd'), request.get('env'))
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            # 일반 인터프리터 종료와 같은 순서: non-daemon 스레드 join → atexit
+            # (perf 카운터 기록, notifier 대기열 전송 포함) → 출력 flush.
+            # os._exit는 둘 다 건너뛰므로 직접 실행
+            try:
+                threading._shutdown()
+            except Exception:
+                traceback.print_exc()
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def _serve(sock_fd: int):
+    """fork 서버 메인 루프 — 요청마다 fork, 자식 종료 코드 회신"""
+    for name in os.environ.get('MARKETFLOW_WARM_PRELOAD', DEFAULT_PRELOAD).split(','):
+        name = name.strip()
+        if name:
+            try:
+                __import__(name)
+            except Exception:
+                pass
+
+    sock = socket.socket(fileno=sock_fd)
+    # SIGCHLD → wakeup 파이프로 select를 깨워 종료 코드를 즉시 회신
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w)
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+
+    sel = selectors.DefaultSelector()
+    sel.register(sock, selectors.EVENT_READ)
+    sel.register(wake_r, selectors.EVENT_READ)
+    children = {}   # pid → request id
+
+    while True:
+        ready = {key.fileobj for key, _ in sel.select(timeout=5)}
+        if wake_r in ready:
+            try:
+                os.read(wake_r, 4096)
+            except BlockingIOError:
+                pass
+        if sock in ready:
+            try:
+                request, fds = _recv_msg(sock, with_fds=True)
+            except (EOFError, OSError):
+                break   # 부모 종료 → 서버 종료 (실행 중인 자식은 그대로 완료)
+            pid = os.fork()
+            if pid == 0:
+                signal.set_wakeup_fd(-1)
+                os.close(wake_r)
+                os.close(wake_w)
+                _child(sock, request, fds[0])
+            for fd in fds:
+                os.close(fd)
+            children[pid] = request['id']
+            _send_msg(sock, {'id': request['id'], 'pid': pid})
+
+        for pid in list(children):
+            done_pid, status = os.waitpid(pid, os.WNOHANG)
+            if done_pid:
+                _send_msg(sock, {'id': children.pop(pid), 'exit': os.waitstatus_to_exitcode(status)})
+
+
+# ── 부모 측 클라이언트 ──
+
+class _Call:
+    def __init__(self):
+        self.pid = None
+        self.exitcode = None
+        self.started = threading.Event()
+        self.finished = threading.Event()
+
+
+class WarmServer:
+    """fork 서버 프로세스 하나와 통신하는 클라이언트 (스레드 안전)"""
+
+    def __init__(self, base_dir: str = None):
+        self.base_dir = base_dir
+        self._proc = None
+        self._sock = None
+        self._calls = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def _ensure_running(self):
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        env = dict(os.environ)
+        if self.base_dir:
+            env['PYTHONPATH'] = os.pathsep.join(
+                p for p in [self.base_dir, env.get('PYTHONPATH', '')] if p)
+        self._proc = subprocess.Popen(
+            [sys.executable, '-c',
+             f'from app.utils.warm_pool import _serve; _serve({child_sock.fileno()})'],
+            pass_fds=[child_sock.fileno()], cwd=self.base_dir, env=env,
+            stdin=subprocess.DEVNULL,
+        )
+        child_sock.close()
+        self._sock = parent_sock
+        threading.Thread(target=self._reader, args=(parent_sock,), daemon=True,
+                         name='warm-pool-reader').start()
+        logger.info(f"🔥 warm pool 서버 시작 (pid={self._proc.pid})")
+
+    def _reader(self, sock: socket.socket):
+        try:
+            while True:
+                msg, _ = _recv_msg(sock)
+                call = self._calls.get(msg['id'])
+                if call is None:
+                    continue
+                if 'pid' in msg:
+                    call.pid = msg['pid']
+                    call.started.set()
+                if 'exit' in msg:
+                    call.exitcode = msg['exit']
+                    call.finished.set()
+        except (EOFError, OSError):
+            pass
+        # 서버 종료 — 대기 중인 호출 모두 실패 처리
+        with self._lock:
+            if self._sock is sock:
+                self._sock = None
+            for call in self._calls.values():
+                if call.exitcode is None:
+                    call.exitcode = -1
+                call.started.set()
+                call.finished.set()
+
+    def run(self, argv: List[str], cwd: str = None, env: dict = None, timeout: float = 600,
+            on_line: Callable[[str], None] = None) -> int:
+        read_fd, write_fd = os.pipe()
+        call = _Call()
+        try:
+            with self._lock:
+                if self._sock is None:
+                    self._proc = None
+                self._ensure_running()
+                self._seq += 1
+                call_id = self._seq
+                self._calls[call_id] = call
+                _send_msg(self._sock, {'id': call_id, 'argv': list(argv), 'cwd': cwd,
+                                       'env': env if env is not None else dict(os.environ)},
+                          [write_fd])
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        call.started.wait(30)
+        deadline = time.time() + timeout if timeout else None
+        timed_out = threading.Event()
+
+        def _on_timeout():
+            timed_out.set()
+            if call.pid:
+                try:
+                    os.kill(call.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+
+        timer = threading.Timer(max(0.0, deadline - time.time()), _on_timeout) if deadline else None
+        if timer:
+            timer.daemon = True
+            timer.start()
+        try:
+            with open(read_fd, 'r', encoding='utf-8', errors='replace') as reader:
+                for line in reader:
+                    clean = line.rstrip()
+                    if clean and on_line:
+                        on_line(clean)
+            call.finished.wait(max(1.0, deadline - time.time()) if deadline else None)
+        finally:
+            if timer:
+                timer.cancel()
+            with self._lock:
+                self._calls.pop(call_id, None)
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(['python'] + list(argv), timeout)
+        return call.exitcode if call.exitcode is not None else -1
+
+    def shutdown(self):
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+            if self._proc is not None:
+                self._proc.terminate()
+                self._proc = None
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def is_available() -> bool:
+    """warm 실행 가능 여부 (fork + fd 전달 지원, 환경변수로 비활성화되지 않음)"""
+    if os.environ.get('MARKETFLOW_WARM_POOL', 'true').lower() != 'true':
+        return False
+    return hasattr(os, 'fork') and hasattr(socket, 'send_fds')
+
+
+def can_run(python_path: str, argv: List[str] = None) -> bool:
+    """python_path로 실행하려던 명령을 warm 서버로 대체할 수 있는지
+
+    같은 인터프리터이고, argv(인터프리터 뒤 인자)를 주면 그 옵션을 warm 자식에서 재현할 수 있을 때만.
+    """
+    if not is_available():
+        return False
+    if argv is not None:
+        try:
+            _strip_interpreter_flags(argv)
+        except ValueError as e:
+            logger.info(f"warm pool skipped ({e}) — using subprocess")
+            return False
+    try:
+        return os.path.samefile(python_path, sys.executable)
+    except OSError:
+        return False
+
+
+def get_warm_server() -> WarmServer:
+    """프로세스 단위 WarmServer 싱글톤"""
+    global _server
+    if _server is None:
+        with _server_lock:
+            if _server is None:
+                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+                _server = WarmServer(base_dir)
+    return _server
+
+
+def run_python(argv: List[str], cwd: str = None, env: dict = None, timeout: float = 600,
+               on_line: Callable[[str], None] = None) -> int:
+    """`python <argv...>`와 동일한 실행을 warm 자식 프로세스에서 수행
+
+    Args:
+        argv: 인터프리터 뒤 인자 — [script, *args] | ['-m', module, *args] | ['-c', code, *args]
+              (앞에 붙은 -u, -B, -X opt 같은 인터프리터 옵션은 제거)
+        cwd / env: 작업 디렉토리 / 전체 환경변수 (None이면 현재 값)
+        on_line: 출력 한 줄마다 호출 (개행 제거)
+
+    Returns:
+        종료 코드 (시그널로 죽으면 음수)
+
+    Raises:
+        subprocess.TimeoutExpired: timeout 초과 (자식은 kill됨)
+        ValueError: warm 자식에서 재현할 수 없는 인터프리터 옵션
+    """
+    argv = _strip_interpreter_flags(argv)
+    return get_warm_server().run(argv, cwd=cwd, env=env, timeout=timeout, on_line=on_line)
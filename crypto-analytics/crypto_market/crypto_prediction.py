@@ -24,13 +24,33 @@ Usage:
 
 import os
 import json
+import time
 import logging
 import numpy as np
 import pandas as pd
 import requests
 import yfinance as yf
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
+# 공용 피처 스토어 (증분 피처 계산, 없으면 매번 다운로드 + 전체 계산)
+try:
+    from app.utils.feature_store import FeatureSet, get_feature_store
+except ImportError:
+    get_feature_store = None
+
+# 모델 레지스트리 + 증분 재학습 (없으면 항상 전체 재학습)
+try:
+    from app.utils.model_registry import (
+        RetrainPolicy, extend_model, fingerprint, get_model_registry, model_size, plan_training,
+    )
+except ImportError:
+    plan_training = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -75,8 +95,12 @@ class CryptoPredictor:
         'GLD': 'GLD', '^VIX': 'VIX', 'TLT': 'TLT', 'UUP': 'DXY',
     }
 
+    # 피처 정의 버전 (_calculate_* 보조 함수를 바꾸면 올릴 것 → 피처 스토어 전체 재계산)
+    FEATURE_VERSION = '1'
+
     ENSEMBLE_SEEDS = [42, 123, 456]
     RETRAIN_INTERVAL_DAYS = 7
+    FULL_RETRAIN_DAYS = 28      # 그 사이 재학습은 warm start 증분
     PREDICTION_HORIZON = 5  # 5 trading days forward
     HISTORY_MAX_ENTRIES = 90
 
@@ -162,12 +186,43 @@ class CryptoPredictor:
     # Feature Engineering
     # ------------------------------------------------------------------
 
+    def feature_set(self, years: int = 3) -> 'FeatureSet':
+        """피처 스토어 정의 (종가 + BTC 거래량 → build_features)"""
+        return FeatureSet(
+            name='crypto_prediction',
+            version=self.FEATURE_VERSION,
+            tickers=self.TICKER_LABELS,
+            builder=self.build_features,
+            history_start=(datetime.now() - timedelta(days=years * 365 + 300)).strftime('%Y-%m-%d'),
+            volume=['BTC-USD'],
+        )
+
+    def _load_features(self, years: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """(가격, 피처) — 피처 스토어가 있으면 증분 갱신된 프레임에서, 없으면 다운로드 후 계산"""
+        if get_feature_store is not None:
+            try:
+                fs = self.feature_set()
+                start = datetime.now() - timedelta(days=years * 365 + 300)
+                frame = get_feature_store().load(fs, start=start)
+                if not frame.empty and 'btc_return_5d' in frame.columns:
+                    return frame[fs.input_columns], frame.drop(columns=fs.input_columns)
+            except Exception as e:
+                logger.warning(f"Feature store unavailable, computing features directly: {e}")
+
+        data = self._fetch_price_data(years=years)
+        if data.empty:
+            return data, pd.DataFrame()
+        return data, self.build_features(data)
+
     def _fetch_price_data(self, years: int = 3) -> pd.DataFrame:
         """Download price data for all required tickers"""
         start_date = (datetime.now() - timedelta(days=years * 365 + 300)).strftime('%Y-%m-%d')
 
         try:
-            data = yf.download(self.TICKERS, start=start_date, progress=False)
+            if ohlcv_lake is not None:
+                data = ohlcv_lake.get_panel(self.TICKERS, start=start_date, max_age_hours=1)
+            else:
+                data = yf.download(self.TICKERS, start=start_date, progress=False)
             if data.empty:
                 logger.error("No data returned from yfinance")
                 return pd.DataFrame()
@@ -282,12 +337,10 @@ class CryptoPredictor:
         """Build features + target for training with threshold-based label"""
         logger.info("Building training dataset...")
 
-        data = self._fetch_price_data(years=3)
-        if data.empty:
+        data, features = self._load_features(years=3)
+        if data.empty or features.empty:
             return pd.DataFrame()
 
-        features = self.build_features(data)
-
         # Target: threshold-based label
         # forward_5d_return > median + 0.5*std -> bullish (1), else 0
         btc = data['BTC']
@@ -321,12 +374,10 @@ class CryptoPredictor:
 
     def _build_latest_features(self) -> Optional[pd.Series]:
         """Build today's feature vector for live prediction"""
-        data = self._fetch_price_data(years=1)
-        if data.empty:
+        data, features = self._load_features(years=1)
+        if data.empty or features.empty:
             return None
 
-        features = self.build_features(data)
-
         # Fill point-in-time features for the latest row
         funding_rate = self._fetch_funding_rate()
         fear_greed = self._fetch_fear_greed()
@@ -355,11 +406,14 @@ class CryptoPredictor:
     # Model Training
     # ------------------------------------------------------------------
 
-    def train_model(self, df: pd.DataFrame) -> Dict:
+    def train_model(self, df: pd.DataFrame, mode: str = 'auto') -> Dict:
         """Train multi-algorithm ensemble with TimeSeriesSplit CV
 
         Algorithms: GradientBoosting (x3 seeds), RandomForest,
                     HistGradientBoosting, LogisticRegression
+
+        mode='auto'면 이전 앙상블을 warm start로 이어서 학습하고(CV 생략), 피처 변경/드리프트/
+        FULL_RETRAIN_DAYS 경과 시에만 CV 포함 전체 재학습한다. mode='full'은 항상 전체 재학습.
         """
         logger.info("Training BTC prediction multi-model ensemble...")
 
@@ -427,68 +481,116 @@ class CryptoPredictor:
         if len(unique_classes) < 2:
             return {'error': f'Only one class in training data: {unique_classes}'}
 
-        # TimeSeriesSplit CV — per-model + ensemble accuracy
-        tscv = TimeSeriesSplit(n_splits=5)
-        model_cv_results = {cfg['name']: [] for cfg in model_configs}
-        ensemble_cv_results = []
-
-        for train_idx, test_idx in tscv.split(X):
-            X_train_raw, X_test_raw = X[train_idx], X[test_idx]
-            y_train, y_test = y[train_idx], y[test_idx]
-
-            fold_scaler = StandardScaler()
-            X_train = fold_scaler.fit_transform(X_train_raw)
-            X_test = fold_scaler.transform(X_test_raw)
-
-            if len(np.unique(y_train)) < 2:
-                continue
+        started = time.perf_counter()
 
-            all_fold_probas = []
+        # 이전 앙상블을 이어서 학습할 수 있는지 (피처 동일, 드리프트/경과일 기준 이내)
+        previous, plan = None, None
+        if mode == 'auto' and plan_training is not None and os.path.exists(self.model_path):
+            try:
+                previous = joblib.load(self.model_path)
+                plan = plan_training(
+                    previous, available_features, X, y,
+                    RetrainPolicy(full_retrain_days=self.FULL_RETRAIN_DAYS),
+                    sizes=[model_size(c) for clfs in previous['all_classifiers'].values() for c in clfs],
+                )
+                logger.info(f"Training plan: {plan['mode']} ({plan['reason']})")
+            except Exception as e:
+                logger.warning(f"Previous model unusable, full retrain: {e}")
+                previous, plan = None, None
+
+        if plan is not None and plan['mode'] == 'skip':
+            # 학습 데이터가 그대로 — 재학습 주기만 갱신
+            previous['trained_at'] = datetime.now().isoformat()
+            joblib.dump(previous, self.model_path)
+            top_features = sorted(zip(previous['features'], previous['avg_importances']),
+                                  key=lambda x: x[1], reverse=True)[:10]
+            return {
+                'accuracy': previous['cv_accuracy'],
+                'training_samples': previous['training_samples'],
+                'features_used': len(available_features),
+                'top_features': [{'feature': f, 'importance': round(i, 4)} for f, i in top_features],
+                'model_details': previous.get('model_details', {}),
+                'training_mode': 'skip',
+            }
 
-            for cfg in model_configs:
-                model_probas = []
-                for seed in cfg['seeds']:
-                    clf = cfg['create'](seed)
-                    clf.fit(X_train, y_train)
-                    proba = clf.predict_proba(X_test)
-                    model_probas.append(proba)
+        incremental = plan is not None and plan['mode'] == 'incremental'
+        if incremental:
+            # 이전 scaler 유지 (기존 트리 분할 기준) — CV 점수는 마지막 전체 학습 값 유지
+            final_scaler = previous['scaler']
+            X_scaled = final_scaler.transform(X)
+            mean_ensemble_accuracy = previous['cv_accuracy']
+            model_details = previous.get('model_details', {})
+            full_trained_at = previous['full_trained_at']
+            base_size = previous['base_size']
+        else:
+            # TimeSeriesSplit CV — per-model + ensemble accuracy
+            tscv = TimeSeriesSplit(n_splits=5)
+            model_cv_results = {cfg['name']: [] for cfg in model_configs}
+            ensemble_cv_results = []
+
+            for train_idx, test_idx in tscv.split(X):
+                X_train_raw, X_test_raw = X[train_idx], X[test_idx]
+                y_train, y_test = y[train_idx], y[test_idx]
+
+                fold_scaler = StandardScaler()
+                X_train = fold_scaler.fit_transform(X_train_raw)
+                X_test = fold_scaler.transform(X_test_raw)
+
+                if len(np.unique(y_train)) < 2:
+                    continue
+
+                all_fold_probas = []
+
+                for cfg in model_configs:
+                    model_probas = []
+                    for seed in cfg['seeds']:
+                        clf = cfg['create'](seed)
+                        clf.fit(X_train, y_train)
+                        proba = clf.predict_proba(X_test)
+                        model_probas.append(proba)
 
-                avg_model_proba = np.mean(model_probas, axis=0)
-                all_fold_probas.append(avg_model_proba)
+                    avg_model_proba = np.mean(model_probas, axis=0)
+                    all_fold_probas.append(avg_model_proba)
 
-                y_pred = (avg_model_proba[:, 1] >= 0.5).astype(int)
-                model_cv_results[cfg['name']].append(accuracy_score(y_test, y_pred))
+                    y_pred = (avg_model_proba[:, 1] >= 0.5).astype(int)
+                    model_cv_results[cfg['name']].append(accuracy_score(y_test, y_pred))
 
-            # Ensemble: average across all model types
-            ensemble_proba = np.mean(all_fold_probas, axis=0)
-            y_ensemble = (ensemble_proba[:, 1] >= 0.5).astype(int)
-            ensemble_cv_results.append(accuracy_score(y_test, y_ensemble))
+                # Ensemble: average across all model types
+                ensemble_proba = np.mean(all_fold_probas, axis=0)
+                y_ensemble = (ensemble_proba[:, 1] >= 0.5).astype(int)
+                ensemble_cv_results.append(accuracy_score(y_test, y_ensemble))
 
-        if not ensemble_cv_results:
-            return {'error': 'No valid CV folds'}
+            if not ensemble_cv_results:
+                return {'error': 'No valid CV folds'}
 
-        mean_ensemble_accuracy = round(np.mean(ensemble_cv_results) * 100, 1)
+            mean_ensemble_accuracy = round(np.mean(ensemble_cv_results) * 100, 1)
 
-        for name, accs in model_cv_results.items():
-            if accs:
-                logger.info(f"  {name} CV accuracy: {round(np.mean(accs) * 100, 1)}%")
-        logger.info(f"  Ensemble CV accuracy: {mean_ensemble_accuracy}%")
+            for name, accs in model_cv_results.items():
+                if accs:
+                    logger.info(f"  {name} CV accuracy: {round(np.mean(accs) * 100, 1)}%")
+            logger.info(f"  Ensemble CV accuracy: {mean_ensemble_accuracy}%")
 
-        # Final training on all data
-        final_scaler = StandardScaler()
-        X_scaled = final_scaler.fit_transform(X)
+            # Final training on all data
+            final_scaler = StandardScaler()
+            X_scaled = final_scaler.fit_transform(X)
+            full_trained_at = datetime.now().isoformat()
 
         all_classifiers = {}
         all_importances = np.zeros(len(available_features))
         importance_count = 0
 
         for cfg in model_configs:
-            classifiers = []
-            for seed in cfg['seeds']:
-                clf = cfg['create'](seed)
-                clf.fit(X_scaled, y)
-                classifiers.append(clf)
+            if incremental and cfg['name'] in previous['all_classifiers']:
+                classifiers = [extend_model(clf, X_scaled, y, plan['extra_estimators'])
+                               for clf in previous['all_classifiers'][cfg['name']]]
+            else:
+                classifiers = []
+                for seed in cfg['seeds']:
+                    clf = cfg['create'](seed)
+                    clf.fit(X_scaled, y)
+                    classifiers.append(clf)
 
+            for clf in classifiers:
                 if hasattr(clf, 'feature_importances_'):
                     all_importances += clf.feature_importances_
                     importance_count += 1
@@ -503,15 +605,20 @@ class CryptoPredictor:
         top_features = sorted(importances.items(), key=lambda x: x[1], reverse=True)[:10]
 
         # Model details
-        model_details = {}
-        for name, accs in model_cv_results.items():
-            if accs:
-                model_details[name] = {
-                    'accuracy': round(np.mean(accs) * 100, 1),
-                    'models_count': len(all_classifiers.get(name, [])),
-                }
+        if not incremental:
+            model_details = {}
+            for name, accs in model_cv_results.items():
+                if accs:
+                    model_details[name] = {
+                        'accuracy': round(np.mean(accs) * 100, 1),
+                        'models_count': len(all_classifiers.get(name, [])),
+                    }
+            base_size = max(model_size(c) for clfs in all_classifiers.values() for c in clfs) \
+                if plan_training is not None else None
 
         # Save model
+        training_mode = plan['mode'] if plan is not None else 'full'
+        hashes = plan or (fingerprint(available_features, X, y) if plan_training is not None else {})
         model_data = {
             'all_classifiers': all_classifiers,
             'classifiers': all_classifiers.get('GradientBoosting', []),
@@ -522,13 +629,34 @@ class CryptoPredictor:
             'cv_accuracy': mean_ensemble_accuracy,
             'avg_importances': avg_importances.tolist(),
             'model_details': model_details,
+            'full_trained_at': full_trained_at,
+            'base_size': base_size,
+            'training_mode': training_mode,
+            'data_hash': hashes.get('data_hash'),
         }
 
         os.makedirs(self.output_dir, exist_ok=True)
         joblib.dump(model_data, self.model_path)
+        elapsed = time.perf_counter() - started
 
         total_models = sum(len(clfs) for clfs in all_classifiers.values())
-        logger.info(f"Saved {total_models} models ({len(model_configs)} algorithms) to {self.model_path}")
+        logger.info(f"Saved {total_models} models ({len(model_configs)} algorithms) to {self.model_path} "
+                    f"({training_mode}, {elapsed:.1f}s)")
+
+        if plan_training is not None:
+            try:
+                get_model_registry().record(
+                    'crypto_btc', mode=training_mode,
+                    reason=plan['reason'] if plan is not None else (
+                        'full retrain requested' if mode == 'full' else 'no previous model'),
+                    data_hash=hashes.get('data_hash'),
+                    feature_hash=hashes.get('feature_hash'),
+                    drift=plan['drift'] if plan is not None else None,
+                    training_samples=len(X), cv_accuracy=mean_ensemble_accuracy,
+                    models=total_models, train_seconds=round(elapsed, 2), model_path=self.model_path,
+                )
+            except Exception as e:
+                logger.warning(f"Model registry write failed: {e}")
 
         return {
             'accuracy': mean_ensemble_accuracy,
@@ -536,6 +664,7 @@ class CryptoPredictor:
             'features_used': len(available_features),
             'top_features': [{'feature': f, 'importance': round(i, 4)} for f, i in top_features],
             'model_details': model_details,
+            'training_mode': training_mode,
         }
 
     # ------------------------------------------------------------------
@@ -24,6 +24,11 @@ import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -67,11 +72,15 @@ class CryptoRiskAnalyzer:
         start_date = (datetime.now() - timedelta(days=period_days + 10)).strftime('%Y-%m-%d')
 
         try:
-            data = yf.download(
-                self.COIN_TICKERS,
-                start=start_date,
-                progress=False,
-            )['Close']
+            if ohlcv_lake is not None:
+                # 24시간 거래 → 당일 봉이 계속 바뀌므로 1시간 지난 데이터는 다시 받음
+                data = ohlcv_lake.get_close(self.COIN_TICKERS, start=start_date, max_age_hours=1)
+            else:
+                data = yf.download(
+                    self.COIN_TICKERS,
+                    start=start_date,
+                    progress=False,
+                )['Close']
 
             if data.empty:
                 logger.error("No data returned from yfinance")
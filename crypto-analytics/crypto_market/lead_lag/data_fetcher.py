@@ -66,15 +66,28 @@ def fetch_yfinance_data(
     Fetch market data from yfinance.
     Returns DataFrame with columns for each source.
     """
+    tickers = [s.ticker for s in sources]
+    names = [s.name for s in sources]
+
+    # 공용 OHLCV 레이크 경유 (열 순서 = tickers 순서)
+    try:
+        from app.utils import ohlcv_lake
+        result = ohlcv_lake.get_close(tickers, start=start_date, end=end_date, max_age_hours=1)
+        if not result.empty:
+            result.columns = names
+            logger.info(f"Fetched {len(result)} rows from OHLCV lake")
+            return result
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning(f"OHLCV lake fetch error, falling back to yfinance: {e}")
+
     try:
         import yfinance as yf
     except ImportError:
         logger.error("yfinance not installed. Run: pip install yfinance")
         return pd.DataFrame()
     
-    tickers = [s.ticker for s in sources]
-    names = [s.name for s in sources]
-    
     logger.info(f"Fetching {len(tickers)} tickers from yfinance...")
     
     try:
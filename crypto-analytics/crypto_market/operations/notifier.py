@@ -18,6 +18,12 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# 공용 텔레그램 발신 큐 (백그라운드 전송/속도 제한/재시도, 없으면 직접 전송)
+try:
+    from app.utils.notifier import notify as _enqueue_telegram
+except ImportError:
+    _enqueue_telegram = None
+
 
 def load_env():
     """Load environment variables"""
@@ -65,6 +71,13 @@ class TelegramNotifier:
         if not self.is_configured():
             logger.warning("Telegram not configured")
             return False
+
+        if _enqueue_telegram is not None:
+            return _enqueue_telegram(
+                text,
+                destinations=[(self.config.telegram_token, self.config.telegram_chat_id)],
+                parse_mode=parse_mode,
+            )
         
         try:
             import requests
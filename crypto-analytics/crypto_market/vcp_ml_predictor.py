@@ -20,12 +20,21 @@ Usage:
 
 import os
 import json
+import time
 import logging
 import numpy as np
 import joblib
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# 모델 레지스트리 + 증분 재학습 (없으면 항상 전체 재학습)
+try:
+    from app.utils.model_registry import (
+        RetrainPolicy, extend_model, fingerprint, get_model_registry, model_size, plan_training,
+    )
+except ImportError:
+    plan_training = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -177,8 +186,12 @@ class VCPMLPredictor:
 
     # ===== Training =====
 
-    def train(self, backtest_path: str = None) -> dict:
-        """Train ML models on backtest trade data"""
+    def train(self, backtest_path: str = None, mode: str = 'auto') -> dict:
+        """Train ML models on backtest trade data
+
+        mode='auto'면 이전 모델을 warm start로 이어서 학습하고(CV 생략), 피처 변경/드리프트/
+        28일 경과 시에만 CV 포함 전체 재학습한다. mode='full'은 항상 전체 재학습.
+        """
         from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier, HistGradientBoostingClassifier
         from sklearn.linear_model import LogisticRegression
         from sklearn.preprocessing import StandardScaler
@@ -188,6 +201,25 @@ class VCPMLPredictor:
         X, y, feature_names = self._build_features(trades)
 
         self.feature_names = feature_names
+        started = time.perf_counter()
+
+        # 이전 모델을 이어서 학습할 수 있는지 (피처 동일, 드리프트/경과일 기준 이내)
+        previous, plan = None, None
+        if mode == 'auto' and plan_training is not None and os.path.exists(MODEL_PATH):
+            try:
+                previous = joblib.load(MODEL_PATH)
+                previous['features'] = previous['feature_names']
+                plan = plan_training(previous, feature_names, X, y, RetrainPolicy(),
+                                     sizes=[model_size(m) for m in previous['models'].values()])
+                logger.info(f"Training plan: {plan['mode']} ({plan['reason']})")
+            except Exception as e:
+                logger.warning(f"Previous model unusable, full retrain: {e}")
+                previous, plan = None, None
+        full_reason = plan['reason'] if plan is not None else (
+            'full retrain requested' if mode == 'full' else 'no previous model')
+
+        if plan is not None and plan['mode'] in ('skip', 'incremental'):
+            return self._train_from_previous(previous, plan, X, y, started)
 
         # Scale
         self.scaler = StandardScaler()
@@ -281,6 +313,7 @@ class VCPMLPredictor:
         ensemble_accuracy = np.mean(ensemble_accs) * 100
 
         # Save model
+        hashes = plan or (fingerprint(feature_names, X, y) if plan_training is not None else {})
         model_data = {
             'models': self.models,
             'scaler': self.scaler,
@@ -291,11 +324,17 @@ class VCPMLPredictor:
             'training_samples': len(X),
             'win_rate_baseline': float(np.mean(y) * 100),
             'top_features': [(f, float(imp)) for f, imp in importance_pairs[:10]],
+            'full_trained_at': datetime.now().isoformat(),
+            'base_size': max(model_size(m) for m in self.models.values()) if plan_training is not None else None,
+            'training_mode': 'full',
+            'data_hash': hashes.get('data_hash'),
         }
 
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         joblib.dump(model_data, MODEL_PATH)
         logger.info(f"Model saved to {MODEL_PATH}")
+        self._record_training(model_data, {**hashes, 'drift': plan['drift'] if plan is not None else None},
+                              started, full_reason)
 
         return {
             'ensemble_accuracy': ensemble_accuracy,
@@ -304,8 +343,70 @@ class VCPMLPredictor:
             'win_rate_baseline': float(np.mean(y) * 100),
             'feature_count': len(feature_names),
             'top_features': importance_pairs[:10],
+            'training_mode': 'full',
+        }
+
+    def _train_from_previous(self, previous: dict, plan: dict, X: np.ndarray, y: np.ndarray,
+                             started: float) -> dict:
+        """이전 모델 재사용 — skip이면 그대로, incremental이면 이전 scaler로 warm start 추가 학습
+
+        CV 점수(모델별/앙상블)는 마지막 전체 학습 값을 유지한다.
+        """
+        self.models = previous['models']
+        self.scaler = previous['scaler']
+        self.model_details = previous.get('model_details', {})
+
+        if plan['mode'] == 'incremental':
+            X_scaled = self.scaler.transform(X)
+            for clf in self.models.values():
+                extend_model(clf, X_scaled, y, plan['extra_estimators'])
+
+        importance_pairs = sorted(
+            zip(self.feature_names, self.models['RandomForest'].feature_importances_),
+            key=lambda x: x[1], reverse=True,
+        )
+        model_data = {
+            **{k: v for k, v in previous.items() if k != 'features'},
+            'trained_at': datetime.now().isoformat(),
+            'training_samples': len(X),
+            'win_rate_baseline': float(np.mean(y) * 100),
+            'top_features': [(f, float(imp)) for f, imp in importance_pairs[:10]],
+            'training_mode': plan['mode'],
+            'data_hash': plan['data_hash'],
+        }
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        joblib.dump(model_data, MODEL_PATH)
+        logger.info(f"Model saved to {MODEL_PATH} ({plan['mode']})")
+        if plan['mode'] == 'incremental':
+            self._record_training(model_data, plan, started, plan['reason'])
+
+        return {
+            'ensemble_accuracy': previous['ensemble_accuracy'],
+            'models': {k: v['accuracy'] for k, v in self.model_details.items()},
+            'training_samples': len(X),
+            'win_rate_baseline': float(np.mean(y) * 100),
+            'feature_count': len(self.feature_names),
+            'top_features': importance_pairs[:10],
+            'training_mode': plan['mode'],
         }
 
+    def _record_training(self, model_data: dict, plan: dict, started: float, reason: str):
+        if plan_training is None:
+            return
+        try:
+            get_model_registry().record(
+                'vcp_ml', mode=model_data['training_mode'],
+                reason=reason,
+                data_hash=plan.get('data_hash'),
+                feature_hash=plan.get('feature_hash'),
+                drift=plan.get('drift'),
+                training_samples=model_data['training_samples'],
+                cv_accuracy=round(float(model_data['ensemble_accuracy']), 1),
+                train_seconds=round(time.perf_counter() - started, 2), model_path=MODEL_PATH,
+            )
+        except Exception as e:
+            logger.warning(f"Model registry write failed: {e}")
+
     # ===== Loading =====
 
     def load_model(self) -> bool:
@@ -29,6 +29,7 @@ from engine.scorer import Scorer
 from engine.position_sizer import PositionSizer
 from engine.llm_analyzer import LLMAnalyzer, MultiAIConsensusScreener
 from engine.dart_collector import DARTCollector
+from engine.history_index import update_history_index
 
 
 def _get_kst_now():
@@ -469,6 +470,10 @@ async def analyze_single_stock_by_code(
             if os.path.exists(daily_path):
                  with open(daily_path, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
+                 try:
+                     update_history_index(base_dir, date_str, data)
+                 except Exception as e:
+                     print(f"[WARN] 히스토리 인덱스 갱신 실패: {e}")
             
             return new_signal
             
@@ -506,6 +511,12 @@ def save_result_to_json(result: ScreenerResult, claude_picks: dict = None):
         json.dump(data, f, indent=2, ensure_ascii=False)
     
     print(f"\n[저장 완료] Daily: {save_path}")
+
+    # 히스토리 인덱스 갱신 (해당 날짜 항목만)
+    try:
+        update_history_index(base_dir, date_str, data)
+    except Exception as e:
+        print(f"[WARN] 히스토리 인덱스 갱신 실패: {e}")
     
     # 2. Latest 파일 업데이트 (덮어쓰기)
     latest_path = os.path.join(base_dir, "jongga_v2_latest.json")
@@ -0,0 +1,192 @@
+"""
+종가베팅 V2 히스토리 인덱스 (jongga_v2_index.json)
+
+날짜별 결과 파일(jongga_v2_results_YYYYMMDD.json)마다 요약 통계를 한 줄씩
+기록해 두어, 날짜 목록/백테스트 집계가 전체 히스토리 파일을 매번 열지 않도록 한다.
+
+- save_result_to_json()이 새 날짜를 쓸 때 해당 날짜 항목만 갱신
+- load_history_index()는 디렉토리 목록(stat)만 비교해서 새로 생기거나
+  크기/수정시간이 바뀐 파일만 다시 읽는다 (수동 복사·삭제도 자동 반영)
+- 인덱스 읽기-수정-쓰기는 FileLock(jongga_v2_index.json.lock)으로 묶고,
+  임시 파일은 프로세스별 경로에 쓴 뒤 os.replace
+"""
+
+import os
+import re
+import json
+from typing import Dict, Optional
+
+try:
+    from app.utils.file_lock import safe_write
+except ImportError:
+    from contextlib import contextmanager
+
+    @contextmanager
+    def safe_write(filepath, timeout=30):
+        yield filepath
+
+INDEX_FILENAME = "jongga_v2_index.json"
+INDEX_VERSION = 1
+
+_RESULT_FILE_RE = re.compile(r"^jongga_v2_results_(\d{8})\.json$")
+
+# 백테스트 추정 수익률 캡 (sync_dashboard 종가베팅 요약과 동일 규칙)
+EST_RETURN_CAP = 5.0
+EST_RETURN_FLOOR = -3.0
+
+
+def _index_path(data_dir: str) -> str:
+    return os.path.join(data_dir, INDEX_FILENAME)
+
+
+def summarize_day(data: dict) -> dict:
+    """하루치 결과 JSON → 인덱스 요약 항목"""
+    signals = data.get("signals") or []
+
+    by_grade: Dict[str, int] = {}
+    wins = 0
+    valid_count = 0
+    total_return = 0.0
+
+    for s in signals:
+        grade = s.get("grade")
+        if grade:
+            by_grade[grade] = by_grade.get(grade, 0) + 1
+
+        if (s.get("entry_price") or 0) <= 0:
+            continue
+        change_pct = s.get("change_pct") or 0
+        if change_pct > 0:
+            total_return += min(change_pct, EST_RETURN_CAP)
+            wins += 1
+        else:
+            total_return += max(change_pct, EST_RETURN_FLOOR)
+        valid_count += 1
+
+    return {
+        "date": data.get("date", ""),
+        "signal_count": len(signals),
+        "by_grade": by_grade,
+        "valid_count": valid_count,
+        "wins": wins,
+        "total_return": round(total_return, 4),
+        "updated_at": data.get("updated_at", ""),
+    }
+
+
+def _entry_for_file(path: str, data: Optional[dict] = None) -> Optional[dict]:
+    """파일 stat + 요약 통계 (data 미지정 시 파일에서 읽음)"""
+    try:
+        st = os.stat(path)
+        if data is None:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    entry = summarize_day(data)
+    entry.update({
+        "file": os.path.basename(path),
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+    })
+    return entry
+
+
+def _read_index(data_dir: str) -> dict:
+    try:
+        with open(_index_path(data_dir), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            return index
+    except (OSError, ValueError):
+        pass
+    return {"version": INDEX_VERSION, "days": {}}
+
+
+def _write_index(data_dir: str, index: dict):
+    path = _index_path(data_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def update_history_index(data_dir: str, date_str: str, data: dict = None) -> Optional[dict]:
+    """한 날짜 항목만 갱신 (save_result_to_json 직후 호출)
+
+    Args:
+        data_dir: data/ 경로
+        date_str: YYYYMMDD
+        data: 방금 저장한 결과 dict (없으면 파일에서 읽음)
+    """
+    path = os.path.join(data_dir, f"jongga_v2_results_{date_str}.json")
+    entry = _entry_for_file(path, data)
+    if entry is None:
+        return None
+
+    with safe_write(_index_path(data_dir)):
+        index = _read_index(data_dir)
+        index["days"][date_str] = entry
+        _write_index(data_dir, index)
+    return entry
+
+
+def load_history_index(data_dir: str) -> dict:
+    """최신 인덱스 반환 — 변경된 날짜 파일만 다시 읽어 증분 갱신
+
+    Returns:
+        {YYYYMMDD: entry} (날짜 오름차순)
+    """
+    index = _read_index(data_dir)
+    days = index["days"]
+    changed = False
+
+    try:
+        names = os.listdir(data_dir)
+    except OSError:
+        return {}
+
+    seen = set()
+    for name in names:
+        m = _RESULT_FILE_RE.match(name)
+        if not m:
+            continue
+        date_str = m.group(1)
+        seen.add(date_str)
+
+        path = os.path.join(data_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+
+        entry = days.get(date_str)
+        if entry and entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime:
+            continue
+
+        entry = _entry_for_file(path)
+        if entry is None:
+            continue
+        days[date_str] = entry
+        changed = True
+
+    for date_str in [d for d in days if d not in seen]:
+        del days[date_str]
+        changed = True
+
+    if changed:
+        try:
+            # 항목은 방금 확인한 파일 stat 기준 — 동시 갱신과 엇갈려도 다음 조회 때 stat 비교로 다시 읽힌다
+            with safe_write(_index_path(data_dir)):
+                _write_index(data_dir, index)
+        except Exception as e:
+            print(f"[WARN] jongga v2 index write failed: {e}")
+
+    return dict(sorted(days.items()))
+
+
+def list_signal_dates(data_dir: str) -> list:
+    """시그널이 1개 이상 있는 날짜 (YYYYMMDD, 최신순) — 휴장일/빈 파일 제외"""
+    days = load_history_index(data_dir)
+    return sorted((d for d, e in days.items() if e.get("signal_count", 0) > 0), reverse=True)
@@ -470,7 +470,20 @@ function DataStatusBox({ updatedAt }: { updatedAt?: string }) {
         setUpdating(true);
         try {
             const res = await fetch('/api/kr/jongga-v2/run', { method: 'POST' });
-            if (res.ok) {
+            if (!res.ok) {
+                alert('엔진 실행 실패. 서버 로그를 확인하세요.');
+                return;
+            }
+            // 백그라운드 작업 완료까지 폴링
+            const { job_id } = await res.json();
+            let job = { status: 'queued' };
+            while (job.status === 'queued' || job.status === 'running') {
+                await new Promise(r => setTimeout(r, 5000));
+                const pollRes = await fetch(`/api/jobs/${job_id}?log_tail=0`);
+                if (!pollRes.ok) break;
+                job = await pollRes.json();
+            }
+            if (job.status === 'succeeded') {
                 alert('전체 분석이 완료되었습니다!');
                 window.location.reload();
             } else {
@@ -15,6 +15,11 @@ from dataclasses import dataclass
 
 from config import KOSPI_TICKER, KOSDAQ_TICKER, USD_KRW_TICKER, MarketGateConfig
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -49,6 +54,12 @@ KR_SECTORS = {
     "증권": "102970.KS",
 }
 
+def _download(tickers: List[str], period: str) -> pd.DataFrame:
+    """Yahoo OHLCV (레이크 경유 시 (필드, 티커) 열 구조 동일)"""
+    if ohlcv_lake is not None:
+        return ohlcv_lake.get_panel(tickers, period=period)
+    return yf.download(tickers, period=period, progress=False)
+
 def calculate_rsi(series: pd.Series, period: int = 14) -> float:
     """Calculate RSI"""
     delta = series.diff()
@@ -212,7 +223,7 @@ def run_kr_market_gate() -> KRMarketGateResult:
             if missing_indices:
                 logger.warning(f"Indices missing in FDR: {missing_indices}, trying Yahoo for indices...")
                 try:
-                    yf_data = yf.download(missing_indices, period="1y", progress=False)
+                    yf_data = _download(missing_indices, period="1y")
                     if not yf_data.empty and 'Close' in yf_data.columns:
                         # Merge Yahoo data into existing data
                         for missing in missing_indices:
@@ -232,7 +243,7 @@ def run_kr_market_gate() -> KRMarketGateResult:
     # Fallback to Yahoo Finance (if FDR failed)
     if data is None or data.empty:
         try:
-            data = yf.download(all_tickers, period="1y", progress=False)
+            data = _download(all_tickers, period="1y")
             if data.empty or 'Close' not in data.columns:
                 raise ValueError("Yahoo Finance returned empty data")
             logger.info("✅ Yahoo Finance loaded data as fallback")
@@ -71,6 +71,13 @@ except ImportError:
     def safe_read(filepath, timeout=10):
         yield filepath
 
+# 의존성 그래프 병렬 실행기 / warm 스크립트 실행기
+from app.utils.task_graph import Task, run_task_graph
+from app.utils.stage_memo import StageMemo, format_skipped
+from app.utils import warm_pool
+from app.utils import perf
+from app.utils.notifier import notify
+
 # 대시보드 동기화 임포트
 try:
     from sync_dashboard import sync_dashboard
@@ -124,6 +131,12 @@ class Config:
     HISTORY_TIMEOUT = int(os.environ.get('KR_MARKET_HISTORY_TIMEOUT', '900'))
     CRYPTO_TASK_TIMEOUT = int(os.environ.get('CRYPTO_MARKET_TASK_TIMEOUT', '600'))
     CRYPTO_BRIEFING_TIMEOUT = int(os.environ.get('CRYPTO_MARKET_BRIEFING_TIMEOUT', '300'))
+    US_PIPELINE_TIMEOUT = int(os.environ.get('US_MARKET_PIPELINE_TIMEOUT', '1800'))
+    JONGGA_TIMEOUT = int(os.environ.get('KR_MARKET_JONGGA_TIMEOUT', '900'))
+    CRYPTO_PIPELINE_TIMEOUT = int(os.environ.get('CRYPTO_MARKET_PIPELINE_TIMEOUT', '2400'))
+
+    # 전체 업데이트/라운드 병렬 작업 수 (동시 실행 서브프로세스 상한)
+    GRAPH_WORKERS = int(os.environ.get('MARKETFLOW_GRAPH_WORKERS', '3'))
 
     # Python 실행 경로 (가상환경 우선)
     _VENV_PYTHON = os.path.join(_SCRIPT_DIR, '.venv', 'Scripts', 'python.exe')
@@ -163,21 +176,34 @@ def setup_logging():
 
 logger = setup_logging()
 
+# 단계 메모이제이션 — 입력 파일/파라미터 해시가 마지막 성공 때와 같으면 생략
+# (강제 실행: --force-stages all|이름,... 또는 MARKETFLOW_FORCE_STAGES)
+stage_memo = StageMemo(os.path.join(Config.DATA_DIR, 'stage_memo.json'))
+
 
 # ============================================================
 # 공통 유틸리티
 # ============================================================
 
 def run_command(cmd: list, description: str, timeout: int = 600,
-                notify: bool = False, env_extra: dict = None,
+                send_notification: bool = False, env_extra: dict = None,
                 cwd: str = None) -> bool:
     """명령 실행 헬퍼 (실시간 출력 스트리밍)
 
     Args:
-        notify: True일 때만 텔레그램 알림 전송 (기본: False → 로그만)
+        send_notification: True일 때만 텔레그램 알림 전송 (기본: False → 로그만)
         env_extra: 추가 환경변수 dict (기존 환경변수에 병합)
         cwd: 작업 디렉토리 (기본: Config.BASE_DIR)
     """
+    with perf.span(description, step='subprocess') as sp:
+        ok = _run_command(cmd, description, timeout, send_notification, env_extra, cwd)
+        if not ok:
+            sp.fail()
+        return ok
+
+
+def _run_command(cmd: list, description: str, timeout: int, send_notification: bool,
+                 env_extra: dict, cwd: str) -> bool:
     logger.info(f"🚀 시작: {description}")
     start = time.time()
 
@@ -188,116 +214,79 @@ def run_command(cmd: list, description: str, timeout: int = 600,
         clean_env['PYTHONIOENCODING'] = 'utf-8'
         # 바탕화면/OneDrive 경로가 PATH에 섞이지 않도록 보호
         env = clean_env
+        env.update(perf.child_env())  # 자식 프로세스 span을 현재 단계 아래에 기록
         if env_extra:
             env.update(env_extra)
 
-        process = subprocess.Popen(
-            cmd,
-            cwd=cwd or Config.BASE_DIR,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            env=env,
-            bufsize=1
-        )
+        def _log_line(line):
+            logger.info(f"   > {line}")
+
+        if len(cmd) > 1 and warm_pool.can_run(cmd[0], cmd[1:]):
+            # 사전 로드된 warm 서버에서 fork 실행 (pandas/yfinance 재import 생략)
+            returncode = warm_pool.run_python(cmd[1:], cwd=cwd or Config.BASE_DIR, env=env,
+                                              timeout=timeout, on_line=_log_line)
+        else:
+            process = subprocess.Popen(
+                cmd,
+                cwd=cwd or Config.BASE_DIR,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                env=env,
+                bufsize=1
+            )
 
-        for line in iter(process.stdout.readline, ''):
-            clean = line.strip()
-            if clean:
-                logger.info(f"   > {clean}")
+            for line in iter(process.stdout.readline, ''):
+                clean = line.strip()
+                if clean:
+                    _log_line(clean)
 
-        process.wait(timeout=timeout)
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                raise
+            returncode = process.returncode
 
         elapsed = time.time() - start
 
-        if process.returncode == 0:
+        if returncode == 0:
             logger.info(f"✅ 완료: {description} ({elapsed:.1f}초)")
             return True
         else:
-            logger.error(f"❌ 실패: {description} (Exit Code: {process.returncode})")
-            if notify:
-                send_telegram(f"❌ 실패: {description} (Error Code: {process.returncode})")
+            logger.error(f"❌ 실패: {description} (Exit Code: {returncode})")
+            if send_notification:
+                send_telegram(f"❌ 실패: {description} (Error Code: {returncode})")
             return False
 
     except subprocess.TimeoutExpired:
-        process.kill()
         logger.error(f"⏰ 타임아웃: {description}")
-        if notify:
+        if send_notification:
             send_telegram(f"⏰ 타임아웃 발생: {description}")
         return False
     except Exception as e:
         logger.error(f"❌ 에러: {description} - {e}")
-        if notify:
+        if send_notification:
             send_telegram(f"❌ 예외 발생: {description}\n{str(e)}")
         return False
 
 
 def send_telegram(message: str) -> bool:
-    """텔레그램 메시지 전송 (개인 + 채널 동시)"""
-    import requests
-    success = False
-
-    # 1) 개인 봇
-    token = os.getenv("TELEGRAM_BOT_TOKEN")
-    chat_id = os.getenv("TELEGRAM_CHAT_ID")
-    if token and chat_id and "your_bot_token" not in token:
-        try:
-            r = requests.post(
-                f"https://api.telegram.org/bot{token}/sendMessage",
-                json={"chat_id": chat_id, "text": message, "parse_mode": "HTML"},
-                timeout=10
-            )
-            if r.status_code == 200:
-                success = True
-        except Exception as e:
-            logger.error(f"❌ 텔레그램(개인) 전송 실패: {e}")
+    """텔레그램 메시지 전송 (개인 + 채널 동시)
 
-    # 2) 채널 봇 (style_종가매매)
-    ch_token = os.getenv("TELEGRAM_CHANNEL_BOT_TOKEN")
-    ch_chat_id = os.getenv("TELEGRAM_CHANNEL_CHAT_ID")
-    if ch_token and ch_chat_id:
-        try:
-            r = requests.post(
-                f"https://api.telegram.org/bot{ch_token}/sendMessage",
-                json={"chat_id": ch_chat_id, "text": message, "parse_mode": "HTML"},
-                timeout=10
-            )
-            if r.status_code == 200:
-                success = True
-        except Exception as e:
-            logger.error(f"❌ 텔레그램(채널) 전송 실패: {e}")
-
-    if not success:
-        logger.warning("⚠️ 텔레그램 전송 실패 또는 설정 미완료")
-    return success
+    발신 큐(app/utils/notifier.py)에 넣고 바로 반환한다 — 분할/속도 제한/재시도는 백그라운드 처리.
+    """
+    if notify(message):
+        return True
+    logger.warning("⚠️ 텔레그램 설정 미완료")
+    return False
 
 
 def send_telegram_long(message: str) -> bool:
-    """긴 텔레그램 메시지를 4000자 단위로 분할 전송"""
-    MAX_LEN = 4000
-    if len(message) <= MAX_LEN:
-        return send_telegram(message)
-
-    chunks = []
-    current = ""
-    for paragraph in message.split("\n\n"):
-        if len(current) + len(paragraph) + 2 > MAX_LEN:
-            if current:
-                chunks.append(current.strip())
-            current = paragraph
-        else:
-            current = current + "\n\n" + paragraph if current else paragraph
-    if current.strip():
-        chunks.append(current.strip())
-
-    ok = True
-    for chunk in chunks:
-        if not send_telegram(chunk):
-            ok = False
-        time.sleep(0.5)
-    return ok
+    """긴 텔레그램 메시지 전송 (4000자 단위 분할은 발신 큐가 처리)"""
+    return send_telegram(message)
 
 
 # ============================================================
@@ -633,7 +622,6 @@ def update_jongga_v2():
                         if i > 0:
                             chunk = f"<b>🎯 종가베팅 V2 계속 ({i+1}/{len(chunks)})</b>\n" + chunk
                         send_telegram(chunk)
-                        time.sleep(0.5)
 
         except Exception as e:
             logger.error(f"❌ 종가베팅 결과 전송 실패: {e}")
@@ -701,6 +689,7 @@ def _build_vcp_top10_text() -> str:
 
 # ── KR Round 1 & 2 ──
 
+@perf.timed('round1')
 def run_round1(skip_sync: bool = False):
     """1차 업데이트 (15:10) — 종가베팅 + AI 분석"""
     logger.info("=" * 60)
@@ -725,18 +714,32 @@ def run_round1(skip_sync: bool = False):
     return all(r[1] for r in results)
 
 
+@perf.timed('round2')
 def run_round2(skip_sync: bool = False):
     """2차 업데이트 (16:00) — 데이터 갱신 + VCP + AI → VCP Top10 포함 요약"""
     logger.info("=" * 60)
     logger.info("🇰🇷 [2차] 데이터 갱신 + VCP 시그널 시작 (16:00)")
     logger.info("=" * 60)
 
-    results = []
-    results.append(('daily_prices', update_daily_prices()))
-    results.append(('institutional', update_institutional_data()))
-    results.append(('vcp_signals', run_vcp_signal_scan(send_alert=False)))
-    results.append(('ai_analysis', run_ai_analysis_scan()))
-    results.append(('daily_report', generate_daily_report()))
+    inst_csv = os.path.join(Config.DATA_DIR, 'all_institutional_trend_data.csv')
+    prices_csv = os.path.join(Config.DATA_DIR, 'daily_prices.csv')
+    signals_csv = os.path.join(Config.DATA_DIR, 'signals_log.csv')
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    # 수급 → VCP 스캔 → (AI 분석 ‖ 일일 리포트)
+    graph = run_task_graph([
+        Task('daily_prices', update_daily_prices, outputs=[prices_csv]),
+        Task('institutional', update_institutional_data, outputs=[inst_csv],
+             timeout=Config.INST_TIMEOUT + 60),
+        Task('vcp_signals', lambda: run_vcp_signal_scan(send_alert=False),
+             inputs=[prices_csv, inst_csv], outputs=[signals_csv],
+             timeout=Config.SIGNAL_TIMEOUT + 60, memoize=True, params={'date': today}),
+        Task('ai_analysis', run_ai_analysis_scan, inputs=[signals_csv],
+             memoize=True, params={'date': today}),
+        Task('daily_report', generate_daily_report, inputs=[signals_csv],
+             memoize=True, params={'date': today}),
+    ], max_workers=Config.GRAPH_WORKERS, log=logger, memo=stage_memo)
+    results = [(r.task.name, r.ok) for r in graph.results]
 
     vcp_summary = _build_vcp_top10_text()
 
@@ -755,6 +758,9 @@ def run_round2(skip_sync: bool = False):
         f"결과: {success_count}/{total_count}\n"
         + "\n".join(summary_lines)
     )
+    for line in (format_skipped(graph.unchanged), graph.format_critical_path()):
+        if line:
+            msg += f"\n{line}"
     if vcp_summary:
         msg += f"\n\n{vcp_summary}"
 
@@ -775,6 +781,7 @@ def run_round2(skip_sync: bool = False):
 # [US Market] 작업 함수들
 # ============================================================
 
+@perf.timed('us_update')
 def run_us_market_update(skip_sync: bool = False):
     """US 마켓 전체 업데이트 (us-market-pro 파이프라인)"""
     logger.info("=" * 60)
@@ -874,6 +881,14 @@ def save_us_track_record_snapshot():
         except Exception as e:
             logger.warning(f"⚠️ US 스냅샷 API 실패: {e}")
 
+        # 누적 성과/히스토리 요약 사전 집계 (API는 집계 파일만 읽음)
+        try:
+            from us_market.track_record_store import update_track_record
+            agg = update_track_record(os.path.join(Config.BASE_DIR, 'us_market'))
+            logger.info(f"✅ US 성과 집계 갱신: 스냅샷 {len(agg.get('snapshots', {}))}개")
+        except Exception as e:
+            logger.warning(f"⚠️ US 성과 집계 갱신 실패: {e}")
+
         tracker_path = os.path.join(Config.BASE_DIR, 'us_market_preview', 'performance_tracker.py')
         if os.path.exists(tracker_path):
             return run_command(
@@ -1182,6 +1197,7 @@ def notify_crypto_briefing() -> bool:
 
 # ── Crypto 전체 파이프라인 ──
 
+@perf.timed('crypto_pipeline')
 def run_crypto_pipeline(skip_sync: bool = False):
     """Crypto 전체 파이프라인 (4시간마다 실행)"""
     logger.info("=" * 60)
@@ -1192,33 +1208,44 @@ def run_crypto_pipeline(skip_sync: bool = False):
     results = []
 
     # 1. Gate Check
-    results.append(('Gate Check', run_crypto_gate_check()))
+    gate_ok = run_crypto_gate_check()
+    results.append(('Gate Check', gate_ok))
 
     # 2. VCP Scan (RED 시 자동 스킵)
     results.append(('VCP Scan', run_crypto_vcp_scan()))
 
-    # 3. Briefing
-    results.append(('Briefing', run_crypto_briefing()))
-
-    # 4. Prediction
-    results.append(('Prediction', run_crypto_prediction()))
-
-    # 5. Risk
-    results.append(('Risk', run_crypto_risk()))
-
-    # 6. Lead-Lag
-    results.append(('Lead-Lag', run_crypto_leadlag()))
+    # 3~6. 분석 단계 — 같은 날 BTC 지표(게이트 metrics)가 그대로면 생략.
+    # 게이트 체크가 실패했으면 market_gate.json이 이전 값이라 비교할 수 없으므로 항상 실행
+    gate_data = _load_json(os.path.join(Config.CRYPTO_OUTPUT_DIR, 'market_gate.json')) or {}
+    btc_state = {'metrics': gate_data.get('metrics'), 'gate': gate_data.get('gate'),
+                 'date': datetime.now().strftime('%Y-%m-%d')}
+    skipped = []
+    briefing_ran = False
+    for name, fn in [('Briefing', run_crypto_briefing), ('Prediction', run_crypto_prediction),
+                     ('Risk', run_crypto_risk), ('Lead-Lag', run_crypto_leadlag)]:
+        if gate_ok:
+            ok, was_skipped = stage_memo.run(f'crypto:{name}', fn, params=btc_state)
+        else:
+            ok, was_skipped = fn() is not False, False
+        results.append((name, ok))
+        if was_skipped:
+            skipped.append(name)
+        elif name == 'Briefing':
+            briefing_ran = ok
 
-    # 7. Briefing 텔레그램 알림
-    notify_crypto_briefing()
+    # 7. Briefing 텔레그램 알림 (새로 생성된 경우만)
+    if briefing_ran:
+        notify_crypto_briefing()
 
     elapsed = time.time() - start_time
     success_count = sum(1 for _, ok in results if ok)
     total_count = len(results)
 
     for name, ok in results:
-        status = "✅" if ok else "❌"
+        status = "⏩" if name in skipped else ("✅" if ok else "❌")
         logger.info(f"  {status} {name}")
+    if skipped:
+        logger.info(format_skipped(skipped))
 
     logger.info(f"🪙 Crypto 파이프라인 완료: {success_count}/{total_count} ({elapsed:.0f}초)")
 
@@ -1237,38 +1264,39 @@ def run_crypto_pipeline(skip_sync: bool = False):
 # 전체 업데이트
 # ============================================================
 
+@perf.timed('full_update')
 def run_full_update():
-    """전체 올 업데이트 (--now) — 5개 작업 순차 실행 + 통합 sync/deploy + 텔레그램"""
+    """전체 올 업데이트 (--now) — 의존성 그래프 병렬 실행 + 통합 sync/deploy + 텔레그램
+
+    US / KR / Crypto 분기는 서로 독립이므로 동시에 실행하고, KR은 수급 CSV를 읽는
+    VCP·종가베팅 V2가 수급 업데이트 뒤에 실행된다. 소요 시간 ≈ 가장 긴 분기.
+    """
     logger.info("=" * 60)
-    logger.info("🌐 전체 올 업데이트 시작 — US + KR + Crypto")
+    logger.info("🌐 전체 올 업데이트 시작 — US + KR + Crypto (병렬)")
     logger.info("=" * 60)
 
     overall_start = time.time()
 
-    # 5개 작업 정의: (label, emoji, callable)
-    tasks = [
-        ("US Market",   "🇺🇸", lambda: run_us_market_update(skip_sync=True)),
-        ("KR 수급",     "🇰🇷", lambda: update_institutional_data()),
-        ("KR VCP",      "🇰🇷", lambda: run_vcp_signal_scan(send_alert=False)),
-        ("종가베팅 V2",  "🎯", lambda: update_jongga_v2()),
-        ("Crypto",      "🪙", lambda: run_crypto_pipeline(skip_sync=True)),
-    ]
-
-    results = []  # (label, emoji, success, elapsed)
-
-    for label, emoji, task_fn in tasks:
-        task_start = time.time()
-        try:
-            success = task_fn()
-            if success is None:
-                success = True
-        except Exception as e:
-            logger.error(f"❌ {label} 예외: {e}")
-            success = False
-        elapsed = time.time() - task_start
-        results.append((label, emoji, success, elapsed))
-        status = "✅" if success else "❌"
-        logger.info(f"{status} {emoji} {label} ({elapsed:.0f}초)")
+    inst_csv = os.path.join(Config.DATA_DIR, 'all_institutional_trend_data.csv')
+    prices_csv = os.path.join(Config.DATA_DIR, 'daily_prices.csv')
+    signals_csv = os.path.join(Config.DATA_DIR, 'signals_log.csv')
+    jongga_json = os.path.join(Config.DATA_DIR, 'jongga_v2_latest.json')
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    graph = run_task_graph([
+        Task('us', lambda: run_us_market_update(skip_sync=True),
+             label="US Market", emoji="🇺🇸", timeout=Config.US_PIPELINE_TIMEOUT),
+        Task('kr_inst', update_institutional_data, outputs=[inst_csv],
+             label="KR 수급", emoji="🇰🇷", timeout=Config.INST_TIMEOUT + 60),
+        Task('vcp_signals', lambda: run_vcp_signal_scan(send_alert=False),
+             inputs=[prices_csv, inst_csv], outputs=[signals_csv],
+             label="KR VCP", emoji="🇰🇷", timeout=Config.SIGNAL_TIMEOUT + 60, memoize=True,
+             params={'date': today}),
+        Task('jongga_v2', update_jongga_v2, inputs=[inst_csv], outputs=[jongga_json],
+             label="종가베팅 V2", emoji="🎯", timeout=Config.JONGGA_TIMEOUT),
+        Task('crypto', lambda: run_crypto_pipeline(skip_sync=True),
+             label="Crypto", emoji="🪙", timeout=Config.CRYPTO_PIPELINE_TIMEOUT),
+    ], max_workers=Config.GRAPH_WORKERS, log=logger, memo=stage_memo)
 
     # ── 통합 대시보드 동기화 + Vercel 배포 (1회) ──
     deploy_ok = False
@@ -1281,15 +1309,14 @@ def run_full_update():
 
     # ── 통합 텔레그램 요약 ──
     overall_elapsed = int(time.time() - overall_start)
-    success_count = sum(1 for _, _, s, _ in results if s)
-    total_count = len(results)
+    success_count = graph.success_count
+    total_count = len(graph.results)
     hour_str = datetime.now().strftime('%H:%M')
     now_str = datetime.now().strftime('%Y-%m-%d %H:%M')
 
     task_lines = []
-    for label, emoji, success, _ in results:
-        icon = "✅" if success else "❌"
-        task_lines.append(f"  {icon} {emoji} {label}")
+    for r in graph.results:
+        task_lines.append(f"  {r.icon} {r.task.emoji} {r.task.label} ({r.elapsed:.0f}초)")
 
     deploy_text = "✅ Vercel 배포 완료" if deploy_ok else "❌ Vercel 배포 실패"
 
@@ -1298,7 +1325,9 @@ def run_full_update():
         f"⏰ {now_str} ({overall_elapsed}초)\n"
         f"결과: {success_count}/{total_count}\n\n"
         + "\n".join(task_lines)
-        + f"\n\n📦 {deploy_text}"
+        + "\n\n"
+        + "".join(f"{line}\n" for line in (format_skipped(graph.unchanged), graph.format_critical_path()) if line)
+        + f"📦 {deploy_text}"
     )
 
     send_telegram(msg)
@@ -1327,28 +1356,29 @@ def _run_trading_skill(skill_name: str, script_name: str, api_key_env: str = Non
         if key:
             cmd.extend(['--api-key', key])
 
-    env = os.environ.copy()
-    env['PYTHONIOENCODING'] = 'utf-8'
-
+    # 기준 거래일이 같으면(휴장일/중복 실행) 리포트 재생성 생략
     try:
-        result = subprocess.run(cmd, cwd=Config.BASE_DIR, env=env,
-                                capture_output=True, text=True, timeout=300)
-        if result.returncode == 0:
-            logger.info(f"✅ 스킬 완료: {skill_name}")
-            return True
-        else:
-            logger.warning(f"⚠️ 스킬 실패: {skill_name} (exit={result.returncode})")
-            if result.stderr:
-                logger.debug(result.stderr[:500])
-            return False
-    except subprocess.TimeoutExpired:
-        logger.error(f"❌ 스킬 타임아웃: {skill_name} (5분 초과)")
-        return False
-    except Exception as e:
-        logger.error(f"❌ 스킬 실행 오류: {skill_name} — {e}")
-        return False
+        from us_market.holidays import get_last_trading_day
+        trading_day = get_last_trading_day()
+    except ImportError:
+        trading_day = datetime.now().strftime('%Y-%m-%d')
+
+    ok, skipped = stage_memo.run(
+        f'skill:{skill_name}',
+        lambda: run_command(cmd, f'스킬: {skill_name}', timeout=300),
+        inputs=[script_path],
+        params={'trading_day': trading_day, 'script': script_name},
+    )
+    if skipped:
+        return True
+    if ok:
+        logger.info(f"✅ 스킬 완료: {skill_name}")
+    else:
+        logger.warning(f"⚠️ 스킬 실패: {skill_name}")
+    return ok
 
 
+@perf.timed('skills_daily')
 def run_trading_skills_daily():
     """매일 실행할 트레이딩 스킬 (US 프리마켓)"""
     skills = [
@@ -1369,6 +1399,7 @@ def run_trading_skills_daily():
     return success > 0
 
 
+@perf.timed('skills_weekly')
 def run_trading_skills_weekly():
     """주간 실행 트레이딩 스킬 (월요일)"""
     skills = [
@@ -1497,8 +1528,18 @@ def main():
     parser.add_argument('--crypto-gate', action='store_true', help='Crypto Gate Check만')
     parser.add_argument('--crypto-scan', action='store_true', help='Crypto VCP Scan만')
 
+    # 단계 메모이제이션
+    parser.add_argument('--force-stages', default='',
+                        help='입력 변경이 없어도 강제 실행할 단계 (all 또는 쉼표 구분 이름)')
+
     args = parser.parse_args()
 
+    if args.force_stages:
+        stage_memo.force.update(s.strip() for s in args.force_stages.split(',') if s.strip())
+
+    # 텔레그램/동기화 등 프로세스 내 HTTP 호출 수를 perf 카운터로 기록
+    perf.install_http_counter()
+
     logger.info("=" * 60)
     logger.info("🚀 MarketFlow 통합 스케줄러")
     logger.info("=" * 60)
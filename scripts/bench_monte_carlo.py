@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BacktestEngine Monte Carlo 벤치마크 — 경로별 루프 vs 청크 단위 배열 생성
+
+가짜 일간 수익률(Student-t, 2년치)로
+  1) 기존 방식: 경로마다 t_dist.rvs(size=num_days) + cumprod (--legacy-paths개 측정 후 선형 환산)
+  2) monte_carlo_simulation (parametric normal / student_t, bootstrap, 3종목 상관 경로)
+의 소요 시간과 주요 분위수를 출력한다.
+
+사용법:
+  python scripts/bench_monte_carlo.py
+  python scripts/bench_monte_carlo.py --sims 100000 --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'us_market'))
+from backtest_engine import BacktestEngine  # noqa: E402
+
+
+def legacy_student_t(returns: pd.Series, num_simulations: int, num_days: int = 252,
+                     initial_value: float = 100000) -> np.ndarray:
+    """기존 구현 (경로마다 rvs 호출)"""
+    from scipy.stats import t as t_dist
+    np.random.seed(42)
+    df_t, loc_t, scale_t = t_dist.fit(returns.dropna())
+    paths = []
+    for _ in range(num_simulations):
+        daily_returns = t_dist.rvs(df_t, loc=loc_t, scale=scale_t, size=num_days)
+        paths.append(initial_value * np.cumprod(1 + daily_returns))
+    return np.array(paths)[:, -1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo benchmark')
+    parser.add_argument('--sims', type=int, default=100_000)
+    parser.add_argument('--days', type=int, default=252)
+    parser.add_argument('--legacy-paths', type=int, default=5_000, help='기존 방식 측정 경로 수 (결과는 --sims로 환산)')
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    returns = pd.Series(rng.standard_t(4, 504) * 0.01 + 0.0005)
+    assets = pd.DataFrame(
+        rng.multivariate_normal([5e-4, 4e-4, 3e-4], [[1, .8, .2], [.8, 1, .1], [.2, .1, 1]], 504) * 0.01,
+        columns=['AAA', 'BBB', 'CCC'],
+    )
+    engine = BacktestEngine()
+
+    t0 = time.perf_counter()
+    legacy = legacy_student_t(returns, args.legacy_paths, args.days)
+    legacy_s = (time.perf_counter() - t0) * args.sims / args.legacy_paths
+    print(f"legacy student_t      ~{legacy_s:7.2f}s (환산)  median {np.median(legacy):,.0f}  p5 {np.percentile(legacy, 5):,.0f}")
+
+    cases = [
+        ('parametric normal', returns, dict(distribution='normal')),
+        ('parametric student_t', returns, dict(distribution='student_t')),
+        ('bootstrap', returns, dict(method='bootstrap')),
+        ('3-asset student_t', assets, dict(distribution='student_t')),
+        ('3-asset bootstrap', assets, dict(method='bootstrap')),
+    ]
+    for name, data, kwargs in cases:
+        t0 = time.perf_counter()
+        res = engine.monte_carlo_simulation(data, num_simulations=args.sims, num_days=args.days,
+                                            workers=args.workers, **kwargs)
+        elapsed = time.perf_counter() - t0
+        print(f"{name:<21} {elapsed:8.2f}s         median {res['median_final']:,.0f}  p5 {res['percentile_5']:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스냅샷 JSON 정리 벤치마크 — 재귀 clean_nans_and_numpy vs 열 단위 frame_to_records
+
+signals_log.csv 형태의 히스토리(기본 50,000행, NaN/inf 포함)를 만들어
+  1) DataFrame → to_dict('records') → clean_nans_and_numpy (기존 재귀 방식)
+  2) frame_to_records (열 단위 변환)
+의 소요 시간을 비교하고, 두 결과의 JSON 직렬화가 같은지 확인한다.
+
+사용법:
+  python scripts/bench_snapshot_sanitize.py
+  python scripts/bench_snapshot_sanitize.py --rows 200000 --repeat 5
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sync_dashboard import clean_nans_and_numpy, frame_to_records  # noqa: E402
+
+
+def make_history(rows: int, seed: int = 42) -> pd.DataFrame:
+    """signals_log.csv와 같은 열 구성의 가짜 VCP 히스토리"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2020-01-01', periods=max(1, rows // 20)).strftime('%Y-%m-%d')
+    df = pd.DataFrame({
+        'ticker': [f"{t:06d}" for t in rng.integers(1, 400000, rows)],
+        'name': rng.choice(['삼성전자', 'SK하이닉스', 'NAVER', '카카오', ''], rows),
+        'signal_date': rng.choice(dates, rows),
+        'entry_price': rng.uniform(1000, 500000, rows).round(0),
+        'score': rng.uniform(40, 100, rows).round(1),
+        'foreign_5d': rng.integers(-5_000_000, 5_000_000, rows),
+        'inst_5d': rng.integers(-5_000_000, 5_000_000, rows),
+        'contraction_ratio': rng.uniform(0.2, 1.0, rows).round(3),
+        'status': rng.choice(['OPEN', 'CLOSED'], rows),
+        'return_pct': rng.normal(0, 8, rows).round(2),
+    })
+    # 미청산 포지션의 수익률 NaN + 일부 계산 오류(inf)
+    df.loc[df['status'] == 'OPEN', 'return_pct'] = np.nan
+    df.loc[df.sample(frac=0.001, random_state=seed).index, 'contraction_ratio'] = np.inf
+    return df
+
+
+def bench(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스냅샷 JSON 정리 벤치마크')
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_history(args.rows)
+
+    recursive = lambda: clean_nans_and_numpy(df.to_dict('records'))  # noqa: E731
+    columnar = lambda: frame_to_records(df)  # noqa: E731
+
+    same = json.dumps(recursive(), ensure_ascii=False) == json.dumps(columnar(), ensure_ascii=False)
+    t_rec = bench(recursive, args.repeat)
+    t_col = bench(columnar, args.repeat)
+
+    print(f"rows={args.rows:,}  repeat={args.repeat} (best)")
+    print(f"  recursive clean_nans_and_numpy : {t_rec * 1000:8.1f} ms")
+    print(f"  column-wise frame_to_records   : {t_col * 1000:8.1f} ms  ({t_rec / t_col:.1f}x)")
+    print(f"  identical JSON                 : {same}")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+US 수급(거래량) 분석 벤치마크 — 티커별 루프 vs groupby 단일 패스
+
+S&P 500 + NASDAQ 100 규모(기본 600종목, 2020-01-01부터 영업일 일봉)의 가짜
+us_daily_prices를 만들어
+  1) 기존 run() 방식: 티커마다 df[df['ticker'] == t] 필터 + analyze_supply_demand
+  2) VolumeAnalyzer.analyze_all (groupby 단일 패스, --workers로 프로세스 샤드)
+의 소요 시간을 비교하고, 두 결과의 supply_demand_stage/점수가 같은지 확인한다.
+
+사용법:
+  python scripts/bench_volume_analysis.py
+  python scripts/bench_volume_analysis.py --tickers 100 --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'us_market'))
+from analyze_volume import VolumeAnalyzer, RESULT_COLUMNS  # noqa: E402
+
+
+def make_prices(tickers: int, start: str = '2020-01-01', seed: int = 42) -> pd.DataFrame:
+    """load_prices() 결과와 같은 열 구성의 가짜 일봉 (신규 상장/보합/거래량 0 포함)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, pd.Timestamp.today().normalize())
+    frames = []
+    for i in range(tickers):
+        n = len(dates) if i % 25 else int(rng.integers(10, 300))  # 일부는 짧은 히스토리
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        close = np.round(close, 2)  # 보합일 생성
+        spread = np.abs(rng.normal(0, 0.01, n)) * close
+        volume = rng.integers(0, 5_000_000, n)
+        frames.append(pd.DataFrame({
+            'date': dates[-n:],
+            'open': close,
+            'high': close + spread,
+            'low': np.where(i % 50 == 7, close + spread, close - spread),  # 고가 = 저가 구간
+            'current_price': close,
+            'volume': volume,
+            'ticker': f'T{i:03d}',
+        }))
+    # CSV처럼 추가 순서(날짜 블록)가 섞인 상태
+    return pd.concat(frames, ignore_index=True).sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def legacy_run(analyzer: VolumeAnalyzer, df: pd.DataFrame) -> pd.DataFrame:
+    """변경 전 run()의 루프 그대로"""
+    results = []
+    for ticker in df['ticker'].unique():
+        ticker_data = df[df['ticker'] == ticker].copy()
+        if len(ticker_data) < 30:
+            continue
+        analysis = analyzer.analyze_supply_demand(ticker_data)
+        if analysis:
+            results.append({'ticker': ticker, 'name': ticker, **analysis})
+    return pd.DataFrame(results, columns=RESULT_COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='US 수급 분석 벤치마크')
+    parser.add_argument('--tickers', type=int, default=600)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    df = make_prices(args.tickers)
+    analyzer = VolumeAnalyzer()
+
+    start = time.perf_counter()
+    legacy = legacy_run(analyzer, df)
+    t_legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    grouped = analyzer.analyze_all(df, workers=args.workers)
+    t_grouped = time.perf_counter() - start
+
+    same_stage = legacy['supply_demand_stage'].tolist() == grouped['supply_demand_stage'].tolist()
+    compare = [c for c in RESULT_COLUMNS if c not in ('name', 'date')]
+    same_all = legacy[compare].reset_index(drop=True).equals(grouped[compare].reset_index(drop=True))
+
+    print(f"tickers={args.tickers}  rows={len(df):,}  analyzed={len(grouped)}  workers={args.workers}")
+    print(f"  per-ticker loop (legacy run) : {t_legacy:8.2f} s")
+    print(f"  groupby single pass          : {t_grouped:8.2f} s  ({t_legacy / t_grouped:.0f}x)")
+    print(f"  identical stages             : {same_stage}")
+    print(f"  identical indicators/scores  : {same_all}")
+    sys.exit(0 if same_stage and same_all else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -37,6 +37,15 @@ except ImportError:
     def safe_read(filepath, timeout=10):
         yield filepath
 
+# 단계 내부 구간 perf span (스케줄러 경유 시 부모 단계 span 아래에 기록, app 패키지가 없으면 생략)
+try:
+    from app.utils.perf import span as perf_span
+except ImportError:
+    from contextlib import nullcontext
+
+    def perf_span(name, step=None):
+        return nullcontext()
+
 
 class SignalTracker:
     """시그널 추적 및 성과 기록"""
@@ -57,7 +66,8 @@ class SignalTracker:
         }
         
         # 로컬 가격 데이터 로드 (yfinance 대신)
-        self.price_df = self._load_price_data()
+        with perf_span('load_prices', step='parse'):
+            self.price_df = self._load_price_data()
         
         logger.info("✅ Signal Tracker 초기화 완료")
     
@@ -166,33 +176,35 @@ class SignalTracker:
         
         # VCP 필터 적용
         vcp_signals = []
-        for _, row in signals.iterrows():
-            ticker = row['ticker']
-            is_vcp, vcp_info = self.detect_vcp_forming(ticker)
+        with perf_span('vcp_filter', step='score'):
+            for _, row in signals.iterrows():
+                ticker = row['ticker']
+                is_vcp, vcp_info = self.detect_vcp_forming(ticker)
             
-            if is_vcp:
-                signal = {
-                    'signal_date': datetime.now().strftime('%Y-%m-%d'),
-                    'ticker': ticker,
-                    'foreign_5d': row['foreign_net_buy_5d'],
-                    'inst_5d': row['institutional_net_buy_5d'],
-                    'score': row['supply_demand_index'],
-                    'contraction_ratio': vcp_info.get('contraction_ratio'),
-                    'entry_price': vcp_info.get('current_price'),
-                    'status': 'OPEN',
-                    'exit_price': None,
-                    'exit_date': None,
-                    'return_pct': None,
-                    'hold_days': 0
-                }
-                vcp_signals.append(signal)
-                logger.info(f"   🎯 VCP 시그널: {ticker} | 축소비: {vcp_info.get('contraction_ratio'):.2f}")
+                if is_vcp:
+                    signal = {
+                        'signal_date': datetime.now().strftime('%Y-%m-%d'),
+                        'ticker': ticker,
+                        'foreign_5d': row['foreign_net_buy_5d'],
+                        'inst_5d': row['institutional_net_buy_5d'],
+                        'score': row['supply_demand_index'],
+                        'contraction_ratio': vcp_info.get('contraction_ratio'),
+                        'entry_price': vcp_info.get('current_price'),
+                        'status': 'OPEN',
+                        'exit_price': None,
+                        'exit_date': None,
+                        'return_pct': None,
+                        'hold_days': 0
+                    }
+                    vcp_signals.append(signal)
+                    logger.info(f"   🎯 VCP 시그널: {ticker} | 축소비: {vcp_info.get('contraction_ratio'):.2f}")
         
         signals_df = pd.DataFrame(vcp_signals)
         
         if not signals_df.empty:
             # 기존 로그에 추가
-            self._append_to_log(signals_df)
+            with perf_span('append_log', step='write'):
+                self._append_to_log(signals_df)
         
         logger.info(f"✅ 오늘 VCP 시그널: {len(signals_df)}개")
         return signals_df
@@ -11,18 +11,29 @@ data/ → frontend/data-snapshot/ 동기화 + Vercel 자동 배포
   python sync_dashboard.py --crypto     # Crypto만
   python sync_dashboard.py --dry-run    # 동기화만 (배포 안 함)
   python sync_dashboard.py --no-deploy  # 동기화만 (배포 안 함)
+
+동기화 방식:
+  - 스냅샷 작업은 스레드 풀에서 동시 실행 (DASHBOARD_SYNC_WORKERS, 기본 4)
+  - US 변환 엔드포인트는 HTTP 대신 라우트 빌더 함수를 프로세스 내에서 직접 호출
+    (import 실패 시에만 로컬 Flask 서버 HTTP 호출로 폴백)
+  - JSON은 compact 형식으로 직렬화하고 내용 해시가 바뀐 파일만 기록
+  - 변경 파일 목록은 data/dashboard_sync_manifest.json에 남기고,
+    배포 커밋에는 변경된 파일만 스테이징
 """
 
 import os
 import sys
 import json
-import glob
-import shutil
 import subprocess
 import argparse
 import math
+import hashlib
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Optional
+from contextlib import nullcontext as _nullcontext
+from typing import Callable, List, Optional, Tuple
 
 # ── 경로 설정 ──
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -30,11 +41,26 @@ BASE_DIR = os.environ.get('KR_MARKET_DIR', SCRIPT_DIR)
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 FRONTEND_DIR = os.path.join(BASE_DIR, 'frontend')
 SNAPSHOT_DIR = os.path.join(FRONTEND_DIR, 'data-snapshot')
+MANIFEST_PATH = os.path.join(DATA_DIR, 'dashboard_sync_manifest.json')
+
+SYNC_WORKERS = int(os.environ.get('DASHBOARD_SYNC_WORKERS', '4'))
+
+# 스냅샷 작업별 perf span (app 패키지를 찾을 수 없으면 기록 생략)
+try:
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    from app.utils import perf
+except ImportError:
+    perf = None
+
+
+_log_lock = threading.Lock()
 
 
 def log(msg: str):
     ts = datetime.now().strftime('%H:%M:%S')
-    print(f"  [{ts}] {msg}")
+    with _log_lock:  # 스냅샷 작업이 동시에 실행되므로 줄 단위로 직렬화
+        print(f"  [{ts}] {msg}", flush=True)
 
 
 def safe_float(val):
@@ -53,48 +79,146 @@ def safe_float(val):
     return val
 
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SanitizedList(list):
+    """이미 JSON-safe로 변환된 레코드 리스트 — clean_nans_and_numpy가 재귀하지 않음"""
+
+
 def clean_nans_and_numpy(obj):
+    if isinstance(obj, SanitizedList):
+        return obj
     if isinstance(obj, dict):
         return {k: clean_nans_and_numpy(v) for k, v in obj.items()}
     elif isinstance(obj, list) or isinstance(obj, tuple):
         return [clean_nans_and_numpy(v) for v in obj]
     elif isinstance(obj, float):
-        import math
         if math.isnan(obj) or math.isinf(obj):
             return None
         return obj
+    elif np is not None:
+        if isinstance(obj, np.integer):
+            return int(obj)
+        elif isinstance(obj, np.floating):
+            if math.isnan(obj) or math.isinf(obj):
+                return None
+            return float(obj)
+        elif isinstance(obj, np.ndarray):
+            return clean_nans_and_numpy(obj.tolist())
+    return obj
+
+
+def _clean_column(series) -> list:
+    """DataFrame 한 열 → JSON-safe 파이썬 값 리스트 (NaN/inf/NaT → None)"""
+    values = series.to_numpy()
+    kind = values.dtype.kind
+    if kind == 'f':
+        out = values.tolist()
+        bad = np.flatnonzero(~np.isfinite(values))
+    elif kind in 'iub':
+        return values.tolist()
+    elif kind == 'M':
+        out = [ts.isoformat() for ts in series.dt.to_pydatetime()] if len(series) else []
+        bad = np.flatnonzero(series.isna().to_numpy())
     else:
-        try:
-            import numpy as np
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                import math
-                if math.isnan(obj) or math.isinf(obj):
-                    return None
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return clean_nans_and_numpy(obj.tolist())
-        except ImportError:
-            pass
-        return obj
+        out = values.tolist()
+        bad = np.flatnonzero(series.isna().to_numpy())
+        # object 열에 섞인 numpy 스칼라/inf 정리 (문자열 열은 그대로 통과)
+        if not all(type(v) is str for v in out):
+            out = [clean_nans_and_numpy(v) for v in out]
+    for i in bad:
+        out[i] = None
+    return out
+
+
+def frame_to_records(df) -> SanitizedList:
+    """DataFrame → JSON-safe 레코드 리스트 (열 단위 변환)
+
+    셀마다 파이썬 객체를 만든 뒤 clean_nans_and_numpy로 재귀 정리하는 대신,
+    열 전체를 numpy 연산으로 변환(NaN/inf → None, numpy → 네이티브)한 다음
+    한 번에 dict로 묶는다. 결과는 SanitizedList라 safe_json_dump에서 다시 순회하지 않는다.
+    """
+    columns = [str(c) for c in df.columns]
+    cleaned = [_clean_column(df.iloc[:, i]) for i in range(len(columns))]
+    return SanitizedList(dict(zip(columns, row)) for row in zip(*cleaned))
+
+# ============================================================
+# 변경분 기록 (내용 해시 비교)
+# ============================================================
+
+class SnapshotManifest:
+    """동기화 1회 동안 기록된 스냅샷 파일의 변경 여부 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.changed = []
+        self.unchanged = []
+
+    def record(self, filepath: str, changed: bool):
+        name = os.path.relpath(filepath, SNAPSHOT_DIR)
+        with self._lock:
+            (self.changed if changed else self.unchanged).append(name)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {'changed': sorted(self.changed), 'unchanged': sorted(self.unchanged)}
+
+
+_manifest = SnapshotManifest()
+_sync_lock = threading.Lock()
+
+
+def _file_sha256(filepath: str) -> Optional[str]:
+    try:
+        with open(filepath, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
 
-def safe_json_dump(data: dict, filepath: str):
-    """JSON 파일을 안전하게 저장 (NaN 제거)"""
+def write_if_changed(payload: bytes, filepath: str) -> bool:
+    """내용 해시가 다를 때만 원자적으로 기록
+
+    Returns:
+        실제로 파일을 썼는지 여부
+    """
+    changed = hashlib.sha256(payload).hexdigest() != _file_sha256(filepath)
+    if changed:
+        tmp_path = f"{filepath}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    _manifest.record(filepath, changed)
+    if perf is not None:
+        perf.count('files_changed' if changed else 'files_unchanged')
+    return changed
+
+
+def safe_json_dump(data: dict, filepath: str) -> bool:
+    """JSON 파일을 안전하게 저장 (NaN 제거, compact, 내용이 같으면 쓰지 않음)"""
     cleaned = clean_nans_and_numpy(data)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(cleaned, f, ensure_ascii=False, indent=2)
+    payload = json.dumps(cleaned, ensure_ascii=False, separators=(',', ':'))
+    return write_if_changed(payload.encode('utf-8'), filepath)
+
 
-def safe_copy_json(src: str, dst: str):
+def _copy_if_changed(src: str, dst: str) -> bool:
+    with open(src, 'rb') as f:
+        return write_if_changed(f.read(), dst)
+
+
+def safe_copy_json(src: str, dst: str) -> bool:
     if not src.endswith('.json'):
-        shutil.copy2(src, dst)
-        return
+        return _copy_if_changed(src, dst)
     try:
         with open(src, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        safe_json_dump(data, dst)
+        return safe_json_dump(data, dst)
     except Exception as e:
-        shutil.copy2(src, dst)
+        return _copy_if_changed(src, dst)
 
 
 # ============================================================
@@ -265,58 +389,31 @@ def snapshot_kr_backtest_summary() -> bool:
                     'avg_return': round(float(avg_ret), 2)
                 }
 
-        # 2. Closing Bet (Jongga V2) Backtest
-        history_files = glob.glob(os.path.join(DATA_DIR, 'jongga_v2_results_*.json'))
+        # 2. Closing Bet (Jongga V2) Backtest — 히스토리 인덱스의 일별 요약 합산
+        from engine.history_index import load_history_index
+        history_days = load_history_index(DATA_DIR)
 
-        if len(history_files) < 2:
+        if len(history_days) < 2:
             summary['closing_bet'] = {
                 'status': 'Accumulating',
-                'message': f'{len(history_files)}일 데이터 (최소 2일 필요)',
+                'message': f'{len(history_days)}일 데이터 (최소 2일 필요)',
                 'count': 0, 'win_rate': 0, 'avg_return': 0
             }
         else:
-            all_signals = []
             today = datetime.now().strftime('%Y%m%d')
+            past_days = [e for d, e in history_days.items() if d != today]
 
-            for fp in sorted(history_files):
-                if today in fp:
-                    continue
-                try:
-                    with open(fp, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    for signal in data.get('signals', []):
-                        signal['file_date'] = data.get('date', '')
-                        all_signals.append(signal)
-                except Exception:
-                    continue
-
-            if all_signals:
-                wins = 0
-                total_return = 0
-                valid_count = 0
-
-                for signal in all_signals:
-                    entry_price = signal.get('entry_price', 0)
-                    if entry_price <= 0:
-                        continue
-
-                    change_pct = signal.get('change_pct', 0)
-                    if change_pct > 0:
-                        est_return = min(change_pct, 5.0)
-                        wins += 1
-                    else:
-                        est_return = max(change_pct, -3.0)
-
-                    total_return += est_return
-                    valid_count += 1
+            wins = sum(e.get('wins', 0) for e in past_days)
+            total_return = sum(e.get('total_return', 0) for e in past_days)
+            valid_count = sum(e.get('valid_count', 0) for e in past_days)
 
-                if valid_count > 0:
-                    summary['closing_bet'] = {
-                        'status': 'OK',
-                        'count': valid_count,
-                        'win_rate': round((wins / valid_count) * 100, 1),
-                        'avg_return': round(total_return / valid_count, 2)
-                    }
+            if valid_count > 0:
+                summary['closing_bet'] = {
+                    'status': 'OK',
+                    'count': valid_count,
+                    'win_rate': round((wins / valid_count) * 100, 1),
+                    'avg_return': round(total_return / valid_count, 2)
+                }
 
         dst = os.path.join(SNAPSHOT_DIR, 'kr-backtest-summary.json')
         safe_json_dump(summary, dst)
@@ -338,9 +435,9 @@ def snapshot_kr_simple_copies() -> int:
         src = os.path.join(DATA_DIR, src_name)
         dst = os.path.join(SNAPSHOT_DIR, dst_name)
         if os.path.exists(src):
-            safe_copy_json(src, dst)
+            changed = safe_copy_json(src, dst)
             size = os.path.getsize(dst)
-            log(f"✓ {dst_name:45s} {size:>10,} bytes")
+            log(f"✓ {dst_name:45s} {size:>10,} bytes{'' if changed else ' (변경 없음)'}")
             ok += 1
         else:
             log(f"⚠ {src_name} 없음 — 스킵")
@@ -348,23 +445,12 @@ def snapshot_kr_simple_copies() -> int:
 
 
 def snapshot_kr_jongga_dates() -> bool:
-    """jongga_v2_results_*.json → kr-jongga-v2-dates.json"""
+    """jongga_v2_results_*.json → kr-jongga-v2-dates.json (히스토리 인덱스 기반)"""
     try:
-        files = glob.glob(os.path.join(DATA_DIR, 'jongga_v2_results_*.json'))
-        dates = []
-        for fp in sorted(files, reverse=True):
-            basename = os.path.basename(fp)
-            # jongga_v2_results_20260224.json → 20260224
-            date_part = basename.replace('jongga_v2_results_', '').replace('.json', '')
-            if len(date_part) == 8 and date_part.isdigit():
-                # 빈 파일 제외
-                try:
-                    with open(fp, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    if data.get('signals'):
-                        dates.append(date_part)
-                except Exception:
-                    continue
+        from engine.history_index import list_signal_dates
+
+        # 빈 파일(시그널 0개) 제외, 최신순
+        dates = list_signal_dates(DATA_DIR)
 
         result = {'dates': dates[:30], 'count': len(dates)}
         dst = os.path.join(SNAPSHOT_DIR, 'kr-jongga-v2-dates.json')
@@ -430,21 +516,34 @@ def snapshot_kr_vcp_history() -> bool:
             except Exception:
                 pass
 
-        records = []
-        for _, row in df.iterrows():
-            t = str(row.get('ticker', '')).zfill(6)
-            records.append({
-                'ticker': t,
-                'name': row.get('name', '') or name_map.get(t, t),
-                'signal_date': str(row.get('signal_date', '')),
-                'entry_price': float(row.get('entry_price', 0)),
-                'score': float(row.get('score', 0)),
-                'foreign_5d': int(row.get('foreign_5d', 0)),
-                'inst_5d': int(row.get('inst_5d', 0)),
-                'contraction_ratio': float(row.get('contraction_ratio', 0)),
-                'status': str(row.get('status', '')),
-                'return_pct': float(row.get('return_pct', 0)) if 'return_pct' in row.index else 0,
-            })
+        def column(name, default):
+            if name in df.columns:
+                return df[name]
+            return pd.Series(default, index=df.index)
+
+        def numeric(name):
+            return pd.to_numeric(column(name, 0), errors='coerce').astype(float)
+
+        # 행 단위 iterrows 대신 열 단위로 변환
+        tickers = df['ticker'].astype(str).str.zfill(6)
+        names = column('name', '')
+        names = names.where(names.notna() & (names.astype(str) != ''),
+                            tickers.map(name_map).fillna(tickers))
+        frame = pd.DataFrame({
+            'ticker': tickers,
+            'name': names,
+            'signal_date': column('signal_date', '').astype(str),
+            'entry_price': numeric('entry_price'),
+            'score': numeric('score'),
+            'foreign_5d': numeric('foreign_5d').fillna(0).astype('int64'),
+            'inst_5d': numeric('inst_5d').fillna(0).astype('int64'),
+            'contraction_ratio': numeric('contraction_ratio'),
+            'status': column('status', '').astype(str),
+            'return_pct': numeric('return_pct'),
+        })
+        records = frame_to_records(frame)
+        if perf is not None:
+            perf.count('rows', len(records))
 
         result = {'history': records, 'count': len(records)}
         dst = os.path.join(SNAPSHOT_DIR, 'kr-vcp-history.json')
@@ -480,19 +579,44 @@ def _fetch_flask_endpoint(endpoint: str, dst_name: str, port: int = 5001) -> boo
         return False
 
 
+def _snapshot_route_builder(builder_name: str, endpoint: str, dst_name: str) -> bool:
+    """app.routes.us_market의 응답 빌더를 프로세스 내에서 호출해 스냅샷으로 저장
+
+    라우트 모듈을 import할 수 없는 환경에서만 실행 중인 Flask 서버로 폴백한다.
+    """
+    try:
+        if SCRIPT_DIR not in sys.path:
+            sys.path.insert(0, SCRIPT_DIR)
+        from app.routes import us_market as us_routes
+        builder = getattr(us_routes, builder_name)
+    except Exception as e:
+        log(f"⚠ 라우트 빌더 import 실패 ({str(e)[:50]}) — Flask HTTP 폴백")
+        return _fetch_flask_endpoint(endpoint, dst_name)
+
+    try:
+        dst = os.path.join(SNAPSHOT_DIR, dst_name)
+        changed = safe_json_dump(builder(), dst)
+        size = os.path.getsize(dst)
+        log(f"✓ {dst_name:45s} {size:>10,} bytes{'' if changed else ' (변경 없음)'}")
+        return True
+    except Exception as e:
+        log(f"✗ {dst_name:45s} {str(e)[:50]}")
+        return False
+
+
 def snapshot_us_copies() -> int:
-    """US Market 스냅샷 — Flask 변환 필요 엔드포인트 + 단순 파일 복사"""
+    """US Market 스냅샷 — 변환 필요 엔드포인트(라우트 빌더) + 단순 파일 복사"""
     us_output = os.path.join(BASE_DIR, 'us_market_preview', 'output')
     ok = 0
 
-    # ── Flask API 경유 (데이터 변환 필요한 엔드포인트) ──
-    flask_endpoints = [
-        ('/api/us/market-briefing',   'us-market-briefing.json'),
-        ('/api/us/heatmap-data',      'us-heatmap-data.json'),
-        ('/api/us/earnings-impact',   'us-earnings-impact.json'),
+    # ── 라우트 빌더 직접 호출 (데이터 변환 필요한 엔드포인트) ──
+    route_builders = [
+        ('build_market_briefing',   '/api/us/market-briefing',   'us-market-briefing.json'),
+        ('build_sector_heatmap',    '/api/us/heatmap-data',      'us-heatmap-data.json'),
+        ('build_earnings_impact',   '/api/us/earnings-impact',   'us-earnings-impact.json'),
     ]
-    for endpoint, dst_name in flask_endpoints:
-        if _fetch_flask_endpoint(endpoint, dst_name):
+    for builder_name, endpoint, dst_name in route_builders:
+        if _snapshot_route_builder(builder_name, endpoint, dst_name):
             ok += 1
 
     # ── 단순 파일 복사 (변환 불필요) ──
@@ -515,9 +639,9 @@ def snapshot_us_copies() -> int:
     for src, dst_name in copies:
         dst = os.path.join(SNAPSHOT_DIR, dst_name)
         if os.path.exists(src):
-            safe_copy_json(src, dst)
+            changed = safe_copy_json(src, dst)
             size = os.path.getsize(dst)
-            log(f"✓ {dst_name:45s} {size:>10,} bytes")
+            log(f"✓ {dst_name:45s} {size:>10,} bytes{'' if changed else ' (변경 없음)'}")
             ok += 1
     return ok
 
@@ -541,9 +665,9 @@ def snapshot_crypto_copies() -> int:
         src = os.path.join(crypto_output, src_name)
         dst = os.path.join(SNAPSHOT_DIR, dst_name)
         if os.path.exists(src):
-            safe_copy_json(src, dst)
+            changed = safe_copy_json(src, dst)
             size = os.path.getsize(dst)
-            log(f"✓ {dst_name:45s} {size:>10,} bytes")
+            log(f"✓ {dst_name:45s} {size:>10,} bytes{'' if changed else ' (변경 없음)'}")
             ok += 1
     return ok
 
@@ -561,9 +685,9 @@ def snapshot_econ_copies() -> int:
         src = os.path.join(econ_output, src_name)
         dst = os.path.join(SNAPSHOT_DIR, dst_name)
         if os.path.exists(src):
-            safe_copy_json(src, dst)
+            changed = safe_copy_json(src, dst)
             size = os.path.getsize(dst)
-            log(f"✓ {dst_name:45s} {size:>10,} bytes")
+            log(f"✓ {dst_name:45s} {size:>10,} bytes{'' if changed else ' (변경 없음)'}")
             ok += 1
     return ok
 
@@ -613,43 +737,57 @@ def snapshot_data_version():
 # Vercel 배포
 # ============================================================
 
-def deploy_vercel() -> bool:
-    """Git push를 통한 Vercel 자동 배포 (GitHub 연동)"""
+def _git(args: List[str], timeout: int = 30) -> subprocess.CompletedProcess:
+    return subprocess.run(['git'] + args, cwd=BASE_DIR, capture_output=True, text=True, timeout=timeout)
+
+
+def deploy_vercel(changed_files: Optional[List[str]] = None) -> bool:
+    """Git push를 통한 Vercel 자동 배포 (GitHub 연동)
+
+    이번 실행에서 바뀐 파일뿐 아니라, 이전 실행의 commit/push 실패로 남은
+    미커밋 스냅샷(git status)과 미push 커밋도 함께 배포한다.
+
+    Args:
+        changed_files: 이번 동기화에서 바뀐 스냅샷 파일명 (SNAPSHOT_DIR 기준, 로그용)
+    """
     log("🚀 Git commit + push → Vercel 자동 배포...")
+    snapshot_rel = os.path.relpath(SNAPSHOT_DIR, BASE_DIR)
+    paths = [snapshot_rel]
     try:
-        # 1. data-snapshot 파일 스테이징
-        result = subprocess.run(
-            ['git', 'add', 'frontend/data-snapshot/'],
-            cwd=BASE_DIR,
-            capture_output=True, text=True, timeout=30
-        )
+        # 1. 미커밋 스냅샷 확인 (이번 변경 + 이전 실패분)
+        result = _git(['status', '--porcelain', '--'] + paths)
         if result.returncode != 0:
-            log(f"❌ git add 실패: {result.stderr[:150]}")
+            log(f"❌ git status 실패: {result.stderr[:150]}")
             return False
+        pending = [line[3:] for line in result.stdout.splitlines() if line.strip()]
+        ahead = _git(['rev-list', '--count', '@{u}..HEAD'], timeout=10)
+        unpushed = ahead.returncode == 0 and ahead.stdout.strip() not in ('', '0')
 
-        # 2. 변경사항 확인
-        result = subprocess.run(
-            ['git', 'diff', '--cached', '--stat', '--', 'frontend/data-snapshot/'],
-            cwd=BASE_DIR,
-            capture_output=True, text=True, timeout=10
-        )
-        if not result.stdout.strip():
+        if not pending and not unpushed:
             log("ℹ️ 변경사항 없음 — 배포 스킵")
             return True
-
-        # 3. 커밋
-        now = datetime.now().strftime('%Y-%m-%d %H:%M')
-        msg = f"📊 Dashboard data sync ({now})"
-        result = subprocess.run(
-            ['git', 'commit', '-m', msg, '--', 'frontend/data-snapshot/'],
-            cwd=BASE_DIR,
-            capture_output=True, text=True, timeout=30
-        )
-        if result.returncode != 0:
-            log(f"❌ git commit 실패: {result.stderr[:150]}")
-            return False
-
-        # 4. Push → Vercel 자동 배포 트리거
+        if changed_files is not None and len(pending) > len(changed_files):
+            log(f"ℹ️ 이전 실행에서 배포되지 않은 스냅샷 포함: {len(pending) - len(changed_files)}개")
+
+        if pending:
+            # 2. data-snapshot 스테이징 + 커밋
+            result = _git(['add', '--'] + paths)
+            if result.returncode != 0:
+                log(f"❌ git add 실패: {result.stderr[:150]}")
+                return False
+            staged = _git(['diff', '--cached', '--stat', '--'] + paths, timeout=10)
+            if staged.stdout.strip():
+                now = datetime.now().strftime('%Y-%m-%d %H:%M')
+                msg = f"📊 Dashboard data sync ({now})"
+                result = _git(['commit', '-m', msg, '--'] + paths)
+                if result.returncode != 0:
+                    log(f"❌ git commit 실패: {result.stderr[:150]}")
+                    return False
+            elif not unpushed:
+                log("ℹ️ 변경사항 없음 — 배포 스킵")
+                return True
+
+        # 3. Push → Vercel 자동 배포 트리거 (이전 실행의 미push 커밋 포함)
         result = subprocess.run(
             ['git', 'push', 'origin', 'main'],
             cwd=BASE_DIR,
@@ -682,6 +820,75 @@ def deploy_vercel() -> bool:
 # 메인 동기화 함수
 # ============================================================
 
+def _snapshot_tasks(scope: str) -> List[Tuple[str, Callable]]:
+    """scope별 스냅샷 작업 목록 — bool 반환은 성공/실패 1건, int 반환은 복사 성공 수"""
+    tasks = []
+    if scope in ('all', 'kr'):
+        tasks += [
+            ('kr-signals', snapshot_kr_signals),
+            ('kr-market-gate', snapshot_kr_market_gate),
+            ('kr-backtest-summary', snapshot_kr_backtest_summary),
+            ('kr-vcp-stats', snapshot_kr_vcp_stats),
+            ('kr-vcp-history', snapshot_kr_vcp_history),
+            ('kr-jongga-dates', snapshot_kr_jongga_dates),
+            ('kr-copies', snapshot_kr_simple_copies),
+        ]
+    if scope in ('all', 'us'):
+        tasks.append(('us', snapshot_us_copies))
+    if scope in ('all', 'crypto'):
+        tasks.append(('crypto', snapshot_crypto_copies))
+    if scope in ('all', 'econ'):
+        tasks.append(('econ', snapshot_econ_copies))
+    return tasks
+
+
+def _run_snapshot_tasks(tasks: List[Tuple[str, Callable]], workers: int = SYNC_WORKERS) -> Tuple[int, int]:
+    """스냅샷 작업을 스레드 풀에서 동시 실행 → (ok, fail)"""
+    def _call(task):
+        name, fn = task
+        try:
+            if perf is None:
+                return fn()
+            with perf.span(name, step='write') as sp:
+                res = fn()
+                if res is False:
+                    sp.fail()
+                return res
+        except Exception as e:
+            log(f"✗ {name} 실패: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='snapshot') as executor:
+        # 호출 측 perf span(예: full_update) 아래에 기록되도록 컨텍스트 복사
+        futures = [executor.submit(contextvars.copy_context().run, _call, task) for task in tasks]
+        results = [f.result() for f in futures]
+
+    ok_count = fail_count = 0
+    for res in results:
+        if isinstance(res, bool):
+            ok_count += int(res)
+            fail_count += int(not res)
+        else:
+            ok_count += res
+    return ok_count, fail_count
+
+
+def write_sync_manifest(scope: str, ok_count: int, fail_count: int, manifest: dict):
+    """변경 파일 목록을 data/dashboard_sync_manifest.json에 기록 (배포 대상 아님)"""
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+            json.dump({
+                'synced_at': datetime.now().isoformat(timespec='seconds'),
+                'scope': scope,
+                'ok': ok_count,
+                'fail': fail_count,
+                **manifest,
+            }, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        log(f"⚠ sync manifest 저장 실패: {e}")
+
+
 def sync_dashboard(
     scope: str = 'all',
     deploy: bool = True
@@ -694,8 +901,9 @@ def sync_dashboard(
         deploy: True면 Vercel 배포까지 실행
 
     Returns:
-        {'ok': int, 'fail': int, 'deployed': bool}
+        {'ok': int, 'fail': int, 'deployed': bool, 'changed': [파일명]}
     """
+    global _manifest
     os.makedirs(SNAPSHOT_DIR, exist_ok=True)
 
     print("")
@@ -705,84 +913,42 @@ def sync_dashboard(
     print(f"  Scope: {scope}")
     print(f"  Deploy: {'Yes' if deploy else 'No (dry-run)'}")
     print(f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"  Workers: {SYNC_WORKERS}")
     print("")
 
-    ok_count = 0
-    fail_count = 0
-
-    # ── KR Market ──
-    if scope in ('all', 'kr'):
-        print("  ── KR Market ──")
-        # 변환이 필요한 파일들
-        if snapshot_kr_signals():
-            ok_count += 1
-        else:
-            fail_count += 1
+    # 동시 호출 시 manifest가 섞이지 않도록 동기화 단위로 직렬화
+    with _sync_lock, (perf.span(f'sync_dashboard:{scope}') if perf is not None else _nullcontext()):
+        _manifest = SnapshotManifest()
+        ok_count, fail_count = _run_snapshot_tasks(_snapshot_tasks(scope))
 
-        if snapshot_kr_market_gate():
-            ok_count += 1
-        else:
-            fail_count += 1
-
-        if snapshot_kr_backtest_summary():
-            ok_count += 1
-        else:
-            fail_count += 1
-
-        if snapshot_kr_vcp_stats():
-            ok_count += 1
-        else:
-            fail_count += 1
-
-        if snapshot_kr_vcp_history():
-            ok_count += 1
-        else:
-            fail_count += 1
-
-        if snapshot_kr_jongga_dates():
-            ok_count += 1
-        else:
-            fail_count += 1
-
-        # 단순 복사
-        ok_count += snapshot_kr_simple_copies()
-
-    # ── US Market ──
-    if scope in ('all', 'us'):
-        print("  ── US Market ──")
-        ok_count += snapshot_us_copies()
-
-    # ── Crypto ──
-    if scope in ('all', 'crypto'):
-        print("  ── Crypto ──")
-        ok_count += snapshot_crypto_copies()
-
-    # ── Economy ──
-    if scope in ('all', 'econ'):
-        print("  ── Economy ──")
-        ok_count += snapshot_econ_copies()
+        # ── Health & Data Version — 실제 변경이 있을 때만 갱신 (타임스탬프만 바뀐 커밋 방지) ──
+        if _manifest.changed:
+            snapshot_health(ok_count, fail_count)
+            snapshot_data_version()
+        manifest = _manifest.to_dict()
 
-    # ── Health & Data Version ──
-    snapshot_health(ok_count, fail_count)
-    snapshot_data_version()
+    write_sync_manifest(scope, ok_count, fail_count, manifest)
+    changed = manifest['changed']
 
     print("")
-    print(f"  Total: {ok_count} OK, {fail_count} failed")
+    print(f"  Total: {ok_count} OK, {fail_count} failed, {len(changed)} changed")
+    for name in changed:
+        print(f"    Δ {name}")
 
-    # ── Vercel 배포 ──
+    # ── Vercel 배포 (변경 파일만) ──
     deployed = False
     if deploy and ok_count > 0:
-        deployed = deploy_vercel()
+        deployed = deploy_vercel(changed)
 
     print("")
     print("╔══════════════════════════════════════════════╗")
-    print(f"║  스냅샷: {ok_count} 파일 동기화 완료")
+    print(f"║  스냅샷: {ok_count} 파일 동기화 완료 (변경 {len(changed)})")
     print(f"║  Vercel: {'✅ 배포됨' if deployed else '⏭ 스킵'}")
     print(f"║  URL:    https://closing-bet.vercel.app")
     print("╚══════════════════════════════════════════════╝")
     print("")
 
-    return {'ok': ok_count, 'fail': fail_count, 'deployed': deployed}
+    return {'ok': ok_count, 'fail': fail_count, 'deployed': deployed, 'changed': changed}
 
 
 # ============================================================
@@ -0,0 +1,85 @@
+"""피처 스토어 증분 갱신 테스트
+
+가짜 OHLCV 레이크로 날짜를 앞으로 옮겨 가며 증분 갱신한 결과가
+처음부터 다시 계산한 결과와 같은지, 피처 정의가 바뀌면 전체 재계산되는지 확인한다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import feature_store  # noqa: E402
+from app.utils.feature_store import FeatureSet, FeatureStore  # noqa: E402
+
+DATES = pd.bdate_range('2020-01-01', '2024-12-31')
+
+
+class FakeLake:
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        self.close = pd.DataFrame({
+            s: 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(DATES)))) for s in ('SPY', '^VIX')
+        }, index=DATES)
+        self.today = pd.Timestamp('2023-06-30')
+        self.starts = []
+
+    def get_panel(self, symbols, start=None, **kwargs):
+        self.starts.append(pd.Timestamp(start))
+        rows = self.close.loc[pd.Timestamp(start):self.today, list(symbols)]
+        return pd.concat({'Close': rows, 'Volume': rows * 1000}, axis=1)
+
+
+def build(data: pd.DataFrame) -> pd.DataFrame:
+    spy = data['SPY']
+    features = pd.DataFrame(index=data.index)
+    features['spy_ema'] = spy.ewm(alpha=1 / 14, adjust=False).mean()
+    features['spy_ma200'] = spy.rolling(200).mean()
+    features['vix_pct'] = data['VIX'].rolling(252).rank(pct=True)
+    return features
+
+
+@pytest.fixture
+def lake(monkeypatch):
+    fake = FakeLake()
+    monkeypatch.setattr(feature_store.ohlcv_lake, 'get_panel', fake.get_panel)
+    return fake
+
+
+def _feature_set(version='1'):
+    return FeatureSet(name='test', version=version, tickers={'SPY': 'SPY', '^VIX': 'VIX'},
+                      builder=build, history_start='2020-01-01', refresh_minutes=0)
+
+
+def test_incremental_update_matches_full_rebuild(lake, tmp_path):
+    store = FeatureStore(str(tmp_path / 'incremental'))
+    store.update(_feature_set())
+    for day in ('2023-07-05', '2023-07-06', '2023-08-31'):
+        lake.today = pd.Timestamp(day)
+        incremental = store.update(_feature_set())
+    # 증분 갱신은 최근 구간만 다시 받는다
+    assert lake.starts[-1] > pd.Timestamp('2021-06-01')
+
+    full = FeatureStore(str(tmp_path / 'full')).update(_feature_set())
+    assert incremental.index.equals(full.index)
+    pd.testing.assert_frame_equal(incremental, full, check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def test_version_change_triggers_full_rebuild(lake, tmp_path):
+    store = FeatureStore(str(tmp_path))
+    store.update(_feature_set('1'))
+    lake.today = pd.Timestamp('2023-07-10')
+    store.update(_feature_set('2'))
+    assert lake.starts[-1] == pd.Timestamp('2020-01-01')
+    assert store.status()[0]['mode'] == 'full'
+
+
+def test_matrix_aligns_columns():
+    frame = pd.DataFrame({'b': [1.0, np.nan], 'a': [3.0, 4.0]})
+    X = FeatureStore.matrix(frame, ['a', 'b', 'c'])
+    assert X.tolist() == [[3.0, 1.0, 0.0], [4.0, 0.0, 0.0]]
+    assert FeatureStore.matrix(frame.iloc[0], ['a', 'c']).tolist() == [[3.0, 0.0]]
@@ -0,0 +1,59 @@
+"""웹 워커 부팅 import 예산 테스트
+
+create_app()이 pandas/yfinance/stripe 등을 import하지 않고,
+import 시간·RSS가 예산 안에 있는지 새 인터프리터에서 측정한다.
+(측정: python -m app.utils.import_profile)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.import_profile import check_budget, parse_importtime, profile_imports  # noqa: E402
+
+# 현재 측정치(약 600ms / 60MB)의 1.5배 여유 — lazy import 이전은 약 1300ms / 128MB
+IMPORT_BUDGET_MS = float(os.environ.get('MARKETFLOW_IMPORT_BUDGET_MS', 1000))
+RSS_BUDGET_MB = float(os.environ.get('MARKETFLOW_RSS_BUDGET_MB', 100))
+
+
+@pytest.fixture(scope='module')
+def app_profile():
+    return profile_imports('app')
+
+
+def test_create_app_skips_heavy_modules(app_profile):
+    assert app_profile['heavy_loaded'] == [], f"부팅 시 로드됨: {app_profile['heavy_loaded']}"
+
+
+def test_create_app_within_import_budget(app_profile):
+    assert check_budget(app_profile, IMPORT_BUDGET_MS, RSS_BUDGET_MB) == []
+
+
+def test_heavy_module_loads_on_first_use(monkeypatch):
+    from app.utils.lazy_import import LazyModule, lazy_module
+
+    # 다른 테스트가 이미 import했을 수 있으므로 sys.modules에서 빼고 시작 (종료 시 복원)
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+
+    proxy = lazy_module('colorsys')
+    assert isinstance(proxy, LazyModule)
+    assert 'colorsys' not in sys.modules
+    assert 'not loaded' in repr(proxy)
+
+    assert proxy.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert 'colorsys' in sys.modules
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |     flask.json\n"
+        "import time:       300 |        400 |   flask\n"
+        "import time:        50 |        450 | app\n"
+    )
+    records = parse_importtime(stderr)
+    assert [(r['name'], r['depth']) for r in records] == [('flask.json', 2), ('flask', 1), ('app', 0)]
+    assert records[-1]['cumulative_us'] == 450
@@ -0,0 +1,31 @@
+"""제공자 라우터 서킷 브레이커 테스트
+
+HALF_OPEN 시험 호출이 호출 예산 부족으로 나가지 못했을 때
+브레이커가 시험 중 상태에 갇히지 않고, 예산이 보충되면 다시 시험 호출하는지 확인한다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from us_market.provider_router import CLOSED, HALF_OPEN, OPEN, ProviderRouter  # noqa: E402
+
+
+def test_half_open_probe_released_when_budget_exhausted(tmp_path):
+    router = ProviderRouter(max_workers=1, health_file=str(tmp_path / 'health.json'))
+    state = router._state('fmp')
+    state.breaker.state = OPEN
+    state.breaker.opened_at = time.monotonic() - state.breaker.cooldown
+    state.budget.tokens = 0
+    state.budget.refill_per_sec = 0
+
+    assert router._available('fmp') is None
+    assert state.breaker.state == HALF_OPEN
+    assert state.counts['skipped_budget'] == 1
+
+    state.budget.tokens = 1   # 예산 보충 → 다음 호출이 시험 호출로 나감
+    result = router.call('quote', [('fmp', lambda: {'price': 1.0})], hedge=False)
+    assert result == {'price': 1.0}
+    assert state.breaker.state == CLOSED
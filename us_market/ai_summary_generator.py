@@ -28,6 +28,15 @@ from tqdm import tqdm
 import time
 from dotenv import load_dotenv
 
+# 단계 내부 구간 perf span (스케줄러 경유 시 부모 단계 span 아래에 기록, app 패키지가 없으면 생략)
+try:
+    from app.utils.perf import span as perf_span
+except ImportError:
+    from contextlib import nullcontext
+
+    def perf_span(name, step=None):
+        return nullcontext()
+
 # Load environment variables
 load_dotenv()
 
@@ -680,13 +689,15 @@ class AIStockAnalyzer:
         
         # Collect news (use company name for better search)
         company_name = data.get('name', ticker)
-        news = self.news_collector.get_news_for_ticker(ticker, company_name)
+        with perf_span('news', step='fetch'):
+            news = self.news_collector.get_news_for_ticker(ticker, company_name)
         
-        # Generate Korean summary
-        summary_ko = self.summary_generator.generate_summary(ticker, data, news, 'ko', macro_context)
-        
-        # Generate English summary
-        summary_en = self.summary_generator.generate_summary(ticker, data, news, 'en', macro_context)
+        with perf_span('summary', step='llm'):
+            # Generate Korean summary
+            summary_ko = self.summary_generator.generate_summary(ticker, data, news, 'ko', macro_context)
+            
+            # Generate English summary
+            summary_en = self.summary_generator.generate_summary(ticker, data, news, 'en', macro_context)
         
         # Cache result with both languages and sources
         sources = [
@@ -707,7 +718,8 @@ class AIStockAnalyzer:
             'news_count': len(news),
             'updated': datetime.now().isoformat()
         }
-        self._save_summaries()
+        with perf_span('save', step='write'):
+            self._save_summaries()
         
         return self.summaries[ticker]
     
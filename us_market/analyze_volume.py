@@ -9,6 +9,7 @@ import os
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from tqdm import tqdm
@@ -221,22 +222,11 @@ class VolumeAnalyzer:
             'supply_demand_stage': stage
         }
     
-    def run(self) -> pd.DataFrame:
-        """Run volume analysis for all stocks"""
-        logger.info("🚀 Starting Volume Analysis...")
-        
-        # Load data
-        df = self.load_prices()
-        
-        # Get unique tickers
-        tickers = df['ticker'].unique()
-        logger.info(f"📊 Analyzing {len(tickers)} stocks")
-        
+    def analyze_per_ticker(self, df: pd.DataFrame) -> pd.DataFrame:
+        """티커별 analyze_supply_demand 루프 (기존 방식, 비교/검증용)"""
         results = []
         
-        for ticker in tqdm(tickers, desc="Analyzing volume"):
-            ticker_data = df[df['ticker'] == ticker].copy()
-            
+        for ticker, ticker_data in tqdm(df.groupby('ticker', sort=False), desc="Analyzing volume"):
             if len(ticker_data) < 30:
                 continue
             
@@ -250,8 +240,39 @@ class VolumeAnalyzer:
                 }
                 results.append(result)
         
-        # Create DataFrame
-        results_df = pd.DataFrame(results)
+        return pd.DataFrame(results, columns=RESULT_COLUMNS)
+    
+    def analyze_all(self, df: pd.DataFrame, workers: int = 1) -> pd.DataFrame:
+        """전 종목 수급 분석 — (ticker, date) 정렬 프레임 한 번에 groupby로 계산
+
+        analyze_supply_demand와 같은 지표/점수/단계를 낸다. workers > 1이면 티커 샤드를
+        프로세스로 나눠 계산한다 (종목 수가 아주 많을 때만 이득).
+        """
+        tickers = df['ticker'].unique()
+        if workers > 1:
+            shards = [df[df['ticker'].isin(part)] for part in np.array_split(tickers, workers) if len(part)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = [p for p in executor.map(_analyze_frame, shards) if not p.empty]
+            results = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=RESULT_COLUMNS)
+        else:
+            results = _analyze_frame(df)
+        # 기존 루프와 같은 순서 (가격 파일에 처음 나온 순서)
+        order = pd.Series(np.arange(len(tickers)), index=tickers)
+        return results.iloc[np.argsort(order[results['ticker']].to_numpy(), kind='stable')].reset_index(drop=True)
+    
+    def run(self, vectorized: bool = True, workers: int = 1) -> pd.DataFrame:
+        """Run volume analysis for all stocks"""
+        logger.info("🚀 Starting Volume Analysis...")
+        
+        # Load data
+        df = self.load_prices()
+        
+        logger.info(f"📊 Analyzing {df['ticker'].nunique()} stocks")
+        
+        if vectorized:
+            results_df = self.analyze_all(df, workers=workers)
+        else:
+            results_df = self.analyze_per_ticker(df)
         
         # Save results
         results_df.to_csv(self.output_file, index=False)
@@ -266,16 +287,152 @@ class VolumeAnalyzer:
         return results_df
 
 
+RESULT_COLUMNS = [
+    'ticker', 'name', 'date', 'obv', 'obv_change_20d', 'ad_line', 'ad_change_20d', 'mfi',
+    'vol_ratio_5d_20d', 'surge_count_5d', 'surge_count_20d', 'supply_demand_score', 'supply_demand_stage',
+]
+
+
+def _tail_matrix(values: np.ndarray, pos_from_end: np.ndarray, n: int) -> np.ndarray:
+    """(ticker, date) 정렬 배열에서 그룹별 마지막 n개 → (그룹 수, n) 행렬"""
+    return values[pos_from_end < n].reshape(-1, n)
+
+
+def _py_max(first: np.ndarray, *others: np.ndarray) -> np.ndarray:
+    """원소별 max(a, b, ...) — 파이썬 내장 max와 같은 NaN 처리 (왼쪽부터 비교, NaN은 비교에서 제외)"""
+    result = np.asarray(first, dtype=float)
+    for other in others:
+        result = np.where(other > result, other, result)
+    return result
+
+
+def _tail_mean(values: np.ndarray, pos_from_end: np.ndarray, n: int) -> np.ndarray:
+    """그룹별 마지막 n개 평균 (Series.mean처럼 NaN 제외)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        matrix = _tail_matrix(np.asarray(values, dtype=float), pos_from_end, n)
+        mask = np.isnan(matrix)
+        return np.where(mask, 0.0, matrix).sum(axis=1) / (~mask).sum(axis=1)
+
+
+def _group_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """구간별 누적합 — Series.cumsum과 같은 순차 합산(NaN은 건너뛰고 자리는 NaN 유지)
+
+    groupby().cumsum()은 보정 합산이라 끝자리가 달라질 수 있어, 티커별 계산과
+    비트 단위로 같게 하려고 구간마다 np.cumsum을 쓴다.
+    """
+    values = np.asarray(values, dtype=float)
+    mask = np.isnan(values)
+    filled = np.where(mask, 0.0, values)
+    out = np.empty_like(filled)
+    bounds = np.append(starts, len(values))
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        out[start:end] = np.cumsum(filled[start:end])
+    out[mask] = np.nan
+    return out
+
+
+def _analyze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """VolumeAnalyzer.analyze_supply_demand의 열 단위 버전 (티커당 30일 미만 제외)"""
+    df = df[df.groupby('ticker')['ticker'].transform('size') >= 30]
+    if df.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    df = df.sort_values(['ticker', 'date'], kind='mergesort').reset_index(drop=True)
+    ticker = df['ticker']
+    close, high, low, volume = df['current_price'], df['high'], df['low'], df['volume']
+    starts = np.flatnonzero(ticker.ne(ticker.shift()).to_numpy())
+
+    # OBV: 상승일 +거래량, 하락일 -거래량 (첫 행 0). 거래량 NaN은 이후 값을 NaN으로 (루프 버전과 동일)
+    price_delta = close.groupby(ticker).diff()
+    step = volume.where(price_delta > 0, (-volume).where(price_delta < 0, 0))
+    step.iloc[starts] = 0
+    obv = step.groupby(ticker).cumsum()
+    obv = obv.mask(step.isna().groupby(ticker).cummax())
+
+    # A/D Line
+    high_low = (high - low).replace(0, 0.0001)
+    clv = ((close - low) - (high - close)) / high_low
+    ad_v = _group_cumsum((clv * volume).to_numpy(), starts)
+
+    # MFI (14)
+    typical_price = (high + low + close) / 3
+    money_flow = typical_price * volume
+    tp_delta = typical_price.groupby(ticker).diff()
+    flows = pd.DataFrame({
+        'positive': money_flow.where(tp_delta > 0, 0),
+        'negative': money_flow.where(tp_delta < 0, 0),
+    })
+    flow_sums = flows.groupby(ticker).rolling(window=14).sum().reset_index(level=0, drop=True)
+    mfi = 100 - (100 / (1 + flow_sums['positive'] / flow_sums['negative'].replace(0, 0.0001)))
+
+    # Volume surge (> 2x 20일 평균)
+    vol_sma = volume.groupby(ticker).rolling(window=20).mean().reset_index(level=0, drop=True)
+    vol_surge = (volume > vol_sma * 2.0).to_numpy()
+
+    # 그룹별 끝에서부터의 위치 (0 = 최신)
+    pos = df.groupby('ticker').cumcount(ascending=False).to_numpy()
+    last = pos == 0
+    obv_v = obv.to_numpy()
+
+    obv_20 = obv_v[pos == 19]
+    obv_denom = _py_max(np.abs(obv_20), np.abs(_tail_mean(obv_v, pos, 20)), 1)
+    obv_change = (obv_v[last] - obv_20) / obv_denom * 100
+
+    ad_20 = ad_v[pos == 19]
+    ad_denom = _py_max(np.abs(ad_20), np.abs(_tail_mean(ad_v, pos, 20)), 1)
+    ad_change = (ad_v[last] - ad_20) / ad_denom * 100
+
+    vol_5d = _tail_mean(volume.to_numpy(), pos, 5)
+    vol_20d = _tail_mean(volume.to_numpy(), pos, 20)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vol_ratio = np.where(vol_20d > 0, vol_5d / vol_20d, 1)
+
+    surge_count_5d = _tail_matrix(vol_surge, pos, 5).sum(axis=1)
+    surge_count_20d = _tail_matrix(vol_surge, pos, 20).sum(axis=1)
+
+    mfi_last = mfi.to_numpy()[last]
+    mfi_current = np.where(np.isnan(mfi_last), 50, mfi_last)
+
+    # Supply/Demand Score (0-100) — analyze_supply_demand와 같은 구간
+    score = 50 + np.select([obv_change > 10, obv_change > 5, obv_change < -10, obv_change < -5], [15, 10, -15, -10], 0)
+    score = score + np.select([ad_change > 10, ad_change > 5, ad_change < -10, ad_change < -5], [15, 10, -15, -10], 0)
+    score = score + np.select([vol_ratio > 1.5, vol_ratio > 1.2, vol_ratio < 0.7], [10, 5, -5], 0)
+    score = score + np.select([mfi_current > 70, mfi_current < 30], [5, -5], 0)
+    score = np.clip(score, 0, 100)
+    stage = np.select(
+        [score >= 70, score >= 55, score >= 45, score >= 30],
+        ['Strong Accumulation', 'Accumulation', 'Neutral', 'Distribution'], 'Strong Distribution')
+
+    latest = df[last]
+    names = latest['name'].to_numpy() if 'name' in df.columns else latest['ticker'].to_numpy()
+    return pd.DataFrame({
+        'ticker': latest['ticker'].to_numpy(),
+        'name': names,
+        'date': latest['date'].to_numpy(),
+        'obv': obv_v[last],
+        'obv_change_20d': np.round(obv_change, 2),
+        'ad_line': ad_v[last],
+        'ad_change_20d': np.round(ad_change, 2),
+        'mfi': np.round(mfi_current, 1),
+        'vol_ratio_5d_20d': np.round(vol_ratio, 2),
+        'surge_count_5d': surge_count_5d.astype(int),
+        'surge_count_20d': surge_count_20d.astype(int),
+        'supply_demand_score': np.round(score, 1),
+        'supply_demand_stage': stage,
+    }, columns=RESULT_COLUMNS)
+
+
 def main():
     """Main execution"""
     import argparse
     
     parser = argparse.ArgumentParser(description='US Stock Volume Analysis')
     parser.add_argument('--dir', default='.', help='Data directory')
+    parser.add_argument('--workers', type=int, default=1, help='Processes (ticker shards) for vectorized analysis')
+    parser.add_argument('--per-ticker', action='store_true', help='Use the per-ticker loop instead of the grouped pass')
     args = parser.parse_args()
     
     analyzer = VolumeAnalyzer(data_dir=args.dir)
-    results = analyzer.run()
+    results = analyzer.run(vectorized=not args.per_ticker, workers=args.workers)
     
     # Show top 10 accumulation stocks
     print("\n🔥 Top 10 Accumulation Stocks:")
@@ -5,7 +5,7 @@ Backtesting System for Smart Money Strategy v3.0
 - Tests the stock picking strategy on historical data
 - Calculates returns, Sharpe ratio, Sortino ratio, max drawdown
 - Compares against benchmarks (SPY, QQQ)
-- Monte Carlo simulation with Student-t distribution
+- Monte Carlo simulation (Student-t / block bootstrap, correlated multi-asset paths)
 - Walk-forward optimization
 - Rolling Sharpe ratio
 - Transaction cost modeling
@@ -18,6 +18,8 @@ Note on Short Interest Data:
 
 import os
 import json
+import pickle
+import hashlib
 import pandas as pd
 import numpy as np
 import yfinance as yf
@@ -25,31 +27,152 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import logging
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 백테스트 결과 디스크 캐시 (picks, 기간, 파라미터별) — 종료일이 오늘 이후면 당일만 유효
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKTEST_CACHE_DIR = os.environ.get('BACKTEST_CACHE_DIR') or os.path.join(_BASE_DIR, 'data', 'backtest_cache')
+
+
+def _download(tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+    """(필드, 티커) OHLCV 프레임 — 레이크가 있으면 레이크 경유"""
+    if ohlcv_lake is not None:
+        return ohlcv_lake.get_panel(tickers, start=start_date, end=end_date)
+    return yf.download(tickers, start=start_date, end=end_date, progress=False)
+
+
+def _walk_forward_windows(returns: np.ndarray, starts: List[int], in_sample_days: int,
+                          out_sample_days: int) -> List[Tuple[float, float, float]]:
+    """윈도우별 (IS Sharpe, OOS Sharpe, OOS 누적수익률%) — 배열 슬라이스(뷰)만 사용"""
+    out = []
+    for start_idx in starts:
+        is_end = start_idx + in_sample_days
+        is_returns = returns[start_idx:is_end]
+        oos_returns = returns[is_end:is_end + out_sample_days]
+
+        is_std = is_returns.std(ddof=1)
+        is_sharpe = (is_returns.mean() * 252 - 0.04) / (is_std * np.sqrt(252)) if is_std > 0 else 0
+        oos_std = oos_returns.std(ddof=1)
+        oos_sharpe = (oos_returns.mean() * 252 - 0.04) / (oos_std * np.sqrt(252)) if oos_std > 0 else 0
+        oos_total = np.prod(1 + oos_returns) - 1
+        out.append((float(is_sharpe), float(oos_sharpe), float(oos_total * 100)))
+    return out
+
+
+# Monte Carlo: 청크당 난수 원소 수 상한 (float64 4M개 ≈ 32MB)
+MC_CHUNK_ELEMENTS = 4_000_000
+MC_BLOCK_SIZE = 20
+
+
+def _mc_daily_returns(rng: np.random.Generator, n_paths: int, num_days: int, method: str,
+                      distribution: str, params: Dict, block_size: int, multi_asset: bool) -> np.ndarray:
+    """청크 하나의 일간 수익률 — (n_paths, num_days) 또는 다종목이면 (n_paths, num_days, n_assets)"""
+    if method == 'bootstrap':
+        # 순환 블록 부트스트랩: 블록 시작점만 뽑고 연속 구간을 이어 붙임 (다종목은 같은 날짜 행 → 상관 보존)
+        sample = params['sample']
+        n_obs = len(sample)
+        block = max(1, min(block_size, n_obs))
+        n_blocks = -(-num_days // block)
+        starts = rng.integers(0, n_obs, size=(n_paths, n_blocks))
+        idx = (starts[:, :, None] + np.arange(block)) % n_obs
+        return sample[idx.reshape(n_paths, n_blocks * block)[:, :num_days]]
+
+    if multi_asset:
+        n_assets = len(params['mean'])
+        z = rng.standard_normal((n_paths, num_days, n_assets)) @ params['chol'].T
+        if distribution == 'student_t':
+            df = params['df']
+            # 다변량 t: 공통 카이제곱 스케일, 분산이 표본 공분산과 같도록 (df-2)/df 보정
+            scale = np.sqrt((df - 2) / rng.chisquare(df, size=(n_paths, num_days, 1))) if df > 2 \
+                else np.sqrt(df / rng.chisquare(df, size=(n_paths, num_days, 1)))
+            z = z * scale
+        return params['mean'] + z
+
+    if distribution == 'student_t':
+        return params['loc'] + params['scale'] * rng.standard_t(params['df'], size=(n_paths, num_days))
+    return rng.normal(params['mean'], params['std'], size=(n_paths, num_days))
+
 
 class BacktestEngine:
     """Backtesting engine for stock picking strategies"""
 
-    def __init__(self, initial_capital: float = 100000, transaction_cost: float = 0.001):
+    def __init__(self, initial_capital: float = 100000, transaction_cost: float = 0.001,
+                 use_cache: bool = True, cache_dir: str = None):
         self.initial_capital = initial_capital
         self.transaction_cost = transaction_cost  # 0.1% per trade (buy + sell)
         self.benchmark_tickers = ['SPY', 'QQQ']
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir or BACKTEST_CACHE_DIR
+        # 이미 받은 OHLCV 패널 [(티커 집합, 시작, 종료, 패널)] — 포함되는 요청은 재다운로드 없이 슬라이스
+        self._panels: List[Tuple[frozenset, str, str, pd.DataFrame]] = []
+
+    def get_price_panel(self, tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+        """(필드, 티커) OHLCV 패널 — 같은 엔진에서 이미 받은 범위면 행 슬라이스만 반환"""
+        wanted = frozenset(tickers)
+        for have, start, end, panel in self._panels:
+            if wanted <= have and start <= start_date and end_date <= end:
+                lo = panel.index.searchsorted(pd.Timestamp(start_date), side='left')
+                hi = panel.index.searchsorted(pd.Timestamp(end_date), side='left')
+                return panel.iloc[lo:hi]
 
-    def get_historical_prices(self, tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
-        """Fetch historical price data"""
         logger.info(f"📊 Fetching data for {len(tickers)} tickers...")
+        panel = _download(list(tickers), start_date, end_date)
+        if panel is not None and not panel.empty:
+            self._panels.append((wanted, start_date, end_date, panel))
+        return panel
 
+    def get_historical_prices(self, tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+        """Fetch historical price data"""
         try:
-            data = yf.download(tickers, start=start_date, end=end_date, progress=False)
+            data = self.get_price_panel(tickers, start_date, end_date)
             if 'Close' in data.columns:
-                return data['Close']
+                close = data['Close']
+                # 캐시된 패널이 더 많은 티커를 담고 있을 수 있음
+                wanted = set(tickers)
+                return close[[t for t in close.columns if t in wanted]]
             return data
         except Exception as e:
             logger.error(f"Error fetching data: {e}")
             return pd.DataFrame()
 
+    # ── 결과 캐시 ──
+
+    def _cache_key(self, kind: str, picks: List[str], start_date: str, end_date: str, **params) -> str:
+        as_of = datetime.now().strftime('%Y-%m-%d')
+        # 과거 구간 결과는 영구, 오늘까지 걸친 구간은 당일만 (새 봉이 붙으므로)
+        payload = [kind, list(picks), start_date, end_date, sorted(params.items()),
+                   as_of if end_date >= as_of else None]
+        return hashlib.sha1(json.dumps(payload, default=str).encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        if not self.use_cache:
+            return None
+        path = os.path.join(self.cache_dir, f'{key}.pkl')
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _cache_put(self, key: str, result: Dict):
+        if not self.use_cache or 'error' in result:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, f'{key}.pkl')
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"backtest cache write failed: {e}")
+
     def calculate_returns(self, prices: pd.DataFrame) -> pd.DataFrame:
         """Calculate daily returns"""
         return prices.pct_change().dropna()
@@ -83,6 +206,13 @@ class BacktestEngine:
         Returns:
             Backtest results dictionary
         """
+        cache_key = self._cache_key('equal_weight', picks, start_date, end_date, rebalance_days=rebalance_days,
+                                    cost=self.transaction_cost, capital=self.initial_capital)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️ Backtest cache hit: {start_date} to {end_date}")
+            return cached
+
         logger.info(f"🚀 Running backtest: {start_date} to {end_date}")
         logger.info(f"📈 Stocks: {picks}")
 
@@ -241,6 +371,7 @@ class BacktestEngine:
             }
         }
 
+        self._cache_put(cache_key, results)
         return results
 
     def calculate_sortino_ratio(self, returns: pd.Series, risk_free_rate: float = 0.04) -> float:
@@ -266,91 +397,154 @@ class BacktestEngine:
 
     def monte_carlo_simulation(
         self,
-        returns: pd.Series,
+        returns,
         num_simulations: int = 1000,
         num_days: int = 252,
         initial_value: float = 100000,
-        distribution: str = 'student_t'
+        distribution: str = 'student_t',
+        method: str = 'parametric',
+        block_size: int = MC_BLOCK_SIZE,
+        weights: Optional[List[float]] = None,
+        seed: int = 42,
+        chunk_size: Optional[int] = None,
+        workers: int = 1,
     ) -> Dict:
         """
         Monte Carlo simulation for portfolio projection
 
+        경로를 (chunk, num_days) 배열 단위로 한 번에 생성한다 (청크당 원소 수 ≤ MC_CHUNK_ELEMENTS).
+        청크마다 SeedSequence.spawn()으로 나눈 독립 Generator를 쓰므로, 같은 seed면
+        workers 수와 무관하게 결과가 같다.
+
         Args:
-            returns: Historical daily returns
+            returns: Historical daily returns — Series(포트폴리오) 또는 DataFrame(종목별, 상관 경로)
             num_simulations: Number of simulation paths
             num_days: Days to simulate (252 = 1 year)
             initial_value: Starting portfolio value
-            distribution: 'normal' or 'student_t' (fat-tail)
+            distribution: 'normal' or 'student_t' (fat-tail) — method='parametric'일 때
+            method: 'parametric' (분포 적합) 또는 'bootstrap' (과거 수익률 블록 재표본)
+            block_size: 블록 부트스트랩 블록 길이 (자기상관/변동성 군집 보존)
+            weights: DataFrame일 때 종목 비중 (기본: 동일 비중)
+            seed: 난수 시드
+            chunk_size: 청크당 경로 수 (기본: 메모리 한도에서 자동)
+            workers: 청크 병렬 스레드 수 (numpy 연산은 GIL 해제)
         """
-        if len(returns) < 20:
+        multi_asset = isinstance(returns, pd.DataFrame)
+        data = returns.dropna(how='any') if multi_asset else returns.dropna()
+        if len(data) < 20:
             return {'error': 'Insufficient return data'}
+        if method not in ('parametric', 'bootstrap'):
+            return {'error': f'Unknown method: {method}'}
 
-        mean_return = returns.mean()
-        std_return = returns.std()
-
-        np.random.seed(42)
+        if multi_asset:
+            w = np.full(data.shape[1], 1.0 / data.shape[1]) if weights is None else np.asarray(weights, dtype=float)
+            w = w / w.sum()
+            portfolio_returns = data.to_numpy() @ w
+        else:
+            w = None
+            portfolio_returns = data.to_numpy(dtype=float)
 
         degrees_of_freedom = None
+        params = {}
 
-        if distribution == 'student_t':
-            try:
-                from scipy.stats import t as t_dist
-                df_t, loc_t, scale_t = t_dist.fit(returns.dropna())
-                degrees_of_freedom = round(df_t, 2)
-
-                # Generate random walks using Student-t
-                simulated_paths = []
-                for _ in range(num_simulations):
-                    daily_returns = t_dist.rvs(df_t, loc=loc_t, scale=scale_t, size=num_days)
-                    price_path = initial_value * np.cumprod(1 + daily_returns)
-                    simulated_paths.append(price_path)
-            except ImportError:
-                logger.warning("scipy not available, falling back to normal distribution")
-                distribution = 'normal'
-
-        if distribution == 'normal':
-            simulated_paths = []
-            for _ in range(num_simulations):
-                daily_returns = np.random.normal(mean_return, std_return, num_days)
-                price_path = initial_value * np.cumprod(1 + daily_returns)
-                simulated_paths.append(price_path)
-
-        simulated_paths = np.array(simulated_paths)
-        final_values = simulated_paths[:, -1]
+        if method == 'bootstrap':
+            distribution = 'empirical'
+            params['sample'] = data.to_numpy(dtype=float)
+        else:
+            if distribution == 'student_t':
+                try:
+                    from scipy.stats import t as t_dist
+                    df_t, loc_t, scale_t = t_dist.fit(portfolio_returns)
+                    degrees_of_freedom = round(df_t, 2)
+                    params.update(df=df_t, loc=loc_t, scale=scale_t)
+                except ImportError:
+                    logger.warning("scipy not available, falling back to normal distribution")
+                    distribution = 'normal'
+
+            if multi_asset:
+                # 상관 경로: 공분산 Cholesky (Student-t는 공통 카이제곱 스케일 → 다변량 t)
+                params['mean'] = data.mean().to_numpy()
+                params['chol'] = np.linalg.cholesky(data.cov().to_numpy() + np.eye(data.shape[1]) * 1e-12)
+            else:
+                params['mean'] = float(portfolio_returns.mean())
+                params['std'] = float(portfolio_returns.std(ddof=1))
+
+        n_assets = data.shape[1] if multi_asset else 1
+        if chunk_size is None:
+            chunk_size = max(1, MC_CHUNK_ELEMENTS // (num_days * n_assets))
+        chunk_sizes = [min(chunk_size, num_simulations - i) for i in range(0, num_simulations, chunk_size)]
+        rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(chunk_sizes))]
+
+        def _run(i: int) -> np.ndarray:
+            daily = _mc_daily_returns(rngs[i], chunk_sizes[i], num_days, method, distribution,
+                                      params, block_size, multi_asset)
+            if multi_asset:
+                daily = daily @ w
+            # 통계에는 경로 최종값만 쓰므로 cumprod 대신 prod
+            return initial_value * np.prod(1 + daily, axis=1)
+
+        if workers > 1 and len(chunk_sizes) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_run, range(len(chunk_sizes))))
+        else:
+            parts = [_run(i) for i in range(len(chunk_sizes))]
+        final_values = np.concatenate(parts)
 
-        return {
+        p5, p25, p50, p75, p95 = np.percentile(final_values, [5, 25, 50, 75, 95])
+        result = {
             'simulations': num_simulations,
             'days': num_days,
             'initial_value': initial_value,
+            'method': method,
             'distribution': distribution,
             'degrees_of_freedom': degrees_of_freedom,
-            'median_final': round(np.median(final_values), 2),
-            'mean_final': round(np.mean(final_values), 2),
-            'percentile_5': round(np.percentile(final_values, 5), 2),
-            'percentile_25': round(np.percentile(final_values, 25), 2),
-            'percentile_75': round(np.percentile(final_values, 75), 2),
-            'percentile_95': round(np.percentile(final_values, 95), 2),
-            'prob_profit': round(np.mean(final_values > initial_value) * 100, 1),
-            'prob_double': round(np.mean(final_values > initial_value * 2) * 100, 1),
-            'prob_loss_20pct': round(np.mean(final_values < initial_value * 0.8) * 100, 1),
-            'var_95': round(np.percentile(final_values, 5) - initial_value, 2)  # Value at Risk
+            'seed': seed,
+            'median_final': round(float(p50), 2),
+            'mean_final': round(float(np.mean(final_values)), 2),
+            'percentile_5': round(float(p5), 2),
+            'percentile_25': round(float(p25), 2),
+            'percentile_75': round(float(p75), 2),
+            'percentile_95': round(float(p95), 2),
+            'prob_profit': round(float(np.mean(final_values > initial_value)) * 100, 1),
+            'prob_double': round(float(np.mean(final_values > initial_value * 2)) * 100, 1),
+            'prob_loss_20pct': round(float(np.mean(final_values < initial_value * 0.8)) * 100, 1),
+            'var_95': round(float(p5) - initial_value, 2)  # Value at Risk
         }
+        if method == 'bootstrap':
+            result['block_size'] = block_size
+        if multi_asset:
+            result['assets'] = list(data.columns)
+            result['weights'] = [round(float(x), 4) for x in w]
+        return result
 
     def walk_forward_analysis(self, picks: List[str], start_date: str, end_date: str,
-                               in_sample_days: int = 252, out_sample_days: int = 63) -> Dict:
+                               in_sample_days: int = 252, out_sample_days: int = 63,
+                               workers: int = 1) -> Dict:
         """
         Walk-forward optimization: train on in-sample, test on out-of-sample
 
+        가격 패널은 한 번만 받고, 윈도우는 수익률 배열의 인덱스 슬라이스(복사 없음)로 평가한다.
+        결과는 (picks, 기간, 윈도우 크기)별로 디스크 캐시된다.
+
         Args:
             picks: List of stock tickers
             start_date: Start date
             end_date: End date
             in_sample_days: In-sample window size (trading days)
             out_sample_days: Out-of-sample window size (trading days)
+            workers: 윈도우 평가 프로세스 수 (1이면 현재 프로세스)
 
         Returns:
             Walk-forward results with robustness score
         """
+        cache_key = self._cache_key('walk_forward', picks, start_date, end_date,
+                                    in_sample_days=in_sample_days, out_sample_days=out_sample_days)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("♻️ Walk-forward cache hit")
+            return cached
+
         logger.info(f"📊 Running walk-forward analysis (IS={in_sample_days}, OOS={out_sample_days})...")
 
         all_tickers = list(set(picks + self.benchmark_tickers))
@@ -363,43 +557,36 @@ class BacktestEngine:
         if not available:
             return {'error': 'No valid tickers'}
 
-        returns = prices[available].pct_change().dropna().mean(axis=1)
+        returns = prices[available].pct_change().dropna().mean(axis=1).to_numpy()
 
         window_size = in_sample_days + out_sample_days
         if len(returns) < window_size:
             return {'error': f'Insufficient data ({len(returns)} days < {window_size} needed)'}
 
         # Slide window
-        is_sharpes = []
-        oos_sharpes = []
-        oos_returns_list = []
-
-        step = out_sample_days
-        for start_idx in range(0, len(returns) - window_size + 1, step):
-            is_end = start_idx + in_sample_days
-            oos_end = is_end + out_sample_days
-
-            is_returns = returns.iloc[start_idx:is_end]
-            oos_returns = returns.iloc[is_end:oos_end]
-
-            # In-sample Sharpe
-            is_sharpe = (is_returns.mean() * 252 - 0.04) / (is_returns.std() * np.sqrt(252)) if is_returns.std() > 0 else 0
-            is_sharpes.append(is_sharpe)
-
-            # Out-of-sample Sharpe
-            oos_sharpe = (oos_returns.mean() * 252 - 0.04) / (oos_returns.std() * np.sqrt(252)) if oos_returns.std() > 0 else 0
-            oos_sharpes.append(oos_sharpe)
-
-            oos_total = (1 + oos_returns).prod() - 1
-            oos_returns_list.append(oos_total * 100)
+        starts = list(range(0, len(returns) - window_size + 1, out_sample_days))
+        if workers > 1 and len(starts) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            shards = [starts[i::workers] for i in range(workers) if starts[i::workers]]
+            with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+                parts = list(pool.map(_walk_forward_windows, [returns] * len(shards), shards,
+                                      [in_sample_days] * len(shards), [out_sample_days] * len(shards)))
+            by_start = {s: w for shard, part in zip(shards, parts) for s, w in zip(shard, part)}
+            windows = [by_start[s] for s in starts]
+        else:
+            windows = _walk_forward_windows(returns, starts, in_sample_days, out_sample_days)
 
-        if not is_sharpes:
+        if not windows:
             return {'error': 'No complete windows'}
 
+        is_sharpes = [w[0] for w in windows]
+        oos_sharpes = [w[1] for w in windows]
+        oos_returns_list = [w[2] for w in windows]
+
         # Robustness: correlation between IS and OOS performance
         correlation = np.corrcoef(is_sharpes, oos_sharpes)[0, 1] if len(is_sharpes) > 1 else 0
 
-        return {
+        result = {
             'windows': len(is_sharpes),
             'in_sample_days': in_sample_days,
             'out_sample_days': out_sample_days,
@@ -410,6 +597,8 @@ class BacktestEngine:
             'robustness_score': round(float(correlation) * 100, 1),
             'degradation': round(float(np.mean(is_sharpes) - np.mean(oos_sharpes)), 2),
         }
+        self._cache_put(cache_key, result)
+        return result
 
     def print_results(self, results: Dict):
         """Print formatted backtest results"""
@@ -494,14 +683,15 @@ class HistoricalPicksSimulator:
         # Get 1 year of data before start for indicators
         lookback_start = (datetime.strptime(start_date, '%Y-%m-%d') - timedelta(days=365)).strftime('%Y-%m-%d')
 
+        # 종가/거래량을 한 패널에서 (유니버스 재다운로드 없음)
         prices = self.engine.get_historical_prices(universe, lookback_start, end_date)
         if prices.empty:
             return {'error': 'No price data'}
 
         # Get volume data
         try:
-            volume_data = yf.download(universe, start=lookback_start, end=end_date, progress=False)['Volume']
-        except:
+            volume_data = self.engine.get_price_panel(universe, lookback_start, end_date)['Volume']
+        except Exception:
             volume_data = None
 
         # Simulation period
@@ -629,11 +819,15 @@ def main():
     parser.add_argument('--end', default='2024-12-01', help='End date')
     parser.add_argument('--stocks', nargs='+', default=['AAPL', 'MSFT', 'GOOGL', 'NVDA', 'AMZN'])
     parser.add_argument('--cost', type=float, default=0.001, help='Transaction cost (0.001 = 0.1%)')
+    parser.add_argument('--mc-sims', type=int, default=1000, help='Monte Carlo paths')
+    parser.add_argument('--mc-method', choices=['parametric', 'bootstrap'], default='parametric')
+    parser.add_argument('--workers', type=int, default=1, help='walk-forward window processes')
+    parser.add_argument('--no-cache', action='store_true', help='ignore cached backtest results')
     args = parser.parse_args()
 
     if args.mode == 'simple':
         # Simple backtest with given stocks
-        engine = BacktestEngine(initial_capital=100000, transaction_cost=args.cost)
+        engine = BacktestEngine(initial_capital=100000, transaction_cost=args.cost, use_cache=not args.no_cache)
         results = engine.run_equal_weight_backtest(
             picks=args.stocks,
             start_date=args.start,
@@ -647,10 +841,12 @@ def main():
             prices = engine.get_historical_prices(all_tickers, args.start, args.end)
             if not prices.empty:
                 available = [t for t in args.stocks if t in prices.columns]
-                returns = prices[available].pct_change().dropna().mean(axis=1)
-                mc_results = engine.monte_carlo_simulation(returns, distribution='student_t')
+                # 종목별 수익률 → 상관 경로 (동일 비중 포트폴리오)
+                returns = prices[available].pct_change().dropna()
+                mc_results = engine.monte_carlo_simulation(returns, num_simulations=args.mc_sims,
+                                                           distribution='student_t', method=args.mc_method)
                 if 'error' not in mc_results:
-                    print(f"\n🎲 Monte Carlo ({mc_results['distribution']}, df={mc_results.get('degrees_of_freedom', 'N/A')}):")
+                    print(f"\n🎲 Monte Carlo ({mc_results['method']}/{mc_results['distribution']}, df={mc_results.get('degrees_of_freedom', 'N/A')}):")
                     print(f"   Median: ${mc_results['median_final']:,.2f}")
                     print(f"   5th percentile: ${mc_results['percentile_5']:,.2f}")
                     print(f"   95th percentile: ${mc_results['percentile_95']:,.2f}")
@@ -664,11 +860,12 @@ def main():
         print("\n✅ Results saved to backtest_results.json")
 
     elif args.mode == 'walkforward':
-        engine = BacktestEngine(initial_capital=100000, transaction_cost=args.cost)
+        engine = BacktestEngine(initial_capital=100000, transaction_cost=args.cost, use_cache=not args.no_cache)
         wf_results = engine.walk_forward_analysis(
             picks=args.stocks,
             start_date=args.start,
-            end_date=args.end
+            end_date=args.end,
+            workers=args.workers,
         )
         print("\n" + "=" * 70)
         print("📊 WALK-FORWARD ANALYSIS")
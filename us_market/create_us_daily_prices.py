@@ -10,12 +10,15 @@ import os
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List
 from tqdm import tqdm
 
 # Use hybrid data fetcher instead of direct yfinance
-from data_fetcher import USStockDataFetcher
+from data_fetcher import USStockDataFetcher, yf_throttle
+# 월별 파티션 저장소 (마지막 날짜 매니페스트 + 새 행만 추가)
+from us_price_store import get_last_dates, append_prices
 
 # Logging Configuration
 logging.basicConfig(
@@ -24,6 +27,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 병렬 다운로드 설정 (배치 시작 간격은 data_fetcher.yf_throttle로 프로세스 공용 제한)
+DOWNLOAD_BATCH_SIZE = 25
+DOWNLOAD_WORKERS = int(os.getenv('US_PRICES_WORKERS', '3'))
+BATCH_INTERVAL = float(os.getenv('US_PRICES_BATCH_INTERVAL', '2.0'))
+
 
 class USStockDailyPricesCreator:
     def print_header(self, msg):
@@ -196,35 +204,15 @@ class USStockDailyPricesCreator:
         self.update_prices(tickers_list)
 
     def update_prices(self, tickers: List[str]):
-        """Fetch and update price data incrementally"""
-        # Load existing price data if available
-        if os.path.exists(self.prices_file):
-            logger.info("📂 Loading existing price data...")
-            try:
-                # Optimized load: read only headers first or use chunking if huge
-                # For 500-600 stocks, standard read_csv is okay (~100MB)
-                existing_df = pd.read_csv(self.prices_file)
-                existing_df['Date'] = pd.to_datetime(existing_df['Date'])
-                
-                # Pivot to get last date per ticker
-                # Structure: Date, Open, High, Low, Close, Volume, Ticker
-                last_dates = existing_df.groupby('Ticker')['Date'].max()
-                logger.info(f"✅ Loaded history for {len(last_dates)} tickers")
-                
-            except Exception as e:
-                logger.warning(f"⚠️ Error reading existing file: {e}. Starting fresh.")
-                last_dates = pd.Series()
-                existing_df = pd.DataFrame()
-        else:
-            last_dates = pd.Series()
-            existing_df = pd.DataFrame()
+        """Fetch and update price data incrementally
+
+        마지막 날짜는 월별 파티션 저장소의 매니페스트에서 읽고(CSV 전체를 읽지 않음),
+        배치들은 공용 rate limiter 아래 병렬로 받아 새 행만 저장소/CSV에 추가한다.
+        """
+        store_dir = os.path.dirname(self.prices_file)
+        last_dates = get_last_dates(store_dir)
+        logger.info(f"✅ Last dates loaded for {len(last_dates)} tickers (manifest)")
 
-        # Determine download ranges
-        new_data_list = []
-        
-        # Batch size for downloading
-        batch_size = 50 
-        
         # Identify new vs existing tickers
         tickers_to_process = []
         for ticker in tickers:
@@ -243,67 +231,54 @@ class USStockDailyPricesCreator:
 
         logger.info(f"🔄 Need to update {len(tickers_to_process)} tickers")
         
-        # Group by start date to optimize batch downloads
+        # Group by start date, then split into download batches
         # (Many will share the same start date)
         from collections import defaultdict
         date_groups = defaultdict(list)
         for t, d in tickers_to_process:
             date_groups[d].append(t)
+        batches = [
+            (start_d, group_tickers[i:i + DOWNLOAD_BATCH_SIZE])
+            for start_d, group_tickers in date_groups.items()
+            for i in range(0, len(group_tickers), DOWNLOAD_BATCH_SIZE)
+        ]
         
         # Initialize hybrid data fetcher (yfinance + Finnhub fallback)
         fetcher = USStockDataFetcher()
-            
-        # Download using hybrid fetcher with rate limiting
-        for start_d, group_tickers in date_groups.items():
-            logger.info(f"⬇️ Downloading {len(group_tickers)} stocks from {start_d.date()}...")
-            
-            try:
-                # Use hybrid fetcher with rate limiting and Finnhub fallback
-                data = fetcher.download_history(
-                    symbols=group_tickers,
-                    start_date=start_d,
-                    end_date=self.end_date,
-                    batch_size=25,  # Smaller batches to avoid rate limits
-                    delay_between_batches=5.0  # 5 second delay between batches
-                )
-                
+
+        def _download(start_d, batch):
+            # 배치 시작 간격은 프로세스 공용 rate limiter로 제한 (info 조회 등과 같은 타임라인)
+            yf_throttle(BATCH_INTERVAL)
+            return fetcher.download_history(
+                symbols=batch,
+                start_date=start_d,
+                end_date=self.end_date,
+                batch_size=len(batch),
+                delay_between_batches=0
+            )
+
+        logger.info(f"⬇️ Downloading {len(batches)} batches ({DOWNLOAD_WORKERS} workers, "
+                    f"{BATCH_INTERVAL:.1f}s apart)...")
+        added = 0
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {executor.submit(_download, start_d, batch): (start_d, batch) for start_d, batch in batches}
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Price batches"):
+                start_d, batch = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Download failed for {len(batch)} stocks from {start_d.date()}: {e}")
+                    continue
+                # 배치마다 바로 저장 (해당 월 파티션 + CSV 끝에 새 행만)
                 if not data.empty:
-                    new_data_list.append(data)
-                    logger.info(f"   ✅ Got {len(data)} rows")
-                    
-            except Exception as e:
-                logger.error(f"❌ Download failed for group starting {start_d.date()}: {e}")
+                    added += append_prices(store_dir, data)
         
-        # Combine and Save
-        if new_data_list:
-            new_df = pd.concat(new_data_list)
-            
-            # Standardize columns
-            # Ensure columns: Date, Ticker, Open, High, Low, Close, Volume
-            # Make sure we have these columns (case sensitive check might be needed)
-            # yfinance usually returns Proper Case (Open, Close...)
-            
-            # Merge with existing
-            if not existing_df.empty:
-                full_df = pd.concat([existing_df, new_df])
-            else:
-                full_df = new_df
-                
-            # Remove duplicates just in case
-            full_df.drop_duplicates(subset=['Date', 'Ticker'], inplace=True)
-            
-            # Sort
-            full_df.sort_values(['Ticker', 'Date'], inplace=True)
-            
-            # Save
-            logger.info(f"💾 Saving updated data to {self.prices_file}")
-            full_df.to_csv(self.prices_file, index=False)
-            logger.info("✨ Update complete!")
+        if added:
+            logger.info(f"✨ Update complete! (+{added} rows)")
         else:
             logger.info("⚠️ No new data downloaded.")
 
 
-
 def main():
     """Main execution function"""
     import argparse
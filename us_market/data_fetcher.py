@@ -7,13 +7,58 @@ Uses yfinance with rate limiting + Finnhub as fallback
 
 import os
 import time
+import pickle
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 import pandas as pd
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
+# 제공자 오케스트레이션 (서킷 브레이커 + 헤지 요청 + 호출 예산)
+try:
+    from provider_router import get_provider_router
+except ImportError:
+    from us_market.provider_router import get_provider_router
+
 logger = logging.getLogger(__name__)
 
+# 펀더멘털 디스크 캐시 (티커별 파일, 필드별 TTL)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FUNDAMENTALS_CACHE_DIR = os.environ.get('FUNDAMENTALS_CACHE_DIR') or os.path.join(_BASE_DIR, 'data', 'fundamentals_cache')
+FUNDAMENTAL_TTLS = {
+    'info': 24 * 3600,           # 밸류에이션/애널리스트 목표가: 하루
+    'calendar': 7 * 24 * 3600,   # 실적 발표일: 일주일
+}
+FAILURE_TTL = 3600               # 빈 응답/실패 티커 재시도 간격
+FUNDAMENTALS_MAX_WORKERS = int(os.environ.get('FUNDAMENTALS_MAX_WORKERS', '4'))
+YF_MIN_INTERVAL = float(os.environ.get('YF_MIN_INTERVAL', '0.5'))            # 프로세스 전체 Yahoo 호출 간격
+YF_INFO_MIN_INTERVAL = float(os.environ.get('YF_INFO_MIN_INTERVAL', '1.5'))  # Ticker.info는 더 엄격하게 (기존 직렬 1.5초)
+
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def yf_throttle(min_interval: float = YF_MIN_INTERVAL):
+    """스레드 수와 무관하게 Yahoo 호출을 min_interval초 간격으로 줄 세움"""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        wait = max(0.0, _next_request_at - now)
+        _next_request_at = max(now, _next_request_at) + min_interval
+    if wait:
+        time.sleep(wait)
+
+
+def _has_profile(info: Dict) -> bool:
+    """info 응답이 실제 종목 프로필인지 (없는 티커는 예외 없이 빈/거의 빈 dict가 옴)"""
+    return bool(info) and bool(info.get('shortName') or info.get('longName') or info.get('quoteType'))
+
 
 class USStockDataFetcher:
     """
@@ -132,74 +177,79 @@ class USStockDataFetcher:
 
         import requests
         url = f"https://financialmodelingprep.com/api/v3/profile/{symbol}?apikey={self.fmp_key}"
-        try:
-            resp = requests.get(url, timeout=10)
-            data = resp.json()
-            if data and isinstance(data, list) and len(data) > 0:
-                profile = data[0]
-                return {
-                    'symbol': symbol,
-                    'shortName': profile.get('companyName', ''),
-                    'longName': profile.get('companyName', ''),
-                    'sector': profile.get('sector', ''),
-                    'industry': profile.get('industry', ''),
-                    'marketCap': profile.get('mktCap', 0),
-                    'trailingPE': profile.get('pe', 0) if profile.get('pe') else None,
-                    'beta': profile.get('beta', 0),
-                    'dividendYield': profile.get('lastDiv', 0) / profile.get('price', 1) if profile.get('price') else 0,
-                    'fiftyTwoWeekHigh': profile.get('range', '').split('-')[-1].strip() if profile.get('range') else None,
-                    'fiftyTwoWeekLow': profile.get('range', '').split('-')[0].strip() if profile.get('range') else None,
-                    'description': profile.get('description', ''),
-                    'ceo': profile.get('ceo', ''),
-                    'website': profile.get('website', ''),
-                    'exchange': profile.get('exchangeShortName', ''),
-                }
-        except Exception as e:
-            logger.debug(f"FMP profile failed for {symbol}: {e}")
+        # 요청/인증 오류는 그대로 올려 provider_router가 실패로 기록 (없는 티커는 빈 목록 → 빈 응답)
+        resp = requests.get(url, timeout=10)
+        resp.raise_for_status()
+        data = resp.json()
+        if isinstance(data, dict) and data.get('Error Message'):
+            raise RuntimeError(data['Error Message'])
+        if data and isinstance(data, list) and len(data) > 0:
+            profile = data[0]
+            return {
+                'symbol': symbol,
+                'shortName': profile.get('companyName', ''),
+                'longName': profile.get('companyName', ''),
+                'sector': profile.get('sector', ''),
+                'industry': profile.get('industry', ''),
+                'marketCap': profile.get('mktCap', 0),
+                'trailingPE': profile.get('pe', 0) if profile.get('pe') else None,
+                'beta': profile.get('beta', 0),
+                'dividendYield': profile.get('lastDiv', 0) / profile.get('price', 1) if profile.get('price') else 0,
+                'fiftyTwoWeekHigh': profile.get('range', '').split('-')[-1].strip() if profile.get('range') else None,
+                'fiftyTwoWeekLow': profile.get('range', '').split('-')[0].strip() if profile.get('range') else None,
+                'description': profile.get('description', ''),
+                'ceo': profile.get('ceo', ''),
+                'website': profile.get('website', ''),
+                'exchange': profile.get('exchangeShortName', ''),
+            }
         return {}
     
+    def _yf_ticker(self, symbol: str):
+        # Use curl_cffi session if available to bypass bot protection
+        if self.yf_session:
+            return self.yf.Ticker(symbol, session=self.yf_session)
+        return self.yf.Ticker(symbol)
+
+    def _finnhub_quote(self, symbol: str) -> Dict[str, Any]:
+        quote = self.finnhub_client.get_quote(symbol)
+        if quote.get('error'):
+            raise RuntimeError(quote['error'])
+        return quote
+
+    def _yf_quote(self, symbol: str) -> Dict[str, Any]:
+        info = self._yf_ticker(symbol).fast_info
+        return {
+            'symbol': symbol,
+            'current': info.get('lastPrice', 0),
+            'prev_close': info.get('previousClose', 0),
+            'open': info.get('open', 0),
+            'high': info.get('dayHigh', 0),
+            'low': info.get('dayLow', 0),
+        }
+
     def get_quote(self, symbol: str) -> Dict[str, Any]:
-        """Get current quote for a symbol."""
-        # 1. Try Finnhub first (most reliable)
-        if self.finnhub_available:
-            try:
-                return self.finnhub_client.get_quote(symbol)
-            except Exception as e:
-                logger.warning(f"Finnhub quote failed for {symbol}: {e}")
+        """Get current quote for a symbol.
 
-        # 2. Try FMP (comprehensive data)
+        Finnhub → FMP → Alpha Vantage → yfinance 우선순위로 provider_router를 통해 조회.
+        열린 서킷/소진된 호출 예산의 제공자는 건너뛰고, 앞 제공자가 평소 지연(p90)을
+        넘기면 다음 제공자를 동시에 호출해 먼저 온 응답을 쓴다.
+        """
+        attempts = []
+        if self.finnhub_available:
+            attempts.append(('finnhub', lambda: self._finnhub_quote(symbol)))
         if self.fmp_key:
-            result = self._fmp_quote(symbol)
-            if result:
-                return result
-
-        # 3. Try Alpha Vantage (no rate limit issues)
+            attempts.append(('fmp', lambda: self._fmp_quote(symbol)))
         if self.alpha_vantage_key:
-            result = self._alpha_vantage_quote(symbol)
-            if result:
-                return result
-
-        # 4. Fallback to yfinance (rate limited, use session if available)
+            attempts.append(('alpha_vantage', lambda: self._alpha_vantage_quote(symbol)))
         if self.yf_available:
-            try:
-                time.sleep(1.0)  # Increased rate limit delay
-                # Use curl_cffi session if available to bypass bot protection
-                if self.yf_session:
-                    ticker = self.yf.Ticker(symbol, session=self.yf_session)
-                else:
-                    ticker = self.yf.Ticker(symbol)
-                info = ticker.fast_info
-                return {
-                    'symbol': symbol,
-                    'current': info.get('lastPrice', 0),
-                    'prev_close': info.get('previousClose', 0),
-                    'open': info.get('open', 0),
-                    'high': info.get('dayHigh', 0),
-                    'low': info.get('dayLow', 0),
-                }
-            except Exception as e:
-                logger.warning(f"yfinance quote failed for {symbol}: {e}")
+            attempts.append(('yfinance', lambda: self._yf_quote(symbol)))
 
+        result = get_provider_router().call(
+            'quote', attempts, validate=lambda q: bool(q) and bool(q.get('current')),
+            before={'yfinance': yf_throttle})
+        if result:
+            return result
+        logger.warning(f"All quote providers failed for {symbol}")
         return {'symbol': symbol, 'error': 'No data source available'}
     
     def get_quotes_batch(self, symbols: List[str], use_finnhub: bool = True) -> Dict[str, Dict]:
@@ -242,8 +292,29 @@ class USStockDataFetcher:
         all_data = []
         successful_symbols = set()
 
-        # 1. Try yfinance batch download FIRST (fastest for bulk data)
-        if self.yf_available:
+        # 1a. 공용 레이크 경유 (오늘 이미 받은 심볼은 다운로드 없이 로컬에서)
+        if self.yf_available and ohlcv_lake is not None:
+            logger.info(f"📊 Fetching history for {len(symbols)} symbols via OHLCV lake...")
+            try:
+                panel = ohlcv_lake.get_panel(
+                    symbols,
+                    start=start_date,
+                    end=end_date + timedelta(days=1),
+                    session=self.yf_session,
+                    batch_size=batch_size,
+                    pause=delay_between_batches,
+                )
+                if not panel.empty:
+                    data = panel.stack(level='Ticker', future_stack=True).dropna(how='all')
+                    data.reset_index(inplace=True)
+                    data.columns.name = None
+                    all_data.append(data)
+                    successful_symbols.update(data['Ticker'].unique())
+            except Exception as e:
+                logger.error(f"   ❌ OHLCV lake fetch failed: {e}")
+
+        # 1b. Try yfinance batch download FIRST (fastest for bulk data)
+        elif self.yf_available:
             logger.info(f"📊 Fetching history for {len(symbols)} symbols via yfinance...")
 
             # Process in batches
@@ -367,12 +438,10 @@ class USStockDataFetcher:
             except Exception as e:
                 logger.warning(f"Finnhub profile failed for {symbol}: {e}")
         
-        # Fallback to yfinance
+        # Fallback to yfinance (공용 펀더멘털 캐시)
         if self.yf_available:
             try:
-                time.sleep(0.5)
-                ticker = self.yf.Ticker(symbol)
-                info = ticker.info
+                info = self.get_info(symbol)
                 return {
                     'symbol': symbol,
                     'name': info.get('shortName', ''),
@@ -419,9 +488,7 @@ class USStockDataFetcher:
         # yfinance fallback mostly just basic info
         if self.yf_available:
             try:
-                time.sleep(0.5)
-                ticker = self.yf.Ticker(symbol)
-                info = ticker.info
+                info = self.get_info(symbol)
                 return {
                     'symbol': symbol,
                     'institutional_pct': info.get('heldPercentInstitutions', 0),
@@ -458,19 +525,24 @@ class USStockDataFetcher:
 
     def get_history(self, symbol: str, period: str = "6mo") -> pd.DataFrame:
         """Get historical data (Technical Analysis)."""
-        # Try yfinance directly with curl_cffi session (most reliable now)
-        if self.yf_available:
+        # 공용 레이크 (오늘 이미 받은 심볼이면 대기/다운로드 없음)
+        if self.yf_available and ohlcv_lake is not None:
             try:
-                time.sleep(1.0)
-                if self.yf_session:
-                    ticker = self.yf.Ticker(symbol, session=self.yf_session)
-                else:
-                    ticker = self.yf.Ticker(symbol)
-                df = ticker.history(period=period)
+                df = ohlcv_lake.get_ohlcv(symbol, period=period, session=self.yf_session)
                 if not df.empty:
                     return df
             except Exception as e:
-                logger.warning(f"YF history failed for {symbol}: {e}")
+                logger.warning(f"OHLCV lake history failed for {symbol}: {e}")
+
+        # Try yfinance directly with curl_cffi session (most reliable now)
+        # (Yahoo 서킷이 열려 있으면 대기 없이 download_history의 Finnhub 경로로)
+        if self.yf_available:
+            df = get_provider_router().call(
+                'history', [('yfinance', lambda: self._yf_ticker(symbol).history(period=period))],
+                validate=lambda d: d is not None and not d.empty,
+                before={'yfinance': yf_throttle})
+            if df is not None:
+                return df
 
         # Fallback to download_history (uses Finnhub first)
         end_date = datetime.now()
@@ -486,62 +558,214 @@ class USStockDataFetcher:
         df = self.download_history([symbol], start_date, end_date, batch_size=1, delay_between_batches=1.0)
         return df
 
+    @property
+    def fundamentals(self) -> 'FundamentalsService':
+        """이 fetcher를 원천으로 쓰는 펀더멘털 서비스 (디스크 캐시/호출 간격은 프로세스 공용)"""
+        if getattr(self, '_fundamentals', None) is None:
+            self._fundamentals = FundamentalsService(self)
+        return self._fundamentals
+
     def get_info(self, symbol: str) -> Dict:
-        """Get full stock info (Fundamentals, Analyst)."""
+        """Get full stock info (Fundamentals, Analyst) — 디스크 캐시 (TTL 1일)"""
+        return self.fundamentals.get_info(symbol)
+
+    def get_calendar(self, symbol: str) -> Dict:
+        """Get earnings calendar — 디스크 캐시 (TTL 7일)"""
+        return self.fundamentals.get_calendar(symbol)
+
+    def _yf_info(self, symbol: str) -> Dict:
+        return self._yf_ticker(symbol).info
+
+    def _finnhub_info(self, symbol: str) -> Dict:
+        profile = self.finnhub_client.get_company_profile(symbol)
+        if profile.get('error'):
+            raise RuntimeError(profile['error'])
+        financials = self.finnhub_client.get_basic_financials(symbol)
+        # Map fields to mimic yf.info structure
+        return {
+            'symbol': symbol,
+            'shortName': profile.get('name'),
+            'longName': profile.get('name'),
+            'sector': profile.get('sector'),
+            'marketCap': profile.get('market_cap', 0) * 1000000,  # Finnhub might use M
+            'trailingPE': financials.get('pe_ratio'),
+            'dividendYield': financials.get('dividend_yield', 0) / 100.0 if financials.get('dividend_yield') else 0,
+            'beta': financials.get('beta'),
+            'fiftyTwoWeekHigh': financials.get('52_week_high'),
+            'fiftyTwoWeekLow': financials.get('52_week_low'),
+        }
+
+    def _fetch_info(self, symbol: str) -> Dict:
+        """원천 조회 (yfinance → FMP → Finnhub, provider_router 경유), 캐시 없이"""
+        attempts = []
         # 1. Primarily rely on yfinance for rich info (but rate limited)
         if self.yf_available:
-            try:
-                time.sleep(1.5)  # Stronger rate limit for info calls
-                # Use curl_cffi session if available to bypass bot protection
-                if self.yf_session:
-                    ticker = self.yf.Ticker(symbol, session=self.yf_session)
-                else:
-                    ticker = self.yf.Ticker(symbol)
-                return ticker.info
-            except Exception as e:
-                logger.warning(f"YF info failed for {symbol}: {e}")
-
+            attempts.append(('yfinance', lambda: self._yf_info(symbol)))
         # 2. FMP Fallback (comprehensive profile)
         if self.fmp_key:
-            result = self._fmp_company_profile(symbol)
-            if result:
-                return result
-
+            attempts.append(('fmp', lambda: self._fmp_company_profile(symbol)))
         # 3. Minimal Finnhub Fallback
         if self.finnhub_available:
-            try:
-                profile = self.finnhub_client.get_company_profile(symbol)
-                financials = self.finnhub_client.get_basic_financials(symbol)
-                # Map fields to mimic yf.info structure
-                mapped = {
-                    'symbol': symbol,
-                    'shortName': profile.get('name'),
-                    'longName': profile.get('name'),
-                    'sector': profile.get('sector'),
-                    'marketCap': profile.get('market_cap', 0) * 1000000,  # Finnhub might use M
-                    'trailingPE': financials.get('pe_ratio'),
-                    'dividendYield': financials.get('dividend_yield', 0) / 100.0 if financials.get('dividend_yield') else 0,
-                    'beta': financials.get('beta'),
-                    'fiftyTwoWeekHigh': financials.get('52_week_high'),
-                    'fiftyTwoWeekLow': financials.get('52_week_low'),
-                }
-                return mapped
-            except Exception as e:
-                logger.warning(f"Finnhub info failed for {symbol}: {e}")
+            attempts.append(('finnhub', lambda: self._finnhub_info(symbol)))
 
-        return {}
-    
-    def get_calendar(self, symbol: str) -> Dict:
-        """Get earnings calendar."""
+        # 헤지하지 않음: yfinance가 조금 늦어도 FMP/Finnhub의 얇은 프로필이 1일 캐시를 차지하지 않도록
+        return get_provider_router().call(
+            'info', attempts, validate=_has_profile, hedge=False,
+            before={'yfinance': lambda: yf_throttle(YF_INFO_MIN_INTERVAL)}) or {}
+
+    def _fetch_calendar(self, symbol: str) -> Dict:
+        """원천 조회 (yfinance), 캐시 없이"""
         if self.yf_available:
             try:
-                time.sleep(0.5)
-                ticker = self.yf.Ticker(symbol)
-                return ticker.calendar
+                yf_throttle()
+                return self._yf_ticker(symbol).calendar or {}
             except Exception as e:
                 logger.debug(f"Calendar fetch failed for {symbol}: {e}")
         return {}
 
+
+class FundamentalsService:
+    """yfinance info/calendar 공용 조회 서비스 (티커별 디스크 캐시 + 필드별 TTL + 동시성 제한)
+
+    스크리너, 슈퍼 퍼포먼스 스캐너, 옵션 플로우, 실적 분석기 등이 같은 티커의
+    Ticker.info / calendar를 각자 다시 받던 것을 한곳으로 모은다.
+
+    - 캐시: data/fundamentals_cache/<티커>.pkl — {필드: {'value', 'fetched_at', 'failed_at'}}
+      (달력의 date 객체 등 원래 타입을 그대로 보존하려고 pickle 사용)
+    - TTL: FUNDAMENTAL_TTLS (info 1일, calendar 7일). 빈 응답/실패는 FAILURE_TTL 동안 재시도하지 않고,
+      이전 값이 있으면 만료됐어도 그 값을 돌려준다.
+    - 동시성: prefetch()가 max_workers 스레드로 병렬 조회, Yahoo 호출 간격은 yf_throttle로 프로세스 공용 제한
+      (info는 YF_INFO_MIN_INTERVAL — 워커 수와 무관하게 기존 직렬 조회보다 빠르게 호출하지 않음)
+    - 소비 모듈은 get_fundamentals_service()를 import만 하고, 없으면 yfinance를 직접 조회
+    - 같은 티커 동시 요청은 티커별 잠금으로 한 번만 조회
+
+    사용법:
+        from data_fetcher import get_fundamentals_service
+
+        svc = get_fundamentals_service()
+        svc.prefetch(tickers, fields=('info', 'calendar'))   # 병렬 워밍
+        info = svc.get_info('AAPL')
+        calendar = svc.get_calendar('AAPL')
+    """
+
+    def __init__(self, fetcher: 'USStockDataFetcher' = None, cache_dir: str = None,
+                 max_workers: int = None, ttls: Dict[str, int] = None):
+        self.fetcher = fetcher or USStockDataFetcher()
+        self.cache_dir = cache_dir or FUNDAMENTALS_CACHE_DIR
+        self.max_workers = max_workers or FUNDAMENTALS_MAX_WORKERS
+        self.ttls = {**FUNDAMENTAL_TTLS, **(ttls or {})}
+        self._memory: Dict[str, Dict[str, Dict]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {'hits': 0, 'fetched': 0, 'failed': 0}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ── 디스크 캐시 ──
+
+    def _path(self, symbol: str) -> str:
+        safe = ''.join(c if c.isalnum() or c in '-_.' else f'%{ord(c):02X}' for c in symbol)
+        return os.path.join(self.cache_dir, f'{safe}.pkl')
+
+    def _load(self, symbol: str) -> Dict[str, Dict]:
+        if symbol not in self._memory:
+            entries = {}
+            path = self._path(symbol)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'rb') as f:
+                        entries = pickle.load(f)
+                except Exception as e:
+                    logger.warning(f"Fundamentals cache unreadable for {symbol}: {e}")
+            self._memory[symbol] = entries
+        return self._memory[symbol]
+
+    def _save(self, symbol: str, entries: Dict[str, Dict]):
+        path = self._path(symbol)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump(entries, f)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Fundamentals cache write failed for {symbol}: {e}")
+
+    def _lock(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _is_fresh(self, entry: Optional[Dict], field: str, now: float) -> bool:
+        if not entry:
+            return False
+        if entry.get('value') and now - entry.get('fetched_at', 0) < self.ttls[field]:
+            return True
+        return now - (entry.get('failed_at') or 0) < FAILURE_TTL
+
+    # ── 조회 ──
+
+    def get(self, symbol: str, field: str) -> Dict:
+        """캐시가 유효하면 캐시, 아니면 원천 조회 후 저장"""
+        if field not in self.ttls:
+            raise ValueError(f"Unknown fundamentals field: {field}")
+        with self._lock(symbol):
+            entries = self._load(symbol)
+            entry = entries.get(field)
+            now = time.time()
+            if self._is_fresh(entry, field, now):
+                self.stats['hits'] += 1
+                return entry.get('value') or {}
+
+            try:
+                value = getattr(self.fetcher, f'_fetch_{field}')(symbol)
+            except Exception as e:
+                logger.warning(f"Fundamentals fetch failed for {symbol} ({field}): {e}")
+                value = None
+
+            if value:
+                entries[field] = {'value': value, 'fetched_at': now, 'failed_at': None}
+                self.stats['fetched'] += 1
+            else:
+                # 실패해도 이전 값은 유지 (만료된 값이라도 빈 값보다 낫다)
+                entries[field] = {**(entry or {'value': None, 'fetched_at': 0}), 'failed_at': now}
+                self.stats['failed'] += 1
+            self._save(symbol, entries)
+            return entries[field].get('value') or {}
+
+    def get_info(self, symbol: str) -> Dict:
+        return self.get(symbol, 'info')
+
+    def get_calendar(self, symbol: str) -> Dict:
+        return self.get(symbol, 'calendar')
+
+    def prefetch(self, symbols: Iterable[str], fields: Iterable[str] = ('info',)) -> Dict[str, Dict[str, Dict]]:
+        """여러 티커를 병렬로 조회해 캐시를 채움 → {티커: {필드: 값}}"""
+        symbols = list(dict.fromkeys(symbols))
+        fields = list(fields)
+        if not symbols:
+            return {}
+        logger.info(f"📚 Fundamentals prefetch: {len(symbols)} symbols x {fields} ({self.max_workers} workers)")
+
+        def _one(symbol):
+            return symbol, {field: self.get(symbol, field) for field in fields}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fundamentals') as executor:
+            return dict(executor.map(_one, symbols))
+
+    def status(self) -> Dict:
+        return {**self.stats, 'cached_symbols': len(self._memory), 'cache_dir': self.cache_dir}
+
+
+_fundamentals_service: Optional[FundamentalsService] = None
+_fundamentals_lock = threading.Lock()
+
+
+def get_fundamentals_service() -> FundamentalsService:
+    """FundamentalsService 싱글톤 (fetcher를 따로 두지 않는 스크립트용)"""
+    global _fundamentals_service
+    with _fundamentals_lock:
+        if _fundamentals_service is None:
+            _fundamentals_service = FundamentalsService()
+        return _fundamentals_service
+
 # Test function
 def test_fetcher():
     """Test the hybrid fetcher."""
@@ -15,6 +15,14 @@ import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+try:
+    from data_fetcher import get_fundamentals_service
+except ImportError:
+    try:
+        from us_market.data_fetcher import get_fundamentals_service
+    except ImportError:
+        get_fundamentals_service = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -31,7 +39,7 @@ class EarningsAnalyzer:
             stock = yf.Ticker(ticker)
             
             # 1. Get Calendar (Next Earnings)
-            calendar = stock.calendar
+            calendar = get_fundamentals_service().get_calendar(ticker) if get_fundamentals_service else stock.calendar
             next_date = "N/A"
             if calendar and isinstance(calendar, dict):
                  # yfinance structure varies. Sometimes it's a dict passed as 'Earnings Date' list
@@ -84,7 +92,8 @@ class EarningsAnalyzer:
                 'next_earnings_date': next_date,
                 'avg_surprise_pct': round(avg_surprise, 2),
                 'surprises': surprises,
-                'revenue_growth': stock.info.get('revenueGrowth', 0)
+                'revenue_growth': (get_fundamentals_service().get_info(ticker) if get_fundamentals_service
+                                   else stock.info).get('revenueGrowth', 0)
             }
             
         except Exception as e:
@@ -16,6 +16,14 @@ import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+try:
+    from data_fetcher import get_fundamentals_service
+except ImportError:
+    try:
+        from us_market.data_fetcher import get_fundamentals_service
+    except ImportError:
+        get_fundamentals_service = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -327,7 +335,7 @@ class EarningsImpactModel:
                 stock = yf.Ticker(ticker)
 
                 # Check if earnings are within 14 days
-                calendar = stock.calendar
+                calendar = get_fundamentals_service().get_calendar(ticker) if get_fundamentals_service else stock.calendar
                 next_date_str = None
 
                 if calendar and isinstance(calendar, dict):
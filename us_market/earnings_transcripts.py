@@ -23,6 +23,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    from data_fetcher import get_fundamentals_service
+except ImportError:
+    try:
+        from us_market.data_fetcher import get_fundamentals_service
+    except ImportError:
+        get_fundamentals_service = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -95,7 +103,7 @@ class EarningsTranscriptCollector:
             import yfinance as yf
             
             stock = yf.Ticker(ticker)
-            calendar = stock.calendar
+            calendar = get_fundamentals_service().get_calendar(ticker) if get_fundamentals_service else stock.calendar
             
             next_date = None
             if calendar and isinstance(calendar, dict):
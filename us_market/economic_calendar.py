@@ -23,6 +23,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    from data_fetcher import get_fundamentals_service
+except ImportError:
+    try:
+        from us_market.data_fetcher import get_fundamentals_service
+    except ImportError:
+        get_fundamentals_service = None
+
 # Translation Map for key events
 EVENT_TRANSLATION = {
     'Federal Funds Rate': 'FOMC 금리 결정',
@@ -319,7 +327,7 @@ class EconomicCalendar:
                 # Method 2: calendar attribute (fallback)
                 if not next_date:
                     try:
-                        cal = stock.calendar
+                        cal = get_fundamentals_service().get_calendar(ticker) if get_fundamentals_service else stock.calendar
                         if cal:
                             dates = cal.get('Earnings Date', [])
                             if dates:
@@ -337,7 +345,7 @@ class EconomicCalendar:
                     sector = ''
                     mkt_cap_str = ''
                     try:
-                        info = stock.info or {}
+                        info = (get_fundamentals_service().get_info(ticker) if get_fundamentals_service else stock.info) or {}
                         sector = info.get('sector', '')
                         mkt_cap = info.get('marketCap', 0)
                         if mkt_cap > 1e12:
@@ -12,12 +12,27 @@ Index Direction Predictor v2.0
 
 import os
 import json
+import time
 import logging
 import pandas as pd
 import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# 공용 피처 스토어 (증분 피처 계산, 없으면 매번 다운로드 + 전체 계산)
+try:
+    from app.utils.feature_store import FeatureSet, get_feature_store
+except ImportError:
+    get_feature_store = None
+
+# 모델 레지스트리 + 증분 재학습 (없으면 항상 전체 재학습)
+try:
+    from app.utils.model_registry import (
+        RetrainPolicy, extend_model, fingerprint, get_model_registry, model_size, plan_training,
+    )
+except ImportError:
+    plan_training = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -45,6 +60,14 @@ class IndexPredictor:
         'dxy_return_1w',    # strong dollar = headwind for earnings
     }
 
+    # 피처 정의 버전 (_calculate_* 보조 함수를 바꾸면 올릴 것 → 피처 스토어 전체 재계산)
+    FEATURE_VERSION = '1'
+    PRICE_TICKERS = {
+        'SPY': 'SPY', 'QQQ': 'QQQ', '^VIX': 'VIX', 'XLK': 'XLK', 'XLU': 'XLU', 'XLY': 'XLY',
+        'GC=F': 'GOLD', 'DX-Y.NYB': 'DXY', '^TNX': 'TNX', '^FVX': 'FVX',
+    }
+    FEATURE_HISTORY_START = '2022-08-01'
+
     def __init__(self, data_dir: str = '.'):
         self.data_dir = data_dir
         self.output_file = os.path.join(data_dir, 'output', 'index_prediction.json')
@@ -63,6 +86,8 @@ class IndexPredictor:
             'min_training_samples': 50,
             'confidence_high_threshold': 70,
             'confidence_moderate_threshold': 60,
+            'full_retrain_days': 28,
+            'drift_threshold': 1.0,
         }
         try:
             if os.path.exists(config_path):
@@ -167,9 +192,37 @@ class IndexPredictor:
 
         return features
 
+    def feature_set(self) -> 'FeatureSet':
+        """피처 스토어 정의 (입력 종가 + _build_raw_features)"""
+        return FeatureSet(
+            name='index_predictor',
+            version=self.FEATURE_VERSION,
+            tickers=self.PRICE_TICKERS,
+            builder=self._build_raw_features,
+            history_start=self.FEATURE_HISTORY_START,
+        )
+
+    def _load_features(self, start_date: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """(입력 종가, 피처) — 피처 스토어가 있으면 증분 갱신된 프레임에서, 없으면 다운로드 후 계산"""
+        if get_feature_store is not None:
+            try:
+                fs = self.feature_set()
+                lookback_start = pd.to_datetime(start_date) - timedelta(days=300)
+                frame = get_feature_store().load(fs, start=lookback_start)
+                if not frame.empty:
+                    data = frame[fs.input_columns]
+                    return data, frame.drop(columns=fs.input_columns)
+            except Exception as e:
+                logger.warning(f"Feature store unavailable, computing features directly: {e}")
+
+        data = self._fetch_price_data(start_date)
+        if data.empty:
+            return data, pd.DataFrame()
+        return data, self._build_raw_features(data)
+
     def _fetch_price_data(self, start_date: str = '2023-01-01') -> pd.DataFrame:
         """Fetch all price data needed for features"""
-        tickers = ['SPY', 'QQQ', '^VIX', 'XLK', 'XLU', 'XLY', 'GC=F', 'DX-Y.NYB', '^TNX', '^FVX']
+        tickers = list(self.PRICE_TICKERS)
         lookback_start = (pd.to_datetime(start_date) - timedelta(days=300)).strftime('%Y-%m-%d')
 
         try:
@@ -181,20 +234,16 @@ class IndexPredictor:
         if data.empty:
             return pd.DataFrame()
 
-        rename_map = {'^VIX': 'VIX', 'GC=F': 'GOLD', 'DX-Y.NYB': 'DXY', '^TNX': 'TNX', '^FVX': 'FVX'}
-        data = data.rename(columns=rename_map)
-        return data
+        return data.rename(columns=self.PRICE_TICKERS)
 
     def reconstruct_signals_from_prices(self, start_date: str = '2023-01-01') -> pd.DataFrame:
         """Build training dataset with features + targets"""
         logger.info(f"Reconstructing signals from prices since {start_date}...")
 
-        data = self._fetch_price_data(start_date)
+        data, features = self._load_features(start_date)
         if data.empty:
             return pd.DataFrame()
 
-        features = self._build_raw_features(data)
-
         horizon = self.config['prediction_horizon_days']
 
         # Add targets for both SPY and QQQ
@@ -214,12 +263,10 @@ class IndexPredictor:
 
     def build_latest_features(self) -> Optional[pd.Series]:
         """Build today's feature vector for prediction (fresh, not stale)"""
-        data = self._fetch_price_data(start_date='2024-01-01')
+        data, features = self._load_features(start_date='2024-01-01')
         if data.empty:
             return None
 
-        features = self._build_raw_features(data)
-
         # Get the last row that has valid feature values (forward-fill missing)
         available = [f for f in self.FEATURE_NAMES if f in features.columns]
         latest = features[available].iloc[-1]
@@ -233,8 +280,12 @@ class IndexPredictor:
         latest = latest.fillna(0)
         return latest
 
-    def train(self, df: pd.DataFrame, target_ticker: str = 'SPY') -> Dict:
-        """Train GradientBoosting with proper CV (scaler inside fold)"""
+    def train(self, df: pd.DataFrame, target_ticker: str = 'SPY', mode: str = 'auto') -> Dict:
+        """Train GradientBoosting with proper CV (scaler inside fold)
+
+        mode='auto'면 이전 모델을 warm start로 이어서 학습하고(CV 생략), 피처 변경/드리프트/
+        full_retrain_days 경과 시에만 CV 포함 전체 재학습한다. mode='full'은 항상 전체 재학습.
+        """
         logger.info(f"Training {target_ticker} prediction model...")
 
         try:
@@ -273,57 +324,98 @@ class IndexPredictor:
         if len(unique_classes) < 2:
             return {'error': f'Only one class in training data: {unique_classes}'}
 
-        # TimeSeriesSplit CV with scaler INSIDE each fold (no data leakage)
-        n_splits = self.config['cv_splits']
-        tscv = TimeSeriesSplit(n_splits=n_splits)
-        cv_accuracies = []
-        cv_brier = []
-
-        for train_idx, test_idx in tscv.split(X):
-            X_train_raw, X_test_raw = X[train_idx], X[test_idx]
-            y_train, y_test = y_direction[train_idx], y_direction[test_idx]
+        started = time.perf_counter()
+        model_path = self.model_path_spy if target_ticker == 'SPY' else self.model_path_qqq
 
-            # Fit scaler on TRAINING fold only
-            fold_scaler = StandardScaler()
-            X_train = fold_scaler.fit_transform(X_train_raw)
-            X_test = fold_scaler.transform(X_test_raw)
+        # 이전 모델을 이어서 학습할 수 있는지 (피처 동일, 드리프트/경과일 기준 이내)
+        previous, plan = None, None
+        if mode == 'auto' and plan_training is not None and os.path.exists(model_path):
+            try:
+                previous = joblib.load(model_path)
+                plan = plan_training(
+                    previous, available_features, X, y_direction,
+                    RetrainPolicy(full_retrain_days=self.config['full_retrain_days'],
+                                  drift_threshold=self.config['drift_threshold']),
+                    sizes=[model_size(previous['classifier']), model_size(previous['regressor'])],
+                )
+                logger.info(f"   {target_ticker} training plan: {plan['mode']} ({plan['reason']})")
+            except Exception as e:
+                logger.warning(f"   Previous {target_ticker} model unusable, full retrain: {e}")
+                previous, plan = None, None
+
+        if plan is not None and plan['mode'] == 'skip':
+            # 학습 데이터가 그대로 — 재학습 주기만 갱신
+            previous['trained_at'] = datetime.now().isoformat()
+            joblib.dump(previous, model_path)
+            return self._train_summary(previous, available_features, mode='skip')
+
+        if plan is not None and plan['mode'] == 'incremental':
+            # 이전 scaler 유지 (기존 트리 분할 기준), 새 단계만 추가 — CV 점수는 마지막 전체 학습 값 유지
+            final_scaler = previous['scaler']
+            X_scaled = final_scaler.transform(X)
+            clf_final = extend_model(previous['classifier'], X_scaled, y_direction, plan['extra_estimators'])
+            reg_final = extend_model(previous['regressor'], X_scaled, y_return, plan['extra_estimators'])
+            cv_accuracy = previous['cv_accuracy']
+            cv_brier_score = previous.get('cv_brier')
+            full_trained_at = previous['full_trained_at']
+            base_size = previous['base_size']
+        else:
+            # TimeSeriesSplit CV with scaler INSIDE each fold (no data leakage)
+            n_splits = self.config['cv_splits']
+            tscv = TimeSeriesSplit(n_splits=n_splits)
+            cv_accuracies = []
+            cv_brier = []
+
+            for train_idx, test_idx in tscv.split(X):
+                X_train_raw, X_test_raw = X[train_idx], X[test_idx]
+                y_train, y_test = y_direction[train_idx], y_direction[test_idx]
+
+                # Fit scaler on TRAINING fold only
+                fold_scaler = StandardScaler()
+                X_train = fold_scaler.fit_transform(X_train_raw)
+                X_test = fold_scaler.transform(X_test_raw)
+
+                # Skip fold if single class in training
+                if len(np.unique(y_train)) < 2:
+                    continue
 
-            # Skip fold if single class in training
-            if len(np.unique(y_train)) < 2:
-                continue
+                clf = GradientBoostingClassifier(
+                    n_estimators=100, max_depth=3, learning_rate=0.1,
+                    subsample=0.8, min_samples_leaf=5, random_state=42
+                )
+                clf.fit(X_train, y_train)
 
-            clf = GradientBoostingClassifier(
-                n_estimators=100, max_depth=3, learning_rate=0.1,
-                subsample=0.8, min_samples_leaf=5, random_state=42
-            )
-            clf.fit(X_train, y_train)
+                y_pred = clf.predict(X_test)
+                y_proba = clf.predict_proba(X_test)
 
-            y_pred = clf.predict(X_test)
-            y_proba = clf.predict_proba(X_test)
+                cv_accuracies.append(accuracy_score(y_test, y_pred))
+                # Brier score needs probability of positive class
+                if y_proba.shape[1] == 2:
+                    cv_brier.append(brier_score_loss(y_test, y_proba[:, 1]))
 
-            cv_accuracies.append(accuracy_score(y_test, y_pred))
-            # Brier score needs probability of positive class
-            if y_proba.shape[1] == 2:
-                cv_brier.append(brier_score_loss(y_test, y_proba[:, 1]))
+            if not cv_accuracies:
+                return {'error': 'No valid CV folds'}
 
-        if not cv_accuracies:
-            return {'error': 'No valid CV folds'}
+            # Train final model on ALL training data (fit scaler on all training data)
+            final_scaler = StandardScaler()
+            X_scaled = final_scaler.fit_transform(X)
 
-        # Train final model on ALL training data (fit scaler on all training data)
-        final_scaler = StandardScaler()
-        X_scaled = final_scaler.fit_transform(X)
+            clf_final = GradientBoostingClassifier(
+                n_estimators=100, max_depth=3, learning_rate=0.1,
+                subsample=0.8, min_samples_leaf=5, random_state=42
+            )
+            clf_final.fit(X_scaled, y_direction)
 
-        clf_final = GradientBoostingClassifier(
-            n_estimators=100, max_depth=3, learning_rate=0.1,
-            subsample=0.8, min_samples_leaf=5, random_state=42
-        )
-        clf_final.fit(X_scaled, y_direction)
+            reg_final = GradientBoostingRegressor(
+                n_estimators=100, max_depth=3, learning_rate=0.1,
+                subsample=0.8, min_samples_leaf=5, random_state=42
+            )
+            reg_final.fit(X_scaled, y_return)
 
-        reg_final = GradientBoostingRegressor(
-            n_estimators=100, max_depth=3, learning_rate=0.1,
-            subsample=0.8, min_samples_leaf=5, random_state=42
-        )
-        reg_final.fit(X_scaled, y_return)
+            cv_accuracy = round(np.mean(cv_accuracies) * 100, 1)
+            cv_brier_score = round(np.mean(cv_brier), 4) if cv_brier else None
+            full_trained_at = datetime.now().isoformat()
+            base_size = clf_final.n_estimators
 
         # Feature importances
         importances = dict(zip(available_features, clf_final.feature_importances_))
@@ -333,7 +425,8 @@ class IndexPredictor:
         target_std = float(np.std(y_return))
 
         # Save model
-        model_path = self.model_path_spy if target_ticker == 'SPY' else self.model_path_qqq
+        training_mode = plan['mode'] if plan is not None else 'full'
+        hashes = plan or (fingerprint(available_features, X, y_direction) if plan_training is not None else {})
         model_data = {
             'classifier': clf_final,
             'regressor': reg_final,
@@ -341,20 +434,56 @@ class IndexPredictor:
             'features': available_features,
             'trained_at': datetime.now().isoformat(),
             'training_samples': len(X),
-            'cv_accuracy': round(np.mean(cv_accuracies) * 100, 1),
+            'cv_accuracy': cv_accuracy,
+            'cv_brier': cv_brier_score,
             'target_std': target_std,
+            'full_trained_at': full_trained_at,
+            'base_size': base_size,
+            'training_mode': training_mode,
+            'data_hash': hashes.get('data_hash'),
         }
 
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
         joblib.dump(model_data, model_path)
-        logger.info(f"   Model saved to {model_path}")
+        elapsed = time.perf_counter() - started
+        logger.info(f"   Model saved to {model_path} ({training_mode}, {elapsed:.1f}s)")
+
+        if plan_training is not None:
+            try:
+                get_model_registry().record(
+                    f'index_{target_ticker.lower()}', mode=training_mode,
+                    reason=plan['reason'] if plan is not None else (
+                        'full retrain requested' if mode == 'full' else 'no previous model'),
+                    data_hash=hashes.get('data_hash'),
+                    feature_hash=hashes.get('feature_hash'),
+                    drift=plan['drift'] if plan is not None else None,
+                    training_samples=len(X), cv_accuracy=cv_accuracy, cv_brier=cv_brier_score,
+                    estimators=model_size(clf_final), train_seconds=round(elapsed, 2),
+                    model_path=model_path,
+                )
+            except Exception as e:
+                logger.warning(f"Model registry write failed: {e}")
 
         return {
-            'accuracy': round(np.mean(cv_accuracies) * 100, 1),
-            'brier_score': round(np.mean(cv_brier), 4) if cv_brier else None,
+            'accuracy': cv_accuracy,
+            'brier_score': cv_brier_score,
             'training_samples': len(X),
             'features_used': len(available_features),
             'top_features': [{'feature': f, 'importance': round(i, 4)} for f, i in top_features],
+            'training_mode': training_mode,
+        }
+
+    def _train_summary(self, model_data: Dict, features: List[str], mode: str) -> Dict:
+        """저장된 모델 기준 학습 요약 (재학습 생략 시)"""
+        importances = dict(zip(features, model_data['classifier'].feature_importances_))
+        top_features = sorted(importances.items(), key=lambda x: x[1], reverse=True)[:10]
+        return {
+            'accuracy': model_data.get('cv_accuracy'),
+            'brier_score': model_data.get('cv_brier'),
+            'training_samples': model_data.get('training_samples', 0),
+            'features_used': len(features),
+            'top_features': [{'feature': f, 'importance': round(i, 4)} for f, i in top_features],
+            'training_mode': mode,
         }
 
     def _get_driver_direction(self, feature_name: str, value: float) -> str:
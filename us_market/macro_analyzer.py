@@ -21,6 +21,12 @@ from dotenv import load_dotenv
 load_dotenv()
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
 
+# 실행 단위 시장 스냅샷 (update_all.py가 시작 시 한 번에 받아 둔 1년치 매크로 시세)
+try:
+    from app.utils import market_snapshot
+except ImportError:
+    market_snapshot = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -97,7 +103,11 @@ class MacroDataCollector:
         
         try:
             tickers_list = list(self.macro_tickers.values())
-            data = yf.download(tickers_list, period='5d', progress=False)
+            if market_snapshot is not None:
+                # 1년치 한 번 — 전일 대비 변동과 52주 고저를 같은 패널에서 계산
+                data = market_snapshot.get_panel(tickers_list, period='1y')
+            else:
+                data = yf.download(tickers_list, period='5d', progress=False)
             
             if data.empty:
                 return {}
@@ -119,7 +129,10 @@ class MacroDataCollector:
                     change_pct = ((close / prev_close) - 1) * 100
                     
                     # Get 52-week high/low
-                    hist = yf.Ticker(ticker).history(period='1y')
+                    if market_snapshot is not None:
+                        hist = data.xs(ticker, axis=1, level='Ticker').dropna(how='all')
+                    else:
+                        hist = yf.Ticker(ticker).history(period='1y')
                     if not hist.empty:
                         high_52w = hist['High'].max()
                         low_52w = hist['Low'].min()
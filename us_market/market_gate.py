@@ -13,6 +13,17 @@ from datetime import datetime
 from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
+# 실행 단위 시장 스냅샷 (update_all.py가 시작 시 한 번에 받아 둔 지수/섹터 시세)
+try:
+    from app.utils import market_snapshot
+except ImportError:
+    market_snapshot = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -162,7 +173,12 @@ def run_us_market_gate() -> USMarketGateResult:
     
     all_tickers = ["SPY", "QQQ", "^VIX"] + list(SECTORS.values())
     try:
-        data = yf.download(all_tickers, period="1y", progress=False)
+        if market_snapshot is not None:
+            data = market_snapshot.get_panel(all_tickers, period="1y")
+        elif ohlcv_lake is not None:
+            data = ohlcv_lake.get_panel(all_tickers, period="1y")
+        else:
+            data = yf.download(all_tickers, period="1y", progress=False)
         if data.empty:
             raise ValueError("No data from yfinance")
         
@@ -17,6 +17,17 @@ import yfinance as yf
 from datetime import datetime
 from typing import Dict, Optional
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
+# 실행 단위 시장 스냅샷 (update_all.py가 시작 시 한 번에 받아 둔 지수/매크로 시세)
+try:
+    from app.utils import market_snapshot
+except ImportError:
+    market_snapshot = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -35,17 +46,39 @@ class MarketRegimeDetector:
         'crisis': (30, 999),
     }
 
+    # Signal inputs (fetched together in one batched call)
+    REGIME_TICKERS = ['SPY', '^VIX', '^TNX', '^IRX', '^MMFI']
+
     def __init__(self, data_dir: str = '.'):
         self.data_dir = data_dir
         self.output_file = os.path.join(data_dir, 'output', 'regime_config.json')
+        self._panel = None
 
     # ------------------------------------------------------------------
     # Data fetchers
     # ------------------------------------------------------------------
+    def _prefetch(self):
+        """Fetch all regime inputs at once (run snapshot or one lake call)."""
+        if market_snapshot is None:
+            return
+        try:
+            panel = market_snapshot.get_panel(self.REGIME_TICKERS, period='1y')
+            self._panel = panel if not panel.empty else None
+        except Exception as e:
+            logger.warning(f"Batched regime fetch failed, falling back per ticker: {e}")
+            self._panel = None
+
     def _fetch_series(self, ticker: str, period: str = '6mo') -> Optional[pd.Series]:
         """Fetch Close series for a single ticker."""
         try:
-            df = yf.download(ticker, period=period, progress=False)
+            if self._panel is not None and ticker in self._panel['Close'].columns:
+                close = self._panel['Close'][ticker].dropna()
+                close = close.loc[close.index >= market_snapshot.period_start(period)]
+                return close if not close.empty else None
+            if ohlcv_lake is not None:
+                df = ohlcv_lake.get_ohlcv(ticker, period=period)
+            else:
+                df = yf.download(ticker, period=period, progress=False)
             if df.empty:
                 return None
             return df['Close'].squeeze()
@@ -151,6 +184,7 @@ class MarketRegimeDetector:
         logger.info("🔍 Detecting market regime...")
 
         # Fetch data
+        self._prefetch()
         vix_data = self._fetch_series('^VIX', period='3mo')
         spy_data = self._fetch_series('SPY', period='1y')
 
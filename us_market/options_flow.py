@@ -14,6 +14,14 @@ from datetime import datetime, timedelta
 from typing import Dict, List
 import logging
 
+try:
+    from data_fetcher import get_fundamentals_service
+except ImportError:
+    try:
+        from us_market.data_fetcher import get_fundamentals_service
+    except ImportError:
+        get_fundamentals_service = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -87,7 +95,11 @@ class OptionsFlowAnalyzer:
             # Calculate Max Pain (simplified)
             # Max pain is the strike where most options expire worthless
             all_strikes = set(calls['strike'].tolist() + puts['strike'].tolist())
-            current_price = stock.info.get('regularMarketPrice', 0)
+            # 옵션 체인 응답에 기초자산 시세가 포함됨 → 별도 info 호출 불필요
+            current_price = (getattr(opt, 'underlying', None) or {}).get('regularMarketPrice')
+            if not current_price:
+                info = get_fundamentals_service().get_info(ticker) if get_fundamentals_service else stock.info
+                current_price = info.get('regularMarketPrice', 0)
             
             # Unusual activity detection
             avg_call_volume = calls['volume'].mean()
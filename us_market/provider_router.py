@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터 제공자 오케스트레이션 (서킷 브레이커 + 헤지 요청 + 호출 예산 + 상태 통계)
+
+USStockDataFetcher가 yfinance / Finnhub / FMP / Alpha Vantage를 순서대로 하나씩
+시도하던 것을 대체한다. 느리거나 죽은 제공자가 매 호출마다 자기 타임아웃만큼
+지연을 더하지 않도록:
+
+- 서킷 브레이커: 연속 실패 FAILURE_THRESHOLD회면 OPEN — 쿨다운 동안 호출하지 않고 바로 다음 제공자로.
+  쿨다운이 지나면 HALF_OPEN으로 한 건만 시험 호출, 성공하면 CLOSED, 실패하면 쿨다운 2배(최대 MAX_COOLDOWN)
+- 헤지 요청: 첫 제공자가 자기 지연 p90(연산별)을 넘기도록 응답이 없으면 다음 제공자를 동시에 호출,
+  먼저 온 유효한 응답을 사용 (실패하면 기다리지 않고 즉시 다음 제공자)
+- 빈 응답: 예외 없이 validate를 통과하지 못한 응답(없는 티커, 빈 프로필)은 다음 제공자로 넘어가되
+  제공자 장애가 아니므로 브레이커 실패로 세지 않음 ('empty' 통계)
+- 호출 예산: 제공자별 토큰 버킷 (무료 티어 한도). 예산이 바닥나면 기다리지 않고 건너뜀
+- 상태 통계: 제공자별 호출/성공/실패/건너뜀, 지연 p50/p90, 브레이커 상태
+  → data/provider_health.json (30초마다/상태 전환 시) + /api/system/providers
+
+사용법:
+    from provider_router import get_provider_router
+
+    router = get_provider_router()
+    quote = router.call('quote', [
+        ('finnhub', lambda: client.get_quote(symbol)),
+        ('fmp', lambda: fmp_quote(symbol)),
+    ])                                  # 모두 실패하면 None
+    router.health()                     # {provider: {...}}
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from app.utils import perf
+except ImportError:
+    perf = None
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEALTH_FILE = os.environ.get('PROVIDER_HEALTH_FILE') or os.path.join(_BASE_DIR, 'data', 'provider_health.json')
+
+FAILURE_THRESHOLD = 3       # 연속 실패 → OPEN
+BASE_COOLDOWN = 30.0        # 첫 OPEN 쿨다운 (초)
+MAX_COOLDOWN = 600.0
+HEDGE_PERCENTILE = 0.9      # 이 지연 백분위를 넘기면 다음 제공자 동시 호출
+DEFAULT_HEDGE_DELAY = 2.0   # 지연 표본이 부족할 때
+MIN_HEDGE_DELAY = 0.2
+LATENCY_SAMPLES = 200
+SNAPSHOT_INTERVAL = 30.0
+
+# 제공자별 호출 예산: (버킷 크기, 초당 보충량) — 무료 티어 기준
+RATE_BUDGETS = {
+    'yfinance': (10, 2.0),
+    'finnhub': (30, 1.0),              # 60/분
+    'fmp': (20, 250 / 86400),          # 250/일
+    'alpha_vantage': (5, 5 / 60),      # 5/분 (일 25회는 서버가 거절 → 브레이커가 처리)
+}
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, base_cooldown: float = BASE_COOLDOWN,
+                 max_cooldown: float = MAX_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.cooldown = base_cooldown
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def release_probe(self):
+        """allow()로 잡은 HALF_OPEN 시험 호출을 보내지 않았을 때 반납 (다음 호출이 시험하도록)"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_success(self) -> bool:
+        """성공 기록 — 상태가 바뀌었으면 True"""
+        with self._lock:
+            changed = self.state != CLOSED
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.cooldown = self.base_cooldown
+            self._probe_in_flight = False
+            return changed
+
+    def record_failure(self) -> bool:
+        """실패 기록 — 상태가 바뀌었으면 True"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.state == OPEN or self.consecutive_failures < self.failure_threshold:
+                return False
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+            return True
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+class RateBudget:
+    """토큰 버킷 (기다리지 않음 — 토큰이 없으면 False)"""
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class _ProviderState:
+    def __init__(self, name: str):
+        self.name = name
+        self.breaker = CircuitBreaker()
+        capacity, refill = RATE_BUDGETS.get(name, (10, 1.0))
+        self.budget = RateBudget(capacity, refill)
+        self.latencies: Dict[str, deque] = {}
+        self.counts = {'calls': 0, 'success': 0, 'failure': 0, 'empty': 0, 'skipped_open': 0,
+                       'skipped_budget': 0, 'hedged': 0, 'wasted': 0}
+        self.last_error = None
+        self.last_error_at = None
+
+    def latency_percentile(self, op: str, q: float) -> Optional[float]:
+        samples = self.latencies.get(op)
+        if not samples or len(samples) < 5:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ProviderRouter:
+    """제공자 목록을 브레이커/예산/헤지 규칙에 따라 호출"""
+
+    def __init__(self, max_workers: int = 8, health_file: str = HEALTH_FILE):
+        self._providers: Dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='provider')
+        self.health_file = health_file
+        self._last_snapshot = 0.0
+
+    def _state(self, name: str) -> _ProviderState:
+        with self._lock:
+            if name not in self._providers:
+                self._providers[name] = _ProviderState(name)
+            return self._providers[name]
+
+    # ── 호출 ──
+
+    def _invoke(self, state: _ProviderState, op: str, fn: Callable[[], Any],
+                validate: Callable[[Any], bool]) -> Tuple[bool, Any]:
+        start = time.monotonic()
+        error = None
+        try:
+            result = fn()
+            ok = validate(result)
+        except Exception as e:
+            result, ok, error = None, False, f'{type(e).__name__}: {e}'
+        elapsed = time.monotonic() - start
+
+        with self._lock:
+            state.counts['calls'] += 1
+            state.latencies.setdefault(op, deque(maxlen=LATENCY_SAMPLES)).append(elapsed)
+            if ok:
+                state.counts['success'] += 1
+            elif error is None:
+                state.counts['empty'] += 1
+            else:
+                state.counts['failure'] += 1
+                state.last_error = str(error)[:200]
+                state.last_error_at = time.time()
+        # 빈 응답도 제공자는 응답한 것 — 브레이커에는 성공으로 기록 (HALF_OPEN 시험 호출도 종료)
+        changed = state.breaker.record_failure() if error is not None else state.breaker.record_success()
+        if changed:
+            logger.warning(f"🔌 Provider {state.name}: circuit {state.breaker.state}"
+                           + (f" ({state.last_error})" if error is not None else ""))
+        if perf is not None:
+            outcome = 'ok' if ok else ('empty' if error is None else 'fail')
+            perf.count(f'provider_{state.name}_{outcome}')
+        self._maybe_snapshot(force=changed)
+        return ok, result
+
+    def _hedge_delay(self, state: _ProviderState, op: str) -> float:
+        p = state.latency_percentile(op, HEDGE_PERCENTILE)
+        return DEFAULT_HEDGE_DELAY if p is None else max(MIN_HEDGE_DELAY, p)
+
+    def _available(self, name: str) -> Optional[_ProviderState]:
+        state = self._state(name)
+        if not state.breaker.allow():
+            with self._lock:
+                state.counts['skipped_open'] += 1
+            return None
+        if not state.budget.try_acquire():
+            state.breaker.release_probe()
+            with self._lock:
+                state.counts['skipped_budget'] += 1
+            return None
+        return state
+
+    def call(self, op: str, attempts: List[Tuple[str, Callable[[], Any]]],
+             validate: Callable[[Any], bool] = bool, hedge: bool = True,
+             before: Dict[str, Callable[[], None]] = None) -> Any:
+        """attempts를 우선순위대로 시도해 첫 유효 결과 반환 (모두 실패/건너뜀이면 None)
+
+        Args:
+            op: 연산 이름 (지연 통계 구분용: 'quote', 'info', 'history' ...)
+            attempts: [(제공자 이름, 인자 없는 호출 함수)] — 우선순위 순
+            validate: 결과가 유효한지 (기본: 비어 있지 않음)
+            hedge: False면 순차 시도 (브레이커/예산은 그대로 적용)
+            before: {제공자 이름: 호출 직전 대기 함수} — 스로틀 등. 브레이커/예산을 통과한 제공자만,
+                호출 스레드에서 제출 전에 실행하므로 지연 통계와 헤지 타이머에 포함되지 않음
+        """
+        pending = list(attempts)
+        running = {}  # future → state
+
+        def _launch_next() -> bool:
+            while pending:
+                name, fn = pending.pop(0)
+                state = self._available(name)
+                if state is None:
+                    continue
+                if before and name in before:
+                    before[name]()
+                future = self._executor.submit(self._invoke, state, op, fn, validate)
+                running[future] = state
+                return True
+            return False
+
+        if not _launch_next():
+            return None
+
+        while running:
+            # 가장 최근에 시작한 제공자의 지연 p90까지 기다렸다가 헤지
+            newest = list(running.values())[-1]
+            timeout = self._hedge_delay(newest, op) if hedge and pending else None
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                with self._lock:
+                    newest.counts['hedged'] += 1
+                _launch_next()
+                continue
+
+            for future in done:
+                running.pop(future)
+                ok, result = future.result()
+                if ok:
+                    # 늦게 끝나는 나머지 요청은 결과만 통계에 반영되고 버려짐
+                    with self._lock:
+                        for other in running.values():
+                            other.counts['wasted'] += 1
+                    return result
+            if not running:
+                _launch_next()
+        return None
+
+    # ── 상태 ──
+
+    def health(self) -> Dict[str, dict]:
+        with self._lock:
+            providers = list(self._providers.values())
+        report = {}
+        for state in providers:
+            latency = {}
+            for op in list(state.latencies):
+                p50 = state.latency_percentile(op, 0.5)
+                p90 = state.latency_percentile(op, 0.9)
+                latency[op] = {
+                    'samples': len(state.latencies[op]),
+                    'p50_ms': round(p50 * 1000) if p50 is not None else None,
+                    'p90_ms': round(p90 * 1000) if p90 is not None else None,
+                }
+            calls = state.counts['calls']
+            report[state.name] = {
+                'state': state.breaker.state,
+                'retry_in_s': round(state.breaker.retry_in(), 1),
+                'consecutive_failures': state.breaker.consecutive_failures,
+                'success_rate': round(state.counts['success'] / calls, 3) if calls else None,
+                'budget_tokens': round(state.budget.tokens, 1),
+                **state.counts,
+                'latency': latency,
+                'last_error': state.last_error,
+                'last_error_at': state.last_error_at,
+            }
+        return report
+
+    def _maybe_snapshot(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._last_snapshot < SNAPSHOT_INTERVAL:
+            return
+        self._last_snapshot = now
+        try:
+            os.makedirs(os.path.dirname(self.health_file), exist_ok=True)
+            payload = {'updated_at': time.time(), 'pid': os.getpid(), 'providers': self.health()}
+            tmp = f'{self.health_file}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.health_file)
+        except Exception as e:
+            logger.debug(f"provider health snapshot failed: {e}")
+
+
+def load_health_snapshot(path: str = HEALTH_FILE) -> Optional[dict]:
+    """마지막으로 기록된 제공자 상태 (다른 프로세스가 쓴 것 포함)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+_router: Optional[ProviderRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_provider_router() -> ProviderRouter:
+    """ProviderRouter 싱글톤"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ProviderRouter()
+        return _router
@@ -16,10 +16,23 @@ import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+# 실행 단위 시장 스냅샷 (추천 종목은 처음 요청 때 한 번 받아 이후 조회에서 재사용)
+try:
+    from app.utils import market_snapshot
+except ImportError:
+    market_snapshot = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _download_close(tickers: List[str], period: str) -> pd.DataFrame:
+    """종가 (열 = 티커) — 스냅샷 경유, 없으면 yfinance 직접"""
+    if market_snapshot is not None:
+        return market_snapshot.get_close(tickers, period=period)
+    return yf.download(tickers, period=period, progress=False)['Close']
+
+
 class RiskAlertSystem:
     """Portfolio risk monitoring and alerting"""
 
@@ -94,7 +107,7 @@ class RiskAlertSystem:
             return {}
 
         try:
-            data = yf.download(tickers, period=period, progress=False)['Close']
+            data = _download_close(tickers, period)
             if isinstance(data, pd.Series):
                 data = data.to_frame(name=tickers[0])
 
@@ -139,7 +152,7 @@ class RiskAlertSystem:
             return {}
 
         try:
-            data = yf.download(tickers, period='6mo', progress=False)['Close']
+            data = _download_close(tickers, '6mo')
             if isinstance(data, pd.Series):
                 data = data.to_frame(name=tickers[0])
 
@@ -212,7 +225,7 @@ class RiskAlertSystem:
             return []
 
         try:
-            data = yf.download(tickers, period='1d', progress=False)['Close']
+            data = _download_close(tickers, '1d')
             if isinstance(data, pd.Series):
                 data = data.to_frame(name=tickers[0])
 
@@ -272,7 +285,7 @@ class RiskAlertSystem:
 
         try:
             if len(tickers) >= 2:
-                data = yf.download(tickers, period='3mo', progress=False)['Close']
+                data = _download_close(tickers, '3mo')
                 if not data.empty:
                     returns = data.pct_change().dropna()
                     corr = returns.corr()
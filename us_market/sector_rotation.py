@@ -17,10 +17,22 @@ import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+try:
+    from app.utils import ohlcv_lake
+except ImportError:
+    ohlcv_lake = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _download_close(tickers: List[str], period: str) -> pd.DataFrame:
+    """종가 프레임 (열 = 티커)"""
+    if ohlcv_lake is not None:
+        return ohlcv_lake.get_close(tickers, period=period)
+    return yf.download(tickers, period=period, progress=False)['Close']
+
+
 class SectorRotationTracker:
     """Track sector rotation and detect business cycle phases"""
 
@@ -86,7 +98,7 @@ class SectorRotationTracker:
 
         try:
             # Fetch 1 year of data to cover all periods
-            data = yf.download(tickers, period='1y', progress=False)['Close']
+            data = _download_close(tickers, period='1y')
 
             if data.empty:
                 return {}
@@ -130,7 +142,7 @@ class SectorRotationTracker:
         days_needed = weeks * 7 + 10
 
         try:
-            data = yf.download(tickers, period=f'{days_needed}d', progress=False)['Close']
+            data = _download_close(tickers, period=f'{days_needed}d')
 
             if data.empty or 'SPY' not in data.columns:
                 return {}
@@ -22,6 +22,15 @@ import warnings
 warnings.filterwarnings('ignore')
 from data_fetcher import USStockDataFetcher
 
+# 단계 내부 구간 perf span (스케줄러 경유 시 부모 단계 span 아래에 기록, app 패키지가 없으면 생략)
+try:
+    from app.utils.perf import span as perf_span
+except ImportError:
+    from contextlib import nullcontext
+
+    def perf_span(name, step=None):
+        return nullcontext()
+
 # Logging Configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +39,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _right_align(close: pd.DataFrame) -> pd.DataFrame:
+    """티커별 마지막 유효값이 마지막 행에 오도록 열을 아래로 밀기
+
+    일괄 다운로드 행렬은 상장 폐지/거래 정지 종목의 끝부분이 NaN일 수 있다.
+    개별 get_history처럼 "그 종목의 마지막 봉"을 iloc[-1]로 읽을 수 있게 정렬한다.
+    """
+    values = close.to_numpy(dtype=float)
+    n = len(values)
+    if n == 0:
+        return close
+    valid = ~np.isnan(values)
+    last_valid = np.where(valid.any(axis=0), n - 1 - np.argmax(valid[::-1], axis=0), n - 1)
+    shift = (n - 1) - last_valid
+    if not shift.any():
+        return close
+    rows = np.arange(n)[:, None] - shift[None, :]
+    aligned = np.where(rows >= 0, values[np.clip(rows, 0, None), np.arange(values.shape[1])], np.nan)
+    return pd.DataFrame(aligned, index=close.index, columns=close.columns)
+
+
 class EnhancedSmartMoneyScreener:
     """
     Enhanced screener with comprehensive analysis:
@@ -55,9 +84,6 @@ class EnhancedSmartMoneyScreener:
 
         # S&P 500 benchmark data
         self.spy_data = None
-
-        # Cache for get_info calls (avoids duplicate API requests)
-        self._info_cache: Dict[str, Dict] = {}
         
     def load_data(self) -> bool:
         """Load all analysis results"""
@@ -235,10 +261,8 @@ class EnhancedSmartMoneyScreener:
         }
     
     def _get_info_cached(self, ticker: str) -> Dict:
-        """Return cached info dict, fetch once per ticker"""
-        if ticker not in self._info_cache:
-            self._info_cache[ticker] = self.fetcher.get_info(ticker)
-        return self._info_cache[ticker]
+        """Return cached info dict (공용 펀더멘털 캐시, TTL 1일)"""
+        return self.fetcher.get_info(ticker)
 
     def get_fundamental_analysis(self, ticker: str) -> Dict:
         """Get fundamental/valuation metrics"""
@@ -486,6 +510,123 @@ class EnhancedSmartMoneyScreener:
         except Exception as e:
             return {'rs_20d': 0, 'rs_60d': 0, 'rs_score': 50}
 
+    # ------------------------------------------------------------------
+    # Bulk mode: 1회 일괄 다운로드 + 열 단위 지표 계산
+    # ------------------------------------------------------------------
+    def load_price_matrix(self, tickers: List[str], years: int = 1) -> pd.DataFrame:
+        """후보 전체 + SPY 종가를 한 번에 받아 (날짜 x 티커) 행렬로 반환
+
+        get_history(period="1y")를 티커마다 부르는 대신 download_history 한 번으로
+        (OHLCV lake를 거쳐 배치 단위로) 받는다.
+        """
+        symbols = list(dict.fromkeys(list(tickers) + ['SPY']))
+        end_date = datetime.now()
+        start_date = pd.Timestamp(end_date.date()) - pd.DateOffset(years=years)
+        logger.info(f"📥 Bulk history download: {len(symbols)} symbols...")
+        long_df = self.fetcher.download_history(symbols, start_date.to_pydatetime(), end_date)
+        if long_df.empty:
+            return pd.DataFrame()
+        close = long_df.pivot_table(index='Date', columns='Ticker', values='Close', aggfunc='last')
+        close.index = pd.to_datetime(close.index)
+        return close.sort_index()
+
+    def compute_technical_bulk(self, close: pd.DataFrame) -> pd.DataFrame:
+        """get_technical_analysis와 같은 지표/점수를 모든 티커에 대해 열 단위로 계산
+
+        Returns:
+            index=ticker, columns=_default_technical() 키 (히스토리 50일 미만은 기본값)
+        """
+        close = _right_align(close)
+        valid = close.notna().sum()
+
+        # RSI (14-day, Wilder's smoothing) — 선행 NaN 구간은 gain/loss 0으로 시작해 개별 계산과 동일
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).ewm(alpha=1/14, adjust=False).mean()
+        loss = (-delta.where(delta < 0, 0)).ewm(alpha=1/14, adjust=False).mean()
+        rsi = (100 - (100 / (1 + gain / loss))).iloc[-1]
+
+        # MACD
+        macd_line = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+        signal_line = macd_line.ewm(span=9, adjust=False).mean()
+        hist = macd_line - signal_line
+        hist_now, hist_prev = hist.iloc[-1], hist.iloc[-2]
+
+        # Moving Averages (200일 미만이면 MA50으로 대체)
+        ma20_all = close.rolling(20).mean()
+        ma50_all = close.rolling(50).mean()
+        ma200_all = close.rolling(200).mean()
+        long_enough = valid >= 200
+        ma20, ma50 = ma20_all.iloc[-1], ma50_all.iloc[-1]
+        ma200 = ma200_all.iloc[-1].where(long_enough, ma50)
+        ma50_prev = ma50_all.iloc[-5]
+        ma200_prev = ma200_all.iloc[-5].where(long_enough, ma50_prev)
+        price = close.iloc[-1]
+
+        ma_signal = pd.Series(np.select(
+            [(price > ma20) & (ma20 > ma50), (price < ma20) & (ma20 < ma50)],
+            ['Bullish', 'Bearish'], 'Neutral'), index=close.columns)
+        cross_signal = pd.Series(np.select(
+            [(ma50 > ma200) & (ma50_prev <= ma200_prev), (ma50 < ma200) & (ma50_prev >= ma200_prev)],
+            ['Golden Cross', 'Death Cross'], 'None'), index=close.columns)
+
+        # Technical Score (0-100) — get_technical_analysis와 같은 구간/가중치
+        score = 50 + np.select(
+            [rsi < 30, rsi <= 45, rsi <= 60, rsi <= 70],
+            [10 + np.trunc((30 - rsi) / 6), 10, 8, 2], -5)
+        score = score + np.select(
+            [(hist_now > 0) & (hist_prev < 0), hist_now > 0, hist_now < 0], [15, 8, -5], 0)
+        score = score + np.select([ma_signal == 'Bullish', ma_signal == 'Bearish'], [15, -10], 0)
+        score = score + np.select([cross_signal == 'Golden Cross', cross_signal == 'Death Cross'], [10, -15], 0)
+
+        result = pd.DataFrame({
+            'rsi': rsi.round(1),
+            'macd': macd_line.iloc[-1].round(3),
+            'macd_signal': signal_line.iloc[-1].round(3),
+            'macd_histogram': hist_now.round(3),
+            'ma20': ma20.round(2),
+            'ma50': ma50.round(2),
+            'ma_signal': ma_signal,
+            'cross_signal': cross_signal,
+            'technical_score': np.clip(score, 0, 100).astype(int),
+        })
+        short = valid < 50
+        result.loc[short, list(self._default_technical())] = list(self._default_technical().values())
+        return result
+
+    def compute_relative_strength_bulk(self, close: pd.DataFrame, benchmark: str = 'SPY',
+                                       months: int = 3) -> pd.DataFrame:
+        """get_relative_strength와 같은 RS 지표/점수를 최근 months개월 구간에서 열 단위로 계산"""
+        start = pd.Timestamp(datetime.now().date()) - pd.DateOffset(months=months)
+        window = _right_align(close.loc[close.index >= start])
+        valid = window.notna().sum()
+
+        last = window.iloc[-1]
+        first = window.bfill().iloc[0]
+        ret_20d = ((last / window.iloc[-21] - 1) * 100).where(valid >= 21, 0) if len(window) >= 21 \
+            else pd.Series(0.0, index=window.columns)
+        ret_60d = (last / first - 1) * 100
+
+        if benchmark not in window.columns or valid.get(benchmark, 0) < 20:
+            return pd.DataFrame({'rs_20d': 0, 'rs_60d': 0, 'rs_score': 50}, index=window.columns)
+
+        rs_20d = ret_20d - ret_20d[benchmark]
+        rs_60d = ret_60d - ret_60d[benchmark]
+        score = 50 + np.select(
+            [rs_20d > 10, rs_20d > 5, rs_20d > 0, rs_20d < -10, rs_20d < -5], [25, 15, 8, -20, -10], 0)
+        score = score + np.select([rs_60d > 15, rs_60d > 5, rs_60d < -15], [15, 8, -15], 0)
+
+        result = pd.DataFrame({
+            'stock_return_20d': ret_20d.round(1),
+            'spy_return_20d': round(ret_20d[benchmark], 1),
+            'rs_20d': rs_20d.round(1),
+            'rs_60d': rs_60d.round(1),
+            'rs_score': np.clip(score, 0, 100).astype(int),
+        })
+        short = valid < 20
+        result.loc[short, ['rs_20d', 'rs_60d', 'rs_score']] = [0, 0, 50]
+        result.loc[short, ['stock_return_20d', 'spy_return_20d']] = np.nan
+        return result
+
     def calculate_swing_trend_scores(self, row: pd.Series, tech: Dict, fund: Dict, analyst: Dict, rs: Dict) -> Dict:
         """
         Phase 2: Dual Scoring Logic
@@ -657,8 +798,13 @@ class EnhancedSmartMoneyScreener:
             
         return df
 
-    def run_screening(self, top_n: int = 50) -> pd.DataFrame:
-        """Run enhanced screening"""
+    def run_screening(self, top_n: int = 50, bulk: bool = True) -> pd.DataFrame:
+        """Run enhanced screening
+
+        Args:
+            bulk: True면 후보 전체 가격을 한 번에 받아 기술/상대강도 지표를 열 단위로 계산
+                  (False 또는 일괄 다운로드 실패 시 티커별 get_history 경로)
+        """
         logger.info("🔍 Running Enhanced Smart Money Screening...")
         
         # Merge volume and holdings data
@@ -692,16 +838,33 @@ class EnhancedSmartMoneyScreener:
         
         logger.info(f"📊 Pre-filtered to {len(filtered)} candidates (from {len(merged_df)})")
         
+        # 펀더멘털/애널리스트: 배치 API가 없어 티커별 info/calendar를 병렬로 미리 캐시에 채움
+        if not filtered.empty:
+            with perf_span('fundamentals_prefetch', step='fetch'):
+                self.fetcher.fundamentals.prefetch(filtered['ticker'].tolist(), fields=('info', 'calendar'))
+        
+        # Bulk: 기술/상대강도 지표를 한 번에 계산
+        tech_map, rs_map = {}, {}
+        if bulk and not filtered.empty:
+            with perf_span('price_matrix', step='fetch'):
+                close = self.load_price_matrix(filtered['ticker'].tolist())
+            if not close.empty:
+                tech_map = self.compute_technical_bulk(close).to_dict('index')
+                rs_map = self.compute_relative_strength_bulk(close).to_dict('index')
+                logger.info(f"⚡ Bulk technical/RS computed for {len(tech_map)} tickers")
+            else:
+                logger.warning("⚠️ Bulk history empty, falling back to per-ticker history")
+        
         results = []
         
         for idx, row in tqdm(filtered.iterrows(), total=len(filtered), desc="Enhanced Screening"):
             ticker = row['ticker']
             
             # Get all analyses
-            tech = self.get_technical_analysis(ticker)
+            tech = tech_map.get(ticker) or self.get_technical_analysis(ticker)
             fund = self.get_fundamental_analysis(ticker)
             analyst = self.get_analyst_ratings(ticker)
-            rs = self.get_relative_strength(ticker)
+            rs = rs_map.get(ticker) or self.get_relative_strength(ticker)
             
             # Calculate composite score
             composite_score, grade = self.calculate_composite_score(row, tech, fund, analyst, rs)
@@ -782,28 +945,33 @@ class EnhancedSmartMoneyScreener:
         
         return results_df
     
-    def run(self, top_n: int = 50) -> pd.DataFrame:
+    def run(self, top_n: int = 50, bulk: bool = True) -> pd.DataFrame:
         """Main execution"""
         logger.info("🚀 Starting Enhanced Smart Money Screener v2.0...")
         
-        if not self.load_data():
+        with perf_span('load_data', step='parse'):
+            loaded = self.load_data()
+        if not loaded:
             logger.error("❌ Failed to load data")
             return pd.DataFrame()
         
-        results_df = self.run_screening(top_n)
-        
-        # Save results (Overwrite current top picks)
-        results_df.to_csv(self.output_file, index=False)
-        logger.info(f"✅ Saved to {self.output_file}")
-        
-        # Archive results (Append-only history)
-        archive_dir = os.path.join(self.data_dir, 'archive')
-        os.makedirs(archive_dir, exist_ok=True)
+        # 채점 구간 (펀더멘털/가격 수신은 하위 fetch span으로 따로 기록)
+        with perf_span('screening', step='score'):
+            results_df = self.run_screening(top_n, bulk=bulk)
         
-        today = datetime.now().strftime('%Y%m%d')
-        archive_file = os.path.join(archive_dir, f'picks_{today}.csv')
-        results_df.to_csv(archive_file, index=False)
-        logger.info(f"📜 Archived to {archive_file}")
+        with perf_span('save', step='write'):
+            # Save results (Overwrite current top picks)
+            results_df.to_csv(self.output_file, index=False)
+            logger.info(f"✅ Saved to {self.output_file}")
+            
+            # Archive results (Append-only history)
+            archive_dir = os.path.join(self.data_dir, 'archive')
+            os.makedirs(archive_dir, exist_ok=True)
+            
+            today = datetime.now().strftime('%Y%m%d')
+            archive_file = os.path.join(archive_dir, f'picks_{today}.csv')
+            results_df.to_csv(archive_file, index=False)
+            logger.info(f"📜 Archived to {archive_file}")
         
         # Summary
         logger.info("\n📊 Grade Distribution:")
@@ -820,10 +988,12 @@ def main():
     parser = argparse.ArgumentParser(description='Enhanced Smart Money Screener v2.0')
     parser.add_argument('--dir', default='.', help='Data directory')
     parser.add_argument('--top', type=int, default=20, help='Top picks to show')
+    parser.add_argument('--per-ticker', action='store_true',
+                        help='Disable bulk technical engine (per-ticker history calls)')
     args = parser.parse_args()
     
     screener = EnhancedSmartMoneyScreener(data_dir=args.dir)
-    results = screener.run(top_n=args.top)
+    results = screener.run(top_n=args.top, bulk=not args.per_ticker)
     
     if results.empty:
         print("❌ No results")
@@ -20,6 +20,14 @@ from datetime import datetime, timedelta
 from tqdm import tqdm
 import warnings
 
+try:
+    from data_fetcher import get_fundamentals_service
+except ImportError:
+    try:
+        from us_market.data_fetcher import get_fundamentals_service
+    except ImportError:
+        get_fundamentals_service = None
+
 warnings.filterwarnings('ignore')
 
 # Logging Configuration
@@ -415,7 +423,7 @@ class SuperPerformanceScanner:
             breakout = self.validate_breakout(hist, vcp['pivot_price'])
             
             # 6. Fundamental Check
-            info = stock.info
+            info = get_fundamentals_service().get_info(ticker) if get_fundamentals_service else stock.info
             fundamentals = self.check_fundamentals(info)
             
             # 7. Calculate Composite Score
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+US Track Record 집계 저장소 (data/track_record_aggregate.json)
+
+/api/us/cumulative-performance, /api/us/history-summary가 요청마다
+us_daily_prices.csv 전체 + history/picks_*.json 전체 + yfinance SPY 조회로
+성과를 다시 계산하지 않도록, 스냅샷별 진입가·SPY 벤치마크 시계열·최종 응답
+payload를 하루 한 번(save_us_track_record_snapshot) 미리 계산해 둔다.
+
+- 스냅샷 파일은 크기/수정시간이 바뀐 것만 다시 읽음 (jongga v2 인덱스와 동일 방식)
+- 가격 CSV는 크기/수정시간이 바뀐 경우에만 최신 종가를 다시 읽음
+- SPY 시계열은 CSV에 있으면 CSV, 없으면 yfinance에서 마지막 저장일 이후만 추가 조회
+- 라우트는 get_track_record()로 stat 비교 후 저장된 payload를 그대로 반환
+  (요청당 stat은 가격 CSV, history 디렉토리, 최신 스냅샷 파일 3개로 고정 — 스냅샷 추가/삭제는
+  디렉토리 mtime으로, 당일 스냅샷 덮어쓰기는 최신 파일 stat으로 감지. 과거 스냅샷을 직접
+  고친 경우는 스케줄러의 일일 update_track_record 전체 stat 비교에서 반영)
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_FILENAME = 'track_record_aggregate.json'
+AGGREGATE_VERSION = 1
+PRICES_FILENAME = 'us_daily_prices.csv'
+BENCHMARK = 'SPY'
+
+_SNAPSHOT_RE = re.compile(r'^picks_(\d{4}-\d{2}-\d{2})\.json$')
+
+# 프로세스 내 캐시: 집계 파일 경로 → (mtime, aggregate)
+_cache = {}
+_lock = threading.Lock()
+
+
+def _paths(us_market_dir: str):
+    data_dir = os.path.join(us_market_dir, 'data')
+    return (
+        os.path.join(us_market_dir, 'history'),
+        os.path.join(data_dir, PRICES_FILENAME),
+        os.path.join(data_dir, AGGREGATE_FILENAME),
+    )
+
+
+def _signature(path: str) -> Optional[dict]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {'size': st.st_size, 'mtime': st.st_mtime}
+
+
+def _read_aggregate(path: str) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            agg = json.load(f)
+        if agg.get('version') == AGGREGATE_VERSION:
+            return agg
+    except (OSError, ValueError):
+        pass
+    return {'version': AGGREGATE_VERSION, 'snapshots': {}, 'spy': {}}
+
+
+def _write_aggregate(path: str, agg: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(agg, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _load_snapshot_picks(path: str) -> Optional[list]:
+    """스냅샷 JSON → 성과 계산에 필요한 필드만 추출"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    picks = []
+    for pick in snapshot.get('picks', []):
+        picks.append({
+            'ticker': pick.get('ticker', ''),
+            'name': pick.get('name', pick.get('ticker', '')),
+            'entry_price': _to_float(pick.get('price_at_analysis')),
+            'final_score': _to_float(pick.get('final_score')),
+            'recommendation': pick.get('ai_recommendation', ''),
+        })
+    return picks
+
+
+def _to_float(val) -> float:
+    try:
+        val = float(val)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if np.isnan(val) else val
+
+
+def _sync_snapshots(history_dir: str, snapshots: dict) -> bool:
+    """변경된 스냅샷만 다시 읽음. 변경 여부 반환"""
+    try:
+        names = os.listdir(history_dir)
+    except OSError:
+        names = []
+
+    changed = False
+    seen = set()
+    for name in names:
+        m = _SNAPSHOT_RE.match(name)
+        if not m:
+            continue
+        date_str = m.group(1)
+        seen.add(date_str)
+
+        path = os.path.join(history_dir, name)
+        sig = _signature(path)
+        if sig is None:
+            continue
+        entry = snapshots.get(date_str)
+        if entry and entry.get('size') == sig['size'] and entry.get('mtime') == sig['mtime']:
+            continue
+
+        picks = _load_snapshot_picks(path)
+        if picks is None:
+            continue
+        snapshots[date_str] = dict(sig, picks=picks)
+        changed = True
+
+    for date_str in [d for d in snapshots if d not in seen]:
+        del snapshots[date_str]
+        changed = True
+    return changed
+
+
+def _history_signature(history_dir: str, snapshots: dict) -> Optional[dict]:
+    """history 디렉토리 mtime + 최신 스냅샷 파일 stat (스냅샷 수와 무관하게 stat 2회)"""
+    dir_sig = _signature(history_dir)
+    if dir_sig is None:
+        return None
+    latest = max(snapshots) if snapshots else None
+    latest_sig = _signature(os.path.join(history_dir, f'picks_{latest}.json')) if latest else None
+    return {'dir_mtime': dir_sig['mtime'], 'latest': latest, 'latest_signature': latest_sig}
+
+
+def _load_prices(prices_path: str):
+    """가격 CSV → (최신일, {ticker: 최신 종가}, {date: SPY 종가})"""
+    import pandas as pd
+
+    df = pd.read_csv(prices_path, usecols=['Date', 'Ticker', 'Close'])
+    df['Date'] = df['Date'].astype(str).str[:10]
+    latest_date = df['Date'].max()
+
+    latest = df[df['Date'] == latest_date].drop_duplicates('Ticker', keep='last')
+    closes = {t: float(c) for t, c in zip(latest['Ticker'], latest['Close']) if pd.notna(c)}
+
+    spy = df[df['Ticker'] == BENCHMARK].dropna(subset=['Close'])
+    spy_series = {d: float(c) for d, c in zip(spy['Date'], spy['Close'])}
+    return latest_date, closes, spy_series
+
+
+def _fetch_spy(start: str) -> Dict[str, float]:
+    """yfinance SPY 종가 (start 이후). 실패 시 빈 dict"""
+    try:
+        import yfinance as yf
+        hist = yf.Ticker(BENCHMARK).history(start=start, auto_adjust=True)
+    except Exception as e:
+        logger.warning(f"SPY 벤치마크 조회 실패: {e}")
+        return {}
+    if hist is None or hist.empty:
+        return {}
+    return {idx.strftime('%Y-%m-%d'): float(c) for idx, c in zip(hist.index, hist['Close'])}
+
+
+def _build_payloads(agg: dict) -> dict:
+    """스냅샷 진입가 + 최신 종가 + SPY 시계열 → 두 엔드포인트 응답"""
+    closes = agg.get('closes', {})
+    spy = agg.get('spy', {})
+    spy_dates = sorted(spy)
+    spy_latest = spy[spy_dates[-1]] if spy_dates else None
+
+    all_picks = []
+    by_date = []
+    for date_str in sorted(agg['snapshots']):
+        returns = []
+        for pick in agg['snapshots'][date_str]['picks']:
+            current = closes.get(pick['ticker'])
+            entry = pick['entry_price']
+            if current is None or entry <= 0:
+                continue
+            return_pct = ((current / entry) - 1) * 100
+            returns.append(return_pct)
+            all_picks.append({
+                'ticker': pick['ticker'],
+                'name': pick['name'],
+                'rec_date': date_str,
+                'entry_price': round(entry, 2),
+                'current_price': round(current, 2),
+                'return_pct': round(return_pct, 2),
+                'final_score': pick['final_score'],
+                'recommendation': pick['recommendation'],
+            })
+
+        if not returns:
+            continue
+
+        # SPY 벤치마크: 스냅샷 당일 또는 이후 첫 종가 → 최신 종가
+        spy_return = 0.0
+        pos = int(np.searchsorted(spy_dates, date_str))
+        if spy_latest is not None and pos < len(spy_dates):
+            spy_return = ((spy_latest / spy[spy_dates[pos]]) - 1) * 100
+
+        avg_ret = float(np.mean(returns))
+        win_count = sum(1 for r in returns if r > 0)
+        by_date.append({
+            'date': date_str,
+            'avg_return': round(avg_ret, 2),
+            'spy_return': round(spy_return, 2),
+            'alpha': round(avg_ret - spy_return, 2),
+            'win_rate': round(win_count / len(returns) * 100, 1),
+            'num_picks': len(returns),
+        })
+
+    chart_data = [{'date': d['date'], 'avg_return': d['avg_return'], 'spy_return': d['spy_return']}
+                  for d in by_date]
+    by_date.reverse()
+
+    summary = {}
+    if all_picks:
+        rets = [p['return_pct'] for p in all_picks]
+        alphas = [d['alpha'] for d in by_date]
+        summary = {
+            'total_picks': len(all_picks),
+            'unique_tickers': len({p['ticker'] for p in all_picks}),
+            'win_rate': round(sum(1 for r in rets if r > 0) / len(rets) * 100, 1),
+            'avg_return': round(float(np.mean(rets)), 2),
+            'avg_alpha': round(float(np.mean(alphas)), 2) if alphas else 0,
+            'max_gain': round(max(rets), 2),
+            'max_loss': round(min(rets), 2),
+            'best_ticker': max(all_picks, key=lambda p: p['return_pct'])['ticker'],
+            'worst_ticker': min(all_picks, key=lambda p: p['return_pct'])['ticker'],
+            'num_snapshots': len(by_date),
+        }
+
+    overall = {}
+    if by_date:
+        overall = {
+            'total_recommendations': sum(d['num_picks'] for d in by_date),
+            'avg_return_all': round(float(np.mean([d['avg_return'] for d in by_date])), 2),
+            'avg_alpha': round(float(np.mean([d['alpha'] for d in by_date])), 2),
+            'avg_win_rate': round(float(np.mean([d['win_rate'] for d in by_date])), 1),
+            'num_dates': len(by_date),
+        }
+
+    return {
+        'cumulative_performance': {
+            'summary': summary,
+            'chart_data': chart_data,
+            'picks': all_picks,
+            'by_date': by_date,
+        },
+        'history_summary': {
+            'overall': overall,
+            'by_date': by_date,
+        },
+    }
+
+
+def update_track_record(us_market_dir: str, fetch_benchmark: bool = True) -> dict:
+    """집계 증분 갱신 (save_us_track_record_snapshot에서 하루 한 번 호출)
+
+    Args:
+        us_market_dir: us_market/ 경로
+        fetch_benchmark: CSV에 SPY가 없을 때 yfinance로 누락 구간 조회 여부
+
+    Returns:
+        갱신된 aggregate dict
+    """
+    history_dir, prices_path, agg_path = _paths(us_market_dir)
+
+    with _lock:
+        agg = _read_aggregate(agg_path)
+        changed = _sync_snapshots(history_dir, agg['snapshots'])
+
+        prices_sig = _signature(prices_path)
+        if prices_sig and prices_sig != agg.get('prices_signature'):
+            latest_date, closes, csv_spy = _load_prices(prices_path)
+            agg.update(prices_signature=prices_sig, latest_date=latest_date, closes=closes)
+            if csv_spy:
+                agg['spy'] = csv_spy
+                agg['spy_source'] = 'csv'
+            elif agg.get('spy_source') == 'csv':
+                # CSV에서 SPY가 빠졌으면 yfinance로 전환하고 오늘 바로 다시 조회
+                agg['spy_source'] = 'yfinance'
+                agg.pop('spy_checked', None)
+            changed = True
+
+        if fetch_benchmark and agg['snapshots'] and agg.get('spy_source') != 'csv':
+            earliest = min(agg['snapshots'])
+            stored = sorted(agg['spy'])
+            # 저장된 구간이 첫 스냅샷을 덮으면 마지막 저장일부터만 추가 조회
+            start = stored[-1] if stored and stored[0] <= earliest else earliest
+            today = datetime.now().strftime('%Y-%m-%d')
+            if agg.get('spy_checked') != today:
+                fetched = _fetch_spy(start)
+                if fetched:
+                    if start == earliest:
+                        agg['spy'] = {}
+                    agg['spy'].update(fetched)
+                    agg['spy_source'] = 'yfinance'
+                    changed = True
+                agg['spy_checked'] = today
+
+        history_sig = _history_signature(history_dir, agg['snapshots'])
+        if history_sig != agg.get('history_signature'):
+            agg['history_signature'] = history_sig
+            changed = True
+
+        if changed or 'payloads' not in agg:
+            agg['payloads'] = _build_payloads(agg)
+            agg['updated_at'] = datetime.now().isoformat()
+            _write_aggregate(agg_path, agg)
+            logger.info(f"US track record 집계 갱신: 스냅샷 {len(agg['snapshots'])}개")
+
+        _cache.pop(agg_path, None)
+    return agg
+
+
+def _is_stale(us_market_dir: str, agg: dict) -> bool:
+    """원본(가격 CSV, 스냅샷 추가/삭제, 당일 스냅샷 덮어쓰기)이 집계 이후 바뀌었는지 — 스냅샷 수와 무관한 stat 3회"""
+    history_dir, prices_path, _ = _paths(us_market_dir)
+    if _signature(prices_path) != agg.get('prices_signature'):
+        return True
+    return _history_signature(history_dir, agg.get('snapshots', {})) != agg.get('history_signature')
+
+
+def get_track_record(us_market_dir: str, key: str) -> Optional[dict]:
+    """미리 계산된 payload 조회 (원본 변경 시에만 증분 재계산)
+
+    Args:
+        key: 'cumulative_performance' 또는 'history_summary'
+
+    Returns:
+        payload dict, 스냅샷/가격 데이터가 없으면 None
+    """
+    history_dir, prices_path, agg_path = _paths(us_market_dir)
+    if not os.path.exists(history_dir) or not os.path.exists(prices_path):
+        return None
+
+    agg_sig = _signature(agg_path)
+    cached = _cache.get(agg_path)
+    if cached and agg_sig and cached[0] == agg_sig['mtime']:
+        agg = cached[1]
+    else:
+        agg = _read_aggregate(agg_path)
+
+    if 'payloads' not in agg or _is_stale(us_market_dir, agg):
+        # 요청 경로에서는 yfinance를 호출하지 않음 — 벤치마크는 스케줄러 갱신에 맡김
+        agg = update_track_record(us_market_dir, fetch_benchmark=not agg.get('spy'))
+
+    agg_sig = _signature(agg_path)
+    if agg_sig:
+        _cache[agg_path] = (agg_sig['mtime'], agg)
+
+    if not agg['snapshots']:
+        return None
+    return agg['payloads'].get(key)
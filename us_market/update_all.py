@@ -10,6 +10,7 @@ US Market - 전체 데이터 업데이트 스크립트 (Parallel Pipeline v2.0)
     python3 update_all.py --ai-only     # AI 분석만 업데이트
     python3 update_all.py --force       # 강제 업데이트 (최신 여부 무시)
     python3 update_all.py --sequential  # 순차 실행 (디버깅용)
+    python3 update_all.py --no-snapshot # 시장 스냅샷 없이 단계별 직접 수신
 """
 
 import os
@@ -17,7 +18,7 @@ import sys
 import subprocess
 import time
 import argparse
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 # 스크립트 디렉토리 기준 절대경로
@@ -48,6 +49,25 @@ except ImportError:
         return check_date.strftime("%Y-%m-%d")
 
 
+# warm 스크립트 실행기 (스케줄러 경유 실행 시 PYTHONPATH로 import 가능, 없으면 subprocess)
+try:
+    from app.utils import warm_pool
+except ImportError:
+    warm_pool = None
+
+# 실행 단위 시장 스냅샷 (레짐/게이트/매크로/리스크 단계가 공유하는 시세를 시작 시 한 번에 수신)
+try:
+    from app.utils import market_snapshot
+except ImportError:
+    market_snapshot = None
+
+# 단계별 perf span 기록 (스케줄러 경유 시 부모 span 아래에 중첩, 없으면 기록 생략)
+try:
+    from app.utils import perf
+except ImportError:
+    perf = None
+
+
 def get_data_last_date():
     """
     저장된 가격 데이터의 마지막 날짜 확인
@@ -60,6 +80,15 @@ def get_data_last_date():
     if not os.path.exists(csv_path):
         return None
 
+    # 가격 저장소 매니페스트가 CSV와 동기화돼 있으면 CSV를 읽지 않음
+    try:
+        from us_price_store import get_latest_date
+        last_date = get_latest_date(os.path.dirname(csv_path))
+        if last_date:
+            return last_date
+    except ImportError:
+        pass
+
     if not _HAS_PANDAS:
         return None
 
@@ -140,31 +169,54 @@ def run_script(script_name, description, timeout=600):
         print_skip(f"{script_file} not found (skipped)")
         return True  # 아직 복사되지 않은 스크립트는 스킵 처리 (실패 아님)
 
+    if perf is not None:
+        with perf.span(script_file, step='subprocess') as sp:
+            ok = _run_script(script_path, script_args, description, timeout, perf.child_env())
+            if not ok:
+                sp.fail()
+            return ok
+    return _run_script(script_path, script_args, description, timeout, {})
+
+
+def _run_script(script_path, script_args, description, timeout, env_extra):
     start_time = time.time()
 
     try:
         env = os.environ.copy()
         env['PYTHONIOENCODING'] = 'utf-8'
-        result = subprocess.run(
-            [sys.executable, script_path] + script_args,
-            cwd=SCRIPT_DIR,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=timeout,
-            env=env
-        )
+        env.update(env_extra)
+
+        if warm_pool is not None and warm_pool.can_run(sys.executable):
+            # 사전 로드된 warm 서버에서 fork 실행 — 출력은 실패 시 마지막 부분만 표시
+            output = []
+            returncode = warm_pool.run_python(
+                [script_path] + script_args, cwd=SCRIPT_DIR, env=env,
+                timeout=timeout, on_line=output.append
+            )
+            error_text = '\n'.join(output[-5:])
+        else:
+            result = subprocess.run(
+                [sys.executable, script_path] + script_args,
+                cwd=SCRIPT_DIR,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                timeout=timeout,
+                env=env
+            )
+            returncode = result.returncode
+            error_text = result.stderr
 
         elapsed = time.time() - start_time
 
-        if result.returncode == 0:
+        if returncode == 0:
             print_success(f"{description} 완료 ({elapsed:.1f}초)")
             return True
         else:
-            print_error(f"{description} 실패 (exit code: {result.returncode})")
-            if result.stderr:
-                print(f"      Error: {result.stderr[:200]}...")
+            print_error(f"{description} 실패 (exit code: {returncode})")
+            if error_text:
+                print(f"      Error: {error_text[:200]}...")
             return False
 
     except subprocess.TimeoutExpired:
@@ -176,14 +228,14 @@ def run_script(script_name, description, timeout=600):
 
 
 def run_script_worker(script_name, description, timeout=600):
-    """Parallel-safe wrapper around run_script (module-level for pickling)"""
+    """Parallel-safe wrapper around run_script"""
     success = run_script(script_name, description, timeout)
     return (script_name, description, success)
 
 
 def run_parallel_group(scripts, group_name, max_workers=4):
     """
-    Run scripts in parallel using ProcessPoolExecutor
+    Run scripts in parallel (each script runs in its own process; threads only wait on them)
 
     Args:
         scripts: List of (script_name, description, timeout) tuples
@@ -198,7 +250,7 @@ def run_parallel_group(scripts, group_name, max_workers=4):
 
     print(f"\n  {Colors.BLUE}⚡ 병렬 실행 ({len(scripts)}개, max_workers={max_workers}){Colors.END}")
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = {}
         for script, desc, timeout in scripts:
             future = executor.submit(run_script_worker, script, desc, timeout)
@@ -356,6 +408,7 @@ def main():
     parser.add_argument('--force', action='store_true', help='강제 업데이트 (최신 여부 무시)')
     parser.add_argument('--sequential', action='store_true', help='순차 실행 (디버깅용)')
     parser.add_argument('--no-telegram', action='store_true', help='텔레그램 알림 스킵')
+    parser.add_argument('--no-snapshot', action='store_true', help='시장 스냅샷 생략 (단계별로 직접 수신)')
     args = parser.parse_args()
 
     # 시작 시간
@@ -395,6 +448,14 @@ def main():
         print(f"\n🔧 모드: 전체 업데이트 (순차)")
         scripts = update_full()
 
+    # 시장 스냅샷: 이후 실행하는 모든 스크립트가 환경변수로 경로를 물려받아 메모리에서 읽음
+    if market_snapshot is not None and not args.no_snapshot:
+        snapshot_start = time.time()
+        if market_snapshot.build():
+            print_success(f"시장 스냅샷 수신 완료 ({time.time() - snapshot_start:.1f}초)")
+        else:
+            print_skip("시장 스냅샷 수신 실패 (단계별 직접 수신)")
+
     total_success = 0
     total_failed = []
     total_scripts = 0
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+US 일별 가격 월별 파티션 저장소 (append-only + 마지막 날짜 매니페스트)
+
+create_us_daily_prices.py가 매일 us_daily_prices.csv 전체를 읽어 종목별 마지막
+날짜를 구하고, 새 행을 합쳐 정렬한 뒤 CSV 전체를 다시 쓰던 것을 대체한다.
+
+- 파티션: data/us_prices/YYYY-MM.parquet — 그 달의 전 종목 일봉
+  (pyarrow/fastparquet 미설치 환경에서는 같은 위치에 .pkl)
+- 매니페스트: data/us_prices/manifest.json — 종목별 마지막 날짜, 파티션별 행 수,
+  마지막으로 동기화한 us_daily_prices.csv의 크기/mtime
+- 갱신: 새 행이 속한 달의 파티션만 다시 쓰고(tmp → os.replace), CSV에는 새 행만 덧붙인다
+  → 일일 갱신은 이번 달 파티션 하나 + CSV 끝부분만 건드린다
+- 복구: CSV가 외부에서 교체됐거나(서명 불일치) 매니페스트가 없으면 CSV에서 한 번 재구성,
+  CSV가 없으면 파티션에서 다시 내보냄
+
+us_daily_prices.csv는 기존 소비자(analyze_volume, 트랙레코드 등)를 위해 계속 유지한다.
+CSV 행 순서는 (Ticker, Date) 정렬이 아니라 추가 순서다 — 소비자는 각자 정렬해서 쓴다.
+
+사용법:
+    from us_price_store import get_last_dates, append_prices, load_prices
+
+    last_dates = get_last_dates(data_dir)            # {ticker: Timestamp}
+    append_prices(data_dir, new_df)                  # 새 행만 파티션/CSV에 추가
+    df = load_prices(data_dir, tickers=['AAPL'], start='2025-01-01')
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = 'us_prices'
+CSV_FILENAME = 'us_daily_prices.csv'
+MANIFEST_FILENAME = 'manifest.json'
+COLUMNS = ['Date', 'Ticker', 'Open', 'High', 'Low', 'Close', 'Volume']
+LOCK_TIMEOUT = 600
+
+
+def _parquet_available() -> bool:
+    for module in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+STORAGE_EXT = '.parquet' if _parquet_available() else '.pkl'
+
+
+# ── 경로 / 파일 입출력 ──
+
+def _store_dir(data_dir: str) -> str:
+    return os.path.join(data_dir, STORE_DIRNAME)
+
+
+def _csv_path(data_dir: str) -> str:
+    return os.path.join(data_dir, CSV_FILENAME)
+
+
+def _partition_path(data_dir: str, month: str) -> str:
+    return os.path.join(_store_dir(data_dir), f'{month}{STORAGE_EXT}')
+
+
+def _lock(data_dir: str) -> FileLock:
+    os.makedirs(_store_dir(data_dir), exist_ok=True)
+    return FileLock(os.path.join(_store_dir(data_dir), '.store.lock'), timeout=LOCK_TIMEOUT)
+
+
+def _csv_signature(data_dir: str) -> Optional[dict]:
+    path = _csv_path(data_dir)
+    if not os.path.exists(path):
+        return None
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime': st.st_mtime}
+
+
+def _read_partition(path: str) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=COLUMNS)
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _write_partition(path: str, df: pd.DataFrame):
+    """원자적 쓰기 (tmp → os.replace) — 읽는 쪽은 항상 완성된 파일만 본다"""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    if path.endswith('.parquet'):
+        df.to_parquet(tmp, index=False)
+    else:
+        df.to_pickle(tmp)
+    os.replace(tmp, path)
+
+
+def load_manifest(data_dir: str) -> Optional[dict]:
+    path = os.path.join(_store_dir(data_dir), MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if manifest.get('format') == STORAGE_EXT else None
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ US price manifest unreadable: {e}")
+        return None
+
+
+def _write_manifest(data_dir: str, manifest: dict):
+    path = os.path.join(_store_dir(data_dir), MANIFEST_FILENAME)
+    manifest['updated_at'] = datetime.now().isoformat(timespec='seconds')
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# ── 정규화 ──
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Date(자정, tz 없음) + COLUMNS 순서, (Date, Ticker) 중복은 마지막 값 유지"""
+    df = df.copy()
+    dates = pd.to_datetime(df['Date'])
+    if getattr(dates.dt, 'tz', None) is not None:
+        dates = dates.dt.tz_localize(None)
+    df['Date'] = dates.dt.normalize()
+    for col in COLUMNS:
+        if col not in df.columns:
+            df[col] = pd.NA
+    df = df[COLUMNS].dropna(subset=['Close'])
+    df = df.drop_duplicates(subset=['Date', 'Ticker'], keep='last')
+    return df.sort_values(['Ticker', 'Date']).reset_index(drop=True)
+
+
+def _month_key(dates: pd.Series) -> pd.Series:
+    return dates.dt.strftime('%Y-%m')
+
+
+# ── 재구성 ──
+
+def _write_all_partitions(data_dir: str, df: pd.DataFrame) -> dict:
+    """정규화된 전체 데이터 → 월별 파티션 + 매니페스트 (기존 파티션은 교체)"""
+    store_dir = _store_dir(data_dir)
+    for name in os.listdir(store_dir):
+        if name.endswith(('.parquet', '.pkl')):
+            os.remove(os.path.join(store_dir, name))
+
+    partitions = {}
+    for month, part in df.groupby(_month_key(df['Date']), sort=True):
+        _write_partition(_partition_path(data_dir, month), part.reset_index(drop=True))
+        partitions[month] = {'rows': len(part)}
+
+    last = df.groupby('Ticker')['Date'].max()
+    manifest = {
+        'format': STORAGE_EXT,
+        'tickers': {t: d.strftime('%Y-%m-%d') for t, d in last.items()},
+        'partitions': partitions,
+        'csv': _csv_signature(data_dir),
+    }
+    _write_manifest(data_dir, manifest)
+    return manifest
+
+
+def _bootstrap_from_csv(data_dir: str) -> dict:
+    logger.info(f"📂 Building US price store from {CSV_FILENAME} (one-time)...")
+    df = _normalize(pd.read_csv(_csv_path(data_dir)))
+    manifest = _write_all_partitions(data_dir, df)
+    logger.info(f"✅ US price store: {len(manifest['tickers'])} tickers, {len(manifest['partitions'])} partitions")
+    return manifest
+
+
+def _export_csv(data_dir: str, manifest: dict) -> dict:
+    logger.info(f"📝 Exporting {CSV_FILENAME} from US price store...")
+    df = load_prices(data_dir)
+    df.to_csv(_csv_path(data_dir), index=False, date_format='%Y-%m-%d')
+    manifest['csv'] = _csv_signature(data_dir)
+    _write_manifest(data_dir, manifest)
+    return manifest
+
+
+def _ensure_store(data_dir: str) -> dict:
+    """매니페스트와 CSV를 맞춘 뒤 매니페스트 반환 (잠금 안에서 호출)"""
+    manifest = load_manifest(data_dir)
+    csv_sig = _csv_signature(data_dir)
+
+    if manifest is None:
+        if csv_sig is None:
+            manifest = {'format': STORAGE_EXT, 'tickers': {}, 'partitions': {}, 'csv': None}
+            _write_manifest(data_dir, manifest)
+            return manifest
+        return _bootstrap_from_csv(data_dir)
+
+    if csv_sig is None:
+        return _export_csv(data_dir, manifest) if manifest['tickers'] else manifest
+    if csv_sig != manifest.get('csv'):
+        logger.info(f"🔄 {CSV_FILENAME} changed outside the store, rebuilding...")
+        return _bootstrap_from_csv(data_dir)
+    return manifest
+
+
+# ── 공개 API ──
+
+def get_last_dates(data_dir: str) -> Dict[str, pd.Timestamp]:
+    """종목별 마지막 저장 날짜 (매니페스트만 읽음)"""
+    with _lock(data_dir):
+        manifest = _ensure_store(data_dir)
+    return {t: pd.Timestamp(d) for t, d in manifest['tickers'].items()}
+
+
+def get_latest_date(data_dir: str) -> Optional[str]:
+    """저장소 전체의 마지막 날짜 'YYYY-MM-DD' (매니페스트가 없거나 CSV와 어긋나면 None)"""
+    manifest = load_manifest(data_dir)
+    if not manifest or not manifest['tickers'] or manifest.get('csv') != _csv_signature(data_dir):
+        return None
+    return max(manifest['tickers'].values())
+
+
+def append_prices(data_dir: str, new_df: pd.DataFrame) -> int:
+    """새로 받은 일봉을 추가 → 추가된 행 수
+
+    종목별 마지막 날짜 이후 행만 받아들이고, 해당 월 파티션만 다시 쓰며,
+    CSV에는 새 행만 덧붙인다.
+    """
+    if new_df is None or new_df.empty:
+        return 0
+
+    with _lock(data_dir):
+        manifest = _ensure_store(data_dir)
+        new = _normalize(new_df)
+
+        last = new['Ticker'].map(manifest['tickers']).fillna('0000-00-00')
+        new = new[new['Date'].dt.strftime('%Y-%m-%d') > last].reset_index(drop=True)
+        if new.empty:
+            return 0
+
+        # 1. 월별 파티션 (새 행이 속한 달만)
+        for month, part in new.groupby(_month_key(new['Date']), sort=True):
+            path = _partition_path(data_dir, month)
+            merged = pd.concat([_read_partition(path), part], ignore_index=True)
+            merged = merged.drop_duplicates(subset=['Date', 'Ticker'], keep='last')
+            merged = merged.sort_values(['Ticker', 'Date']).reset_index(drop=True)
+            _write_partition(path, merged)
+            manifest['partitions'][month] = {'rows': len(merged)}
+
+        # 2. CSV 끝에 새 행만 추가 (기존 헤더의 열 순서를 따름)
+        csv_path = _csv_path(data_dir)
+        if os.path.exists(csv_path):
+            header = pd.read_csv(csv_path, nrows=0).columns.tolist()
+            new.reindex(columns=header).to_csv(
+                csv_path, mode='a', header=False, index=False, date_format='%Y-%m-%d')
+        else:
+            new.to_csv(csv_path, index=False, date_format='%Y-%m-%d')
+
+        # 3. 매니페스트 (마지막에 기록 — 중간에 실패하면 다음 실행에서 다시 받아 중복 제거)
+        for ticker, date in new.groupby('Ticker')['Date'].max().items():
+            manifest['tickers'][ticker] = date.strftime('%Y-%m-%d')
+        manifest['csv'] = _csv_signature(data_dir)
+        _write_manifest(data_dir, manifest)
+
+    logger.info(f"💾 Appended {len(new)} rows ({new['Ticker'].nunique()} tickers) to US price store")
+    return len(new)
+
+
+def load_prices(data_dir: str, tickers: Optional[Iterable[str]] = None,
+                start=None, end=None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """파티션에서 조회 (기간에 걸친 월 파티션만 읽음) → COLUMNS 형식 DataFrame"""
+    manifest = load_manifest(data_dir)
+    if not manifest or not manifest['partitions']:
+        return pd.DataFrame(columns=columns or COLUMNS)
+
+    start_month = pd.Timestamp(start).strftime('%Y-%m') if start is not None else None
+    end_month = pd.Timestamp(end).strftime('%Y-%m') if end is not None else None
+    months = [m for m in sorted(manifest['partitions'])
+              if (start_month is None or m >= start_month) and (end_month is None or m <= end_month)]
+
+    ticker_set = set(tickers) if tickers is not None else None
+    frames = []
+    for month in months:
+        part = _read_partition(_partition_path(data_dir, month))
+        if ticker_set is not None:
+            part = part[part['Ticker'].isin(ticker_set)]
+        frames.append(part)
+    if not frames:
+        return pd.DataFrame(columns=columns or COLUMNS)
+
+    df = pd.concat(frames, ignore_index=True)
+    if start is not None:
+        df = df[df['Date'] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df['Date'] <= pd.Timestamp(end)]
+    df = df.sort_values(['Ticker', 'Date']).reset_index(drop=True)
+    return df[columns] if columns else df